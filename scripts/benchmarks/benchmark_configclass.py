@@ -0,0 +1,89 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the construction, copy and conversion of the environment configurations.
+
+The configurations are created with the default copy of their members and inside the
+:func:`~isaaclab.utils.configclass.deferred_copy` context that is used by
+:func:`~isaaclab_tasks.utils.parse_cfg.load_cfg_from_registry`. The benchmark does not require the simulator.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_configclass.py --tasks Isaac-Velocity-Rough-Anymal-C-v0
+
+"""
+
+import argparse
+import gymnasium as gym
+import importlib
+from prettytable import PrettyTable
+
+# note: the package replaces the Omniverse packages when the application is not running
+from simulator_free.suites import measure
+
+from isaaclab.utils.configclass import deferred_copy
+
+import isaaclab_tasks  # noqa: F401
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the environment configurations.")
+parser.add_argument(
+    "--tasks",
+    type=str,
+    nargs="+",
+    default=["Isaac-Velocity-Rough-Anymal-C-v0", "Isaac-Lift-Cube-Franka-v0", "Isaac-Cartpole-v0"],
+    help="Names of the tasks whose configurations are benchmarked.",
+)
+parser.add_argument("--num_iterations", type=int, default=20, help="Number of timed iterations of each benchmark.")
+args_cli = parser.parse_args()
+
+
+def load_cfg_class(task_name: str) -> type:
+    """Load the environment configuration class of a task from the gym registry."""
+    cfg_entry_point = gym.spec(task_name).kwargs["env_cfg_entry_point"]
+    if isinstance(cfg_entry_point, str):
+        mod_name, attr_name = cfg_entry_point.split(":")
+        return getattr(importlib.import_module(mod_name), attr_name)
+    return cfg_entry_point
+
+
+def construct_deferred(cfg_cls: type) -> object:
+    """Construct a configuration inside the deferred copy context."""
+    with deferred_copy():
+        return cfg_cls()
+
+
+def main():
+    """Run the benchmarks."""
+    table = PrettyTable(["Task", "Benchmark", "Mean (ms)", "Std (ms)", "Min (ms)"])
+    table.title = "Configuration benchmarks"
+    table.align = "r"
+    table.align["Task"] = "l"
+    table.align["Benchmark"] = "l"
+    for task_name in args_cli.tasks:
+        cfg_cls = load_cfg_class(task_name)
+        cfg = cfg_cls()
+        benchmarks = {
+            "construct": cfg_cls,
+            "construct (deferred copy)": lambda: construct_deferred(cfg_cls),
+            "copy": cfg.copy,
+            "to_dict": cfg.to_dict,
+        }
+        for name, func in benchmarks.items():
+            result = measure(name, func, None, args_cli.num_iterations, "cpu")
+            table.add_row([
+                task_name,
+                name,
+                f"{result.mean_ms:.3f}",
+                f"{result.std_ms:.3f}",
+                f"{result.min_ms:.3f}",
+            ])
+    print(table)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the solvers of the differential inverse kinematics controller.
+
+The benchmark evaluates the joint-space update of the :class:`~isaaclab.controllers.DifferentialIKController`
+on random Jacobians for different numbers of environments and degrees of freedom. It does not require the
+simulator and only depends on PyTorch.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_differential_ik.py --device cpu
+
+"""
+
+import argparse
+import time
+import torch
+from prettytable import PrettyTable
+
+from isaaclab.controllers import DifferentialIKController, DifferentialIKControllerCfg
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the solvers of the differential IK controller.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1024, 4096, 16384, 65536], help="Number of environments to benchmark."
+)
+parser.add_argument("--num_dofs", type=int, nargs="+", default=[7, 30], help="Number of joints of the Jacobian.")
+parser.add_argument(
+    "--ik_methods",
+    type=str,
+    nargs="+",
+    default=["pinv", "svd", "dls", "dls_cholesky"],
+    choices=["pinv", "svd", "trans", "dls", "dls_cholesky"],
+    help="Inverse kinematics methods to benchmark.",
+)
+parser.add_argument(
+    "--num_iterations", type=int, default=1, help="Number of refinement iterations for the 'dls_cholesky' method."
+)
+parser.add_argument("--num_steps", type=int, default=20, help="Number of timed calls for each configuration.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the benchmark on.")
+parser.add_argument("--num_threads", type=int, default=None, help="Number of threads used by PyTorch on the CPU.")
+args_cli = parser.parse_args()
+
+
+def benchmark_ik_method(ik_method: str, num_envs: int, num_dofs: int) -> float:
+    """Benchmark the joint-space update of the controller.
+
+    Args:
+        ik_method: The inverse kinematics method.
+        num_envs: The number of environments.
+        num_dofs: The number of joints of the Jacobian.
+
+    Returns:
+        The mean time per call (in ms).
+    """
+    ik_params = {"num_iterations": args_cli.num_iterations} if ik_method == "dls_cholesky" else None
+    cfg = DifferentialIKControllerCfg(command_type="pose", ik_method=ik_method, ik_params=ik_params)
+    controller = DifferentialIKController(cfg, num_envs=num_envs, device=args_cli.device)
+    # create random inputs
+    jacobian = torch.randn(num_envs, 6, num_dofs, device=args_cli.device)
+    delta_pose = 0.01 * torch.randn(num_envs, 6, device=args_cli.device)
+    # warm-up
+    for _ in range(2):
+        controller._compute_delta_joint_pos(delta_pose, jacobian)
+    # time the calls
+    _synchronize()
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        controller._compute_delta_joint_pos(delta_pose, jacobian)
+    _synchronize()
+    return (time.perf_counter() - start_time) / args_cli.num_steps * 1000.0
+
+
+def _synchronize():
+    """Wait for all the kernels on the device to finish."""
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize(args_cli.device)
+
+
+def main():
+    """Run the benchmark."""
+    if args_cli.num_threads is not None:
+        torch.set_num_threads(args_cli.num_threads)
+    # create the table
+    table = PrettyTable(["Num. DoFs", "Num. envs"] + [f"{ik_method} (ms)" for ik_method in args_cli.ik_methods])
+    table.title = f"Differential IK joint-space update on '{args_cli.device}'"
+    table.align = "r"
+    # run the benchmarks
+    for num_dofs in args_cli.num_dofs:
+        for num_envs in args_cli.num_envs:
+            timings = [benchmark_ik_method(ik_method, num_envs, num_dofs) for ik_method in args_cli.ik_methods]
+            table.add_row([num_dofs, num_envs] + [f"{timing:.3f}" for timing in timings])
+            print(f"[INFO] Finished benchmark for {num_dofs} DoFs and {num_envs} environments.")
+    # print the results
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the cold import time of the core modules of Isaac Lab.
+
+Each module is imported in a fresh Python interpreter with the ``-X importtime`` option, which reports the time
+spent in the import of every module. The script prints the total import time of each module together with its
+slowest dependencies, and checks that:
+
+* the modules do not load heavy packages that they are expected to load lazily (see ``--lazy_packages``), and
+* the import time does not regress with respect to a baseline file (see ``--baseline``).
+
+The script exits with a non-zero code if one of the checks fails, so it can be used in continuous integration.
+The default modules do not require the simulator. Modules that depend on it (such as ``isaaclab.sim``) can be
+passed with ``--modules`` when the script is run with the Python interpreter of Isaac Sim.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_import_time.py --save_baseline import_times.json
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_import_time.py --baseline import_times.json
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from prettytable import PrettyTable
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the cold import time of the core modules of Isaac Lab.")
+parser.add_argument(
+    "--modules",
+    type=str,
+    nargs="+",
+    default=["isaaclab.utils", "isaaclab.utils.datasets", "isaaclab.utils.io", "isaaclab.utils.math"],
+    help="Names of the modules to import.",
+)
+parser.add_argument(
+    "--lazy_packages",
+    type=str,
+    nargs="*",
+    default=["h5py", "trimesh", "warp"],
+    help="Names of the packages that must not be loaded by the import of the modules.",
+)
+parser.add_argument("--num_runs", type=int, default=5, help="Number of imports of each module. The fastest is kept.")
+parser.add_argument("--top_k", type=int, default=5, help="Number of slowest dependencies to report for each module.")
+parser.add_argument("--baseline", type=str, default=None, help="Path to a JSON file with the baseline import times.")
+parser.add_argument(
+    "--save_baseline", type=str, default=None, help="Path to a JSON file to which the import times are saved."
+)
+parser.add_argument(
+    "--tolerance", type=float, default=0.2, help="Allowed relative increase of the import times over the baseline."
+)
+parser.add_argument(
+    "--min_regression", type=float, default=0.05, help="Allowed absolute increase of the import times (in seconds)."
+)
+args_cli = parser.parse_args()
+
+
+def measure_import_time(module: str) -> dict[str, float]:
+    """Import a module in a new interpreter and parse the output of ``-X importtime``.
+
+    Args:
+        module: The name of the module.
+
+    Returns:
+        A dictionary mapping the names of all the modules that are loaded by the import to their cumulative
+        import time (in seconds).
+
+    Raises:
+        RuntimeError: If the module cannot be imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import the module '{module}':\n{result.stderr}")
+    # each line is of the form: "import time: <self [us]> | <cumulative [us]> | <indentation><module>"
+    import_times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        import_times[name.strip()] = int(cumulative) * 1e-6
+    return import_times
+
+
+def main():
+    """Run the benchmark."""
+    # load the baseline
+    baseline = dict()
+    if args_cli.baseline is not None:
+        with open(args_cli.baseline) as f:
+            baseline = json.load(f)
+
+    # create the table
+    table = PrettyTable(["Module", "Import time (s)", "Baseline (s)", f"Slowest {args_cli.top_k} dependencies (s)"])
+    table.title = "Cold import times"
+    table.align = "l"
+    # import the modules
+    errors = list()
+    total_times = dict()
+    for module in args_cli.modules:
+        # keep the fastest run to reduce the noise of the measurements
+        runs = [measure_import_time(module) for _ in range(args_cli.num_runs)]
+        import_times = min(runs, key=lambda times: times[module])
+        total_times[module] = import_times[module]
+        # check that the heavy packages are not loaded
+        for package in args_cli.lazy_packages:
+            if package in import_times:
+                errors.append(f"The import of '{module}' loads the package '{package}'.")
+        # check the baseline
+        baseline_time = baseline.get(module)
+        if baseline_time is not None:
+            max_time = max(baseline_time * (1.0 + args_cli.tolerance), baseline_time + args_cli.min_regression)
+            if total_times[module] > max_time:
+                errors.append(
+                    f"The import time of '{module}' regressed: {total_times[module]:.3f} s > {max_time:.3f} s."
+                )
+        # find the slowest dependencies, i.e. the slowest imports of top-level packages other than the module
+        top_level = {name: time for name, time in import_times.items() if "." not in name and name != module}
+        slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[: args_cli.top_k]
+        table.add_row([
+            module,
+            f"{total_times[module]:.3f}",
+            "-" if baseline_time is None else f"{baseline_time:.3f}",
+            ", ".join(f"{name} ({time:.3f})" for name, time in slowest),
+        ])
+    # print the results
+    print(table)
+
+    # save the baseline
+    if args_cli.save_baseline is not None:
+        with open(args_cli.save_baseline, "w") as f:
+            json.dump(total_times, f, indent=4)
+        print(f"[INFO] Saved the import times to: {args_cli.save_baseline}")
+    # report the failed checks
+    for error in errors:
+        print(f"[ERROR] {error}")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
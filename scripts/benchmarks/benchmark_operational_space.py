@@ -0,0 +1,159 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the high-throughput mode of the operational space controller.
+
+The benchmark evaluates :meth:`~isaaclab.controllers.OperationalSpaceController.compute` with and without
+the high-throughput mode on random Jacobians and mass matrices for different numbers of environments. The
+controller configurations mirror the ones in ``source/isaaclab/test/controllers/test_operational_space.py``.
+It does not require the simulator and only depends on PyTorch.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_operational_space.py --device cpu
+
+"""
+
+import argparse
+import time
+import torch
+from prettytable import PrettyTable
+
+from isaaclab.controllers import OperationalSpaceController, OperationalSpaceControllerCfg
+from isaaclab.utils.math import random_orientation
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the high-throughput mode of the operational space controller.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[4096, 16384, 65536], help="Number of environments to benchmark."
+)
+parser.add_argument("--num_dofs", type=int, default=7, help="Number of joints of the manipulator.")
+parser.add_argument("--num_steps", type=int, default=20, help="Number of timed calls for each configuration.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the benchmark on.")
+parser.add_argument("--num_threads", type=int, default=None, help="Number of threads used by PyTorch on the CPU.")
+args_cli = parser.parse_args()
+
+# controller configurations to benchmark
+CONTROLLER_CFGS = {
+    "pose_abs": OperationalSpaceControllerCfg(
+        target_types=["pose_abs"],
+        impedance_mode="fixed",
+        inertial_dynamics_decoupling=False,
+        gravity_compensation=False,
+    ),
+    "pose_abs_decoupling": OperationalSpaceControllerCfg(
+        target_types=["pose_abs"],
+        impedance_mode="fixed",
+        inertial_dynamics_decoupling=True,
+        gravity_compensation=True,
+    ),
+    "pose_abs_partial_decoupling_nullspace": OperationalSpaceControllerCfg(
+        target_types=["pose_abs"],
+        impedance_mode="variable_kp",
+        inertial_dynamics_decoupling=True,
+        partial_inertial_dynamics_decoupling=True,
+        nullspace_control="position",
+    ),
+    "hybrid_decoupling_nullspace": OperationalSpaceControllerCfg(
+        target_types=["pose_abs", "wrench_abs"],
+        impedance_mode="fixed",
+        inertial_dynamics_decoupling=True,
+        gravity_compensation=True,
+        contact_wrench_stiffness_task=[0.0, 0.0, 0.1, 0.0, 0.0, 0.0],
+        motion_control_axes_task=[1, 1, 0, 1, 1, 1],
+        contact_wrench_control_axes_task=[0, 0, 1, 0, 0, 0],
+        nullspace_control="position",
+    ),
+}
+
+
+def benchmark_controller(cfg: OperationalSpaceControllerCfg, num_envs: int, high_throughput_mode: bool) -> float:
+    """Benchmark the computation of the joint efforts of the controller.
+
+    Args:
+        cfg: The configuration of the controller.
+        num_envs: The number of environments.
+        high_throughput_mode: Whether to use the high-throughput mode of the controller.
+
+    Returns:
+        The mean time per call (in ms).
+    """
+    device = args_cli.device
+    num_dofs = args_cli.num_dofs
+    # create the controller
+    cfg = cfg.replace(high_throughput_mode=high_throughput_mode)
+    osc = OperationalSpaceController(cfg, num_envs=num_envs, device=device)
+    # create random commands
+    commands = []
+    for target_type in cfg.target_types:
+        if target_type == "pose_abs":
+            commands += [torch.rand(num_envs, 3, device=device), random_orientation(num_envs, device)]
+        else:
+            commands.append(torch.rand(num_envs, 6, device=device))
+    if cfg.impedance_mode == "variable_kp":
+        commands.append(100.0 * torch.rand(num_envs, 6, device=device))
+    osc.set_command(torch.cat(commands, dim=-1))
+    # create random robot state with a symmetric positive-definite mass matrix
+    mass_matrix = torch.randn(num_envs, num_dofs, num_dofs, device=device)
+    mass_matrix = mass_matrix @ mass_matrix.mT + num_dofs * torch.eye(num_dofs, device=device)
+    inputs = {
+        "jacobian_b": torch.randn(num_envs, 6, num_dofs, device=device),
+        "current_ee_pose_b": torch.cat(
+            [torch.rand(num_envs, 3, device=device), random_orientation(num_envs, device)], dim=-1
+        ),
+        "current_ee_vel_b": torch.randn(num_envs, 6, device=device),
+        "current_ee_force_b": torch.randn(num_envs, 3, device=device),
+        "mass_matrix": mass_matrix,
+        "gravity": torch.randn(num_envs, num_dofs, device=device),
+        "current_joint_pos": torch.randn(num_envs, num_dofs, device=device),
+        "current_joint_vel": torch.randn(num_envs, num_dofs, device=device),
+    }
+    # warm-up
+    for _ in range(2):
+        osc.compute(**inputs)
+    # time the calls
+    _synchronize()
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        osc.compute(**inputs)
+    _synchronize()
+    return (time.perf_counter() - start_time) / args_cli.num_steps * 1000.0
+
+
+def _synchronize():
+    """Wait for all the kernels on the device to finish."""
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize(args_cli.device)
+
+
+def main():
+    """Run the benchmark."""
+    if args_cli.num_threads is not None:
+        torch.set_num_threads(args_cli.num_threads)
+    # create the table
+    table = PrettyTable(["Configuration", "Num. envs", "Default (ms)", "High-throughput (ms)", "Speed-up"])
+    table.title = f"Operational space controller with {args_cli.num_dofs} DoFs on '{args_cli.device}'"
+    table.align = "r"
+    table.align["Configuration"] = "l"
+    # run the benchmarks
+    for name, cfg in CONTROLLER_CFGS.items():
+        for num_envs in args_cli.num_envs:
+            default_time = benchmark_controller(cfg, num_envs, high_throughput_mode=False)
+            high_throughput_time = benchmark_controller(cfg, num_envs, high_throughput_mode=True)
+            table.add_row([
+                name,
+                num_envs,
+                f"{default_time:.3f}",
+                f"{high_throughput_time:.3f}",
+                f"{default_time / high_throughput_time:.2f}x",
+            ])
+            print(f"[INFO] Finished benchmark for '{name}' with {num_envs} environments.")
+    # print the results
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
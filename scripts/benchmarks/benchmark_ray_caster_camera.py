@@ -0,0 +1,145 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the ray-casting of the ray-caster camera against a rough terrain.
+
+The fused kernel of :func:`~isaaclab.utils.warp.raycast_camera` is compared to the previous implementation of the
+camera update, which ray-casts with :func:`~isaaclab.utils.warp.raycast_mesh` and post-processes the depths in
+separate passes. The benchmark does not require the simulator.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_ray_caster_camera.py --num_cameras 1024 --height 128 --width 128
+
+"""
+
+import argparse
+import torch
+from prettytable import PrettyTable
+
+# note: the package replaces the Omniverse packages when the application is not running
+from simulator_free.suites import measure
+
+import isaaclab.utils.math as math_utils
+from isaaclab.sensors.ray_caster import patterns
+from isaaclab.terrains import TerrainGenerator
+from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from isaaclab.utils.warp import convert_to_warp_mesh, raycast_camera, raycast_mesh
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the ray-casting of the ray-caster camera.")
+parser.add_argument("--num_cameras", type=int, default=1024, help="Number of cameras.")
+parser.add_argument("--height", type=int, default=128, help="Height of the images.")
+parser.add_argument("--width", type=int, default=128, help="Width of the images.")
+parser.add_argument("--num_iterations", type=int, default=5, help="Number of timed iterations of each benchmark.")
+parser.add_argument("--device", type=str, default="cuda:0" if torch.cuda.is_available() else "cpu", help="Device.")
+args_cli = parser.parse_args()
+
+DATA_TYPES = ["distance_to_image_plane", "distance_to_camera", "normals"]
+"""Data types of the camera images."""
+
+MAX_DISTANCE = 10.0
+"""Maximum distance of the depths."""
+
+
+def raycast_camera_unfused(
+    mesh, ray_starts, ray_directions, pos_w, quat_w, output: dict[str, torch.Tensor]
+) -> torch.Tensor:
+    """Ray-cast with the previous implementation of :meth:`RayCasterCamera._update_buffers_impl`."""
+    num_rays = ray_directions.shape[1]
+    image_shape = output["distance_to_camera"].shape[1:3]
+    ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, num_rays), ray_starts)
+    ray_starts_w += pos_w.unsqueeze(1)
+    ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, num_rays), ray_directions)
+    ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
+        ray_starts_w, ray_directions_w, mesh=mesh, max_dist=1e6, return_distance=True, return_normal=True
+    )
+    # distance to image plane
+    distance_to_image_plane = (
+        math_utils.quat_apply(
+            math_utils.quat_inv(quat_w).repeat(1, num_rays), (ray_depth[:, :, None] * ray_directions_w)
+        )
+    )[:, :, 0]
+    distance_to_image_plane = torch.clip(distance_to_image_plane, max=MAX_DISTANCE)
+    distance_to_image_plane[torch.isnan(distance_to_image_plane)] = MAX_DISTANCE
+    output["distance_to_image_plane"][:] = distance_to_image_plane.view(-1, *image_shape, 1)
+    # distance to camera
+    ray_depth = torch.clip(ray_depth, max=MAX_DISTANCE)
+    output["distance_to_camera"][:] = ray_depth.view(-1, *image_shape, 1)
+    # normals
+    output["normals"][:] = ray_normal.view(-1, *image_shape, 3)
+    return ray_hits_w
+
+
+def main():
+    """Run the benchmarks."""
+    device = args_cli.device
+    # create the terrain
+    terrain_cfg = ROUGH_TERRAINS_CFG.replace(num_rows=4, num_cols=4, use_cache=False, seed=0)
+    terrain_mesh = TerrainGenerator(terrain_cfg, device="cpu").terrain_mesh
+    mesh = convert_to_warp_mesh(terrain_mesh.vertices, terrain_mesh.faces, device=device)
+
+    # create the rays of the cameras
+    pattern_cfg = patterns.PinholeCameraPatternCfg(height=args_cli.height, width=args_cli.width)
+    f_x = pattern_cfg.width * pattern_cfg.focal_length / pattern_cfg.horizontal_aperture
+    intrinsic_matrices = torch.tensor(
+        [[f_x, 0.0, pattern_cfg.width / 2], [0.0, f_x, pattern_cfg.height / 2], [0.0, 0.0, 1.0]], device=device
+    ).repeat(args_cli.num_cameras, 1, 1)
+    ray_starts, ray_directions = pattern_cfg.func(pattern_cfg, intrinsic_matrices, device)
+    ray_starts, ray_directions = ray_starts.contiguous(), ray_directions.contiguous()
+    # place the cameras above the terrain and look down
+    pos_w = torch.rand(args_cli.num_cameras, 3, device=device) * torch.tensor([32.0, 32.0, 1.0], device=device)
+    pos_w += torch.tensor([-16.0, -16.0, 1.5], device=device)
+    quat_w = math_utils.quat_from_euler_xyz(
+        torch.zeros(args_cli.num_cameras, device=device),
+        torch.full((args_cli.num_cameras,), 0.5, device=device),
+        torch.rand(args_cli.num_cameras, device=device) * 2 * torch.pi,
+    )
+    ray_hits_w = torch.zeros_like(ray_directions)
+
+    table = PrettyTable(["Benchmark", "Mean (ms)", "Std (ms)", "Min (ms)"])
+    table.title = (
+        f"Ray-caster camera: {args_cli.num_cameras} cameras of {args_cli.height}x{args_cli.width} on '{device}'"
+    )
+    table.align = "r"
+    table.align["Benchmark"] = "l"
+    for name, dtype in [("unfused", torch.float32), ("fused", torch.float32), ("fused (float16)", torch.float16)]:
+        # create the output buffers of the camera
+        output = {
+            data_type: torch.zeros(
+                args_cli.num_cameras,
+                args_cli.height,
+                args_cli.width,
+                3 if data_type == "normals" else 1,
+                dtype=dtype,
+                device=device,
+            )
+            for data_type in DATA_TYPES
+        }
+        if name == "unfused":
+            func = lambda: raycast_camera_unfused(mesh, ray_starts, ray_directions, pos_w, quat_w, output)  # noqa: E731
+        else:
+            func = lambda: raycast_camera(  # noqa: E731
+                mesh,
+                ray_starts,
+                ray_directions,
+                pos_w,
+                quat_w,
+                ray_hits_w,
+                distance_to_image_plane=output["distance_to_image_plane"],
+                distance_to_camera=output["distance_to_camera"],
+                normals=output["normals"],
+                max_distance=MAX_DISTANCE,
+                depth_clipping_behavior="max",
+            )
+        result = measure(name, func, args_cli.num_cameras, args_cli.num_iterations, device, num_warmup=1)
+        table.add_row([name, f"{result.mean_ms:.3f}", f"{result.std_ms:.3f}", f"{result.min_ms:.3f}"])
+    print(table)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
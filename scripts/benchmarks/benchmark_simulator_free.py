@@ -0,0 +1,126 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the managers, buffers, math utilities and terrain generation without the simulator.
+
+The environment runs on mock PhysX views that return synthetic data (see the :mod:`simulator_free` package), so
+the benchmarks measure the overhead of Isaac Lab itself and can run on machines without Isaac Sim, for example in
+continuous integration. The benchmarks are run for each number of environments and the results are saved to a JSON
+file that can be compared with the results of another commit.
+
+.. code-block:: bash
+
+    # Usage
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_simulator_free.py --num_envs 64 1024 --output results.json
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_simulator_free.py --num_envs 64 1024 --compare results.json
+
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import torch
+from prettytable import PrettyTable
+
+# note: the package replaces the Omniverse packages when the application is not running
+from simulator_free.suites import SUITES
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark Isaac Lab without the simulator.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[64, 1024], help="Numbers of environments.")
+parser.add_argument("--num_iterations", type=int, default=50, help="Number of timed iterations of each benchmark.")
+parser.add_argument(
+    "--suites", type=str, nargs="+", default=list(SUITES), choices=list(SUITES), help="Names of the suites to run."
+)
+parser.add_argument("--device", type=str, default="cuda:0" if torch.cuda.is_available() else "cpu", help="Device.")
+parser.add_argument("--output", type=str, default=None, help="Path to a JSON file to which the results are saved.")
+parser.add_argument("--compare", type=str, default=None, help="Path to a JSON file with the results to compare to.")
+parser.add_argument(
+    "--tolerance", type=float, default=0.1, help="Allowed relative increase of the times over the compared results."
+)
+args_cli = parser.parse_args()
+
+
+def get_git_commit() -> str | None:
+    """Get the hash of the current commit of the repository."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def main():
+    """Run the benchmarks."""
+    # load the results to compare to
+    reference = dict()
+    if args_cli.compare is not None:
+        with open(args_cli.compare) as f:
+            reference = {result["key"]: result for result in json.load(f)["results"]}
+
+    # run the suites
+    results = list()
+    for suite in args_cli.suites:
+        for num_envs in args_cli.num_envs:
+            print(f"[INFO] Running the suite '{suite}' with {num_envs} environments...")
+            results += SUITES[suite](num_envs, args_cli.num_iterations, args_cli.device)
+
+    # create the table
+    table = PrettyTable(["Benchmark", "Envs", "Mean (ms)", "Std (ms)", "Min (ms)", "Reference (ms)", "Change"])
+    table.title = f"Simulator-free benchmarks on '{args_cli.device}'"
+    table.align = "r"
+    table.align["Benchmark"] = "l"
+    regressions = list()
+    for result in results:
+        reference_result = reference.get(result.key)
+        change = "-"
+        if reference_result is not None:
+            # compare the minimum times since they are the least affected by the noise of the machine
+            relative_change = result.min_ms / reference_result["min_ms"] - 1.0
+            change = f"{relative_change:+.1%}"
+            if relative_change > args_cli.tolerance:
+                regressions.append(f"{result.key}: {result.min_ms:.3f} ms > {reference_result['min_ms']:.3f} ms")
+        table.add_row([
+            result.name,
+            "-" if result.num_envs is None else result.num_envs,
+            f"{result.mean_ms:.3f}",
+            f"{result.std_ms:.3f}",
+            f"{result.min_ms:.3f}",
+            "-" if reference_result is None else f"{reference_result['min_ms']:.3f}",
+            change,
+        ])
+    print(table)
+
+    # save the results
+    if args_cli.output is not None:
+        output = {
+            "metadata": {
+                "git_commit": get_git_commit(),
+                "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                "device": args_cli.device,
+                "device_name": torch.cuda.get_device_name(args_cli.device) if "cuda" in args_cli.device else None,
+                "platform": platform.platform(),
+                "python_version": platform.python_version(),
+                "torch_version": torch.__version__,
+                "num_iterations": args_cli.num_iterations,
+            },
+            "results": [{"key": result.key, **result.to_dict()} for result in results],
+        }
+        with open(args_cli.output, "w") as f:
+            json.dump(output, f, indent=4)
+        print(f"[INFO] Saved the results to: {args_cli.output}")
+    # report the regressions
+    for regression in regressions:
+        print(f"[ERROR] Regression of {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,18 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmarks of Isaac Lab that run without the simulator.
+
+The package provides mock PhysX views and a mock simulation context that produce synthetic data, so that the
+managers, MDP terms, buffers, math utilities and terrain generation of Isaac Lab can be benchmarked on machines
+without Isaac Sim. The Omniverse packages are replaced with placeholder modules when the application is not running.
+
+Note:
+    The package must be imported before any module of Isaac Lab.
+"""
+
+from .placeholders import install_placeholder_modules
+
+install_placeholder_modules()
@@ -0,0 +1,297 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Manager-based environment that runs on the mock simulation.
+
+The environment is the :class:`~isaaclab.envs.ManagerBasedRLEnv` class of Isaac Lab. Only the simulation context,
+the interactive scene and the functions that query the USD stage and create the PhysX views are replaced with their
+mock counterparts, so that the assets, sensors, managers and MDP terms of Isaac Lab run unchanged.
+"""
+
+from __future__ import annotations
+
+import builtins
+import contextlib
+import enum
+import functools
+import math
+import sys
+import torch
+from collections.abc import Callable, Iterator
+from unittest import mock
+
+import isaaclab.sim as sim_utils
+from isaaclab.envs import ManagerBasedRLEnv, ManagerBasedRLEnvCfg
+from isaaclab.scene import InteractiveScene, InteractiveSceneCfg
+from isaaclab.sim import SimulationCfg
+
+from .mock_physx import MockArticulationCfg, MockRigidObjectCfg, MockSimulationView, MockStage
+
+
+class MockTimelineEventType(enum.IntEnum):
+    """Types of the timeline events that are used by Isaac Lab."""
+
+    PLAY = 0
+    STOP = 1
+
+
+class MockTimeline:
+    """Mock of the timeline interface and its event stream.
+
+    The assets, sensors and managers subscribe to the play event of the timeline to initialize themselves once the
+    simulation starts. The subscriptions are called in their order when the simulation is reset.
+    """
+
+    def __init__(self):
+        self._subscriptions: list[MockTimelineSubscription] = list()
+
+    def get_timeline_event_stream(self) -> MockTimeline:
+        return self
+
+    def create_subscription_to_pop_by_type(
+        self, event_type: int, callback: Callable, order: int = 0, name: str | None = None
+    ) -> MockTimelineSubscription:
+        subscription = MockTimelineSubscription(self, event_type, callback, order)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def dispatch(self, event_type: int):
+        """Call the subscriptions to the given type of event in their order."""
+        for subscription in sorted(self._subscriptions, key=lambda subscription: subscription.order):
+            if subscription.event_type == event_type:
+                # note: the subscriber may have been deleted
+                with contextlib.suppress(ReferenceError):
+                    subscription.callback(None)
+
+    def clear(self):
+        self._subscriptions.clear()
+
+
+class MockTimelineSubscription:
+    """Subscription to the events of the :class:`MockTimeline`."""
+
+    def __init__(self, timeline: MockTimeline, event_type: int, callback: Callable, order: int):
+        self.timeline = timeline
+        self.event_type = event_type
+        self.callback = callback
+        self.order = order
+
+    def unsubscribe(self):
+        if self in self.timeline._subscriptions:
+            self.timeline._subscriptions.remove(self)
+
+
+class MockSimulationContext:
+    """Mock of the simulation context that steps the mock PhysX views.
+
+    The simulation is never rendered. Resetting the simulation starts playing the timeline, which initializes the
+    assets, sensors and managers. Stepping the simulation advances the state of the views that are created by the
+    :attr:`physics_sim_view`.
+    """
+
+    RenderMode = sim_utils.SimulationContext.RenderMode
+    """Different rendering modes for the simulation."""
+
+    _instance: MockSimulationContext | None = None
+
+    def __init__(self, cfg: SimulationCfg | None = None):
+        self.cfg = SimulationCfg() if cfg is None else cfg
+        self.device = self.cfg.device
+        self.backend = "torch"
+        self.render_mode = self.RenderMode.NO_GUI_OR_RENDERING
+        self.stage = MockStage()
+        self.timeline = MockTimeline()
+        self.physics_sim_view = MockSimulationView(self.stage, self.device, self.cfg.gravity)
+        self._is_playing = False
+        MockSimulationContext._instance = self
+
+    @classmethod
+    def instance(cls) -> MockSimulationContext | None:
+        return cls._instance
+
+    @classmethod
+    def clear_instance(cls):
+        cls._instance = None
+
+    def clear_all_callbacks(self):
+        self.timeline.clear()
+
+    def get_physics_dt(self) -> float:
+        return self.cfg.dt
+
+    def is_playing(self) -> bool:
+        return self._is_playing
+
+    def is_stopped(self) -> bool:
+        return not self._is_playing
+
+    def has_gui(self) -> bool:
+        return False
+
+    def has_rtx_sensors(self) -> bool:
+        return False
+
+    def reset(self, soft: bool = False):
+        if not self._is_playing:
+            self._is_playing = True
+            self.timeline.dispatch(MockTimelineEventType.PLAY)
+
+    def step(self, render: bool = True):
+        self.physics_sim_view.simulate(self.cfg.dt)
+
+    def forward(self):
+        pass
+
+    def render(self, mode=None):
+        pass
+
+
+class MockInteractiveScene(InteractiveScene):
+    """Interactive scene whose entities are defined on the mock stage.
+
+    Instead of spawning the entities on a USD stage, the prims of the entities are defined on the
+    :class:`MockStage` from the mock configurations. The environments are placed on a grid.
+
+    Note:
+        Terrains are not supported since they require the USD stage.
+    """
+
+    def __init__(self, cfg: InteractiveSceneCfg, mock_assets: dict[str, MockArticulationCfg | MockRigidObjectCfg]):
+        """Initializes the scene.
+
+        Args:
+            cfg: The configuration class for the scene.
+            mock_assets: The mock configurations of the assets in the scene, keyed by their name in the scene.
+        """
+        # check that the config is valid
+        cfg.validate()
+        # store inputs
+        self.cfg = cfg
+        # initialize scene elements
+        self._terrain = None
+        self._articulations = dict()
+        self._deformable_objects = dict()
+        self._rigid_objects = dict()
+        self._rigid_object_collections = dict()
+        self._sensors = dict()
+        self._extras = dict()
+        self._global_prim_paths = list()
+        self._physics_scene_path = "/physicsScene"
+        self.cloner = None
+        # obtain the mock stage
+        sim = MockSimulationContext.instance()
+        self.stage = sim.stage
+        # define the environments on a grid
+        self.env_prim_paths = [f"{self.env_ns}/env_{index}" for index in range(self.num_envs)]
+        for prim_path in self.env_prim_paths:
+            self.stage.define_prim(prim_path)
+        num_rows = math.ceil(math.sqrt(self.num_envs))
+        num_cols = math.ceil(self.num_envs / num_rows)
+        rows, cols = torch.meshgrid(torch.arange(num_rows), torch.arange(num_cols), indexing="ij")
+        self._default_env_origins = torch.zeros(self.num_envs, 3, device=self.device)
+        self._default_env_origins[:, 0] = (rows.flatten()[: self.num_envs] - (num_rows - 1) / 2) * cfg.env_spacing
+        self._default_env_origins[:, 1] = (cols.flatten()[: self.num_envs] - (num_cols - 1) / 2) * cfg.env_spacing
+        # define the prims of the assets
+        for asset_name, mock_cfg in mock_assets.items():
+            asset_cfg = getattr(self.cfg, asset_name)
+            asset_cfg.spawn = None
+            prim_path = asset_cfg.prim_path.format(ENV_REGEX_NS=self.env_regex_ns)
+            self.stage.define_asset(prim_path, self.num_envs, mock_cfg)
+        # add entities from config
+        self._add_entities_from_cfg()
+
+
+@contextlib.contextmanager
+def mock_simulation(mock_assets: dict[str, MockArticulationCfg | MockRigidObjectCfg]) -> Iterator[None]:
+    """Context manager that replaces the simulation of Isaac Lab with the mock simulation.
+
+    Args:
+        mock_assets: The mock configurations of the assets in the scene, keyed by their name in the scene.
+    """
+
+    def get_stage() -> MockStage:
+        return MockSimulationContext.instance().stage
+
+    def get_timeline_interface() -> MockTimeline:
+        return MockSimulationContext.instance().timeline
+
+    with contextlib.ExitStack() as stack:
+        patches = [
+            mock.patch.object(builtins, "ISAAC_LAUNCHED_FROM_TERMINAL", False, create=True),
+            # simulation context and scene created by the environment
+            mock.patch("isaaclab.envs.manager_based_env.SimulationContext", MockSimulationContext),
+            mock.patch(
+                "isaaclab.envs.manager_based_env.InteractiveScene",
+                functools.partial(MockInteractiveScene, mock_assets=mock_assets),
+            ),
+            # simulation context used by the assets and sensors
+            mock.patch.object(sim_utils.SimulationContext, "instance", MockSimulationContext.instance, create=True),
+            # timeline events that initialize the assets, sensors and managers
+            mock.patch.object(sys.modules["omni.timeline"], "get_timeline_interface", get_timeline_interface),
+            mock.patch.object(sys.modules["omni.timeline"], "TimelineEventType", MockTimelineEventType),
+            # queries of the USD stage
+            mock.patch.object(sim_utils, "find_matching_prims", lambda expr: get_stage().find_matching_prims(expr)),
+            mock.patch.object(
+                sim_utils, "find_matching_prim_paths", lambda expr: get_stage().find_matching_prim_paths(expr)
+            ),
+            mock.patch.object(
+                sim_utils, "find_first_matching_prim", lambda expr: get_stage().find_first_matching_prim(expr)
+            ),
+            mock.patch.object(
+                sim_utils,
+                "get_all_matching_child_prims",
+                lambda path, predicate=lambda _: True, **kwargs: get_stage().get_all_matching_child_prims(
+                    path, predicate
+                ),
+            ),
+            # creation of the PhysX views
+            mock.patch.object(
+                sys.modules["omni.physics.tensors.impl.api"],
+                "create_simulation_view",
+                lambda backend: MockSimulationContext.instance().physics_sim_view,
+                create=True,
+            ),
+        ]
+        for patch in patches:
+            stack.enter_context(patch)
+        try:
+            yield
+        finally:
+            MockSimulationContext.clear_instance()
+
+
+class MockManagerBasedRLEnv(ManagerBasedRLEnv):
+    """Manager-based RL environment that runs on the mock simulation.
+
+    The mock simulation is active from the creation of the environment until it is closed. Only one environment
+    can exist at a time.
+    """
+
+    def __init__(
+        self,
+        cfg: ManagerBasedRLEnvCfg,
+        mock_assets: dict[str, MockArticulationCfg | MockRigidObjectCfg],
+        render_mode: str | None = None,
+        **kwargs,
+    ):
+        """Initialize the environment.
+
+        Args:
+            cfg: The configuration for the environment.
+            mock_assets: The mock configurations of the assets in the scene, keyed by their name in the scene.
+            render_mode: The render mode for the environment. Defaults to None.
+        """
+        self._mock_simulation = contextlib.ExitStack()
+        self._mock_simulation.enter_context(mock_simulation(mock_assets))
+        try:
+            super().__init__(cfg, render_mode=render_mode, **kwargs)
+        except Exception:
+            self._mock_simulation.close()
+            raise
+
+    def close(self):
+        if not self._is_closed:
+            super().close()
+            self._mock_simulation.close()
@@ -0,0 +1,455 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Mock implementations of the USD stage and the PhysX tensor views.
+
+The views mirror the interface of the ``omni.physics.tensors`` views that is used by the assets and sensors of
+Isaac Lab. Their state tensors are stored on the simulation device and are advanced by a simple first-order
+integration in :meth:`MockSimulationView.simulate`, so that the data returned by the views changes over time.
+Contact forces are synthetic: each body alternates between contact and swing phases.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import torch
+from collections.abc import Callable
+from dataclasses import MISSING
+from types import SimpleNamespace
+
+from isaaclab.utils import configclass
+
+
+@configclass
+class MockArticulationCfg:
+    """Configuration of a mock articulation."""
+
+    joint_names: list[str] = MISSING
+    """Names of the joints (degrees of freedom) of the articulation."""
+
+    body_names: list[str] = MISSING
+    """Names of the bodies (links) of the articulation. The first body is the root body."""
+
+    fixed_base: bool = False
+    """Whether the articulation is fixed-base. Defaults to False."""
+
+    joint_pos_limits: tuple[float, float] = (-math.pi, math.pi)
+    """Position limits of the joints. Defaults to (-pi, pi)."""
+
+    joint_vel_limit: float = 20.0
+    """Velocity limit of the joints. Defaults to 20.0."""
+
+    joint_effort_limit: float = 80.0
+    """Effort limit of the joints. Defaults to 80.0."""
+
+    body_mass: float = 1.0
+    """Mass of each body. Defaults to 1.0."""
+
+
+@configclass
+class MockRigidObjectCfg:
+    """Configuration of a mock rigid object."""
+
+    mass: float = 1.0
+    """Mass of the rigid body. Defaults to 1.0."""
+
+
+def _set_property(buffer: torch.Tensor, data: torch.Tensor, indices: torch.Tensor):
+    """Write the data of the given indices into a property buffer, which is stored on the CPU."""
+    indices = indices.cpu()
+    buffer[indices] = data.cpu()[indices]
+
+
+class MockPrim:
+    """Mock of a USD prim with the applied physics APIs."""
+
+    def __init__(self, path: str, apis: set[str], cfg: MockArticulationCfg | MockRigidObjectCfg | None = None):
+        self.path = path
+        self.apis = apis
+        self.cfg = cfg
+
+    def GetPath(self) -> SimpleNamespace:
+        return SimpleNamespace(pathString=self.path)
+
+    def HasAPI(self, api) -> bool:
+        # note: the API is a class of the USD schemas or a placeholder, so it is identified by its name
+        return getattr(api, "__name__", str(api)) in self.apis
+
+    def GetAttribute(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(Get=lambda: None)
+
+    def __repr__(self) -> str:
+        return f"MockPrim('{self.path}')"
+
+
+class MockStage:
+    """Mock of a USD stage that stores the prims of the environments."""
+
+    def __init__(self):
+        self._prims: dict[str, MockPrim] = dict()
+
+    def define_prim(self, path: str, apis: set[str] | None = None, cfg=None) -> MockPrim:
+        """Define a prim at the given path."""
+        self._prims[path] = MockPrim(path, apis or set(), cfg)
+        return self._prims[path]
+
+    def define_asset(self, prim_path_expr: str, num_envs: int, cfg: MockArticulationCfg | MockRigidObjectCfg):
+        """Define the prims of an asset in all environments.
+
+        Args:
+            prim_path_expr: The prim path expression of the asset with ``env_.*`` for the environment index.
+            num_envs: The number of environments.
+            cfg: The configuration of the asset.
+        """
+        for env_index in range(num_envs):
+            prim_path = prim_path_expr.replace("env_.*", f"env_{env_index}")
+            parent_path = prim_path.rsplit("/", 1)[0]
+            if parent_path not in self._prims:
+                self.define_prim(parent_path)
+            if isinstance(cfg, MockArticulationCfg):
+                self.define_prim(prim_path, {"ArticulationRootAPI"}, cfg)
+                for body_name in cfg.body_names:
+                    self.define_prim(f"{prim_path}/{body_name}", {"RigidBodyAPI", "PhysxContactReportAPI"})
+            else:
+                self.define_prim(prim_path, {"RigidBodyAPI", "PhysxContactReportAPI"}, cfg)
+
+    def find_matching_prims(self, prim_path_regex: str) -> list[MockPrim]:
+        pattern = re.compile(prim_path_regex)
+        return [prim for path, prim in self._prims.items() if pattern.fullmatch(path)]
+
+    def find_matching_prim_paths(self, prim_path_regex: str) -> list[str]:
+        return [prim.path for prim in self.find_matching_prims(prim_path_regex)]
+
+    def find_first_matching_prim(self, prim_path_regex: str) -> MockPrim | None:
+        pattern = re.compile(prim_path_regex)
+        return next((prim for path, prim in self._prims.items() if pattern.fullmatch(path)), None)
+
+    def get_all_matching_child_prims(
+        self, prim_path: str, predicate: Callable[[MockPrim], bool] = lambda _: True, depth: int | None = None
+    ) -> list[MockPrim]:
+        prims = [prim for path, prim in self._prims.items() if path == prim_path or path.startswith(prim_path + "/")]
+        if depth is not None:
+            prims = [prim for prim in prims if prim.path[len(prim_path) :].count("/") <= depth]
+        return [prim for prim in prims if predicate(prim)]
+
+
+class MockSimulationView:
+    """Mock of the PhysX simulation view that creates the views and advances their state."""
+
+    def __init__(self, stage: MockStage, device: str, gravity: tuple[float, float, float] = (0.0, 0.0, -9.81)):
+        self.stage = stage
+        self.device = device
+        self.gravity = gravity
+        self.time = 0.0
+        self._views = list()
+
+    def set_subspace_roots(self, root: str):
+        pass
+
+    def get_gravity(self) -> tuple[float, float, float]:
+        return self.gravity
+
+    def update_articulations_kinematic(self):
+        pass
+
+    def create_articulation_view(self, pattern: str) -> MockArticulationView:
+        prims = self._find_prims(pattern, "ArticulationRootAPI")
+        return self._add_view(MockArticulationView(self, prims))
+
+    def create_rigid_body_view(self, pattern: str) -> MockRigidBodyView:
+        prims = self._find_prims(pattern, "RigidBodyAPI")
+        return self._add_view(MockRigidBodyView(self, prims))
+
+    def create_rigid_contact_view(
+        self, pattern: str, filter_patterns: list[str] | None = None, max_contact_data_count: int = 0
+    ) -> MockRigidContactView:
+        prims = self._find_prims(pattern, "PhysxContactReportAPI")
+        return MockRigidContactView(self, prims, len(filter_patterns or []))
+
+    def simulate(self, dt: float):
+        """Advance the state of all the views by one physics step."""
+        self.time += dt
+        for view in self._views:
+            view.simulate(dt)
+
+    def _find_prims(self, pattern: str, api: str) -> list[MockPrim]:
+        # convert the glob expression of PhysX back into a regular expression
+        prims = self.stage.find_matching_prims(pattern.replace(".*", "*").replace("*", ".*"))
+        if len(prims) == 0 or any(api not in prim.apis for prim in prims):
+            raise RuntimeError(f"Failed to find prims with '{api}' for the expression: '{pattern}'.")
+        return prims
+
+    def _add_view(self, view):
+        self._views.append(view)
+        return view
+
+
+class MockArticulationView:
+    """Mock of the PhysX articulation view."""
+
+    def __init__(self, sim_view: MockSimulationView, prims: list[MockPrim]):
+        cfg: MockArticulationCfg = prims[0].cfg
+        self._backend = "torch"
+        self._device = sim_view.device
+        self.count = len(prims)
+        self.prim_paths = [prim.path for prim in prims]
+        self.dof_paths = [[f"{path}/{name}" for name in cfg.joint_names] for path in self.prim_paths]
+        self.link_paths = [[f"{path}/{name}" for name in cfg.body_names] for path in self.prim_paths]
+        self.max_fixed_tendons = 0
+        self.shared_metatype = SimpleNamespace(
+            dof_count=len(cfg.joint_names),
+            link_count=len(cfg.body_names),
+            dof_names=list(cfg.joint_names),
+            link_names=list(cfg.body_names),
+            fixed_base=cfg.fixed_base,
+        )
+        num_dofs, num_links = len(cfg.joint_names), len(cfg.body_names)
+        # -- state (on the simulation device)
+        self._root_transforms = torch.zeros(self.count, 7, device=self._device)
+        self._root_transforms[:, 6] = 1.0
+        self._root_velocities = torch.zeros(self.count, 6, device=self._device)
+        self._link_offsets = torch.randn(num_links, 3, device=self._device) * 0.2
+        self._link_offsets[0] = 0.0
+        self._link_accelerations = torch.zeros(self.count, num_links, 6, device=self._device)
+        self._dof_positions = torch.zeros(self.count, num_dofs, device=self._device)
+        self._dof_velocities = torch.zeros_like(self._dof_positions)
+        self._dof_position_targets = torch.zeros_like(self._dof_positions)
+        self._dof_velocity_targets = torch.zeros_like(self._dof_positions)
+        self._dof_actuation_forces = torch.zeros_like(self._dof_positions)
+        # -- properties (on the CPU)
+        self._dof_limits = torch.tensor(cfg.joint_pos_limits).repeat(self.count, num_dofs, 1)
+        self._dof_stiffnesses = torch.zeros(self.count, num_dofs)
+        self._dof_dampings = torch.zeros(self.count, num_dofs)
+        self._dof_armatures = torch.zeros(self.count, num_dofs)
+        self._dof_friction_coefficients = torch.zeros(self.count, num_dofs)
+        self._dof_max_velocities = torch.full((self.count, num_dofs), cfg.joint_vel_limit)
+        self._dof_max_forces = torch.full((self.count, num_dofs), cfg.joint_effort_limit)
+        self._masses = torch.full((self.count, num_links), cfg.body_mass)
+        self._inertias = torch.eye(3).flatten().repeat(self.count, num_links, 1) * 0.01
+        self._coms = torch.tensor([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]).repeat(self.count, num_links, 1)
+        # gains of the simulated joint drives
+        self._drive_gains = torch.zeros(2, self.count, num_dofs, device=self._device)
+
+    """
+    State.
+    """
+
+    def get_root_transforms(self) -> torch.Tensor:
+        return self._root_transforms
+
+    def get_root_velocities(self) -> torch.Tensor:
+        return self._root_velocities
+
+    def get_link_transforms(self) -> torch.Tensor:
+        transforms = self._root_transforms.unsqueeze(1).repeat(1, self.shared_metatype.link_count, 1)
+        transforms[..., :3] += self._link_offsets
+        return transforms
+
+    def get_link_velocities(self) -> torch.Tensor:
+        return self._root_velocities.unsqueeze(1).repeat(1, self.shared_metatype.link_count, 1)
+
+    def get_link_accelerations(self) -> torch.Tensor:
+        return self._link_accelerations
+
+    def get_dof_positions(self) -> torch.Tensor:
+        return self._dof_positions
+
+    def get_dof_velocities(self) -> torch.Tensor:
+        return self._dof_velocities
+
+    def set_root_transforms(self, data: torch.Tensor, indices: torch.Tensor):
+        self._root_transforms[indices] = data[indices].to(self._device)
+
+    def set_root_velocities(self, data: torch.Tensor, indices: torch.Tensor):
+        self._root_velocities[indices] = data[indices].to(self._device)
+
+    def set_dof_positions(self, data: torch.Tensor, indices: torch.Tensor):
+        self._dof_positions[indices] = data[indices].to(self._device)
+
+    def set_dof_velocities(self, data: torch.Tensor, indices: torch.Tensor):
+        self._dof_velocities[indices] = data[indices].to(self._device)
+
+    def set_dof_position_targets(self, data: torch.Tensor, indices: torch.Tensor):
+        self._dof_position_targets[indices] = data[indices].to(self._device)
+
+    def set_dof_velocity_targets(self, data: torch.Tensor, indices: torch.Tensor):
+        self._dof_velocity_targets[indices] = data[indices].to(self._device)
+
+    def set_dof_actuation_forces(self, data: torch.Tensor, indices: torch.Tensor):
+        self._dof_actuation_forces[indices] = data[indices].to(self._device)
+
+    def apply_forces_and_torques_at_position(self, *args, **kwargs):
+        pass
+
+    """
+    Properties.
+    """
+
+    def get_dof_limits(self) -> torch.Tensor:
+        return self._dof_limits
+
+    def get_dof_stiffnesses(self) -> torch.Tensor:
+        return self._dof_stiffnesses
+
+    def get_dof_dampings(self) -> torch.Tensor:
+        return self._dof_dampings
+
+    def get_dof_armatures(self) -> torch.Tensor:
+        return self._dof_armatures
+
+    def get_dof_friction_coefficients(self) -> torch.Tensor:
+        return self._dof_friction_coefficients
+
+    def get_dof_max_velocities(self) -> torch.Tensor:
+        return self._dof_max_velocities
+
+    def get_dof_max_forces(self) -> torch.Tensor:
+        return self._dof_max_forces
+
+    def get_masses(self) -> torch.Tensor:
+        return self._masses
+
+    def get_inertias(self) -> torch.Tensor:
+        return self._inertias
+
+    def get_coms(self) -> torch.Tensor:
+        return self._coms
+
+    def set_dof_limits(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._dof_limits, data, indices)
+
+    def set_dof_stiffnesses(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._dof_stiffnesses, data, indices)
+        self._drive_gains[0] = self._dof_stiffnesses.to(self._device)
+
+    def set_dof_dampings(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._dof_dampings, data, indices)
+        self._drive_gains[1] = self._dof_dampings.to(self._device)
+
+    def set_dof_armatures(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._dof_armatures, data, indices)
+
+    def set_dof_friction_coefficients(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._dof_friction_coefficients, data, indices)
+
+    def set_dof_max_velocities(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._dof_max_velocities, data, indices)
+
+    def set_dof_max_forces(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._dof_max_forces, data, indices)
+
+    def set_masses(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._masses, data, indices)
+
+    def set_inertias(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._inertias, data, indices)
+
+    def set_coms(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._coms, data, indices)
+
+    """
+    Simulation.
+    """
+
+    def simulate(self, dt: float):
+        """Integrate the joint drives and the root velocities over one physics step."""
+        # joint drives: unit inertia with the simulated stiffness and damping
+        acceleration = self._dof_actuation_forces.clone()
+        acceleration += self._drive_gains[0] * (self._dof_position_targets - self._dof_positions)
+        acceleration += self._drive_gains[1] * (self._dof_velocity_targets - self._dof_velocities)
+        self._dof_velocities.add_(acceleration, alpha=dt).clamp_(-20.0, 20.0)
+        self._dof_positions.add_(self._dof_velocities, alpha=dt).clamp_(-math.pi, math.pi)
+        # root: damped free motion
+        if not self.shared_metatype.fixed_base:
+            self._root_velocities.mul_(0.99)
+            self._root_transforms[:, :3].add_(self._root_velocities[:, :3], alpha=dt)
+
+
+class MockRigidBodyView:
+    """Mock of the PhysX rigid body view."""
+
+    def __init__(self, sim_view: MockSimulationView, prims: list[MockPrim]):
+        mass = prims[0].cfg.mass if isinstance(prims[0].cfg, MockRigidObjectCfg) else 1.0
+        self._backend = "torch"
+        self._device = sim_view.device
+        self.count = len(prims)
+        self.prim_paths = [prim.path for prim in prims]
+        # -- state (on the simulation device)
+        self._transforms = torch.zeros(self.count, 7, device=self._device)
+        self._transforms[:, 6] = 1.0
+        self._velocities = torch.zeros(self.count, 6, device=self._device)
+        self._accelerations = torch.zeros(self.count, 6, device=self._device)
+        # -- properties (on the CPU)
+        self._masses = torch.full((self.count, 1), mass)
+        self._inertias = torch.eye(3).flatten().repeat(self.count, 1) * 0.01
+        self._coms = torch.tensor([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]).repeat(self.count, 1)
+
+    def get_transforms(self) -> torch.Tensor:
+        return self._transforms
+
+    def get_velocities(self) -> torch.Tensor:
+        return self._velocities
+
+    def get_accelerations(self) -> torch.Tensor:
+        return self._accelerations
+
+    def get_masses(self) -> torch.Tensor:
+        return self._masses
+
+    def get_inertias(self) -> torch.Tensor:
+        return self._inertias
+
+    def get_coms(self) -> torch.Tensor:
+        return self._coms
+
+    def set_transforms(self, data: torch.Tensor, indices: torch.Tensor):
+        self._transforms[indices] = data[indices].to(self._device)
+
+    def set_velocities(self, data: torch.Tensor, indices: torch.Tensor):
+        self._velocities[indices] = data[indices].to(self._device)
+
+    def set_masses(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._masses, data, indices)
+
+    def set_inertias(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._inertias, data, indices)
+
+    def set_coms(self, data: torch.Tensor, indices: torch.Tensor):
+        _set_property(self._coms, data, indices)
+
+    def apply_forces_and_torques_at_position(self, *args, **kwargs):
+        pass
+
+    def simulate(self, dt: float):
+        """Integrate the damped free motion of the bodies over one physics step."""
+        self._velocities.mul_(0.99)
+        self._transforms[:, :3].add_(self._velocities[:, :3], alpha=dt)
+
+
+class MockRigidContactView:
+    """Mock of the PhysX rigid contact view with synthetic contact forces.
+
+    Each body alternates between a contact phase, in which a vertical force is reported, and a swing phase
+    without contact. The phases of the bodies are randomly offset.
+    """
+
+    def __init__(self, sim_view: MockSimulationView, prims: list[MockPrim], filter_count: int):
+        self._sim_view = sim_view
+        self._device = sim_view.device
+        self.count = len(prims)
+        self.filter_count = filter_count
+        self.sensor_paths = [prim.path for prim in prims]
+        self._phase_offsets = torch.rand(self.count, device=self._device)
+
+    def get_net_contact_forces(self, dt: float) -> torch.Tensor:
+        in_contact = (self._sim_view.time * 2.0 + self._phase_offsets) % 1.0 < 0.5
+        forces = torch.zeros(self.count, 3, device=self._device)
+        forces[:, 2] = in_contact.float() * 50.0
+        return forces
+
+    def get_contact_force_matrix(self, dt: float) -> torch.Tensor:
+        forces = self.get_net_contact_forces(dt) / max(self.filter_count, 1)
+        return forces.unsqueeze(1).repeat(1, self.filter_count, 1)
@@ -0,0 +1,135 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Placeholder modules for the Omniverse packages.
+
+The modules of Isaac Lab import the Omniverse packages (``omni``, ``pxr``, ``carb``, ``isaacsim``) at the top,
+although the pure-Python and torch layers (managers, MDP terms, buffers, ...) do not use them at runtime. When the
+application is not running (for example, on CPU machines without Isaac Sim), the import finder in this module
+creates placeholder modules for them. Any attribute of a placeholder module is a :class:`Placeholder` object that
+accepts calls, attribute accesses and sub-classing, so that the modules of Isaac Lab can be imported.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import sys
+import types
+
+PLACEHOLDER_PACKAGES = ("carb", "isaacsim", "omni", "pxr", "usdrt")
+"""Names of the top-level packages that are replaced with placeholder modules."""
+
+
+class Placeholder:
+    """Placeholder for an attribute of a placeholder module.
+
+    The object behaves like a no-op: calling it or accessing its attributes returns new placeholders, it is
+    falsy and empty, converts to zero and can be used as a base class and as a decorator.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self.__name__ = name.rsplit(".", 1)[-1]
+
+    def __getattr__(self, name: str) -> Placeholder:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Placeholder(f"{self._name}.{name}")
+
+    def __call__(self, *args, **kwargs):
+        # pass-through when used as a decorator
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return args[0]
+        return Placeholder(f"{self._name}()")
+
+    def __mro_entries__(self, bases: tuple) -> tuple:
+        return (object,)
+
+    def __getitem__(self, key) -> Placeholder:
+        return Placeholder(f"{self._name}[]")
+
+    def __or__(self, other) -> Placeholder:
+        return self
+
+    def __ror__(self, other) -> Placeholder:
+        return self
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __int__(self) -> int:
+        return 0
+
+    def __index__(self) -> int:
+        return 0
+
+    def __float__(self) -> float:
+        return 0.0
+
+    def __enter__(self) -> Placeholder:
+        return self
+
+    def __exit__(self, *args) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"<placeholder '{self._name}'>"
+
+
+class PlaceholderModule(types.ModuleType):
+    """Module whose attributes are placeholders."""
+
+    def __getattr__(self, name: str) -> Placeholder:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = Placeholder(f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+
+class _PlaceholderFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import finder that creates placeholder modules for the Omniverse packages."""
+
+    def find_spec(self, fullname: str, path, target=None) -> importlib.machinery.ModuleSpec | None:
+        if fullname.split(".", 1)[0] in PLACEHOLDER_PACKAGES:
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> PlaceholderModule:
+        module = PlaceholderModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module: PlaceholderModule):
+        pass
+
+
+def install_placeholder_modules() -> bool:
+    """Install the import finder for the placeholder modules.
+
+    The finder is not installed if the Omniverse application is running, i.e. if the module ``omni.kit.app``
+    is already imported.
+
+    Returns:
+        True if the finder is installed, False otherwise.
+    """
+    # check if the application is running or the finder is installed
+    if "omni.kit.app" in sys.modules:
+        return False
+    if any(isinstance(finder, _PlaceholderFinder) for finder in sys.meta_path):
+        return True
+    # remove partially imported packages
+    for name in list(sys.modules):
+        if name.split(".", 1)[0] in PLACEHOLDER_PACKAGES:
+            del sys.modules[name]
+    sys.meta_path.insert(0, _PlaceholderFinder())
+    return True
@@ -0,0 +1,272 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark suites that run without the simulator.
+
+Each suite is a function that takes the number of environments, the number of iterations and the device, and
+returns a list of :class:`BenchmarkResult` objects. The suites are registered in :data:`SUITES`.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import torch
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+import isaaclab.utils.math as math_utils
+from isaaclab.sensors.camera.utils import create_batched_pointcloud_from_depth
+from isaaclab.terrains import TerrainGenerator
+from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from isaaclab.utils.buffers import CircularBuffer, DelayBuffer
+
+from .env_cfg import MOCK_ASSETS, LocomotionEnvCfg
+from .mock_env import MockManagerBasedRLEnv
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of a benchmark."""
+
+    name: str
+    """Name of the benchmark, prefixed with the name of the suite."""
+
+    num_envs: int | None
+    """Number of environments. None if the benchmark does not depend on it."""
+
+    mean_ms: float
+    """Mean time of an iteration (in ms)."""
+
+    std_ms: float
+    """Standard deviation of the time of an iteration (in ms)."""
+
+    min_ms: float
+    """Minimum time of an iteration (in ms)."""
+
+    num_iterations: int
+    """Number of timed iterations."""
+
+    @property
+    def key(self) -> str:
+        """Key that identifies the benchmark across runs."""
+        return self.name if self.num_envs is None else f"{self.name}@{self.num_envs}"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    num_envs: int | None,
+    num_iterations: int,
+    device: str,
+    num_warmup: int = 2,
+) -> BenchmarkResult:
+    """Measure the time of a function.
+
+    Args:
+        name: The name of the benchmark.
+        func: The function to measure. It is called without arguments.
+        num_envs: The number of environments. None if the benchmark does not depend on it.
+        num_iterations: The number of timed calls of the function.
+        device: The device on which the function runs. CUDA devices are synchronized around each call.
+        num_warmup: The number of calls before the timed calls. Defaults to 2.
+
+    Returns:
+        The timings of the function.
+    """
+    synchronize = torch.cuda.synchronize if "cuda" in device else lambda: None
+    for _ in range(num_warmup):
+        func()
+    times = list()
+    for _ in range(num_iterations):
+        synchronize()
+        start = time.perf_counter()
+        func()
+        synchronize()
+        times.append((time.perf_counter() - start) * 1e3)
+    return BenchmarkResult(
+        name=name,
+        num_envs=num_envs,
+        mean_ms=statistics.fmean(times),
+        std_ms=statistics.stdev(times) if len(times) > 1 else 0.0,
+        min_ms=min(times),
+        num_iterations=num_iterations,
+    )
+
+
+def benchmark_env(num_envs: int, num_iterations: int, device: str) -> list[BenchmarkResult]:
+    """Benchmark the stepping of the environment and the pipelines of its managers."""
+    env_cfg = LocomotionEnvCfg()
+    env_cfg.scene.num_envs = num_envs
+    env_cfg.sim.device = device
+    env = MockManagerBasedRLEnv(env_cfg, MOCK_ASSETS)
+    try:
+        env.reset()
+        actions = torch.zeros(num_envs, env.action_manager.total_action_dim, device=device)
+
+        def step():
+            actions.uniform_(-1.0, 1.0)
+            env.step(actions)
+
+        def process_and_apply_action():
+            env.action_manager.process_action(actions)
+            env.action_manager.apply_action()
+
+        results = [
+            # macro benchmarks
+            measure("env/step", step, num_envs, num_iterations, device),
+            measure("env/reset", env.reset, num_envs, num_iterations, device),
+            # micro benchmarks
+            measure("env/action_manager", process_and_apply_action, num_envs, num_iterations, device),
+            measure("env/scene_write_data", env.scene.write_data_to_sim, num_envs, num_iterations, device),
+            measure("env/sim_step", env.sim.step, num_envs, num_iterations, device),
+            measure("env/scene_update", lambda: env.scene.update(env.physics_dt), num_envs, num_iterations, device),
+            measure("env/observation_manager", env.observation_manager.compute, num_envs, num_iterations, device),
+            measure(
+                "env/reward_manager", lambda: env.reward_manager.compute(env.step_dt), num_envs, num_iterations, device
+            ),
+            measure("env/termination_manager", env.termination_manager.compute, num_envs, num_iterations, device),
+            measure(
+                "env/command_manager",
+                lambda: env.command_manager.compute(env.step_dt),
+                num_envs,
+                num_iterations,
+                device,
+            ),
+            measure(
+                "env/event_manager",
+                lambda: env.event_manager.apply(mode="interval", dt=env.step_dt),
+                num_envs,
+                num_iterations,
+                device,
+            ),
+            measure("env/recorder_manager", env.recorder_manager.record_post_step, num_envs, num_iterations, device),
+        ]
+    finally:
+        env.close()
+    return results
+
+
+def benchmark_buffers(num_envs: int, num_iterations: int, device: str) -> list[BenchmarkResult]:
+    """Benchmark the buffers used for the observation history and the actuator delays."""
+    data = torch.randn(num_envs, 48, device=device)
+    circular_buffer = CircularBuffer(max_len=10, batch_size=num_envs, device=device)
+    delay_buffer = DelayBuffer(history_length=4, batch_size=num_envs, device=device)
+    delay_buffer.set_time_lag(torch.randint(0, 5, (num_envs,), device=device))
+    lag = torch.randint(0, 10, (num_envs,), device=device)
+    reset_ids = torch.arange(0, num_envs, 8, device=device)
+
+    def circular_buffer_append_and_read():
+        circular_buffer.append(data)
+        circular_buffer[lag]
+
+    def circular_buffer_reset():
+        circular_buffer.reset(reset_ids)
+        circular_buffer.append(data)
+
+    return [
+        measure("buffers/circular_append_read", circular_buffer_append_and_read, num_envs, num_iterations, device),
+        measure("buffers/circular_reset", circular_buffer_reset, num_envs, num_iterations, device),
+        measure("buffers/delay_compute", lambda: delay_buffer.compute(data), num_envs, num_iterations, device),
+    ]
+
+
+def benchmark_math(num_envs: int, num_iterations: int, device: str) -> list[BenchmarkResult]:
+    """Benchmark the math operations on the poses of the bodies of all the environments."""
+    # one pose per body of a legged robot
+    num_poses = num_envs * 17
+    pos = torch.randn(num_poses, 3, device=device)
+    quat = math_utils.random_orientation(num_poses, device=device)
+    other_quat = math_utils.random_orientation(num_poses, device=device)
+    vec = torch.randn(num_poses, 3, device=device)
+    return [
+        measure("math/quat_apply", lambda: math_utils.quat_apply(quat, vec), num_envs, num_iterations, device),
+        measure(
+            "math/quat_rotate_inverse",
+            lambda: math_utils.quat_rotate_inverse(quat, vec),
+            num_envs,
+            num_iterations,
+            device,
+        ),
+        measure("math/quat_mul", lambda: math_utils.quat_mul(quat, other_quat), num_envs, num_iterations, device),
+        measure(
+            "math/combine_frame_transforms",
+            lambda: math_utils.combine_frame_transforms(pos, quat, vec, other_quat),
+            num_envs,
+            num_iterations,
+            device,
+        ),
+        measure(
+            "math/subtract_frame_transforms",
+            lambda: math_utils.subtract_frame_transforms(pos, quat, vec, other_quat),
+            num_envs,
+            num_iterations,
+            device,
+        ),
+        measure(
+            "math/euler_xyz_from_quat", lambda: math_utils.euler_xyz_from_quat(quat), num_envs, num_iterations, device
+        ),
+        measure("math/matrix_from_quat", lambda: math_utils.matrix_from_quat(quat), num_envs, num_iterations, device),
+    ]
+
+
+def benchmark_terrain(num_envs: int, num_iterations: int, device: str) -> list[BenchmarkResult]:
+    """Benchmark the generation of the rough terrains with one sub-terrain per group of 16 environments.
+
+    The terrains are generated on the CPU and are not cached.
+    """
+    num_tiles = max(num_envs // 16, 1)
+    num_rows = max(int(num_tiles**0.5), 1)
+    terrain_cfg = ROUGH_TERRAINS_CFG.replace(
+        num_rows=num_rows, num_cols=max(num_tiles // num_rows, 1), use_cache=False, seed=0
+    )
+    return [
+        measure(
+            "terrain/generate",
+            lambda: TerrainGenerator(terrain_cfg, device=device),
+            num_envs,
+            num_iterations,
+            device,
+            num_warmup=0,
+        )
+    ]
+
+
+def benchmark_pointcloud(num_envs: int, num_iterations: int, device: str) -> list[BenchmarkResult]:
+    """Benchmark the creation of fixed-size pointclouds from the depth images of one camera per environment."""
+    height, width, num_points = 32, 32, 256
+    intrinsic_matrices = torch.tensor(
+        [[24.0, 0.0, width / 2], [0.0, 24.0, height / 2], [0.0, 0.0, 1.0]], device=device
+    ).repeat(num_envs, 1, 1)
+    depth = torch.rand(num_envs, height, width, device=device) * 5.0
+    # mark some depth values as invalid
+    depth[depth > 4.5] = torch.inf
+    pos = torch.randn(num_envs, 3, device=device)
+    quat = math_utils.random_orientation(num_envs, device=device)
+    return [
+        measure(
+            f"pointcloud/{downsample_mode}",
+            lambda: create_batched_pointcloud_from_depth(
+                intrinsic_matrices, depth, num_points, pos, quat, downsample_mode=downsample_mode, voxel_size=0.1
+            ),
+            num_envs,
+            num_iterations,
+            device,
+        )
+        for downsample_mode in ("voxel", "farthest_point")
+    ]
+
+
+SUITES: dict[str, Callable[[int, int, str], list[BenchmarkResult]]] = {
+    "env": benchmark_env,
+    "buffers": benchmark_buffers,
+    "math": benchmark_math,
+    "terrain": benchmark_terrain,
+    "pointcloud": benchmark_pointcloud,
+}
+"""Benchmark suites by name."""
@@ -32,6 +32,12 @@ parser.add_argument(
     action="store_true",
     help="pause after every subtask during generation for debugging - only useful with render flag",
 )
+parser.add_argument(
+    "--batched",
+    action="store_true",
+    default=False,
+    help="Generate the demos of all environments in lockstep with a batched data generator instead of asyncio tasks.",
+)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
@@ -50,7 +56,13 @@ import random
 import torch
 
 import isaaclab_mimic.envs  # noqa: F401
-from isaaclab_mimic.datagen.generation import env_loop, setup_async_generation, setup_env_config
+from isaaclab_mimic.datagen.generation import (
+    batched_env_loop,
+    env_loop,
+    setup_async_generation,
+    setup_batched_generation,
+    setup_env_config,
+)
 from isaaclab_mimic.datagen.utils import get_env_name_from_dataset, setup_output_paths
 
 import isaaclab_tasks  # noqa: F401
@@ -84,6 +96,16 @@ def main():
     # reset before starting
     env.reset()
 
+    if args_cli.batched:
+        if args_cli.pause_subtask:
+            raise ValueError("Pausing after subtasks is not supported with batched data generation.")
+        # Setup and run batched data generation
+        batched_components = setup_batched_generation(
+            env=env, input_file=args_cli.input_file, success_term=success_term
+        )
+        batched_env_loop(env, batched_components["data_generator"])
+        return
+
     # Setup and run async data generation
     async_components = setup_async_generation(
         env=env,
@@ -6,8 +6,9 @@
 """Script to train RL agent with Stable Baselines3.
 
 Since Stable-Baselines3 does not support buffers living on GPU directly,
-we recommend using smaller number of environments. Otherwise,
-there will be significant overhead in GPU->CPU transfer.
+the signals are copied to the CPU at every step. With ``--fast_variant``, the
+wrapper copies all the signals with a single transfer, which reduces the
+overhead for a large number of environments.
 """
 
 """Launch Isaac Sim Simulator first."""
@@ -26,6 +27,12 @@ parser.add_argument("--num_envs", type=int, default=None, help="Number of enviro
 parser.add_argument("--task", type=str, default=None, help="Name of the task.")
 parser.add_argument("--seed", type=int, default=None, help="Seed used for the environment")
 parser.add_argument("--max_iterations", type=int, default=None, help="RL Policy training iterations.")
+parser.add_argument(
+    "--fast_variant",
+    action="store_true",
+    default=False,
+    help="Use the fast variant of the SB3 wrapper to copy the signals to the CPU.",
+)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
@@ -129,7 +136,7 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
         env = gym.wrappers.RecordVideo(env, **video_kwargs)
 
     # wrap around environment for stable baselines
-    env = Sb3VecEnvWrapper(env)
+    env = Sb3VecEnvWrapper(env, fast_variant=args_cli.fast_variant)
 
     if "normalize_input" in agent_cfg:
         env = VecNormalize(
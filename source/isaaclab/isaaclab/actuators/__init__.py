@@ -25,6 +25,7 @@ and called by the :class:`isaaclab.assets.Articulation` class.
 from .actuator_base import ActuatorBase
 from .actuator_cfg import (
     ActuatorBaseCfg,
+    ActuatorNetInferenceCfg,
     ActuatorNetLSTMCfg,
     ActuatorNetMLPCfg,
     DCMotorCfg,
@@ -34,4 +35,12 @@ from .actuator_cfg import (
     RemotizedPDActuatorCfg,
 )
 from .actuator_net import ActuatorNetLSTM, ActuatorNetMLP
-from .actuator_pd import DCMotor, DelayedPDActuator, IdealPDActuator, ImplicitActuator, RemotizedPDActuator
+from .actuator_net_inference import ActuatorNetInference
+from .actuator_pd import (
+    DCMotor,
+    DelayedPDActuator,
+    IdealPDActuator,
+    ImplicitActuator,
+    MergedExplicitActuator,
+    RemotizedPDActuator,
+)
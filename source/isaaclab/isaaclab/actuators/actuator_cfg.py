@@ -194,6 +194,55 @@ class DCMotorCfg(IdealPDActuatorCfg):
     """Peak motor force/torque of the electric DC motor (in N-m)."""
 
 
+@configclass
+class ActuatorNetInferenceCfg:
+    """Configuration for the inference of learned actuator networks.
+
+    The default settings run the network in single precision without any compilation, which matches
+    the behavior of directly calling the loaded TorchScript module.
+    """
+
+    dtype: Literal["float32", "float16", "bfloat16"] = "float32"
+    """The data type used for evaluating the network. Defaults to "float32".
+
+    The inputs are cast to this type before evaluating the network, and the outputs are cast back to
+    single precision before the effort scaling and clipping.
+    """
+
+    compile: bool = False
+    """Whether to compile the network evaluation with :func:`torch.compile`. Defaults to False.
+
+    If True, the network evaluation is compiled together with the scaling and clipping of the output
+    efforts, which allows fusing these operations into fewer kernels.
+    """
+
+    compile_mode: Literal["default", "reduce-overhead", "max-autotune"] = "default"
+    """The mode passed to :func:`torch.compile`. Defaults to "default".
+
+    This is only used if :attr:`compile` is True.
+    """
+
+    use_cuda_graph: bool = False
+    """Whether to capture the network evaluation into a CUDA graph. Defaults to False.
+
+    The graph is captured on the first call and replayed on subsequent calls. Since the network is
+    evaluated on a fixed number of rows (number of environments times number of joints), the graph only
+    needs to be re-captured if the input shapes change. This setting is ignored on CPU devices.
+    """
+
+    share_batch: bool = True
+    """Whether actuator groups of an articulation that load the same network share a forward pass. Defaults to True.
+
+    If True, the inputs of all groups in an articulation with the same network file and inference settings are
+    stacked into one buffer and the network is evaluated once per physics step for all of them. Otherwise, the
+    network is evaluated separately for each group.
+
+    .. note::
+        Sharing is currently only supported for the MLP-based actuator model. When the forward pass is shared,
+        the output scaling and clipping is performed per group outside the compiled or captured graph.
+    """
+
+
 @configclass
 class ActuatorNetLSTMCfg(DCMotorCfg):
     """Configuration for LSTM-based actuator model."""
@@ -204,7 +253,14 @@ class ActuatorNetLSTMCfg(DCMotorCfg):
     damping = None
 
     network_file: str = MISSING
-    """Path to the file containing network weights."""
+    """Path to the file containing network weights.
+
+    The file can either be a TorchScript module or a program exported with :func:`torch.export.save`
+    (with the file extension ``.pt2``).
+    """
+
+    inference: ActuatorNetInferenceCfg = ActuatorNetInferenceCfg()
+    """Settings for evaluating the network. Defaults to single precision without compilation."""
 
 
 @configclass
@@ -217,7 +273,14 @@ class ActuatorNetMLPCfg(DCMotorCfg):
     damping = None
 
     network_file: str = MISSING
-    """Path to the file containing network weights."""
+    """Path to the file containing network weights.
+
+    The file can either be a TorchScript module or a program exported with :func:`torch.export.save`
+    (with the file extension ``.pt2``).
+    """
+
+    inference: ActuatorNetInferenceCfg = ActuatorNetInferenceCfg()
+    """Settings for evaluating the network. Defaults to single precision without compilation."""
 
     pos_scale: float = MISSING
     """Scaling of the joint position errors input to the network."""
@@ -18,9 +18,9 @@ import torch
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-from isaaclab.utils.assets import read_file
 from isaaclab.utils.types import ArticulationActions
 
+from .actuator_net_inference import ActuatorNetInference
 from .actuator_pd import DCMotor
 
 if TYPE_CHECKING:
@@ -45,9 +45,11 @@ class ActuatorNetLSTM(DCMotor):
     def __init__(self, cfg: ActuatorNetLSTMCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
 
-        # load the model from JIT file
-        file_bytes = read_file(self.cfg.network_file)
-        self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
+        # load the model and create the inference backend
+        self._inference = ActuatorNetInference(
+            self.cfg.inference, self.cfg.network_file, self._device, postprocess=self._process_network_output
+        )
+        self.network = self._inference.network
 
         # extract number of lstm layers and hidden dim from the shape of weights
         num_layers = len(self.network.lstm.state_dict()) // 4
@@ -83,14 +85,12 @@ class ActuatorNetLSTM(DCMotor):
         self._joint_vel[:] = joint_vel
 
         # run network inference
-        with torch.inference_mode():
-            torques, (self.sea_hidden_state[:], self.sea_cell_state[:]) = self.network(
-                self.sea_input, (self.sea_hidden_state, self.sea_cell_state)
-            )
-        self.computed_effort = torques.reshape(self._num_envs, self.num_joints)
-
-        # clip the computed effort based on the motor limits
-        self.applied_effort = self._clip_effort(self.computed_effort)
+        # note: the computed effort is clipped based on the motor limits during the post-processing
+        (self.computed_effort, self.applied_effort), (hidden_state, cell_state) = self._inference(
+            self.sea_input, (self.sea_hidden_state, self.sea_cell_state)
+        )
+        self.sea_hidden_state[:] = hidden_state
+        self.sea_cell_state[:] = cell_state
 
         # return torques
         control_action.joint_efforts = self.applied_effort
@@ -98,6 +98,23 @@ class ActuatorNetLSTM(DCMotor):
         control_action.joint_velocities = None
         return control_action
 
+    """
+    Helper functions.
+    """
+
+    def _process_network_output(self, outputs: tuple) -> tuple:
+        """Reshape the output torques of the network and clip them based on the motor limits.
+
+        Args:
+            outputs: The outputs of the network, i.e. the torques and the tuple of hidden and cell states.
+
+        Returns:
+            A tuple containing the tuple of computed and applied efforts, and the tuple of hidden and cell states.
+        """
+        torques, hidden_states = outputs
+        computed_effort = torques.reshape(self._num_envs, self.num_joints)
+        return (computed_effort, self._clip_effort(computed_effort)), hidden_states
+
 
 class ActuatorNetMLP(DCMotor):
     """Actuator model based on multi-layer perceptron and joint history.
@@ -124,16 +141,50 @@ class ActuatorNetMLP(DCMotor):
     def __init__(self, cfg: ActuatorNetMLPCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
 
-        # load the model from JIT file
-        file_bytes = read_file(self.cfg.network_file)
-        self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
+        # load the model and create the inference backend
+        self._inference = ActuatorNetInference(
+            self.cfg.inference, self.cfg.network_file, self._device, postprocess=self._process_network_output
+        )
+        self.network = self._inference.network
+        # the inference backend shared with other actuator groups (set by :meth:`share_inference`)
+        self._shared_inference: ActuatorNetInference | None = None
+        self._shared_rows = slice(None)
+        # flag indicating whether the network inputs of the current step have been staged
+        self._is_input_staged = False
 
         # create buffers for MLP history
-        history_length = max(self.cfg.input_idx) + 1
+        # note: the history is stored as a ring buffer along the second dimension. Instead of shifting the
+        #   complete history at every step, only the slot at the head of the ring is overwritten.
+        input_idx = list(self.cfg.input_idx)
+        self._history_length = max(input_idx) + 1
         self._joint_pos_error_history = torch.zeros(
-            self._num_envs, history_length, self.num_joints, device=self._device
+            self._num_envs, self._history_length, self.num_joints, device=self._device
+        )
+        self._joint_vel_history = torch.zeros(
+            self._num_envs, self._history_length, self.num_joints, device=self._device
         )
-        self._joint_vel_history = torch.zeros(self._num_envs, history_length, self.num_joints, device=self._device)
+        # the slot in the history buffers holding the most recent entry
+        self._history_head = 0
+        # precompute the history slots gathered as network inputs for every position of the head
+        # shape: (history_length, len(input_idx))
+        head_ids = torch.arange(self._history_length, dtype=torch.long, device=self._device)
+        input_ids = torch.tensor(input_idx, dtype=torch.long, device=self._device)
+        self._history_gather_ids = torch.remainder(head_ids.unsqueeze(1) - input_ids.unsqueeze(0), self._history_length)
+
+        # resolve the ordering of the inputs to the network
+        if self.cfg.input_order == "pos_vel":
+            self._pos_input_slot, self._vel_input_slot = 0, 1
+        elif self.cfg.input_order == "vel_pos":
+            self._pos_input_slot, self._vel_input_slot = 1, 0
+        else:
+            raise ValueError(
+                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
+            )
+        # create buffer for the network inputs
+        # note: the network expects the inputs as (num_envs * num_joints, 2 * len(input_idx)) where the two
+        #   halves of the last dimension correspond to the scaled position errors and velocities.
+        self._network_input = torch.zeros(self._num_envs, self.num_joints, 2, len(input_idx), device=self._device)
+        self._network_input_flat = self._network_input.view(self._num_envs * self.num_joints, -1)
 
     """
     Operations.
@@ -144,46 +195,128 @@ class ActuatorNetMLP(DCMotor):
         self._joint_pos_error_history[env_ids] = 0.0
         self._joint_vel_history[env_ids] = 0.0
 
-    def compute(
-        self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
-    ) -> ArticulationActions:
-        # move history queue by 1 and update top of history
+    def stage_inputs(self, joint_pos_target: torch.Tensor, joint_pos: torch.Tensor, joint_vel: torch.Tensor):
+        """Update the joint history and write the network inputs for the current step.
+
+        This is called by :meth:`compute` if the inputs have not been staged already. When the forward pass
+        is shared with other actuator groups, the articulation stages the inputs of all the groups before
+        computing their efforts so that the network is evaluated only once.
+
+        Args:
+            joint_pos_target: The desired joint positions of the joints in the group. Shape is (num_envs, num_joints).
+            joint_pos: The current joint positions of the joints in the group. Shape is (num_envs, num_joints).
+            joint_vel: The current joint velocities of the joints in the group. Shape is (num_envs, num_joints).
+        """
+        # move the head of the history by 1 and update the entry at the head
+        self._history_head = (self._history_head + 1) % self._history_length
         # -- positions
-        self._joint_pos_error_history = self._joint_pos_error_history.roll(1, 1)
-        self._joint_pos_error_history[:, 0] = control_action.joint_positions - joint_pos
+        self._joint_pos_error_history[:, self._history_head] = joint_pos_target - joint_pos
         # -- velocity
-        self._joint_vel_history = self._joint_vel_history.roll(1, 1)
-        self._joint_vel_history[:, 0] = joint_vel
+        self._joint_vel_history[:, self._history_head] = joint_vel
         # save current joint vel for dc-motor clipping
         self._joint_vel[:] = joint_vel
 
         # compute network inputs
+        gather_ids = self._history_gather_ids[self._history_head]
         # -- positions
-        pos_input = torch.cat([self._joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        pos_input = pos_input.view(self._num_envs * self.num_joints, -1)
+        torch.mul(
+            self._joint_pos_error_history.index_select(1, gather_ids).transpose(1, 2),
+            self.cfg.pos_scale,
+            out=self._network_input[:, :, self._pos_input_slot],
+        )
         # -- velocity
-        vel_input = torch.cat([self._joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        vel_input = vel_input.view(self._num_envs * self.num_joints, -1)
-        # -- scale and concatenate inputs
-        if self.cfg.input_order == "pos_vel":
-            network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
-        elif self.cfg.input_order == "vel_pos":
-            network_input = torch.cat([vel_input * self.cfg.vel_scale, pos_input * self.cfg.pos_scale], dim=1)
-        else:
-            raise ValueError(
-                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
-            )
+        torch.mul(
+            self._joint_vel_history.index_select(1, gather_ids).transpose(1, 2),
+            self.cfg.vel_scale,
+            out=self._network_input[:, :, self._vel_input_slot],
+        )
 
-        # run network inference
-        with torch.inference_mode():
-            torques = self.network(network_input).view(self._num_envs, self.num_joints)
-        self.computed_effort = torques.view(self._num_envs, self.num_joints) * self.cfg.torque_scale
+        # mark the inputs as staged
+        self._is_input_staged = True
+        if self._shared_inference is not None:
+            self._shared_inference.invalidate_batch()
 
-        # clip the computed effort based on the motor limits
-        self.applied_effort = self._clip_effort(self.computed_effort)
+    def compute(
+        self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
+    ) -> ArticulationActions:
+        # compute network inputs (if not already done for this step)
+        if not self._is_input_staged:
+            self.stage_inputs(control_action.joint_positions, joint_pos, joint_vel)
+        self._is_input_staged = False
+
+        # run network inference
+        # note: the computed effort is clipped based on the motor limits during the post-processing
+        if self._shared_inference is None:
+            self.computed_effort, self.applied_effort = self._inference(self._network_input_flat)
+        else:
+            torques = self._shared_inference.batch_outputs()[self._shared_rows]
+            self.computed_effort, self.applied_effort = self._process_network_output(torques)
 
         # return torques
         control_action.joint_efforts = self.applied_effort
         control_action.joint_positions = None
         control_action.joint_velocities = None
         return control_action
+
+    @staticmethod
+    def share_inference(actuators: Sequence[ActuatorNetMLP]) -> list[ActuatorNetMLP]:
+        """Share the forward pass of the network between actuator groups that load the same network.
+
+        The actuator groups are batched based on their network file, the number of network inputs and the
+        inference settings. Groups with :attr:`ActuatorNetInferenceCfg.share_batch` set to False are skipped.
+        For every batch with more than one group, the network inputs of the groups are moved into a single
+        buffer of a common inference backend.
+
+        Args:
+            actuators: The actuator groups to consider for sharing.
+
+        Returns:
+            The actuator groups that share the forward pass with at least one other group.
+        """
+        # batch the actuator groups
+        batches: dict[tuple, list[ActuatorNetMLP]] = dict()
+        for actuator in actuators:
+            if not actuator.cfg.inference.share_batch:
+                continue
+            key = (
+                actuator.cfg.network_file,
+                actuator._network_input_flat.shape[1],
+                tuple(actuator.cfg.inference.to_dict().items()),
+            )
+            batches.setdefault(key, []).append(actuator)
+        # create shared inference backends
+        shared_actuators = list()
+        for (network_file, num_inputs, _), batch in batches.items():
+            if len(batch) < 2:
+                continue
+            # note: the post-processing is performed per group since the groups have different motor limits
+            inference = ActuatorNetInference(batch[0].cfg.inference, network_file, batch[0]._device)
+            num_rows = [actuator._network_input_flat.shape[0] for actuator in batch]
+            batch_inputs = inference.create_batch(num_rows, num_inputs)
+            # move the network inputs of the groups into the shared buffer
+            row_start = 0
+            for actuator, actuator_inputs in zip(batch, batch_inputs):
+                actuator._shared_inference = inference
+                actuator._shared_rows = slice(row_start, row_start + actuator_inputs.shape[0])
+                actuator._network_input_flat = actuator_inputs
+                actuator._network_input = actuator_inputs.view(actuator._network_input.shape)
+                row_start += actuator_inputs.shape[0]
+                shared_actuators.append(actuator)
+
+        return shared_actuators
+
+    """
+    Helper functions.
+    """
+
+    def _process_network_output(self, torques: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Scale the output torques of the network and clip them based on the motor limits.
+
+        Args:
+            torques: The output torques of the network. Shape is (num_envs * num_joints, 1).
+
+        Returns:
+            A tuple containing the computed and applied efforts. Shape is (num_envs, num_joints).
+        """
+        computed_effort = torques.view(self._num_envs, self.num_joints) * self.cfg.torque_scale
+        return computed_effort, self._clip_effort(computed_effort)
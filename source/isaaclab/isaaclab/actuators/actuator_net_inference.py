@@ -0,0 +1,233 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Inference backend for learned actuator networks."""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import omni.log
+
+from isaaclab.utils.assets import read_file
+
+if TYPE_CHECKING:
+    from .actuator_cfg import ActuatorNetInferenceCfg
+
+
+class ActuatorNetInference:
+    """Inference backend for evaluating learned actuator networks.
+
+    The backend loads the network from a file and evaluates it based on the settings in the
+    :class:`~isaaclab.actuators.ActuatorNetInferenceCfg`. It supports:
+
+    * Evaluating the network in reduced precision (``float16`` or ``bfloat16``).
+    * Networks saved as TorchScript modules or as programs exported with :func:`torch.export.save`.
+    * Compiling the network evaluation together with the post-processing of its outputs with :func:`torch.compile`.
+    * Capturing the network evaluation into a CUDA graph, which is replayed on subsequent calls.
+    * Stacking the inputs of multiple actuator groups into a single buffer to evaluate them in one forward pass.
+
+    The post-processing function (for instance, the scaling and clipping of the output efforts) is evaluated
+    on the single-precision outputs of the network. It is part of the compiled function or the captured
+    graph so that it can be fused with the network evaluation.
+
+    .. caution::
+        When CUDA graphs are used, the returned tensors are static buffers of the captured graph. They
+        are overwritten on the next call to the backend.
+    """
+
+    _DTYPES = {"float32": torch.float32, "float16": torch.float16, "bfloat16": torch.bfloat16}
+    """Mapping from the data type names in the configuration to the torch data types."""
+
+    def __init__(
+        self,
+        cfg: ActuatorNetInferenceCfg,
+        network_file: str,
+        device: str,
+        postprocess: Callable[[Any], Any] | None = None,
+    ):
+        """Initialize the inference backend.
+
+        Args:
+            cfg: The configuration for the network inference.
+            network_file: Path to the file containing the network. Files with the extension ``.pt2`` are
+                loaded as exported programs, while all other files are loaded as TorchScript modules.
+            device: The device used for processing.
+            postprocess: The function applied on the (single-precision) outputs of the network. Defaults to None,
+                in which case the outputs are returned as is.
+
+        Raises:
+            ValueError: If the data type in the configuration is not supported.
+        """
+        if cfg.dtype not in self._DTYPES:
+            raise ValueError(f"Invalid data type for actuator network: {cfg.dtype}. Expected one of {self._DTYPES}.")
+        # store inputs
+        self.cfg = cfg
+        self._device = device
+        self._dtype = self._DTYPES[cfg.dtype]
+        self._postprocess = postprocess
+
+        # load the network and move it to the data type used for inference
+        file_bytes = read_file(network_file)
+        if network_file.endswith(".pt2"):
+            self.network = torch.export.load(file_bytes).module().to(self._device)
+        else:
+            self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
+        self.network = self.network.to(self._dtype)
+
+        # resolve the function to evaluate
+        self._forward_fn = self._forward
+        if self.cfg.compile:
+            self._forward_fn = torch.compile(self._forward, mode=self.cfg.compile_mode, dynamic=False)
+        # resolve usage of CUDA graphs
+        self._use_cuda_graph = self.cfg.use_cuda_graph and torch.device(self._device).type == "cuda"
+        if self.cfg.use_cuda_graph and not self._use_cuda_graph:
+            omni.log.warn(f"CUDA graphs are not supported on device '{self._device}'. Disabling them for inference.")
+        # buffers for the CUDA graph (captured on the first call)
+        self._graph: torch.cuda.CUDAGraph | None = None
+        self._graph_inputs: tuple = ()
+        self._graph_outputs: Any = None
+
+        # buffers for stacking the inputs of multiple groups (allocated in :meth:`create_batch`)
+        self._batch_inputs: torch.Tensor | None = None
+        self._batch_outputs: torch.Tensor | None = None
+        self._is_batch_stale = True
+
+    """
+    Operations.
+    """
+
+    def __call__(self, *inputs: Any) -> Any:
+        """Evaluate the network and the post-processing function on the given inputs.
+
+        Args:
+            inputs: The inputs to the network. These can be tensors or (nested) tuples of tensors.
+
+        Returns:
+            The post-processed outputs of the network.
+        """
+        with torch.inference_mode():
+            if self._use_cuda_graph:
+                return self._replay_graph(inputs)
+            return self._forward_fn(*inputs)
+
+    def create_batch(self, num_rows: list[int], num_inputs: int) -> list[torch.Tensor]:
+        """Create a shared input buffer for evaluating multiple actuator groups in one forward pass.
+
+        The actuator groups write their inputs into the returned views and call :meth:`invalidate_batch`
+        whenever they do so. The outputs for all groups are obtained with :meth:`batch_outputs`.
+
+        Args:
+            num_rows: The number of input rows for each actuator group.
+            num_inputs: The number of inputs to the network per row.
+
+        Returns:
+            The views into the shared input buffer for each actuator group. Shape is (num_rows[i], num_inputs).
+        """
+        self._batch_inputs = torch.zeros(sum(num_rows), num_inputs, device=self._device)
+        self._batch_outputs = None
+        self._is_batch_stale = True
+        return list(torch.split(self._batch_inputs, num_rows))
+
+    def invalidate_batch(self):
+        """Mark the outputs of the shared forward pass as outdated.
+
+        This should be called whenever an actuator group writes new inputs into the shared input buffer.
+        """
+        self._is_batch_stale = True
+
+    def batch_outputs(self) -> torch.Tensor:
+        """The outputs of the shared forward pass for all actuator groups. Shape is (sum(num_rows), ...).
+
+        The network is only evaluated if the inputs have changed since the last evaluation.
+
+        Raises:
+            RuntimeError: If the shared input buffer has not been created.
+        """
+        if self._batch_inputs is None:
+            raise RuntimeError("The shared input buffer is not created. Please call 'create_batch' first.")
+        if self._is_batch_stale:
+            self._batch_outputs = self(self._batch_inputs)
+            self._is_batch_stale = False
+        return self._batch_outputs
+
+    """
+    Internal helpers.
+    """
+
+    def _forward(self, *inputs: Any) -> Any:
+        """Evaluate the network in the inference data type and post-process the single-precision outputs."""
+        outputs = _cast(self.network(*_cast(inputs, self._dtype)), torch.float32)
+        if self._postprocess is not None:
+            outputs = self._postprocess(outputs)
+        return outputs
+
+    def _replay_graph(self, inputs: tuple) -> Any:
+        """Copy the inputs into the static buffers of the CUDA graph and replay it.
+
+        The graph is (re-)captured if it does not exist yet or if the shapes of the inputs have changed.
+        """
+        if self._graph is None or _shapes(inputs) != _shapes(self._graph_inputs):
+            # create static input buffers
+            self._graph_inputs = _clone(inputs)
+            # warm-up on a side stream (required before capturing)
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self._forward_fn(*self._graph_inputs)
+            torch.cuda.current_stream().wait_stream(stream)
+            # capture the graph
+            self._graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(self._graph):
+                self._graph_outputs = self._forward_fn(*self._graph_inputs)
+        else:
+            _copy(self._graph_inputs, inputs)
+        # replay the graph
+        self._graph.replay()
+        return self._graph_outputs
+
+
+"""
+Helper functions.
+"""
+
+
+def _cast(data: Any, dtype: torch.dtype) -> Any:
+    """Cast floating-point tensors in a (nested) tuple to the given data type."""
+    if isinstance(data, torch.Tensor):
+        return data.to(dtype) if data.is_floating_point() else data
+    if isinstance(data, (tuple, list)):
+        return type(data)(_cast(d, dtype) for d in data)
+    return data
+
+
+def _clone(data: Any) -> Any:
+    """Clone the tensors in a (nested) tuple."""
+    if isinstance(data, torch.Tensor):
+        return data.clone()
+    if isinstance(data, (tuple, list)):
+        return type(data)(_clone(d) for d in data)
+    return data
+
+
+def _copy(dst: Any, src: Any):
+    """Copy the tensors in a (nested) tuple into the tensors of another (nested) tuple."""
+    if isinstance(dst, torch.Tensor):
+        dst.copy_(src)
+    elif isinstance(dst, (tuple, list)):
+        for d, s in zip(dst, src):
+            _copy(d, s)
+
+
+def _shapes(data: Any) -> Any:
+    """Obtain the shapes of the tensors in a (nested) tuple."""
+    if isinstance(data, torch.Tensor):
+        return tuple(data.shape)
+    if isinstance(data, (tuple, list)):
+        return tuple(_shapes(d) for d in data)
+    return None
@@ -286,6 +286,81 @@ class DCMotor(IdealPDActuator):
         return torch.clip(effort, min=min_effort, max=max_effort)
 
 
+class _DelayBufferChannel:
+    """View of a channel of a delay buffer whose input is stacked along the second dimension.
+
+    This provides the interface of the separate delay buffers that were previously used for each setpoint of the
+    :class:`DelayedPDActuator` class. The time lags are shared by all the channels of the delay buffer. Thus, setting
+    the time lags or resetting the view applies to all the channels.
+
+    Since all the channels are appended to the delay buffer together, a single channel cannot be appended on its
+    own. Calling :meth:`compute` raises an error.
+    """
+
+    def __init__(self, delay_buffer: DelayBuffer, channel: int):
+        """Initializes the view of the channel.
+
+        Args:
+            delay_buffer: The delay buffer with the stacked channels.
+            channel: The index of the channel in the second dimension of the data.
+        """
+        self._delay_buffer = delay_buffer
+        self._channel = channel
+
+    @property
+    def batch_size(self) -> int:
+        """The batch size of the ring buffer."""
+        return self._delay_buffer.batch_size
+
+    @property
+    def device(self) -> str:
+        """The device used for processing."""
+        return self._delay_buffer.device
+
+    @property
+    def history_length(self) -> int:
+        """The history length of the delay buffer."""
+        return self._delay_buffer.history_length
+
+    @property
+    def min_time_lag(self) -> int:
+        """Minimum amount of time steps that can be delayed."""
+        return self._delay_buffer.min_time_lag
+
+    @property
+    def max_time_lag(self) -> int:
+        """Maximum amount of time steps that can be delayed."""
+        return self._delay_buffer.max_time_lag
+
+    @property
+    def time_lags(self) -> torch.Tensor:
+        """The time lag across each batch index. Shape is (batch_size,)."""
+        return self._delay_buffer.time_lags
+
+    def set_time_lag(self, time_lag: int | torch.Tensor, batch_ids: Sequence[int] | None = None):
+        """Sets the time lag of all the channels across the provided batch indices.
+
+        See :meth:`isaaclab.utils.DelayBuffer.set_time_lag` for more details.
+        """
+        self._delay_buffer.set_time_lag(time_lag, batch_ids)
+
+    def reset(self, batch_ids: Sequence[int] | None = None):
+        """Reset the data of all the channels at the specified batch indices."""
+        self._delay_buffer.reset(batch_ids)
+
+    def compute(self, data: torch.Tensor) -> torch.Tensor:
+        """Not supported, since the channels are appended to the delay buffer together.
+
+        Raises:
+            RuntimeError: Always.
+        """
+        raise RuntimeError(
+            f"The data of channel {self._channel} cannot be appended on its own to the shared delay buffer. Please"
+            " stack the joint positions, velocities and efforts along the second dimension and call"
+            " `DelayedPDActuator.delay_buffer.compute` instead."
+        )
+
+
 class DelayedPDActuator(IdealPDActuator):
     """Ideal PD actuator with delayed command application.
 
@@ -297,6 +372,9 @@ class DelayedPDActuator(IdealPDActuator):
     The amount of time lag is configurable and can be set to a random value between the minimum and maximum time
     lag bounds at every reset. The minimum and maximum time lag values are set in the configuration instance passed
     to the class.
+
+    Since the desired joint positions, velocities and efforts share the same time lag, they are stacked and stored
+    in a single delay buffer of shape (num_envs, 3, num_joints).
     """
 
     cfg: DelayedPDActuatorCfg
@@ -304,10 +382,10 @@ class DelayedPDActuator(IdealPDActuator):
 
     def __init__(self, cfg: DelayedPDActuatorCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
-        # instantiate the delay buffers
-        self.positions_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
-        self.velocities_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
-        self.efforts_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
+        # instantiate the delay buffer for the stacked joint positions, velocities and efforts
+        self.delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
+        # create buffer for stacking the inputs to the delay buffer
+        self._delay_buffer_input = torch.zeros(self._num_envs, 3, self.num_joints, device=self._device)
         # all of the envs
         self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
 
@@ -327,24 +405,71 @@ class DelayedPDActuator(IdealPDActuator):
             device=self._device,
         )
         # set delays
-        self.positions_delay_buffer.set_time_lag(time_lags, env_ids)
-        self.velocities_delay_buffer.set_time_lag(time_lags, env_ids)
-        self.efforts_delay_buffer.set_time_lag(time_lags, env_ids)
+        # note: the range of the sampled lags is passed so that they are not read back from the device
+        self.delay_buffer.set_time_lag(time_lags, env_ids, time_lag_range=(self.cfg.min_delay, self.cfg.max_delay))
         # reset buffers
-        self.positions_delay_buffer.reset(env_ids)
-        self.velocities_delay_buffer.reset(env_ids)
-        self.efforts_delay_buffer.reset(env_ids)
+        self.delay_buffer.reset(env_ids)
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
         # apply delay based on the delay the model for all the setpoints
-        control_action.joint_positions = self.positions_delay_buffer.compute(control_action.joint_positions)
-        control_action.joint_velocities = self.velocities_delay_buffer.compute(control_action.joint_velocities)
-        control_action.joint_efforts = self.efforts_delay_buffer.compute(control_action.joint_efforts)
+        self._delay_buffer_input[:, 0] = control_action.joint_positions
+        self._delay_buffer_input[:, 1] = control_action.joint_velocities
+        self._delay_buffer_input[:, 2] = control_action.joint_efforts
+        delayed_setpoints = self.delay_buffer.compute(self._delay_buffer_input)
+        control_action.joint_positions = delayed_setpoints[:, 0]
+        control_action.joint_velocities = delayed_setpoints[:, 1]
+        control_action.joint_efforts = delayed_setpoints[:, 2]
         # compte actuator model
         return super().compute(control_action, joint_pos, joint_vel)
 
+    """
+    Deprecated.
+    """
+
+    @property
+    def positions_delay_buffer(self) -> _DelayBufferChannel:
+        """Deprecated property. Please use :attr:`delay_buffer` instead.
+
+        The desired joint positions are stored in the first channel of :attr:`delay_buffer`. This returns a view of
+        the channel, which shares its time lags with the other setpoints. Calling ``compute`` on the view raises an
+        error, since the setpoints are appended to :attr:`delay_buffer` together.
+        """
+        omni.log.warn(
+            "The `positions_delay_buffer` property will be deprecated in a future release. Please use `delay_buffer`"
+            " instead."
+        )
+        return _DelayBufferChannel(self.delay_buffer, 0)
+
+    @property
+    def velocities_delay_buffer(self) -> _DelayBufferChannel:
+        """Deprecated property. Please use :attr:`delay_buffer` instead.
+
+        The desired joint velocities are stored in the second channel of :attr:`delay_buffer`. This returns a view of
+        the channel, which shares its time lags with the other setpoints. Calling ``compute`` on the view raises an
+        error, since the setpoints are appended to :attr:`delay_buffer` together.
+        """
+        omni.log.warn(
+            "The `velocities_delay_buffer` property will be deprecated in a future release. Please use"
+            " `delay_buffer` instead."
+        )
+        return _DelayBufferChannel(self.delay_buffer, 1)
+
+    @property
+    def efforts_delay_buffer(self) -> _DelayBufferChannel:
+        """Deprecated property. Please use :attr:`delay_buffer` instead.
+
+        The desired joint efforts are stored in the third channel of :attr:`delay_buffer`. This returns a view of
+        the channel, which shares its time lags with the other setpoints. Calling ``compute`` on the view raises an
+        error, since the setpoints are appended to :attr:`delay_buffer` together.
+        """
+        omni.log.warn(
+            "The `efforts_delay_buffer` property will be deprecated in a future release. Please use `delay_buffer`"
+            " instead."
+        )
+        return _DelayBufferChannel(self.delay_buffer, 2)
+
 
 class RemotizedPDActuator(DelayedPDActuator):
     """Ideal PD actuator with angle-dependent torque limits.
@@ -414,3 +539,159 @@ class RemotizedPDActuator(DelayedPDActuator):
         )
         self.applied_effort = control_action.joint_efforts
         return control_action
+
+
+"""
+Merged Actuator Models.
+"""
+
+
+class MergedExplicitActuator(ActuatorBase):
+    r"""Vectorized actuator model over multiple ideal PD and DC motor actuator groups.
+
+    Robots with many small actuator groups (for instance, one group per limb or per finger) pay the overhead
+    of slicing the joint commands and states and launching the actuator computations for every group at
+    every physics step. This class merges the :class:`IdealPDActuator` and :class:`DCMotor` groups of an
+    articulation into a single actuator that holds the parameters of all their joints and computes the
+    efforts of all of them in one call.
+
+    The joints of the merged actuator are the concatenation of the joints of the groups (in the order of
+    the groups). The parameters of the groups (gains, limits and efforts) are replaced by views into the
+    corresponding tensors of the merged actuator. This means that in-place modifications of the group parameters
+    (for instance, through randomization events) are reflected in the merged actuator and vice-versa.
+
+    The torque clipping follows the model of each group: for :class:`DCMotor` groups, the velocity-based
+    saturation model is applied, while for :class:`IdealPDActuator` groups, the efforts are clipped symmetrically
+    based on the effort limits.
+
+    .. note::
+        The merged actuator is not created from a configuration. Thus, the attribute :attr:`cfg` is None.
+    """
+
+    def __init__(self, actuators: Sequence[IdealPDActuator]):
+        """Initialize the merged actuator.
+
+        Args:
+            actuators: The ideal PD and DC motor actuator groups to merge. These must be created for the same
+                articulation and should not contain subclasses of these actuator models.
+
+        Raises:
+            TypeError: If an actuator group is not an ideal PD or DC motor actuator model.
+        """
+        # check the actuator groups
+        for actuator in actuators:
+            if type(actuator) not in (IdealPDActuator, DCMotor):
+                raise TypeError(
+                    f"Cannot merge actuator of type '{type(actuator).__name__}'. Only 'IdealPDActuator' and"
+                    " 'DCMotor' actuator models are supported."
+                )
+        # note: the base class constructor is not called since the parameters are taken from the groups
+        self.cfg = None
+        self._actuators = list(actuators)
+        self._num_envs = actuators[0]._num_envs
+        self._device = actuators[0]._device
+        self._joint_names = [joint_name for actuator in actuators for joint_name in actuator.joint_names]
+        self._joint_indices = torch.cat(
+            [torch.as_tensor(actuator.joint_indices, device=self._device) for actuator in actuators]
+        )
+
+        # resolve the joints of each group in the merged actuator
+        self._actuator_joint_slices = list()
+        start = 0
+        for actuator in actuators:
+            self._actuator_joint_slices.append(slice(start, start + actuator.num_joints))
+            start += actuator.num_joints
+
+        # merge the parameters of the groups
+        for name in [
+            "stiffness",
+            "damping",
+            "armature",
+            "friction",
+            "effort_limit",
+            "effort_limit_sim",
+            "velocity_limit",
+            "velocity_limit_sim",
+            "computed_effort",
+            "applied_effort",
+        ]:
+            setattr(self, name, torch.cat([getattr(actuator, name) for actuator in actuators], dim=1))
+            # replace the parameters of the groups with views into the merged parameters
+            for actuator, joint_slice in zip(actuators, self._actuator_joint_slices):
+                setattr(actuator, name, getattr(self, name)[:, joint_slice])
+
+        # parse the saturation model of the DC motors
+        self._saturation_effort = torch.full((1, self.num_joints), torch.inf, device=self._device)
+        self._is_dc_motor = torch.zeros(self.num_joints, dtype=torch.bool, device=self._device)
+        for actuator, joint_slice in zip(actuators, self._actuator_joint_slices):
+            if isinstance(actuator, DCMotor):
+                self._saturation_effort[:, joint_slice] = actuator._saturation_effort
+                self._is_dc_motor[joint_slice] = True
+        # prepare joint vel buffer for max effort computation
+        self._joint_vel = torch.zeros_like(self.computed_effort)
+        # create buffer for zeros effort
+        self._zeros_effort = torch.zeros_like(self.computed_effort)
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the merged actuator."""
+        return (
+            f"<class {self.__class__.__name__}> object:\n"
+            f"\tNumber of groups      : {len(self._actuators)}\n"
+            f"\tNumber of joints      : {self.num_joints}\n"
+            f"\tJoint names           : {self.joint_names}\n"
+            f"\tJoint indices         : {self.joint_indices}\n"
+        )
+
+    """
+    Properties.
+    """
+
+    @property
+    def actuators(self) -> list[IdealPDActuator]:
+        """The actuator groups merged into this actuator."""
+        return self._actuators
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int]):
+        pass
+
+    def compute(
+        self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
+    ) -> ArticulationActions:
+        # save current joint vel
+        self._joint_vel[:] = joint_vel
+        # compute errors
+        error_pos = control_action.joint_positions - joint_pos
+        error_vel = control_action.joint_velocities - joint_vel
+        # calculate the desired joint torques
+        # note: the buffers are updated in-place since the groups hold views into them
+        self.computed_effort[:] = self.stiffness * error_pos + self.damping * error_vel + control_action.joint_efforts
+        # clip the torques based on the motor limits
+        self.applied_effort[:] = self._clip_effort(self.computed_effort)
+        # set the computed actions back into the control action
+        control_action.joint_efforts = self.applied_effort
+        control_action.joint_positions = None
+        control_action.joint_velocities = None
+        return control_action
+
+    """
+    Helper functions.
+    """
+
+    def _clip_effort(self, effort: torch.Tensor) -> torch.Tensor:
+        # compute torque limits for the DC motors
+        # -- max limit
+        max_effort = self._saturation_effort * (1.0 - self._joint_vel / self.velocity_limit)
+        max_effort = torch.clip(max_effort, min=self._zeros_effort, max=self.effort_limit)
+        # -- min limit
+        min_effort = self._saturation_effort * (-1.0 - self._joint_vel / self.velocity_limit)
+        min_effort = torch.clip(min_effort, min=-self.effort_limit, max=self._zeros_effort)
+        # use the symmetric limits for the ideal PD actuators
+        max_effort = torch.where(self._is_dc_motor, max_effort, self.effort_limit)
+        min_effort = torch.where(self._is_dc_motor, min_effort, -self.effort_limit)
+
+        # clip the torques based on the motor limits
+        return torch.clip(effort, min=min_effort, max=max_effort)
@@ -21,7 +21,15 @@ from pxr import PhysxSchema, UsdPhysics
 import isaaclab.sim as sim_utils
 import isaaclab.utils.math as math_utils
 import isaaclab.utils.string as string_utils
-from isaaclab.actuators import ActuatorBase, ActuatorBaseCfg, ImplicitActuator
+from isaaclab.actuators import (
+    ActuatorBase,
+    ActuatorBaseCfg,
+    ActuatorNetMLP,
+    DCMotor,
+    IdealPDActuator,
+    ImplicitActuator,
+    MergedExplicitActuator,
+)
 from isaaclab.utils.types import ArticulationActions
 
 from ..asset_base import AssetBase
@@ -1383,6 +1391,28 @@ class Articulation(AssetBase):
             self._data.default_joint_armature[:, actuator.joint_indices] = actuator.armature
             self._data.default_joint_friction_coeff[:, actuator.joint_indices] = actuator.friction
 
+        # share the forward pass of actuator networks that load the same network
+        self._shared_actuator_nets = ActuatorNetMLP.share_inference(
+            [actuator for actuator in self.actuators.values() if isinstance(actuator, ActuatorNetMLP)]
+        )
+
+        # resolve the actuators to compute at every step
+        self._compute_actuators: list[ActuatorBase] = list(self.actuators.values())
+        # merge the explicit PD and DC motor groups into a single vectorized actuator
+        if self.cfg.merge_explicit_actuators:
+            merged_actuators = [
+                actuator for actuator in self.actuators.values() if type(actuator) in (IdealPDActuator, DCMotor)
+            ]
+            if len(merged_actuators) > 1:
+                self._compute_actuators = [
+                    actuator for actuator in self._compute_actuators if actuator not in merged_actuators
+                ]
+                self._compute_actuators.append(MergedExplicitActuator(merged_actuators))
+                omni.log.info(
+                    f"Merged {len(merged_actuators)} explicit actuator groups into a single actuator with joint names:"
+                    f" {self._compute_actuators[-1].joint_names}."
+                )
+
         # perform some sanity checks to ensure actuators are prepared correctly
         total_act_joints = sum(actuator.num_joints for actuator in self.actuators.values())
         if total_act_joints != (self.num_joints - self.num_fixed_tendons):
@@ -1437,8 +1467,16 @@ class Articulation(AssetBase):
         The actions are first processed using actuator models. Depending on the robot configuration,
         the actuator models compute the joint level simulation commands and sets them into the PhysX buffers.
         """
+        # stage the inputs of actuator networks that share their forward pass
+        # note: this allows evaluating the network only once for all these groups
+        for actuator in self._shared_actuator_nets:
+            actuator.stage_inputs(
+                self._data.joint_pos_target[:, actuator.joint_indices],
+                joint_pos=self._data.joint_pos[:, actuator.joint_indices],
+                joint_vel=self._data.joint_vel[:, actuator.joint_indices],
+            )
         # process actions per group
-        for actuator in self.actuators.values():
+        for actuator in self._compute_actuators:
             # prepare input for actuator model based on cached data
             # TODO : A tensor dict would be nice to do the indexing of all tensors together
             control_action = ArticulationActions(
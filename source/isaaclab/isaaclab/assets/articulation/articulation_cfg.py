@@ -53,3 +53,15 @@ class ArticulationCfg(AssetBaseCfg):
 
     actuators: dict[str, ActuatorBaseCfg] = MISSING
     """Actuators for the robot with corresponding joint names."""
+
+    merge_explicit_actuators: bool = False
+    """Whether to merge the explicit ideal PD and DC motor actuator groups into a single actuator. Defaults to False.
+
+    If True, all actuator groups whose model is exactly :class:`~isaaclab.actuators.IdealPDActuator` or
+    :class:`~isaaclab.actuators.DCMotor` are computed together by a :class:`~isaaclab.actuators.MergedExplicitActuator`
+    with one call per physics step. This reduces the per-group overhead for robots with many small actuator groups.
+    The computed efforts are identical to computing each group separately.
+
+    The groups are still accessible through :attr:`Articulation.actuators`. Their parameters are views into the
+    parameters of the merged actuator, so in-place modifications of them remain effective.
+    """
@@ -35,6 +35,21 @@ class DifferentialIKController:
     - "svd": Adaptive singular-value decomposition (SVD)
     - "trans": Transpose of matrix
     - "dls": Damped version of Moore-Penrose pseudo-inverse (also called Levenberg-Marquardt)
+    - "dls_cholesky": Damped least-squares solved with a Cholesky factorization of the smaller Gram matrix
+
+    The "dls_cholesky" method factorizes :math:`\mathbf{J} \mathbf{J}^T + \lambda^2 \mathbf{I}` (or
+    :math:`\mathbf{J}^T \mathbf{J} + \lambda^2 \mathbf{I}` if there are fewer joints than task-space
+    dimensions) once per call instead of inverting it. The factorization is reused for a configurable number
+    of iterative refinement steps, which reduce the round-off error of the solution in single precision:
+
+    .. math::
+
+        \mathbf{y}_{k+1} = \mathbf{y}_{k} + (\mathbf{J} \mathbf{J}^T + \lambda^2 \mathbf{I})^{-1}
+        (\Delta \mathbf{x} - (\mathbf{J} \mathbf{J}^T + \lambda^2 \mathbf{I}) \mathbf{y}_{k}),
+        \quad \Delta \mathbf{q} = \mathbf{J}^T \mathbf{y}
+
+    Since the residual is computed for the damped system, the refinement converges to the damped least-squares
+    solution and keeps the damping near singularities.
 
 
     .. caution::
@@ -68,6 +83,8 @@ class DifferentialIKController:
         self.ee_quat_des = torch.zeros(self.num_envs, 4, device=self._device)
         # -- input command
         self._command = torch.zeros(self.num_envs, self.action_dim, device=self._device)
+        # -- damping matrices of the cholesky-based solver (created lazily for each size)
+        self._damping_matrices: dict[int, torch.Tensor] = dict()
 
     """
     Properties.
@@ -234,7 +251,59 @@ class DifferentialIKController:
                 jacobian_T @ torch.inverse(jacobian @ jacobian_T + lambda_matrix) @ delta_pose.unsqueeze(-1)
             )
             delta_joint_pos = delta_joint_pos.squeeze(-1)
+        elif self.cfg.ik_method == "dls_cholesky":  # damped least squares with cholesky factorization
+            delta_joint_pos = self._compute_delta_joint_pos_cholesky(delta_pose, jacobian)
         else:
             raise ValueError(f"Unsupported inverse-kinematics method: {self.cfg.ik_method}")
 
         return delta_joint_pos
+
+    def _compute_delta_joint_pos_cholesky(self, delta_pose: torch.Tensor, jacobian: torch.Tensor) -> torch.Tensor:
+        """Computes the change in joint position with damped least-squares using a Cholesky factorization.
+
+        The damped system is factorized on the smaller of the two Gram matrices of the Jacobian. The factorization
+        is then reused for the iterative refinement of the solution against the same damped system.
+
+        Args:
+            delta_pose: The desired delta pose in shape (N, 3) or (N, 6).
+            jacobian: The geometric jacobian matrix in shape (N, 3, num_joints) or (N, 6, num_joints).
+
+        Returns:
+            The desired delta in joint space. Shape is (N, num_joints).
+        """
+        # parameters
+        lambda_val = self.cfg.ik_params["lambda_val"]
+        num_iterations = int(self.cfg.ik_params["num_iterations"])
+        # computation
+        task_dim, num_joints = jacobian.shape[1:]
+        jacobian_T = torch.transpose(jacobian, dim0=1, dim1=2)
+        # build the damped system on the smaller gram matrix
+        if task_dim <= num_joints:
+            # (J J^T + lambda^2 I) y = dx, with shape (N, task_dim, task_dim)
+            gram = torch.baddbmm(self._damping_matrix(task_dim, lambda_val), jacobian, jacobian_T)
+            rhs = delta_pose.unsqueeze(-1)
+        else:
+            # (J^T J + lambda^2 I) dq = J^T dx, with shape (N, num_joints, num_joints)
+            gram = torch.baddbmm(self._damping_matrix(num_joints, lambda_val), jacobian_T, jacobian)
+            rhs = torch.bmm(jacobian_T, delta_pose.unsqueeze(-1))
+        # factorize the damped gram matrix
+        # note: the factorization cannot fail since the damped gram matrix is positive definite. Thus, we skip
+        #   the error checks, which would require synchronizing with the device.
+        gram_L, _ = torch.linalg.cholesky_ex(gram)
+        solution = torch.cholesky_solve(rhs, gram_L)
+        # refine the solution against the residual of the damped system
+        for _ in range(num_iterations - 1):
+            solution = solution + torch.cholesky_solve(rhs - torch.bmm(gram, solution), gram_L)
+        # map the solution to the joint space
+        if task_dim <= num_joints:
+            solution = torch.bmm(jacobian_T, solution)
+        return solution.squeeze(-1)
+
+    def _damping_matrix(self, size: int, lambda_val: float) -> torch.Tensor:
+        r"""Returns the damping matrix :math:`\lambda^2 \mathbf{I}` of the given size.
+
+        The matrix is created on the first call for each size and reused afterwards.
+        """
+        if size not in self._damping_matrices:
+            self._damping_matrices[size] = (lambda_val**2) * torch.eye(n=size, device=self._device)
+        return self._damping_matrices[size]
@@ -32,7 +32,7 @@ class DifferentialIKControllerCfg:
     Otherwise, the controller treats the input command as the absolute position/pose.
     """
 
-    ik_method: Literal["pinv", "svd", "trans", "dls"] = MISSING
+    ik_method: Literal["pinv", "svd", "trans", "dls", "dls_cholesky"] = MISSING
     """Method for computing inverse of Jacobian."""
 
     ik_params: dict[str, float] | None = None
@@ -48,13 +48,16 @@ class DifferentialIKControllerCfg:
         - "k_val": Scaling of computed delta-joint positions (default: 1.0).
     - Damped Moore-Penrose pseudo-inverse ("dls"):
         - "lambda_val": Damping coefficient (default: 0.01).
+    - Damped least-squares with Cholesky factorization ("dls_cholesky"):
+        - "lambda_val": Damping coefficient. Must be positive (default: 0.01).
+        - "num_iterations": Number of iterative refinement steps with the factorized system (default: 1).
     """
 
     def __post_init__(self):
         # check valid input
         if self.command_type not in ["position", "pose"]:
             raise ValueError(f"Unsupported inverse-kinematics command: {self.command_type}.")
-        if self.ik_method not in ["pinv", "svd", "trans", "dls"]:
+        if self.ik_method not in ["pinv", "svd", "trans", "dls", "dls_cholesky"]:
             raise ValueError(f"Unsupported inverse-kinematics method: {self.ik_method}.")
         # default parameters for different inverse kinematics approaches.
         default_ik_params = {
@@ -62,9 +65,18 @@ class DifferentialIKControllerCfg:
             "svd": {"k_val": 1.0, "min_singular_value": 1e-5},
             "trans": {"k_val": 1.0},
             "dls": {"lambda_val": 0.01},
+            "dls_cholesky": {"lambda_val": 0.01, "num_iterations": 1},
         }
         # update parameters for IK-method if not provided
         ik_params = default_ik_params[self.ik_method].copy()
         if self.ik_params is not None:
             ik_params.update(self.ik_params)
         self.ik_params = ik_params
+        # check valid parameters for the cholesky-based solver
+        if self.ik_method == "dls_cholesky":
+            if self.ik_params["lambda_val"] <= 0.0:
+                raise ValueError(f"Damping coefficient must be positive. Received: {self.ik_params['lambda_val']}.")
+            if self.ik_params["num_iterations"] < 1:
+                raise ValueError(
+                    f"Number of iterations must be positive. Received: {self.ik_params['num_iterations']}."
+                )
@@ -100,8 +100,11 @@ class OperationalSpaceController:
             * torch.as_tensor(self.cfg.motion_damping_ratio_task, dtype=torch.float, device=self._device).reshape(1, -1)
         )
         # -- -- motion control gains in root frame
-        self._motion_p_gains_b = torch.zeros_like(self._motion_p_gains_task)
-        self._motion_d_gains_b = torch.zeros_like(self._motion_d_gains_task)
+        # note: the stiffness and damping gains are views into a single buffer so that they can be applied together
+        #   on the stacked pose and velocity errors in the high-throughput mode
+        self._motion_gains_b = torch.zeros(self.num_envs, 6, 12, device=self._device)
+        self._motion_p_gains_b = self._motion_gains_b[:, :, 0:6]
+        self._motion_d_gains_b = self._motion_gains_b[:, :, 6:12]
         # -- force control gains
         if self.cfg.contact_wrench_stiffness_task is not None:
             self._contact_wrench_p_gains_task = torch.diag_embed(
@@ -139,6 +142,9 @@ class OperationalSpaceController:
             * torch.tensor(self.cfg.nullspace_damping_ratio, dtype=torch.float, device=self._device)
         )
 
+        # -- workspace buffers for the high-throughput mode (allocated on the first call to :meth:`compute`)
+        self._joint_efforts: torch.Tensor | None = None
+
     """
     Properties.
     """
@@ -395,6 +401,20 @@ class OperationalSpaceController:
             Tensor: The joint efforts computed by the controller. It is a tensor of shape (``num_envs``, ``num_DoF``).
         """
 
+        # use the implementation with persistent workspace buffers if enabled
+        if self.cfg.high_throughput_mode:
+            return self._compute_high_throughput(
+                jacobian_b,
+                current_ee_pose_b,
+                current_ee_vel_b,
+                current_ee_force_b,
+                mass_matrix,
+                gravity,
+                current_joint_pos,
+                current_joint_vel,
+                nullspace_joint_pos_target,
+            )
+
         # deduce number of DoF
         num_DoF = jacobian_b.shape[2]
         # create joint effort vector
@@ -546,3 +566,257 @@ class OperationalSpaceController:
                 raise ValueError(f"Invalid null-space control method: {self.cfg.nullspace_control}.")
 
         return joint_efforts
+
+    """
+    Internal helpers.
+    """
+
+    def _compute_high_throughput(
+        self,
+        jacobian_b: torch.Tensor,
+        current_ee_pose_b: torch.Tensor | None,
+        current_ee_vel_b: torch.Tensor | None,
+        current_ee_force_b: torch.Tensor | None,
+        mass_matrix: torch.Tensor | None,
+        gravity: torch.Tensor | None,
+        current_joint_pos: torch.Tensor | None,
+        current_joint_vel: torch.Tensor | None,
+        nullspace_joint_pos_target: torch.Tensor | None,
+    ) -> torch.Tensor:
+        r"""Performs inference with the controller using persistent workspace buffers.
+
+        This is the implementation of :meth:`compute` for the high-throughput mode. All intermediate quantities
+        are written into buffers that are allocated on the first call. Instead of inverting the joint-space mass
+        matrix and the inverse of the task-space inertia, their Cholesky factors are computed once per call and
+        shared between the inertial decoupling and the dynamically consistent pseudo-inverse. The null-space
+        projector is never formed explicitly, but applied on the null-space efforts directly:
+
+        .. math::
+
+            \tau_{null} = (I - J^T \bar{J}^T) \tau = \tau - J^T \Lambda (L^{-1} J^T)^T L^{-1} \tau,
+            \quad \Lambda^{-1} = J M^{-1} J^T = (L^{-1} J^T)^T (L^{-1} J^T), \quad M = L L^T
+
+        For the Moore-Penrose pseudo-inverse, :math:`\bar{J}^T = (J J^T)^{-1} J` is used. For singular matrices
+        (for instance, :math:`J J^T` and :math:`J M^{-1} J^T` for rank-deficient Jacobians), the Cholesky
+        factorization fails. The affected matrices are then regularized and factorized again without
+        synchronizing with the device (see :meth:`_factorize_cholesky`). For :math:`J J^T`, this approximates the
+        pseudo-inverse of the Jacobian.
+
+        Please refer to :meth:`compute` for the description of the arguments and the raised errors.
+
+        Returns:
+            The joint efforts computed by the controller. It is a persistent buffer of shape
+            (``num_envs``, ``num_DoF``) that is overwritten on the next call.
+        """
+        # deduce number of DoF
+        num_DoF = jacobian_b.shape[2]
+        # allocate the workspace buffers if the number of DoF changed
+        if self._joint_efforts is None or self._joint_efforts.shape[1] != num_DoF:
+            self._create_workspace_buffers(num_DoF)
+
+        # resolve the quantities required for this call
+        use_motion_control = self.desired_ee_pose_b is not None
+        use_decoupling = use_motion_control and self.cfg.inertial_dynamics_decoupling
+        use_nullspace_control = self.cfg.nullspace_control != "none"
+        use_dynamically_consistent_pinv = (
+            use_nullspace_control
+            and self.cfg.inertial_dynamics_decoupling
+            and not self.cfg.partial_inertial_dynamics_decoupling
+        )
+        # check inputs are provided
+        if use_motion_control and (current_ee_pose_b is None or current_ee_vel_b is None):
+            raise ValueError("Current end-effector pose and velocity are required for motion control.")
+        if use_decoupling and mass_matrix is None:
+            raise ValueError("Mass matrix is required for inertial decoupling.")
+        if use_nullspace_control:
+            if num_DoF <= 6:
+                raise ValueError("Null-space control is only applicable for redundant manipulators.")
+            if use_dynamically_consistent_pinv and mass_matrix is None:
+                raise ValueError("Mass matrix inverse is required for dynamically consistent pseudo-inverse")
+            if self.cfg.nullspace_control != "position":
+                raise ValueError(f"Invalid null-space control method: {self.cfg.nullspace_control}.")
+            if current_joint_pos is None or current_joint_vel is None:
+                raise ValueError("Current joint positions and velocities are required for null-space control.")
+            if nullspace_joint_pos_target is not None and nullspace_joint_pos_target.shape != current_joint_pos.shape:
+                raise ValueError(
+                    f"The target nullspace joint positions shape '{nullspace_joint_pos_target.shape}' does not"
+                    f"match the current joint positions shape '{current_joint_pos.shape}'."
+                )
+
+        # factorize the inverse of the task-space inertia once for decoupling and the null-space projection
+        if use_decoupling or use_dynamically_consistent_pinv:
+            self._factorize_task_space_inertia(jacobian_b, mass_matrix)
+
+        # compute the (selected) task-space command forces
+        self._task_space_command_b.zero_()
+        # -- motion control
+        if use_motion_control:
+            # stack the pose and velocity errors (zero target velocity as the target is assumed to be stationary)
+            self._motion_error_b[:, 0:3], self._motion_error_b[:, 3:6] = compute_pose_error(
+                current_ee_pose_b[:, :3],
+                current_ee_pose_b[:, 3:],
+                self.desired_ee_pose_b[:, :3],
+                self.desired_ee_pose_b[:, 3:],
+                rot_error_type="axis_angle",
+            )
+            torch.neg(current_ee_vel_b, out=self._motion_error_b[:, 6:12])
+            # desired end-effector acceleration: apply stiffness and damping gains together
+            torch.bmm(self._motion_gains_b, self._motion_error_b.unsqueeze(-1), out=self._des_ee_acc_b)
+            if use_decoupling:
+                # F = (J M^(-1) J^T)^(-1) * \ddot(x_des)
+                torch.cholesky_solve(self._des_ee_acc_b, self._os_mass_matrix_inv_chol_b, out=self._os_command_b)
+                os_command_forces_b = self._os_command_b
+            else:
+                os_command_forces_b = self._des_ee_acc_b
+            self._task_space_command_b.baddbmm_(self._selection_matrix_motion_b, os_command_forces_b)
+        # -- contact wrench control
+        if self.desired_ee_wrench_b is not None:
+            if self.cfg.contact_wrench_stiffness_task is not None:
+                # check input is provided
+                if current_ee_force_b is None:
+                    raise ValueError("Current end-effector force is required for closed-loop force control.")
+                # only the force components are measured, so the moment components are controlled open loop
+                self._ee_contact_wrench_b[:, 0:3] = current_ee_force_b
+                self._ee_contact_wrench_b[:, 3:6] = self.desired_ee_wrench_b[:, 3:6]
+                torch.sub(self.desired_ee_wrench_b, self._ee_contact_wrench_b, out=self._wrench_error_b)
+                # closed-loop control with feedforward term
+                torch.baddbmm(
+                    self.desired_ee_wrench_b.unsqueeze(-1),
+                    self._contact_wrench_p_gains_b,
+                    self._wrench_error_b.unsqueeze(-1),
+                    out=self._os_command_b,
+                )
+                os_contact_wrench_command_b = self._os_command_b
+            else:
+                # open-loop control
+                os_contact_wrench_command_b = self.desired_ee_wrench_b.unsqueeze(-1)
+            self._task_space_command_b.baddbmm_(self._selection_matrix_force_b, os_contact_wrench_command_b)
+
+        # map the task-space command forces to joint efforts
+        torch.bmm(jacobian_b.mT, self._task_space_command_b, out=self._joint_efforts.unsqueeze(-1))
+
+        # add gravity compensation (bias correction)
+        if self.cfg.gravity_compensation:
+            # check input is provided
+            if gravity is None:
+                raise ValueError("Gravity vector is required for gravity compensation.")
+            self._joint_efforts.add_(gravity)
+
+        # add null-space position control
+        if use_nullspace_control:
+            # desired joint accelerations
+            if nullspace_joint_pos_target is None:
+                torch.mul(current_joint_pos, -self._nullspace_p_gain, out=self._joint_acc_nullspace)
+            else:
+                torch.sub(nullspace_joint_pos_target, current_joint_pos, out=self._joint_acc_nullspace)
+                self._joint_acc_nullspace.mul_(self._nullspace_p_gain)
+            self._joint_acc_nullspace.addcmul_(current_joint_vel, self._nullspace_d_gain, value=-1.0)
+            # null-space efforts before projection
+            if mass_matrix is not None:
+                torch.bmm(mass_matrix, self._joint_acc_nullspace.unsqueeze(-1), out=self._nullspace_efforts)
+            else:
+                self._nullspace_efforts.copy_(self._joint_acc_nullspace.unsqueeze(-1))
+            # project the efforts: tau_null = tau - J^T * J_pinv^T * tau
+            if use_dynamically_consistent_pinv:
+                # J_pinv^T * tau = (J M^(-1) J^T)^(-1) * (L^(-1) J^T)^T * L^(-1) * tau
+                torch.linalg.solve_triangular(
+                    self._mass_matrix_chol, self._nullspace_efforts, upper=False, out=self._joint_space_rhs
+                )
+                torch.bmm(self._mass_matrix_chol_inv_jacobian_t_b.mT, self._joint_space_rhs, out=self._task_space_rhs)
+                torch.cholesky_solve(self._task_space_rhs, self._os_mass_matrix_inv_chol_b, out=self._task_space_lhs)
+            else:
+                # J_pinv^T * tau = (J J^T)^(-1) * J * tau
+                torch.bmm(jacobian_b, jacobian_b.mT, out=self._jacobian_gram_b)
+                self._factorize_cholesky(self._jacobian_gram_b, self._jacobian_gram_chol_b)
+                torch.bmm(jacobian_b, self._nullspace_efforts, out=self._task_space_rhs)
+                torch.cholesky_solve(self._task_space_rhs, self._jacobian_gram_chol_b, out=self._task_space_lhs)
+            self._nullspace_efforts.baddbmm_(jacobian_b.mT, self._task_space_lhs, alpha=-1.0)
+            # add the null-space joint efforts to the total joint efforts
+            self._joint_efforts.add_(self._nullspace_efforts.squeeze(-1))
+
+        return self._joint_efforts
+
+    def _create_workspace_buffers(self, num_DoF: int):
+        """Allocate the workspace buffers of the high-throughput mode.
+
+        Args:
+            num_DoF: The number of degrees of freedom of the controlled joints.
+        """
+        # -- joint-space quantities
+        self._joint_efforts = torch.zeros(self.num_envs, num_DoF, device=self._device)
+        self._joint_acc_nullspace = torch.zeros(self.num_envs, num_DoF, device=self._device)
+        self._nullspace_efforts = torch.zeros(self.num_envs, num_DoF, 1, device=self._device)
+        self._joint_space_rhs = torch.zeros(self.num_envs, num_DoF, 1, device=self._device)
+        # -- Cholesky factors and the inverse of the mass-matrix factor applied on the transposed Jacobian
+        self._mass_matrix = torch.zeros(self.num_envs, num_DoF, num_DoF, device=self._device)
+        self._mass_matrix_chol = torch.zeros(self.num_envs, num_DoF, num_DoF, device=self._device)
+        self._mass_matrix_chol_inv_jacobian_t_b = torch.zeros(self.num_envs, num_DoF, 6, device=self._device)
+        self._os_mass_matrix_inv_b = torch.zeros(self.num_envs, 6, 6, device=self._device)
+        self._os_mass_matrix_inv_chol_b = torch.zeros(self.num_envs, 6, 6, device=self._device)
+        self._jacobian_gram_b = torch.zeros(self.num_envs, 6, 6, device=self._device)
+        self._jacobian_gram_chol_b = torch.zeros(self.num_envs, 6, 6, device=self._device)
+        self._chol_info = torch.zeros(self.num_envs, dtype=torch.int32, device=self._device)
+        self._chol_failed = torch.zeros(self.num_envs, dtype=torch.bool, device=self._device)
+        self._chol_damping = torch.zeros(self.num_envs, device=self._device)
+        # -- task-space quantities
+        self._motion_error_b = torch.zeros(self.num_envs, 12, device=self._device)
+        self._wrench_error_b = torch.zeros(self.num_envs, 6, device=self._device)
+        self._des_ee_acc_b = torch.zeros(self.num_envs, 6, 1, device=self._device)
+        self._os_command_b = torch.zeros(self.num_envs, 6, 1, device=self._device)
+        self._task_space_command_b = torch.zeros(self.num_envs, 6, 1, device=self._device)
+        self._task_space_rhs = torch.zeros(self.num_envs, 6, 1, device=self._device)
+        self._task_space_lhs = torch.zeros(self.num_envs, 6, 1, device=self._device)
+
+    def _factorize_task_space_inertia(self, jacobian_b: torch.Tensor, mass_matrix: torch.Tensor):
+        """Compute the Cholesky factor of the inverse of the task-space inertia :math:`J M^{-1} J^T`.
+
+        With the Cholesky factorization of the mass matrix :math:`M = L L^T`, the inverse of the task-space
+        inertia is computed as :math:`(L^{-1} J^T)^T (L^{-1} J^T)`, which only requires a single triangular solve.
+        For partial inertial decoupling, the coupling between the translational and rotational parts is
+        removed before the factorization. This is equivalent to factorizing the two blocks separately.
+
+        Args:
+            jacobian_b: The Jacobian matrix of the end-effector in root frame. Shape is (``num_envs``, 6, ``num_DoF``).
+            mass_matrix: The joint-space mass matrix. Shape is (``num_envs``, ``num_DoF``, ``num_DoF``).
+        """
+        # L^(-1) J^T from the Cholesky factor of the mass matrix
+        # note: the mass matrix is copied since the factorization may regularize it in-place
+        self._mass_matrix.copy_(mass_matrix)
+        self._factorize_cholesky(self._mass_matrix, self._mass_matrix_chol)
+        torch.linalg.solve_triangular(
+            self._mass_matrix_chol, jacobian_b.mT, upper=False, out=self._mass_matrix_chol_inv_jacobian_t_b
+        )
+        # J M^(-1) J^T = (L^(-1) J^T)^T (L^(-1) J^T)
+        torch.bmm(
+            self._mass_matrix_chol_inv_jacobian_t_b.mT,
+            self._mass_matrix_chol_inv_jacobian_t_b,
+            out=self._os_mass_matrix_inv_b,
+        )
+        if self.cfg.partial_inertial_dynamics_decoupling:
+            self._os_mass_matrix_inv_b[:, 0:3, 3:6] = 0.0
+            self._os_mass_matrix_inv_b[:, 3:6, 0:3] = 0.0
+        self._factorize_cholesky(self._os_mass_matrix_inv_b, self._os_mass_matrix_inv_chol_b)
+
+    def _factorize_cholesky(self, matrix: torch.Tensor, out: torch.Tensor):
+        """Compute the Cholesky factors of symmetric positive semi-definite matrices.
+
+        The factorization fails for the singular matrices, for instance for rank-deficient Jacobians. To avoid
+        checking the status of the factorization on the host, the matrices are factorized a second time, with a
+        small damping added to the diagonal of the failed matrices. The damping is proportional to the largest
+        diagonal element of the matrix. The other matrices are left unchanged, so that their factors are the same
+        as in the first factorization.
+
+        Args:
+            matrix: The matrices to factorize. Shape is (``num_envs``, ``n``, ``n``). The failed matrices are
+                regularized in-place.
+            out: The output buffer for the lower-triangular Cholesky factors. Shape is (``num_envs``, ``n``, ``n``).
+        """
+        torch.linalg.cholesky_ex(matrix, out=(out, self._chol_info))
+        # damp the failed matrices only
+        # note: the damping is larger than the round-off errors of the eigenvalues of the matrices
+        diagonal = torch.diagonal(matrix, dim1=-2, dim2=-1)
+        torch.amax(diagonal, dim=-1, out=self._chol_damping)
+        torch.gt(self._chol_info, 0, out=self._chol_failed)
+        self._chol_damping.mul_(self._chol_failed).mul_(1e-6)
+        diagonal.add_(self._chol_damping.unsqueeze(-1))
+        torch.linalg.cholesky_ex(matrix, out=(out, self._chol_info))
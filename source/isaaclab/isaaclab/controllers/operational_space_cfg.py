@@ -88,3 +88,23 @@ class OperationalSpaceControllerCfg:
 
     nullspace_damping_ratio: float = 1.0
     """The damping ratio for null space control."""
+
+    high_throughput_mode: bool = False
+    """Whether to compute the joint efforts with persistent workspace buffers. Defaults to False.
+
+    In this mode, the controller does not allocate new tensors on each call to
+    :meth:`~isaaclab.controllers.OperationalSpaceController.compute`. The task-space inertia
+    :math:`(J M^{-1} J^T)^{-1}` is obtained from Cholesky factorizations instead of explicit matrix inverses,
+    and the same factorization is shared between the inertial decoupling and the dynamically consistent
+    pseudo-inverse for null-space control. The stiffness and damping gains are applied in a single
+    batched matrix product.
+
+    .. note::
+        The returned joint efforts are a persistent buffer that is overwritten on the next call.
+        Additionally, the Cholesky factorizations fail for singular matrices, for instance for rank-deficient
+        Jacobians. The failed matrices are then damped and factorized again without synchronizing with the
+        device, which costs a second factorization of each matrix on every call. Thus, the Moore-Penrose
+        pseudo-inverse used for null-space control is approximated by a damped least-squares solution for
+        rank-deficient Jacobians, and the inertial decoupling does not raise an error for singular matrices,
+        unlike in the default mode.
+    """
@@ -65,6 +65,43 @@ class ManagerBasedRLMimicEnv(ManagerBasedRLEnv):
         """
         raise NotImplementedError
 
+    def target_eef_pose_to_action_batch(
+        self,
+        target_eef_pose_dict: dict,
+        gripper_action_dict: dict,
+        noise: torch.Tensor | None = None,
+        env_ids: Sequence[int] | None = None,
+    ) -> torch.Tensor:
+        """
+        Batched version of @target_eef_pose_to_action that computes the actions of multiple environments at once.
+
+        The default implementation calls @target_eef_pose_to_action for each environment. Environments can
+        override this method with a vectorized implementation to speed up batched data generation.
+
+        Args:
+            target_eef_pose_dict: Dictionary of 4x4 target eef poses for each end-effector. Shape is (len(env_ids), 4, 4).
+            gripper_action_dict: Dictionary of gripper actions for each end-effector. Shape is (len(env_ids), G).
+            noise: Noise magnitudes to add to the actions. Shape is (len(env_ids),). If None, no noise is added.
+            env_ids: Environment indices to compute the actions for. If None, all envs are considered.
+
+        Returns:
+            An action torch.Tensor of shape (len(env_ids), action_dim) that's compatible with env.step().
+        """
+        if env_ids is None:
+            env_ids = range(self.num_envs)
+
+        actions = []
+        for i, env_id in enumerate(env_ids):
+            actions.append(
+                self.target_eef_pose_to_action(
+                    target_eef_pose_dict={name: pose[i] for name, pose in target_eef_pose_dict.items()},
+                    gripper_action_dict={name: action[i] for name, action in gripper_action_dict.items()},
+                    noise=None if noise is None else noise[i],
+                    env_id=int(env_id),
+                )
+            )
+        return torch.stack(actions)
+
     def action_to_target_eef_pose(self, action: torch.Tensor) -> dict[str, torch.Tensor]:
         """
         Converts action (compatible with env.step) to a target pose for the end effector controller.
@@ -89,9 +89,12 @@ class CurriculumManager(ManagerBase):
     Operations.
     """
 
-    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, float]:
+    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, float | torch.Tensor]:
         """Returns the current state of individual curriculum terms.
 
+        The states that are tensors are returned as is, so that they are only copied to the host when they
+        are logged.
+
         Note:
             This function does not use the environment indices :attr:`env_ids`
             and logs the state of all the terms. The argument is only present
@@ -107,13 +110,9 @@ class CurriculumManager(ManagerBase):
                 if isinstance(term_state, dict):
                     # each key is a separate state to log
                     for key, value in term_state.items():
-                        if isinstance(value, torch.Tensor):
-                            value = value.item()
                         extras[f"Curriculum/{term_name}/{key}"] = value
                 else:
                     # log directly if not a dict
-                    if isinstance(term_state, torch.Tensor):
-                        term_state = term_state.item()
                     extras[f"Curriculum/{term_name}"] = term_state
         # reset all the curriculum terms
         for term_cfg in self._class_term_cfgs:
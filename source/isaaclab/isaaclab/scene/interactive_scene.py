@@ -147,26 +147,29 @@ class InteractiveScene:
 
         self._global_prim_paths = list()
         if self._is_scene_setup_from_cfg():
-            # add entities from config
-            self._add_entities_from_cfg()
-            # clone environments on a global scope if environment is homogeneous
-            if self.cfg.replicate_physics:
-                self.clone_environments(copy_from_source=False)
-            # replicate physics if we have more than one environment
-            # this is done to make scene initialization faster at play time
-            if self.cfg.replicate_physics and self.cfg.num_envs > 1:
-                self.cloner.replicate_physics(
-                    source_prim_path=self.env_prim_paths[0],
-                    prim_paths=self.env_prim_paths,
-                    base_env_path=self.env_ns,
-                    root_path=self.env_regex_ns.replace(".*", ""),
-                    enable_env_ids=self.cfg.filter_collisions,
-                )
-
-            # since env_ids is only applicable when replicating physics, we have to fallback to the previous method
-            # to filter collisions if replicate_physics is not enabled
-            if not self.cfg.replicate_physics and self.cfg.filter_collisions:
-                self.filter_collisions(self._global_prim_paths)
+            # index the prim paths of the stage while the entities are spawned and cloned
+            # note: the prim path expressions of the entities are resolved many times on the same stage
+            with sim_utils.StagePathIndex(self.stage):
+                # add entities from config
+                self._add_entities_from_cfg()
+                # clone environments on a global scope if environment is homogeneous
+                if self.cfg.replicate_physics:
+                    self.clone_environments(copy_from_source=False)
+                # replicate physics if we have more than one environment
+                # this is done to make scene initialization faster at play time
+                if self.cfg.replicate_physics and self.cfg.num_envs > 1:
+                    self.cloner.replicate_physics(
+                        source_prim_path=self.env_prim_paths[0],
+                        prim_paths=self.env_prim_paths,
+                        base_env_path=self.env_ns,
+                        root_path=self.env_regex_ns.replace(".*", ""),
+                        enable_env_ids=self.cfg.filter_collisions,
+                    )
+
+                # since env_ids is only applicable when replicating physics, we have to fallback to the previous method
+                # to filter collisions if replicate_physics is not enabled
+                if not self.cfg.replicate_physics and self.cfg.filter_collisions:
+                    self.filter_collisions(self._global_prim_paths)
 
     def clone_environments(self, copy_from_source: bool = False):
         """Creates clones of the environment ``/World/envs/env_0``.
@@ -8,6 +8,7 @@
 from .camera import Camera
 from .camera_cfg import CameraCfg
 from .camera_data import CameraData
+from .image_post_processing import ImagePostProcessor
 from .tiled_camera import TiledCamera
-from .tiled_camera_cfg import TiledCameraCfg
+from .tiled_camera_cfg import ImagePostProcessingCfg, TiledCameraCfg
 from .utils import *  # noqa: F401, F403
@@ -0,0 +1,126 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+import warp as wp
+
+from isaaclab.utils.warp.kernels import post_process_image
+
+if TYPE_CHECKING:
+    from .tiled_camera_cfg import ImagePostProcessingCfg
+
+DEPTH_DATA_TYPES = ("depth", "distance_to_image_plane", "distance_to_camera")
+"""Data types of the camera that are depth images."""
+
+
+class ImagePostProcessor:
+    """Post-processing of a batch of camera images into a pre-allocated buffer.
+
+    The post-processing is performed by a single warp kernel on the batched images, as obtained from the tiled
+    rendering with the :func:`~isaaclab.utils.warp.kernels.reshape_tiled_image` kernel. Please refer to
+    :class:`~isaaclab.sensors.camera.ImagePostProcessingCfg` for the operations that are applied.
+    """
+
+    def __init__(self, cfg: ImagePostProcessingCfg, image_shape: tuple[int, int, int, int], device: str):
+        """Initializes the post-processing and its output buffer.
+
+        Args:
+            cfg: The configuration of the post-processing.
+            image_shape: The shape of the input images (num_cameras, height, width, num_channels).
+            device: The device of the images.
+
+        Raises:
+            ValueError: If the configuration is not compatible with the shape of the input images.
+        """
+        num_cameras, height, width, num_channels = image_shape
+        # resolve the channels
+        channels = list(range(num_channels)) if cfg.channels is None else list(cfg.channels)
+        if any(channel < 0 or channel >= num_channels for channel in channels):
+            raise ValueError(
+                f"Invalid channels {channels} for images of '{cfg.data_type}' with {num_channels} channels."
+            )
+        # check the downsampling
+        if cfg.downsample_factor < 1 or height % cfg.downsample_factor != 0 or width % cfg.downsample_factor != 0:
+            raise ValueError(
+                f"The downsample factor {cfg.downsample_factor} must be a positive divisor of the image height"
+                f" ({height}) and width ({width})."
+            )
+        # check the depth normalization
+        if cfg.normalize_depth and cfg.depth_range is None:
+            raise ValueError("The depth range must be set to normalize the depth values.")
+        # resolve the scale and offset of each channel
+        mean = [0.0] * len(channels) if cfg.mean is None else list(cfg.mean)
+        std = [1.0] * len(channels) if cfg.std is None else list(cfg.std)
+        if len(mean) != len(channels) or len(std) != len(channels):
+            raise ValueError(
+                f"The mean ({len(mean)}) and standard deviation ({len(std)}) must have one value per channel"
+                f" ({len(channels)})."
+            )
+
+        # store inputs
+        self.cfg = cfg
+        self.device = device
+        self._is_depth = cfg.data_type in DEPTH_DATA_TYPES
+        self._depth_range = (-torch.inf, torch.inf) if cfg.depth_range is None else cfg.depth_range
+        # create the kernel inputs
+        self._channels = wp.array(channels, dtype=wp.int32, device=device)
+        self._channel_scale = wp.array([cfg.scale / s for s in std], dtype=wp.float32, device=device)
+        self._channel_offset = wp.array([-m / s for m, s in zip(mean, std)], dtype=wp.float32, device=device)
+        # create the output buffer
+        self._output = torch.zeros(
+            (num_cameras, height // cfg.downsample_factor, width // cfg.downsample_factor, len(channels)),
+            dtype=getattr(torch, cfg.dtype),
+            device=device,
+        )
+        self._output_wp = wp.from_torch(self._output)
+
+    """
+    Properties
+    """
+
+    @property
+    def output(self) -> torch.Tensor:
+        """The processed images. Shape is (num_cameras, height, width, num_channels) after downsampling."""
+        return self._output
+
+    """
+    Operations
+    """
+
+    def process(self, images: torch.Tensor) -> torch.Tensor:
+        """Post-processes the images into the output buffer.
+
+        Args:
+            images: The input images. Shape is (num_cameras, height, width, num_channels).
+
+        Returns:
+            The processed images (the output buffer).
+        """
+        wp.launch(
+            kernel=post_process_image,
+            dim=self._output.shape[:3],
+            inputs=[
+                wp.from_torch(images),  # zero-copy alias
+                self._output_wp,
+                self._channels,
+                self._channel_scale,
+                self._channel_offset,
+                self.cfg.downsample_factor,
+                int(self._is_depth),
+                self.cfg.invalid_depth_value,
+                float(self._depth_range[0]),
+                float(self._depth_range[1]),
+                int(self.cfg.normalize_depth),
+            ],
+            device=self.device,
+        )
+        # subtract the mean of each channel over each image
+        if self.cfg.subtract_image_mean:
+            self._output -= torch.mean(self._output, dim=(1, 2), keepdim=True)
+        return self._output
@@ -23,6 +23,7 @@ from isaaclab.utils.warp.kernels import reshape_tiled_image
 
 from ..sensor_base import SensorBase
 from .camera import Camera
+from .image_post_processing import ImagePostProcessor
 
 if TYPE_CHECKING:
     from .tiled_camera_cfg import TiledCameraCfg
@@ -61,6 +62,10 @@ class TiledCamera(Camera):
         - ``"bounding_box_3d"``: The 3D view space bounding box data.
         - ``"bounding_box_3d_fast"``: The 3D view space bounding box data.
 
+    The images can be post-processed on the device into pre-allocated buffers, for example to downsample and
+    normalize them for a policy. The post-processing is configured with :attr:`TiledCameraCfg.post_processing`
+    and the processed images are stored in :attr:`CameraData.output` next to the raw images.
+
     .. _replicator extension: https://docs.omniverse.nvidia.com/extensions/latest/ext_replicator/annotators_details.html#annotator-output
     .. _USDGeom Camera: https://graphics.pixar.com/usd/docs/api/class_usd_geom_camera.html
 
@@ -300,6 +305,10 @@ class TiledCamera(Camera):
                     0.0 if self.cfg.depth_clipping_behavior == "zero" else self.cfg.spawn.clipping_range[1]
                 )
 
+        # post-process the images into their buffers
+        for name, post_processor in self._post_processors.items():
+            self._data.output[name] = post_processor.process(self._data.output[post_processor.cfg.data_type])
+
     """
     Private Helpers
     """
@@ -323,6 +332,30 @@ class TiledCamera(Camera):
                 "\n\tHint: If you need to work with these sensor types, we recommend using their fast counterparts."
                 f"\n\t\tFast counterparts: {fast_common_elements}"
             )
+        # check the post-processing of the images
+        for name, post_processing_cfg in cfg.post_processing.items():
+            if name in cfg.data_types or name in Camera.UNSUPPORTED_TYPES:
+                raise ValueError(f"The name of the processed images '{name}' must not be a data type.")
+            if post_processing_cfg.data_type not in cfg.data_types:
+                raise ValueError(
+                    f"The data type '{post_processing_cfg.data_type}' of the processed images '{name}' is not in the"
+                    f" data types of the camera: {cfg.data_types}."
+                )
+            if (
+                (post_processing_cfg.data_type == "semantic_segmentation" and not cfg.colorize_semantic_segmentation)
+                or (
+                    post_processing_cfg.data_type == "instance_segmentation_fast"
+                    and not cfg.colorize_instance_segmentation
+                )
+                or (
+                    post_processing_cfg.data_type == "instance_id_segmentation_fast"
+                    and not cfg.colorize_instance_id_segmentation
+                )
+            ):
+                raise ValueError(
+                    f"The data type '{post_processing_cfg.data_type}' of the processed images '{name}' cannot be"
+                    " post-processed since it is not colorized."
+                )
 
     def _create_buffers(self):
         """Create buffers for storing data."""
@@ -392,6 +425,15 @@ class TiledCamera(Camera):
                     (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device, dtype=torch.int32
                 ).contiguous()
 
+        # -- post-processed output data
+        self._post_processors: dict[str, ImagePostProcessor] = dict()
+        for name, post_processing_cfg in self.cfg.post_processing.items():
+            post_processor = ImagePostProcessor(
+                post_processing_cfg, data_dict[post_processing_cfg.data_type].shape, self.device
+            )
+            self._post_processors[name] = post_processor
+            data_dict[name] = post_processor.output
+
         self._data.output = data_dict
         self._data.info = dict()
 
@@ -3,12 +3,90 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from dataclasses import MISSING
+from typing import Literal
+
 from isaaclab.utils import configclass
 
 from .camera_cfg import CameraCfg
 from .tiled_camera import TiledCamera
 
 
+@configclass
+class ImagePostProcessingCfg:
+    """Configuration for the post-processing of the images of a camera.
+
+    The images are post-processed in a single pass that writes into a pre-allocated buffer. For each pixel of the
+    processed image, the operations are applied in the following order:
+
+    1. The channels in :attr:`channels` are selected.
+    2. The image is downsampled by averaging the square blocks of :attr:`downsample_factor` pixels.
+    3. For depth images, the non-finite values are replaced with :attr:`invalid_depth_value` (before averaging).
+       If :attr:`depth_range` is not None, the values are clipped to the range and mapped to :math:`[0, 1]` if
+       :attr:`normalize_depth` is True.
+    4. The values are normalized as :math:`(v \\cdot \\text{scale} - \\text{mean}) / \\text{std}`.
+    5. If :attr:`subtract_image_mean` is True, the mean of each channel over each image is subtracted.
+
+    The processed images are always floating-point images.
+    """
+
+    data_type: str = MISSING
+    """The data type of the camera that is post-processed, for example ``"rgb"`` or ``"depth"``.
+
+    The data type must be in :attr:`CameraCfg.data_types`. Non-colorized segmentation data types are not supported,
+    since their values are identifiers.
+    """
+
+    channels: list[int] | None = None
+    """The channels of the image to keep. Defaults to None, in which case all the channels are kept."""
+
+    downsample_factor: int = 1
+    """The factor by which the height and width of the image are divided. Defaults to 1.
+
+    The height and width of the image must be divisible by the factor.
+    """
+
+    invalid_depth_value: float = 0.0
+    """The value of the non-finite depth values. Defaults to 0.0.
+
+    This is only used for the depth data types (``"depth"``, ``"distance_to_image_plane"`` and
+    ``"distance_to_camera"``).
+    """
+
+    depth_range: tuple[float, float] | None = None
+    """The range (min, max) to which the depth values are clipped. Defaults to None, in which case the depth
+    values are not clipped.
+
+    This is only used for the depth data types.
+    """
+
+    normalize_depth: bool = False
+    """Whether to map the :attr:`depth_range` to [0, 1]. Defaults to False.
+
+    This is only used for the depth data types and requires the :attr:`depth_range` to be set.
+    """
+
+    scale: float = 1.0
+    """The scale of the values. Defaults to 1.0.
+
+    For example, a scale of ``1 / 255`` converts a color image to the range [0, 1].
+    """
+
+    mean: list[float] | None = None
+    """The mean of each (selected) channel that is subtracted from the scaled values. Defaults to None,
+    in which case no mean is subtracted."""
+
+    std: list[float] | None = None
+    """The standard deviation of each (selected) channel by which the values are divided. Defaults to None,
+    in which case the values are not divided."""
+
+    subtract_image_mean: bool = False
+    """Whether to subtract the mean of each channel over each image. Defaults to False."""
+
+    dtype: Literal["float32", "float16"] = "float32"
+    """The data type of the processed images. Defaults to "float32"."""
+
+
 @configclass
 class TiledCameraCfg(CameraCfg):
     """Configuration for a tiled rendering-based camera sensor."""
@@ -22,3 +100,19 @@ class TiledCameraCfg(CameraCfg):
     due to the use of :class:`XformPrimView`.
     If False, the pose of the camera during initialization is returned.
     """
+
+    post_processing: dict[str, ImagePostProcessingCfg] = {}
+    """The post-processing of the images, keyed by the name of the processed images. Defaults to no post-processing.
+
+    The processed images are stored in :attr:`CameraData.output` under their name, next to the raw images of the
+    data types. The names must not be data types. For example, the following configuration adds normalized color
+    images that are downsampled by 2 under the name ``"rgb_normalized"``:
+
+    .. code-block:: python
+
+        post_processing = {
+            "rgb_normalized": ImagePostProcessingCfg(
+                data_type="rgb", downsample_factor=2, scale=1.0 / 255.0, subtract_image_mean=True
+            ),
+        }
+    """
@@ -11,6 +11,7 @@ from __future__ import annotations
 import numpy as np
 import torch
 from collections.abc import Sequence
+from typing import Literal
 
 import warp as wp
 
@@ -257,6 +258,220 @@ def create_pointcloud_from_rgbd(
         return points_xyz, points_rgb
 
 
+def create_batched_pointcloud_from_depth(
+    intrinsic_matrices: torch.Tensor,
+    depth: torch.Tensor,
+    num_points: int,
+    position: torch.Tensor | None = None,
+    orientation: torch.Tensor | None = None,
+    features: torch.Tensor | None = None,
+    downsample_mode: Literal["voxel", "farthest_point"] = "voxel",
+    voxel_size: float = 0.05,
+    max_depth: float | None = None,
+    is_ortho: bool = True,
+    generator: torch.Generator | None = None,
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor | None]:
+    r"""Creates fixed-size pointclouds from a batch of depth images of the cameras of all environments.
+
+    Unlike :meth:`create_pointcloud_from_depth`, the invalid points are not removed from the pointclouds, which
+    would result in pointclouds of different sizes. Instead, each pointcloud is downsampled to at most
+    :attr:`num_points` points and padded with zeros. The valid points are indicated by the returned mask.
+    The depth values that are non-finite, non-positive or larger than :attr:`max_depth` are invalid.
+
+    The pointclouds are downsampled with one of the following modes:
+
+    - ``"voxel"``: The points are averaged in the cells of a voxel grid of size :attr:`voxel_size`, as by
+      :func:`downsample_points_voxel`. If there are more occupied voxels than :attr:`num_points`, the voxels
+      are sampled randomly.
+    - ``"farthest_point"``: The points are sampled iteratively such that each point is the farthest from the
+      already sampled points, as by :func:`downsample_points_farthest`.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3) or (3, 3).
+        depth: The depth images. Shape is (N, H, W) or (N, H, W, 1).
+        num_points: The number of points of each pointcloud.
+        position: The positions of the cameras in a target frame. Shape is (N, 3). Defaults to None.
+        orientation: The orientations (w, x, y, z) of the cameras in a target frame. Shape is (N, 4).
+            Defaults to None.
+        features: The features of the pixels, for example colors. Shape is (N, H, W, C). Defaults to None.
+        downsample_mode: The mode to downsample the pointclouds. Defaults to "voxel".
+        voxel_size: The size of the voxels for the ``"voxel"`` mode. Defaults to 0.05.
+        max_depth: The maximum valid depth value. Defaults to None, in which case all the finite depth values
+            are valid.
+        is_ortho: Whether the depth images are orthogonal (distance to the image plane) or perspective
+            (distance to the camera) depth images. Defaults to True.
+        generator: The random number generator for the ``"voxel"`` mode. Defaults to None.
+
+    Returns:
+        A tuple containing the points, the mask of the valid points and the features of the points (None if no
+        features are given). The shapes are (N, num_points, 3), (N, num_points) and (N, num_points, C).
+
+    Raises:
+        ValueError: When the downsample mode is not supported.
+    """
+    if depth.dim() == 4:
+        depth = depth.squeeze(dim=3)
+    num_envs = depth.shape[0]
+    # compute the points in the order of the pixels (u, v)
+    points = math_utils.unproject_depth(depth, intrinsic_matrices, is_ortho=is_ortho)
+    points = math_utils.transform_points(points, position, orientation)
+    # resolve the valid points
+    depth = depth.transpose(1, 2).reshape(num_envs, -1)
+    valid = torch.isfinite(depth) & (depth > 0.0)
+    if max_depth is not None:
+        valid &= depth <= max_depth
+    if features is not None:
+        features = features.transpose(1, 2).reshape(num_envs, -1, features.shape[-1])
+
+    # downsample the points
+    if downsample_mode == "voxel":
+        return downsample_points_voxel(points, valid, voxel_size, num_points, features, generator)
+    elif downsample_mode == "farthest_point":
+        return downsample_points_farthest(points, valid, num_points, features)
+    else:
+        raise ValueError(f"Unsupported downsample mode: '{downsample_mode}'. Expected 'voxel' or 'farthest_point'.")
+
+
+def downsample_points_voxel(
+    points: torch.Tensor,
+    valid: torch.Tensor,
+    voxel_size: float,
+    num_points: int,
+    features: torch.Tensor | None = None,
+    generator: torch.Generator | None = None,
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor | None]:
+    """Downsamples a batch of pointclouds with a voxel grid into fixed-size pointclouds.
+
+    The valid points of each pointcloud are averaged in the cells of a voxel grid. If a pointcloud occupies
+    more voxels than :attr:`num_points`, the voxels are sampled randomly. All the pointclouds are processed at
+    once with scatter operations.
+
+    Args:
+        points: The points. Shape is (N, P, 3).
+        valid: The mask of the valid points. Shape is (N, P).
+        voxel_size: The size of the voxels.
+        num_points: The number of points of each downsampled pointcloud.
+        features: The features of the points, which are averaged as the points. Shape is (N, P, C).
+            Defaults to None.
+        generator: The random number generator to sample the voxels. Defaults to None.
+
+    Returns:
+        A tuple containing the points, the mask of the valid points and the features of the points (None if no
+        features are given). The shapes are (N, num_points, 3), (N, num_points) and (N, num_points, C).
+    """
+    num_envs = points.shape[0]
+    device = points.device
+    # select the valid points
+    env_ids, point_ids = torch.nonzero(valid, as_tuple=True)
+    valid_points = points[env_ids, point_ids]
+    # compute the voxel coordinates relative to the minimum coordinates
+    voxel_coords = torch.floor(valid_points / voxel_size).long()
+    if voxel_coords.shape[0] > 0:
+        voxel_coords -= voxel_coords.min(dim=0).values
+        grid_size = (voxel_coords.max(dim=0).values + 1).tolist()
+    else:
+        grid_size = [1, 1, 1]
+    num_grid_voxels = grid_size[0] * grid_size[1] * grid_size[2]
+    # find the voxels, sorted by environment
+    # note: packing the environment and voxel coordinates into a single key is faster than comparing them row by
+    #   row, but only possible if the keys fit into 64-bit integers
+    if num_envs * num_grid_voxels <= torch.iinfo(torch.long).max:
+        keys = env_ids
+        for dim in range(3):
+            keys = keys * grid_size[dim] + voxel_coords[:, dim]
+        voxel_keys, voxel_ids, voxel_counts = torch.unique(keys, return_inverse=True, return_counts=True)
+        voxel_env_ids = voxel_keys // num_grid_voxels
+    else:
+        voxel_keys, voxel_ids, voxel_counts = torch.unique(
+            torch.cat([env_ids.unsqueeze(1), voxel_coords], dim=1), dim=0, return_inverse=True, return_counts=True
+        )
+        voxel_env_ids = voxel_keys[:, 0]
+    num_voxels = voxel_keys.shape[0]
+    # average the points (and features) in the voxels
+    voxel_points = torch.zeros(num_voxels, 3, dtype=points.dtype, device=device)
+    voxel_points.index_add_(0, voxel_ids, valid_points)
+    voxel_points /= voxel_counts.unsqueeze(1)
+    if features is not None:
+        voxel_features = torch.zeros(num_voxels, features.shape[-1], dtype=torch.float32, device=device)
+        voxel_features.index_add_(0, voxel_ids, features[env_ids, point_ids].float())
+        voxel_features /= voxel_counts.unsqueeze(1)
+
+    # sample the voxels randomly in each environment
+    # note: the voxels are shuffled within each environment by sorting them by environment and random value
+    random_values = torch.rand(num_voxels, dtype=torch.float64, device=device, generator=generator)
+    order = torch.argsort(voxel_env_ids.double() + random_values)
+    voxel_env_ids = voxel_env_ids[order]
+    env_num_voxels = torch.bincount(voxel_env_ids, minlength=num_envs)
+    env_start_ids = torch.cumsum(env_num_voxels, dim=0) - env_num_voxels
+    ranks = torch.arange(num_voxels, device=device) - env_start_ids[voxel_env_ids]
+    selected = ranks < num_points
+    order, voxel_env_ids, ranks = order[selected], voxel_env_ids[selected], ranks[selected]
+
+    # fill the fixed-size outputs
+    out_points = torch.zeros(num_envs, num_points, 3, dtype=points.dtype, device=device)
+    out_points[voxel_env_ids, ranks] = voxel_points[order]
+    out_valid = torch.zeros(num_envs, num_points, dtype=torch.bool, device=device)
+    out_valid[voxel_env_ids, ranks] = True
+    out_features = None
+    if features is not None:
+        out_features = torch.zeros(num_envs, num_points, features.shape[-1], dtype=torch.float32, device=device)
+        out_features[voxel_env_ids, ranks] = voxel_features[order]
+    return out_points, out_valid, out_features
+
+
+def downsample_points_farthest(
+    points: torch.Tensor, valid: torch.Tensor, num_points: int, features: torch.Tensor | None = None
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor | None]:
+    """Downsamples a batch of pointclouds with farthest point sampling into fixed-size pointclouds.
+
+    The first sampled point is the first valid point of each pointcloud. Each next point is the valid point that is
+    the farthest from the already sampled points. The pointclouds are sampled in parallel, with one iteration per
+    sampled point. If a pointcloud has fewer valid points than :attr:`num_points`, all its valid points are sampled.
+
+    Args:
+        points: The points. Shape is (N, P, 3).
+        valid: The mask of the valid points. Shape is (N, P).
+        num_points: The number of points of each downsampled pointcloud.
+        features: The features of the points. Shape is (N, P, C). Defaults to None.
+
+    Returns:
+        A tuple containing the points, the mask of the valid points and the features of the points (None if no
+        features are given). The shapes are (N, num_points, 3), (N, num_points) and (N, num_points, C).
+    """
+    num_envs = points.shape[0]
+    device = points.device
+    # replace the invalid points so that they do not produce NaN distances
+    points = torch.where(valid.unsqueeze(-1), points, 0.0)
+    # note: the coordinates are stored separately as it is faster to compute the distances on the CPU
+    points_x, points_y, points_z = points.permute(2, 0, 1).contiguous()
+    # squared distances of the points to the sampled points (-1 for the invalid and sampled points)
+    distances = torch.where(valid, torch.inf, -1.0)
+    new_distances = torch.empty_like(distances)
+    sample_ids = torch.zeros(num_envs, num_points, dtype=torch.long, device=device)
+    out_valid = torch.zeros(num_envs, num_points, dtype=torch.bool, device=device)
+    env_ids = torch.arange(num_envs, device=device)
+    # note: the first valid point is the first point with the maximum distance
+    for i in range(num_points):
+        max_distances, ids = torch.max(distances, dim=1)
+        sample_ids[:, i] = ids
+        out_valid[:, i] = max_distances >= 0.0
+        # update the distances to the sampled points
+        sampled_points = points[env_ids, ids].unsqueeze(-1)
+        torch.sub(points_x, sampled_points[:, 0], out=new_distances).square_()
+        new_distances.addcmul_(points_y - sampled_points[:, 1], points_y - sampled_points[:, 1])
+        new_distances.addcmul_(points_z - sampled_points[:, 2], points_z - sampled_points[:, 2])
+        torch.minimum(distances, new_distances, out=distances)
+        distances[env_ids, ids] = -1.0
+
+    # gather the fixed-size outputs
+    out_points = torch.gather(points, 1, sample_ids.unsqueeze(-1).expand(-1, -1, 3)) * out_valid.unsqueeze(-1)
+    out_features = None
+    if features is not None:
+        out_features = torch.gather(features.float(), 1, sample_ids.unsqueeze(-1).expand(-1, -1, features.shape[-1]))
+        out_features *= out_valid.unsqueeze(-1)
+    return out_points, out_valid, out_features
+
+
 def save_images_to_file(images: torch.Tensor, file_path: str):
     """Save images to file.
 
@@ -6,6 +6,8 @@
 """Sub-module for Warp-based ray-cast sensor."""
 
 from . import patterns
+from .height_map_scanner import HeightMapScanner
+from .height_map_scanner_cfg import HeightMapScannerCfg
 from .ray_caster import RayCaster
 from .ray_caster_camera import RayCasterCamera
 from .ray_caster_camera_cfg import RayCasterCameraCfg
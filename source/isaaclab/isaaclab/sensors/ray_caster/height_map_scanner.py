@@ -0,0 +1,126 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import omni.log
+
+import isaaclab.sim as sim_utils
+from isaaclab.terrains.height_map import HeightMap, create_flat_height_map, create_height_map_from_mesh, find_height_map
+from isaaclab.utils.math import quat_apply_yaw
+
+from .ray_caster import RayCaster
+
+if TYPE_CHECKING:
+    from .height_map_scanner_cfg import HeightMapScannerCfg
+
+
+class HeightMapScanner(RayCaster):
+    """A height scanner that samples the height map of the terrain instead of ray-casting.
+
+    The sensor has the same interface as the :class:`RayCaster` for vertical rays that only track the yaw
+    orientation of the sensor, as typically used to scan the terrain heights around a robot. Instead of
+    ray-casting against the terrain mesh, the heights at the starting positions of the rays are bilinearly
+    interpolated from a 2D grid of heights on the device (see :class:`~isaaclab.terrains.HeightMap`).
+
+    The height map of the terrain is obtained in the following order:
+
+    * The height map registered by the :class:`~isaaclab.terrains.TerrainImporter` for the terrain prim. This is
+      the case for ground planes and for generated terrains with a
+      :attr:`~isaaclab.terrains.TerrainGeneratorCfg.height_map_resolution`.
+    * Otherwise, the mesh of the terrain prim is rasterized once at the initialization of the sensor with the
+      resolution :attr:`HeightMapScannerCfg.height_map_resolution`.
+
+    The ray hits are :obj:`float('inf')` if the rays start outside the height map, below the terrain or farther
+    than the :attr:`~RayCasterCfg.max_distance` from the terrain.
+
+    .. note::
+        The interpolated heights are smoothed over the cells of the grid. For example, the edges of steps are
+        sloped over one cell. The resolution of the height map should be small enough for the terrain features
+        that the sensor needs to resolve.
+    """
+
+    cfg: HeightMapScannerCfg
+    """The configuration parameters."""
+
+    def __init__(self, cfg: HeightMapScannerCfg):
+        """Initializes the height map scanner.
+
+        Args:
+            cfg: The configuration parameters.
+        """
+        super().__init__(cfg)
+        # the height map of the terrain
+        self.height_map: HeightMap | None = None
+
+    def __str__(self) -> str:
+        """Returns: A string containing information about the instance."""
+        return (
+            f"Height-map-scanner @ '{self.cfg.prim_path}': \n"
+            f"\tview type            : {self._view.__class__}\n"
+            f"\tupdate period (s)    : {self.cfg.update_period}\n"
+            f"\theight map shape     : {tuple(self.height_map.heights.shape)}\n"
+            f"\theight map resolution: {self.height_map.resolution}\n"
+            f"\tnumber of sensors    : {self._view.count}\n"
+            f"\tnumber of rays/sensor: {self.num_rays}\n"
+            f"\ttotal number of rays : {self.num_rays * self._view.count}"
+        )
+
+    """
+    Implementation.
+    """
+
+    def _initialize_warp_meshes(self):
+        # check number of mesh prims provided
+        if len(self.cfg.mesh_prim_paths) != 1:
+            raise NotImplementedError(
+                f"HeightMapScanner currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
+            )
+        mesh_prim_path = self.cfg.mesh_prim_paths[0]
+
+        # use the height map of the imported terrain if available
+        height_map = find_height_map(mesh_prim_path)
+        if height_map is not None:
+            omni.log.info(f"Using the height map registered for the terrain prim: {mesh_prim_path}.")
+        elif sim_utils.get_first_matching_child_prim(mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane"):
+            height_map = create_flat_height_map(device=self.device)
+            omni.log.info(f"Created the height map of the infinite plane prim: {mesh_prim_path}.")
+        else:
+            # read the mesh and rasterize it
+            super()._initialize_warp_meshes()
+            height_map = create_height_map_from_mesh(self.meshes[mesh_prim_path], self.cfg.height_map_resolution)
+            omni.log.info(
+                f"Created the height map of the mesh prim: {mesh_prim_path} with shape"
+                f" {tuple(height_map.heights.shape)}."
+            )
+        self.height_map = height_map.to(self.device)
+
+    def _initialize_rays_impl(self):
+        super()._initialize_rays_impl()
+        # check that the rays are vertical
+        down = torch.tensor([0.0, 0.0, -1.0], device=self._device)
+        if not torch.allclose(self.ray_directions, down.expand_as(self.ray_directions), atol=1e-5):
+            raise ValueError(
+                "The height map scanner only supports vertical rays pointing downwards. Please check the directions"
+                " of the pattern and the rotation of the offset."
+            )
+
+    def _update_ray_hits(self, env_ids: Sequence[int], pos_w: torch.Tensor, quat_w: torch.Tensor):
+        # only yaw orientation is considered and the rays are vertical
+        ray_hits_w = quat_apply_yaw(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
+        ray_hits_w += pos_w.unsqueeze(1)
+        # sample the heights under the ray starts
+        heights = self.height_map.sample(ray_hits_w)
+        # mark the rays that do not hit the terrain
+        # note: the comparisons are false for the NaN heights outside the height map
+        distance = ray_hits_w[..., 2] - heights
+        missed = ~((distance >= 0.0) & (distance <= self.cfg.max_distance))
+        ray_hits_w[..., 2] = heights
+        ray_hits_w[missed] = torch.inf
+        self._data.ray_hits_w[env_ids] = ray_hits_w
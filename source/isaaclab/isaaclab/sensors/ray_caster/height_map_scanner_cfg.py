@@ -0,0 +1,33 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Configuration for the height map scanner."""
+
+from isaaclab.utils import configclass
+
+from .height_map_scanner import HeightMapScanner
+from .ray_caster_cfg import RayCasterCfg
+
+
+@configclass
+class HeightMapScannerCfg(RayCasterCfg):
+    """Configuration for the height map scanner.
+
+    The pattern must define vertical rays pointing downwards, for example a
+    :class:`~isaaclab.sensors.ray_caster.patterns.GridPatternCfg` with the default direction.
+    """
+
+    class_type: type = HeightMapScanner
+
+    height_map_resolution: float = 0.1
+    """The resolution of the height map (in m) if the terrain mesh is rasterized by the sensor. Defaults to 0.1.
+
+    This is only used if no height map is registered for the terrain prim, for example if the terrain is
+    imported from a USD file or if the generated terrain does not have a height map.
+    """
+
+    def __post_init__(self):
+        # for height maps, the rays are vertical and only track the yaw orientation
+        self.attach_yaw_only = True
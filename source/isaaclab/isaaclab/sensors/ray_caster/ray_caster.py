@@ -238,7 +238,17 @@ class RayCaster(SensorBase):
         # store the poses
         self._data.pos_w[env_ids] = pos_w
         self._data.quat_w[env_ids] = quat_w
+        # compute the ray hits
+        self._update_ray_hits(env_ids, pos_w, quat_w)
 
+    def _update_ray_hits(self, env_ids: Sequence[int], pos_w: torch.Tensor, quat_w: torch.Tensor):
+        """Fills the ray hits of the sensors based on their poses.
+
+        Args:
+            env_ids: The indices of the sensors to update.
+            pos_w: The positions of the sensors in the world frame. Shape is (len(env_ids), 3).
+            quat_w: The orientations (w, x, y, z) of the sensors in the world frame. Shape is (len(env_ids), 4).
+        """
         # ray cast based on the sensor poses
         if self.cfg.attach_yaw_only:
             # only yaw orientation is considered and directions are not rotated
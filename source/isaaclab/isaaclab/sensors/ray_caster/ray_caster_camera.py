@@ -15,7 +15,7 @@ from isaacsim.core.prims import XFormPrim
 
 import isaaclab.utils.math as math_utils
 from isaaclab.sensors.camera import CameraData
-from isaaclab.utils.warp import raycast_mesh
+from isaaclab.utils.warp import raycast_camera
 
 from .ray_caster import RayCaster
 
@@ -241,9 +241,11 @@ class RayCasterCamera(RayCaster):
         # compute intrinsic matrices
         self._compute_intrinsic_matrices()
         # compute ray stars and directions
-        self.ray_starts, self.ray_directions = self.cfg.pattern_cfg.func(
+        # note: the rays are stored contiguously to map them to warp arrays without copies
+        ray_starts, ray_directions = self.cfg.pattern_cfg.func(
             self.cfg.pattern_cfg, self._data.intrinsic_matrices, self._device
         )
+        self.ray_starts, self.ray_directions = ray_starts.contiguous(), ray_directions.contiguous()
         self.num_rays = self.ray_directions.shape[1]
         # create buffer to store ray hits
         self.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
@@ -265,57 +267,28 @@ class RayCasterCamera(RayCaster):
         self._data.pos_w[env_ids] = pos_w
         self._data.quat_w_world[env_ids] = quat_w
 
-        # note: full orientation is considered
-        ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-        ray_starts_w += pos_w.unsqueeze(1)
-        ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
-
-        # ray cast and store the hits
-        # note: we set max distance to 1e6 during the ray-casting. THis is because we clip the distance
-        # to the image plane and distance to the camera to the maximum distance afterwards in-order to
-        # match the USD camera behavior.
+        # ray cast and store the hits, the depths and the normals in a single launch
+        # note: we set max distance to 1e6 during the ray-casting. This is because the distance to the
+        # image plane and distance to the camera are clipped to the maximum distance afterwards (in the
+        # same kernel) in-order to match the USD camera behavior.
 
         # TODO: Make ray-casting work for multiple meshes?
         # necessary for regular dictionaries.
-        self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
+        raycast_camera(
             mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
+            ray_starts=self.ray_starts,
+            ray_directions=self.ray_directions,
+            pos_w=pos_w,
+            quat_w=quat_w,
+            ray_hits=self.ray_hits_w,
+            env_ids=torch.as_tensor(env_ids, dtype=torch.int32, device=self._device),
+            distance_to_image_plane=self._data.output.get("distance_to_image_plane"),
+            distance_to_camera=self._data.output.get("distance_to_camera"),
+            normals=self._data.output.get("normals"),
+            max_distance=self.cfg.max_distance,
+            depth_clipping_behavior=self.cfg.depth_clipping_behavior,
             max_dist=1e6,
-            return_distance=any(
-                [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
-            ),
-            return_normal="normals" in self.cfg.data_types,
         )
-        # update output buffers
-        if "distance_to_image_plane" in self.cfg.data_types:
-            # note: data is in camera frame so we only take the first component (z-axis of camera frame)
-            distance_to_image_plane = (
-                math_utils.quat_apply(
-                    math_utils.quat_inv(quat_w).repeat(1, self.num_rays),
-                    (ray_depth[:, :, None] * ray_directions_w),
-                )
-            )[:, :, 0]
-            # apply the maximum distance after the transformation
-            if self.cfg.depth_clipping_behavior == "max":
-                distance_to_image_plane = torch.clip(distance_to_image_plane, max=self.cfg.max_distance)
-                distance_to_image_plane[torch.isnan(distance_to_image_plane)] = self.cfg.max_distance
-            elif self.cfg.depth_clipping_behavior == "zero":
-                distance_to_image_plane[distance_to_image_plane > self.cfg.max_distance] = 0.0
-                distance_to_image_plane[torch.isnan(distance_to_image_plane)] = 0.0
-            self._data.output["distance_to_image_plane"][env_ids] = distance_to_image_plane.view(
-                -1, *self.image_shape, 1
-            )
-
-        if "distance_to_camera" in self.cfg.data_types:
-            if self.cfg.depth_clipping_behavior == "max":
-                ray_depth = torch.clip(ray_depth, max=self.cfg.max_distance)
-            elif self.cfg.depth_clipping_behavior == "zero":
-                ray_depth[ray_depth > self.cfg.max_distance] = 0.0
-            self._data.output["distance_to_camera"][env_ids] = ray_depth.view(-1, *self.image_shape, 1)
-
-        if "normals" in self.cfg.data_types:
-            self._data.output["normals"][env_ids] = ray_normal.view(-1, *self.image_shape, 3)
 
     def _debug_vis_callback(self, event):
         # in case it crashes be safe
@@ -365,7 +338,9 @@ class RayCasterCamera(RayCaster):
             else:
                 raise ValueError(f"Received unknown data type: {name}. Please check the configuration.")
             # allocate tensor to store the data
-            self._data.output[name] = torch.zeros((self._view.count, *shape), device=self._device)
+            self._data.output[name] = torch.zeros(
+                (self._view.count, *shape), dtype=getattr(torch, self.cfg.output_dtype), device=self._device
+            )
 
     def _compute_intrinsic_matrices(self):
         """Computes the intrinsic matrices for the camera based on the config provided."""
@@ -55,6 +55,12 @@ class RayCasterCameraCfg(RayCasterCfg):
       for ``distance_to_image_plane`` data type.
     """
 
+    output_dtype: Literal["float32", "float16"] = "float32"
+    """The data type of the images in :attr:`CameraData.output`. Defaults to "float32".
+
+    Half precision reduces the memory of the images. The ray-casting is always performed in single precision.
+    """
+
     pattern_cfg: PinholeCameraPatternCfg = MISSING
     """The pattern that defines the local ray starting positions and directions in a pinhole camera pattern."""
 
@@ -26,9 +26,17 @@ To make it convenient to use the module, we recommend importing the module as fo
 
 """
 
+from isaaclab.utils.lazy import lazy_attach
+
 from .converters import *  # noqa: F401, F403
 from .schemas import *  # noqa: F401, F403
 from .simulation_cfg import PhysxCfg, RenderCfg, SimulationCfg  # noqa: F401, F403
 from .simulation_context import SimulationContext, build_simulation_context  # noqa: F401, F403
 from .spawners import *  # noqa: F401, F403
+from .stage_path_index import StagePathIndex, get_stage_path_index  # noqa: F401, F403
 from .utils import *  # noqa: F401, F403
+
+# note: the converters are loaded on their first access (see :mod:`isaaclab.sim.converters`)
+__getattr__, __dir__ = lazy_attach(
+    __name__, attributes={name: ".converters" for name in ["MeshConverter", "MjcfConverter", "UrdfConverter"]}
+)
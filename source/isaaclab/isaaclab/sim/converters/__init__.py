@@ -16,11 +16,20 @@ The following converters are currently supported:
 
 """
 
+from isaaclab.utils.lazy import lazy_attach
+
 from .asset_converter_base import AssetConverterBase
 from .asset_converter_base_cfg import AssetConverterBaseCfg
-from .mesh_converter import MeshConverter
 from .mesh_converter_cfg import MeshConverterCfg
-from .mjcf_converter import MjcfConverter
 from .mjcf_converter_cfg import MjcfConverterCfg
-from .urdf_converter import UrdfConverter
 from .urdf_converter_cfg import UrdfConverterCfg
+
+# the converters depend on the asset importer extensions, so they are loaded on first access
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    attributes={
+        "MeshConverter": ".mesh_converter",
+        "MjcfConverter": ".mjcf_converter",
+        "UrdfConverter": ".urdf_converter",
+    },
+)
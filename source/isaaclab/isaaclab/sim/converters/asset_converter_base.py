@@ -4,7 +4,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import abc
-import hashlib
 import json
 import os
 import pathlib
@@ -13,6 +12,7 @@ from datetime import datetime
 
 from isaaclab.sim.converters.asset_converter_base_cfg import AssetConverterBaseCfg
 from isaaclab.utils.assets import check_file_path
+from isaaclab.utils.hashing import CacheReport, ContentHasher, get_file_hash_record, set_file_hash_record
 from isaaclab.utils.io import dump_yaml
 
 
@@ -30,6 +30,8 @@ class AssetConverterBase(abc.ABC):
     * The configuration parameters are modified.
     * The USD file does not exist.
 
+    The reason why the USD file is re-generated or not is reported in :attr:`cache_report`.
+
     To override this behavior to force conversion, the flag :obj:`AssetConverterBaseCfg.force_usd_conversion`
     can be set to True.
 
@@ -87,21 +89,45 @@ class AssetConverterBase(abc.ABC):
         self._usd_file_exists = os.path.isfile(self.usd_path)
         # path to read/write asset hash file
         self._dest_hash_path = os.path.join(self.usd_dir, ".asset_hash")
-        # create asset hash to check if the asset has changed
-        self._asset_hash = self._config_to_hash(cfg)
-        # read the saved hash
+        # read the saved hash and the saved hash of the asset file
+        # note: the hash of the asset file is reused if the asset file did not change since it was saved
+        existing_asset_hash = None
         try:
             with open(self._dest_hash_path) as f:
-                existing_asset_hash = f.readline()
-                self._is_same_asset = existing_asset_hash == self._asset_hash
-        except FileNotFoundError:
-            self._is_same_asset = False
+                existing_asset_hash = f.readline().rstrip("\n")
+                file_hash_record = f.readline()
+            if file_hash_record:
+                set_file_hash_record(json.loads(file_hash_record))
+        except (FileNotFoundError, KeyError, TypeError, ValueError):
+            # the saved hash of the asset file is ignored if it is missing or corrupted
+            pass
+        # create asset hash to check if the asset has changed
+        self._asset_hash = self._config_to_hash(cfg)
+        self._is_same_asset = existing_asset_hash == self._asset_hash
+        # report the validity of the generated USD file
+        if cfg.force_usd_conversion:
+            reason = "the conversion is forced"
+        elif not self._usd_file_exists:
+            reason = "the USD file does not exist"
+        elif existing_asset_hash is None:
+            reason = "the hash of the asset is not saved"
+        elif not self._is_same_asset:
+            reason = "the asset file or the configuration changed"
+        else:
+            reason = "the asset file and the configuration did not change"
+        self._cache_report = CacheReport(
+            path=self.usd_path,
+            hash=self._asset_hash,
+            is_valid=not cfg.force_usd_conversion and self._usd_file_exists and self._is_same_asset,
+            reason=reason,
+        )
 
         # convert the asset to USD if the hash is different or USD file does not exist
-        if cfg.force_usd_conversion or not self._usd_file_exists or not self._is_same_asset:
-            # write the updated hash
+        if not self._cache_report.is_valid:
+            # write the updated hash and the hash of the asset file
             with open(self._dest_hash_path, "w") as f:
-                f.write(self._asset_hash)
+                f.write(self._asset_hash + "\n")
+                f.write(json.dumps(get_file_hash_record(cfg.asset_path)) + "\n")
             # convert the asset to USD
             self._convert_asset(cfg)
             # dump the configuration to a file
@@ -134,6 +160,14 @@ class AssetConverterBase(abc.ABC):
         """The absolute path to the generated USD file."""
         return os.path.join(self.usd_dir, self.usd_file_name)
 
+    @property
+    def cache_report(self) -> CacheReport:
+        """The report about the validity of the previously generated USD file.
+
+        The USD file is re-generated if it is not valid.
+        """
+        return self._cache_report
+
     @property
     def usd_instanceable_meshes_path(self) -> str:
         """The relative path to the USD file with meshes.
@@ -163,7 +197,10 @@ class AssetConverterBase(abc.ABC):
 
     @staticmethod
     def _config_to_hash(cfg: AssetConverterBaseCfg) -> str:
-        """Converts the configuration object and asset file to an MD5 hash of a string.
+        """Converts the configuration object and asset file to a hash string.
+
+        The hash of the asset file is memoized by its path, size and modification time (see
+        :func:`isaaclab.utils.hashing.hash_file`), so that the file is only read if it changed.
 
         .. warning::
             It only checks the main asset file (:attr:`cfg.asset_path`).
@@ -172,7 +209,7 @@ class AssetConverterBase(abc.ABC):
             config : The asset converter configuration object.
 
         Returns:
-            An MD5 hash of a string.
+            A hash string of the configuration and the asset file.
         """
 
         # convert to dict and remove path related info
@@ -180,19 +217,5 @@ class AssetConverterBase(abc.ABC):
         _ = config_dic.pop("asset_path")
         _ = config_dic.pop("usd_dir")
         _ = config_dic.pop("usd_file_name")
-        # convert config dic to bytes
-        config_bytes = json.dumps(config_dic).encode()
-        # hash config
-        md5 = hashlib.md5()
-        md5.update(config_bytes)
-
-        # read the asset file to observe changes
-        with open(cfg.asset_path, "rb") as f:
-            while True:
-                # read 64kb chunks to avoid memory issues for the large files!
-                data = f.read(65536)
-                if not data:
-                    break
-                md5.update(data)
-        # return the hash
-        return md5.hexdigest()
+        # hash config and the asset file to observe changes
+        return ContentHasher().update_dict(config_dic).update_file(cfg.asset_path).hexdigest()
@@ -6,8 +6,6 @@
 from __future__ import annotations
 
 import numpy as np
-import trimesh
-import trimesh.transformations
 from typing import TYPE_CHECKING
 
 import isaacsim.core.utils.prims as prim_utils
@@ -15,12 +13,16 @@ from pxr import Usd, UsdPhysics
 
 from isaaclab.sim import schemas
 from isaaclab.sim.utils import bind_physics_material, bind_visual_material, clone
+from isaaclab.utils.lazy import lazy_import
 
 from ..materials import DeformableBodyMaterialCfg, RigidBodyMaterialCfg
 
 if TYPE_CHECKING:
     from . import meshes_cfg
 
+# note: trimesh is only loaded when a mesh is spawned
+trimesh = lazy_import("trimesh")
+
 
 @clone
 def spawn_mesh_sphere(
@@ -0,0 +1,307 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Index of the prim paths of a USD stage for matching prim path expressions."""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Iterable
+
+from pxr import Sdf, Tf, Usd
+
+_REGEX_SPECIAL_CHARS = frozenset("\\.^$*+?{}[]|()")
+"""The characters that have a special meaning in regex expressions."""
+
+
+class _PrimNode:
+    """A node of the prim tree in the index.
+
+    The names of the children are read from the stage on their first access. The nodes of the children are only
+    created for the names that are matched.
+    """
+
+    __slots__ = ("prim", "_names", "_children")
+
+    def __init__(self, prim: Usd.Prim):
+        self.prim = prim
+        self._names: list[str] | None = None
+        self._children: dict[str, _PrimNode] | None = None
+
+    @property
+    def names(self) -> Iterable[str]:
+        """The names of the children, in the order of the stage."""
+        if self._names is None:
+            self._names = self.prim.GetAllChildrenNames()
+        return self._names
+
+    def get_child(self, name: str) -> _PrimNode | None:
+        """Returns the node of the child with the given name, or None if the prim has no such child."""
+        if self._children is None:
+            self._children = dict()
+        node = self._children.get(name)
+        if node is None and name:
+            # note: the child is looked up by name, which does not require reading all the children
+            child = self.prim.GetChild(name)
+            # note: the children of instances are instance proxies, which are not children for GetAllChildren
+            if child.IsValid() and not child.IsInstanceProxy():
+                node = _PrimNode(child)
+                self._children[name] = node
+        return node
+
+    def get_children(self, names: list[str]) -> list[_PrimNode]:
+        """Returns the nodes of the children with the given names, skipping the names that are not children."""
+        if self._children is None:
+            self._children = dict()
+        if len(names) > 1 and any(name not in self._children for name in names):
+            # note: reading all the children at once is faster than looking them up one by one
+            child_prims = self.prim.GetAllChildren()
+            if len(child_prims) == len(self.names):
+                missing = set(names).difference(self._children)
+                for name, child in zip(self.names, child_prims):
+                    if name in missing:
+                        self._children[name] = _PrimNode(child)
+        return [node for node in map(self.get_child, names) if node is not None]
+
+    def find_loaded_child(self, name: str) -> _PrimNode | None:
+        """Returns the node of the child with the given name if it is in the index, without reading the stage."""
+        return self._children.get(name) if self._children is not None else None
+
+    def clear(self):
+        """Clears the children of the node so that they are read again from the stage."""
+        self._names = None
+        self._children = None
+
+
+class StagePathIndex:
+    """Index of the prim paths of a USD stage.
+
+    The index stores the prim tree of the stage as a trie of prim names. The children of the prims are read from
+    the stage the first time they are needed, and the sub-trees of the prims that are added, removed or
+    recomposed on the stage are cleared through the change notices of the stage. The index is thus only built
+    for the parts of the stage that are queried.
+
+    The prim path expressions are matched token by token (see :meth:`find_matching_prims`). The tokens are
+    resolved without regex matching where possible:
+
+    * Literal tokens (for example, ``Robot``) are looked up in the children of the prims.
+    * Tokens with a literal prefix followed by ``.*`` (for example, ``env_.*``) are expanded by comparing the
+      prefix with the names of the children.
+    * Other tokens are matched with compiled regex expressions, which are cached.
+
+    The index listens to the changes of the stage until it is released. It is meant to be used as a context
+    manager around code that queries the same stage many times. Within the context, the functions
+    :func:`~isaaclab.sim.utils.find_matching_prims` and :func:`~isaaclab.sim.utils.find_first_matching_prim` use
+    the index (see :func:`get_stage_path_index`), and the index is released when the context exits:
+
+    .. code-block:: python
+
+        with StagePathIndex(stage):
+            for prim_path_regex in prim_path_regexes:
+                prims = sim_utils.find_matching_prims(prim_path_regex, stage)
+    """
+
+    def __init__(self, stage: Usd.Stage):
+        """Initializes the index of the stage.
+
+        Args:
+            stage: The USD stage.
+        """
+        self.stage = stage
+        self._root = _PrimNode(stage.GetPseudoRoot())
+        # listen to the changes of the stage to clear the outdated nodes
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    """
+    Operations.
+    """
+
+    def find_matching_prims(self, prim_path_regex: str) -> list[Usd.Prim]:
+        """Finds all the prims whose path matches the input regex expression token by token.
+
+        The expression is split into tokens at the ``/`` characters. Each token must match the full name of the
+        prim at the same depth.
+
+        Args:
+            prim_path_regex: The regex expression for prim path. It must start with ``/``.
+
+        Returns:
+            The matching prims, in the order of the stage.
+        """
+        nodes = [self._root]
+        for token in prim_path_regex.split("/")[1:]:
+            nodes = [child for node in nodes for child in _match_children(node, token)]
+            if not nodes:
+                break
+        return [node.prim for node in nodes]
+
+    def find_first_matching_prim(self, prim_path_regex: str) -> Usd.Prim | None:
+        """Finds the first prim whose full path matches the input regex expression.
+
+        The prims are visited depth-first in the same order and with the same predicate as
+        :meth:`pxr.Usd.Stage.Traverse`. The traversal starts at the deepest prim that contains the literal prefix
+        of the expression, and the sub-trees of the prims whose paths cannot start with the prefix are skipped.
+
+        Args:
+            prim_path_regex: The regex expression for prim path.
+
+        Returns:
+            The first matching prim. If no prim matches, returns None.
+        """
+        pattern = _compile(f"^{prim_path_regex}$")
+        prefix = _get_literal_prefix(prim_path_regex)
+        # resolve the root of the traversal
+        root_path = prefix[: prefix.rfind("/")] if "/" in prefix else ""
+        if root_path:
+            root = self.stage.GetPrimAtPath(root_path)
+            # note: the traversal of the stage does not descend into instances
+            if not root.IsValid() or root.IsInstanceProxy():
+                return None
+            # the prims below a prim that is not traversed are not traversed either
+            for path in Sdf.Path(root_path).GetAncestorsRange():
+                if not _is_traversed(self.stage.GetPrimAtPath(path)):
+                    return None
+            prim_iterator = iter(Usd.PrimRange(root))
+        else:
+            prim_iterator = iter(self.stage.Traverse())
+        # depth-first search over the prims
+        for prim in prim_iterator:
+            path = prim.GetPath().pathString
+            if path.startswith(prefix):
+                if pattern.match(path) is not None:
+                    return prim
+            elif not prefix.startswith(path + "/"):
+                prim_iterator.PruneChildren()
+        return None
+
+    def clear(self):
+        """Clears the index so that it is read again from the stage."""
+        self._root.clear()
+
+    def release(self):
+        """Stops listening to the changes of the stage."""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+    """
+    Operations - Context.
+    """
+
+    def __enter__(self) -> StagePathIndex:
+        """Activates the index for the queries on its stage."""
+        _active_indices.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Deactivates and releases the index."""
+        _active_indices.remove(self)
+        self.release()
+
+    """
+    Internal helpers.
+    """
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage):
+        """Clears the nodes of the prims that are added, removed or recomposed on the stage."""
+        for path in notice.GetResyncedPaths():
+            # the changes of the properties do not change the prim tree
+            if path.IsPropertyPath():
+                continue
+            if path.IsAbsoluteRootPath():
+                self._root.clear()
+                return
+            # clear the children of the parent prim, which contain the changed prim
+            node = self._find_loaded_node(path.GetPrimPath().GetParentPath())
+            if node is not None:
+                node.clear()
+
+    def _find_loaded_node(self, path: Sdf.Path) -> _PrimNode | None:
+        """Finds the node of the prim path in the index without reading the stage.
+
+        Returns:
+            The node of the prim, or None if the node is not in the index.
+        """
+        node = self._root
+        for name in path.pathString.split("/")[1:]:
+            if not name:
+                continue
+            node = node.find_loaded_child(name)
+            if node is None:
+                return None
+        return node
+
+
+"""
+Index of the stages.
+"""
+
+_active_indices: list[StagePathIndex] = []
+"""The indices that are activated as context managers, from the outermost to the innermost."""
+
+
+def get_stage_path_index(stage: Usd.Stage) -> StagePathIndex | None:
+    """Returns the active path index of the stage.
+
+    Args:
+        stage: The USD stage.
+
+    Returns:
+        The innermost index of the stage that is activated as a context manager. If no index of the stage is
+        active, returns None.
+    """
+    for index in reversed(_active_indices):
+        if index.stage == stage:
+            return index
+    return None
+
+
+"""
+Helper functions.
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(pattern: str) -> re.Pattern:
+    """Compiles the regex expression and caches the result."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_literal_prefix(pattern: str) -> str:
+    """Returns the literal prefix that all the strings matching the regex expression start with."""
+    # alternations can apply to the whole expression
+    if "|" in pattern:
+        return ""
+    for index, char in enumerate(pattern):
+        if char in _REGEX_SPECIAL_CHARS:
+            # the quantifiers can make the previous character optional
+            if char in "?*{":
+                index -= 1
+            return pattern[: max(index, 0)]
+    return pattern
+
+
+def _match_children(node: _PrimNode, token: str) -> list[_PrimNode]:
+    """Returns the children of the node whose names fully match the token regex expression."""
+    # literal names are looked up directly
+    if not _REGEX_SPECIAL_CHARS.intersection(token):
+        child = node.get_child(token)
+        return [] if child is None else [child]
+    # names with a literal prefix followed by anything are compared with the prefix
+    # note: this is the case for the environment namespaces, such as "env_.*"
+    if token.endswith(".*") and not _REGEX_SPECIAL_CHARS.intersection(token[:-2]):
+        prefix = token[:-2]
+        return node.get_children([name for name in node.names if name.startswith(prefix)])
+    # other names are matched with the regex expression
+    # note: the token is wrapped in '^' and '$' to prevent matching anywhere in the string
+    pattern = _compile(f"^{token}$")
+    return node.get_children([name for name in node.names if pattern.match(name) is not None])
+
+
+def _is_traversed(prim: Usd.Prim) -> bool:
+    """Checks whether the prim satisfies the default predicate of :meth:`pxr.Usd.Stage.Traverse`."""
+    return prim.IsActive() and prim.IsLoaded() and prim.IsDefined() and not prim.IsAbstract()
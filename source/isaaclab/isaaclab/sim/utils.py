@@ -28,6 +28,7 @@ except ModuleNotFoundError:
 from isaaclab.utils.string import to_camel_case
 
 from . import schemas
+from .stage_path_index import get_stage_path_index
 
 if TYPE_CHECKING:
     from .spawners.spawner_cfg import SpawnerCfg
@@ -656,6 +657,10 @@ def find_first_matching_prim(prim_path_regex: str, stage: Usd.Stage | None = Non
     # get current stage
     if stage is None:
         stage = stage_utils.get_current_stage()
+    # use the path index of the stage if one is active
+    path_index = get_stage_path_index(stage)
+    if path_index is not None:
+        return path_index.find_first_matching_prim(prim_path_regex)
     # need to wrap the token patterns in '^' and '$' to prevent matching anywhere in the string
     pattern = f"^{prim_path_regex}$"
     compiled_pattern = re.compile(pattern)
@@ -686,6 +691,10 @@ def find_matching_prims(prim_path_regex: str, stage: Usd.Stage | None = None) ->
     # get current stage
     if stage is None:
         stage = stage_utils.get_current_stage()
+    # use the path index of the stage if one is active
+    path_index = get_stage_path_index(stage)
+    if path_index is not None:
+        return path_index.find_matching_prims(prim_path_regex)
     # need to wrap the token patterns in '^' and '$' to prevent matching anywhere in the string
     tokens = prim_path_regex.split("/")[1:]
     tokens = [f"^{token}$" for token in tokens]
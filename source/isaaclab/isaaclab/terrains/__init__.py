@@ -21,6 +21,9 @@ There are two main components in this package:
 """
 
 from .height_field import *  # noqa: F401, F403
+from .height_map import HeightMap, create_flat_height_map, create_height_map_from_mesh
+from .terrain_curriculum import TerrainCurriculum
+from .terrain_curriculum_cfg import TerrainCurriculumCfg
 from .terrain_generator import TerrainGenerator
 from .terrain_generator_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
 from .terrain_importer import TerrainImporter
@@ -0,0 +1,183 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Height maps of the terrains for the fast lookup of the terrain heights."""
+
+from __future__ import annotations
+
+import math
+import torch
+from dataclasses import dataclass
+
+import warp as wp
+
+from isaaclab.utils.warp import raycast_mesh
+
+
+@dataclass
+class HeightMap:
+    """A 2D grid of the heights of a terrain.
+
+    The height of the terrain at the grid point :math:`(i, j)` is stored in ``heights[i, j]``. The grid point is at
+    the position :math:`(x_0 + i \\cdot r, y_0 + j \\cdot r)` in the world frame, where :math:`(x_0, y_0)` is the
+    :attr:`origin` and :math:`r` is the :attr:`resolution` of the grid. The heights between the grid points are
+    bilinearly interpolated.
+    """
+
+    heights: torch.Tensor
+    """The heights of the grid points. Shape is (num_x, num_y).
+
+    The grid points that do not have a height, for example above holes in the terrain, are NaN.
+    """
+
+    origin: tuple[float, float]
+    """The position (x, y) of the first grid point in the world frame."""
+
+    resolution: float
+    """The distance between two neighboring grid points (in m)."""
+
+    @property
+    def device(self) -> torch.device:
+        """The device of the heights."""
+        return self.heights.device
+
+    def to(self, device: torch.device | str) -> HeightMap:
+        """Returns the height map with the heights on the given device."""
+        return HeightMap(self.heights.to(device), self.origin, self.resolution)
+
+    def sample(self, points: torch.Tensor) -> torch.Tensor:
+        """Samples the heights of the terrain at the given positions with bilinear interpolation.
+
+        Args:
+            points: The positions in the world frame. Shape is (..., 2) or (..., 3), in which case the z-coordinates
+                are ignored.
+
+        Returns:
+            The heights of the terrain at the positions. Shape is (...). The heights outside the grid are NaN.
+        """
+        num_x, num_y = self.heights.shape
+        # compute the continuous grid coordinates
+        u = (points[..., 0] - self.origin[0]) / self.resolution
+        v = (points[..., 1] - self.origin[1]) / self.resolution
+        # note: the cell is clamped so that the points on the last grid line are interpolated in the last cell
+        i = torch.clamp(torch.floor(u), 0, num_x - 2).long()
+        j = torch.clamp(torch.floor(v), 0, num_y - 2).long()
+        du = u - i
+        dv = v - j
+        # interpolate the heights of the corners of the cells
+        heights = self.heights.flatten()
+        index = i * num_y + j
+        h00, h01 = heights[index], heights[index + 1]
+        h10, h11 = heights[index + num_y], heights[index + num_y + 1]
+        values = (1.0 - du) * ((1.0 - dv) * h00 + dv * h01) + du * ((1.0 - dv) * h10 + dv * h11)
+        # mark the points outside the grid
+        outside = (u < 0.0) | (u > num_x - 1) | (v < 0.0) | (v > num_y - 1)
+        return torch.where(outside, torch.nan, values)
+
+
+def create_height_map_from_mesh(
+    wp_mesh: wp.Mesh, resolution: float, bounds: tuple[float, float, float, float] | None = None
+) -> HeightMap:
+    """Creates the height map of a mesh by ray-casting the grid points vertically.
+
+    The height of each grid point is the height of the highest surface of the mesh above it. The height map is
+    created on the device of the mesh.
+
+    Args:
+        wp_mesh: The warp mesh of the terrain.
+        resolution: The distance between two neighboring grid points (in m).
+        bounds: The bounds (x_min, x_max, y_min, y_max) of the grid. Defaults to None, in which case the bounds
+            of the mesh are used.
+
+    Returns:
+        The height map of the mesh.
+    """
+    device = wp.device_to_torch(wp_mesh.device)
+    points = wp.to_torch(wp_mesh.points)
+    # resolve the bounds of the grid
+    if bounds is None:
+        bounds = (
+            points[:, 0].min().item(),
+            points[:, 0].max().item(),
+            points[:, 1].min().item(),
+            points[:, 1].max().item(),
+        )
+    num_x = max(math.floor((bounds[1] - bounds[0]) / resolution + 1e-6) + 1, 2)
+    num_y = max(math.floor((bounds[3] - bounds[2]) / resolution + 1e-6) + 1, 2)
+    # create the vertical rays above the mesh
+    x = bounds[0] + resolution * torch.arange(num_x, device=device, dtype=torch.float32)
+    y = bounds[2] + resolution * torch.arange(num_y, device=device, dtype=torch.float32)
+    ray_starts = torch.zeros(num_x, num_y, 3, device=device)
+    ray_starts[..., 0] = x.unsqueeze(1)
+    ray_starts[..., 1] = y.unsqueeze(0)
+    ray_starts[..., 2] = points[:, 2].max() + 1.0
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[..., 2] = -1.0
+    # ray-cast the grid points
+    ray_hits = raycast_mesh(ray_starts.view(num_x, -1, 3), ray_directions.view(num_x, -1, 3), wp_mesh)[0]
+    heights = ray_hits[..., 2].view(num_x, num_y)
+    # mark the missed grid points
+    heights[torch.isinf(heights)] = torch.nan
+    return HeightMap(heights, (bounds[0], bounds[2]), resolution)
+
+
+def create_flat_height_map(height: float = 0.0, size: float = 2.0e6, device: str = "cpu") -> HeightMap:
+    """Creates the height map of a flat ground plane.
+
+    Args:
+        height: The height of the plane. Defaults to 0.0.
+        size: The size of the plane, which is centered at the origin. Defaults to 2.0e6.
+        device: The device of the height map. Defaults to "cpu".
+
+    Returns:
+        The height map of the plane.
+    """
+    return HeightMap(torch.full((2, 2), height, device=device), (-size / 2, -size / 2), size)
+
+
+"""
+Registry of the height maps.
+"""
+
+_height_maps: dict[str, HeightMap] = dict()
+"""The height maps of the imported terrains, keyed by the prim path of the terrains."""
+
+
+def register_height_map(prim_path: str, height_map: HeightMap):
+    """Registers the height map of the terrain at the given prim path.
+
+    The height maps are registered by the :class:`~isaaclab.terrains.TerrainImporter` for the generated terrains,
+    so that the sensors can look up the terrain heights without ray-casting.
+
+    Args:
+        prim_path: The prim path of the terrain.
+        height_map: The height map of the terrain.
+    """
+    _height_maps[prim_path] = height_map
+
+
+def unregister_height_maps(prim_path: str):
+    """Unregisters the height maps of the terrains at or below the given prim path.
+
+    Args:
+        prim_path: The prim path.
+    """
+    for key in [key for key in _height_maps if key == prim_path or key.startswith(prim_path + "/")]:
+        del _height_maps[key]
+
+
+def find_height_map(prim_path: str) -> HeightMap | None:
+    """Finds the registered height map of the terrain at or below the given prim path.
+
+    Args:
+        prim_path: The prim path.
+
+    Returns:
+        The height map, or None if no height map is registered at or below the prim path.
+    """
+    for key, height_map in _height_maps.items():
+        if key == prim_path or key.startswith(prim_path + "/"):
+            return height_map
+    return None
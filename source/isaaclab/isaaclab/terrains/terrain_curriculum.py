@@ -0,0 +1,157 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import math
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .terrain_curriculum_cfg import TerrainCurriculumCfg
+
+
+class TerrainCurriculum:
+    """Curriculum of the terrain levels of the environments.
+
+    The curriculum keeps the terrain level and type of each environment in tensors on the device. At the end of
+    the episodes, the environments report whether they should move up or down (see :meth:`update`). The moves
+    are recorded in a window of the latest episodes of each environment, and the environments are promoted or
+    demoted together based on the statistics of their windows (see :class:`TerrainCurriculumCfg`).
+
+    All the operations are vectorized over the environments and do not synchronize with the host. The
+    statistics for logging are returned as tensors on the device, so that they are only copied to the host
+    when they are logged.
+    """
+
+    def __init__(
+        self, cfg: TerrainCurriculumCfg, terrain_levels: torch.Tensor, terrain_types: torch.Tensor, num_levels: int
+    ):
+        """Initializes the curriculum.
+
+        The tensors of the terrain levels and types are updated in-place.
+
+        Args:
+            cfg: The configuration parameters.
+            terrain_levels: The initial terrain levels of the environments. Shape is (num_envs,).
+            terrain_types: The terrain types of the environments. Shape is (num_envs,).
+            num_levels: The number of terrain levels.
+
+        Raises:
+            ValueError: If the window size is not positive.
+        """
+        if cfg.window_size < 1:
+            raise ValueError(f"The window size of the terrain curriculum must be positive. Received: {cfg.window_size}")
+        # store inputs
+        self.cfg = cfg
+        self.terrain_levels = terrain_levels
+        self.terrain_types = terrain_types
+        self.num_levels = num_levels
+        self._device = terrain_levels.device
+        # minimum number of moves in the window to change the level
+        # note: a small tolerance avoids rounding up exact products of the ratio and the window size
+        self._min_moves_up = max(math.ceil(cfg.move_up_ratio * cfg.window_size - 1e-6), 1)
+        self._min_moves_down = max(math.ceil(cfg.move_down_ratio * cfg.window_size - 1e-6), 1)
+
+        # create buffers
+        # -- indices of all the environments
+        self._ALL_INDICES = torch.arange(self.num_envs, device=self._device)
+        # -- moves of the latest episodes (1: up, -1: down, 0: stay)
+        self._moves = torch.zeros(self.num_envs, cfg.window_size, dtype=torch.int8, device=self._device)
+        # -- number of episodes recorded on the current level
+        self._num_episodes = torch.zeros(self.num_envs, dtype=torch.long, device=self._device)
+        # -- number of level changes since the last statistics
+        self._num_promotions = torch.zeros((), dtype=torch.long, device=self._device)
+        self._num_demotions = torch.zeros((), dtype=torch.long, device=self._device)
+
+    def __str__(self) -> str:
+        """Returns: A string containing information about the instance."""
+        msg = "Terrain Curriculum:"
+        msg += f"\n\tNumber of environments: {self.num_envs}"
+        msg += f"\n\tNumber of levels: {self.num_levels}"
+        msg += f"\n\tWindow size: {self.cfg.window_size}"
+        msg += f"\n\tMinimum moves up/down: {self._min_moves_up}/{self._min_moves_down}"
+        return msg
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """Number of environments."""
+        return self.terrain_levels.shape[0]
+
+    @property
+    def mean_level(self) -> torch.Tensor:
+        """The mean terrain level over all the environments. Shape is ()."""
+        return torch.mean(self.terrain_levels.float())
+
+    """
+    Operations.
+    """
+
+    def update(self, env_ids: Sequence[int] | torch.Tensor | None, move_up: torch.Tensor, move_down: torch.Tensor):
+        """Records the moves of the finished episodes and updates the terrain levels.
+
+        The environments that solve the last level are sent to a random level. The minimum level is zero.
+
+        Args:
+            env_ids: The environment indices of the finished episodes. If None, all the environments are updated.
+            move_up: Whether the episodes ask to move up. Shape is (len(env_ids),).
+            move_down: Whether the episodes ask to move down. Shape is (len(env_ids),).
+        """
+        env_ids = self._resolve_env_ids(env_ids)
+        # record the moves in the windows
+        moves = move_up.to(torch.int8) - move_down.to(torch.int8)
+        self._moves[env_ids, self._num_episodes[env_ids] % self.cfg.window_size] = moves
+        self._num_episodes[env_ids] += 1
+        # decide on the level changes based on the windows
+        moves = self._moves[env_ids]
+        promote = torch.sum(moves == 1, dim=1) >= self._min_moves_up
+        demote = (torch.sum(moves == -1, dim=1) >= self._min_moves_down) & ~promote
+        # update the terrain levels
+        levels = self.terrain_levels[env_ids] + promote.long() - demote.long()
+        self.terrain_levels[env_ids] = torch.where(
+            levels >= self.num_levels, torch.randint_like(levels, self.num_levels), torch.clip(levels, min=0)
+        )
+        # clear the windows of the environments that changed levels
+        changed = promote | demote
+        self._moves[env_ids] = torch.where(changed.unsqueeze(1), 0, moves)
+        self._num_episodes[env_ids] = torch.where(changed, 0, self._num_episodes[env_ids])
+        # accumulate the statistics
+        self._num_promotions += torch.sum(promote)
+        self._num_demotions += torch.sum(demote)
+
+    def get_stats(self) -> dict[str, torch.Tensor]:
+        """Returns the statistics of the curriculum for logging.
+
+        The number of promotions and demotions are counted since the last call to this function. The curriculum
+        terms return these statistics at each update, so that they are logged by the curriculum manager.
+
+        Returns:
+            The statistics as tensors on the device.
+        """
+        stats = {
+            "mean_level": self.mean_level,
+            "num_promotions": self._num_promotions.clone(),
+            "num_demotions": self._num_demotions.clone(),
+        }
+        self._num_promotions.zero_()
+        self._num_demotions.zero_()
+        return stats
+
+    """
+    Internal helpers.
+    """
+
+    def _resolve_env_ids(self, env_ids: Sequence[int] | torch.Tensor | None) -> torch.Tensor:
+        """Resolves the environment indices to a tensor on the device."""
+        if env_ids is None or (isinstance(env_ids, slice) and env_ids == slice(None)):
+            return self._ALL_INDICES
+        if isinstance(env_ids, torch.Tensor):
+            return env_ids.to(self._device)
+        return torch.as_tensor(env_ids, dtype=torch.long, device=self._device)
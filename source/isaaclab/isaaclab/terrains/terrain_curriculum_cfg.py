@@ -0,0 +1,39 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Configuration for the curriculum of the terrain levels."""
+
+from isaaclab.utils import configclass
+
+
+@configclass
+class TerrainCurriculumCfg:
+    """Configuration for the curriculum of the terrain levels.
+
+    The curriculum records the moves of the last :attr:`window_size` episodes of each environment. An environment
+    is promoted to the next level if enough of these episodes asked to move up, and is demoted to the previous
+    level if enough of them asked to move down. The statistics of an environment are cleared when its level
+    changes.
+
+    The default configuration moves the environments after every episode that asks to move.
+    """
+
+    window_size: int = 1
+    """The number of latest episodes of an environment over which the moves are counted. Defaults to 1."""
+
+    move_up_ratio: float = 1.0
+    """The minimum fraction of the episodes in the window that asked to move up for promoting an environment.
+    Defaults to 1.0.
+
+    The fraction is with respect to :attr:`window_size`, so an environment is not promoted before enough episodes
+    have been recorded on its level.
+    """
+
+    move_down_ratio: float = 1.0
+    """The minimum fraction of the episodes in the window that asked to move down for demoting an environment.
+    Defaults to 1.0.
+
+    The promotion takes precedence if both conditions are satisfied.
+    """
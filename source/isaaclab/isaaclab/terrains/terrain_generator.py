@@ -9,16 +9,18 @@ import torch
 import trimesh
 
 import omni.log
+import warp as wp
 
-from isaaclab.utils.dict import dict_to_md5_hash
+from isaaclab.utils.hashing import CacheReport, hash_dict
 from isaaclab.utils.io import dump_yaml
 from isaaclab.utils.timer import Timer
 from isaaclab.utils.warp import convert_to_warp_mesh
 
 from .height_field import HfTerrainBaseCfg
+from .height_map import HeightMap, create_height_map_from_mesh
 from .terrain_generator_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
 from .trimesh.utils import make_border
-from .utils import color_meshes_by_height, find_flat_patches
+from .utils import color_meshes_by_height, find_flat_patches_batched
 
 
 class TerrainGenerator:
@@ -61,12 +63,14 @@ class TerrainGenerator:
     If the :attr:`~TerrainGeneratorCfg.flat_patch_sampling` is specified for a sub-terrain, flat patches are sampled
     on the terrain. These can be used for spawning robots, targets, etc. The sampled patches are stored
     in the :obj:`flat_patches` dictionary. The key specifies the intention of the flat patches and the
-    value is a tensor containing the flat patches for each sub-terrain.
+    value is a tensor containing the flat patches for each sub-terrain. The patches of all the sub-terrains
+    are sampled together on the combined terrain mesh once all the sub-terrains are generated.
 
     If the flag :attr:`~TerrainGeneratorCfg.use_cache` is set to True, the terrains are cached based on their
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
-    generating complex sub-terrains that take a long time to generate.
+    generating complex sub-terrains that take a long time to generate. The validity of the cached
+    sub-terrains is reported in :attr:`cache_reports`.
 
     .. attention::
 
@@ -92,6 +96,16 @@ class TerrainGenerator:
     For instance, the key "root_spawn" maps to a tensor containing the flat patches for spawning an asset.
     Similarly, the key "target_spawn" maps to a tensor containing the flat patches for setting targets.
     """
+    height_map: HeightMap | None
+    """The height map of the terrain mesh on the device of the generator.
+
+    It is None if :attr:`TerrainGeneratorCfg.height_map_resolution` is None.
+    """
+    cache_reports: list[CacheReport]
+    """Reports about the validity of the cached sub-terrains, in the order in which the sub-terrains are generated.
+
+    A sub-terrain is loaded from the cache if its report is valid. The list is empty if the caching is disabled.
+    """
 
     def __init__(self, cfg: TerrainGeneratorCfg, device: str = "cpu"):
         """Initialize the terrain generator.
@@ -137,6 +151,10 @@ class TerrainGenerator:
 
         # buffer for storing valid patches
         self.flat_patches = {}
+        # sub-terrains on which flat patches are sampled
+        self._flat_patch_sub_terrains = list()
+        # reports about the validity of the cached sub-terrains
+        self.cache_reports = list()
         # create a list of all sub-terrains
         self.terrain_meshes = list()
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
@@ -173,11 +191,26 @@ class TerrainGenerator:
         self.terrain_mesh.apply_transform(transform)
         # -- terrain origins
         self.terrain_origins += transform[:3, -1]
+
+        # convert the terrain mesh to warp mesh for the queries on the device
+        wp_mesh = None
+        if len(self._flat_patch_sub_terrains) > 0 or self.cfg.height_map_resolution is not None:
+            wp_mesh = convert_to_warp_mesh(self.terrain_mesh.vertices, self.terrain_mesh.faces, device=self.device)
+        # sample flat patches on all the sub-terrains
+        if len(self._flat_patch_sub_terrains) > 0:
+            with Timer("[INFO] Sampling flat patches took"):
+                self._find_flat_patches(wp_mesh, transform[:2, -1])
         # -- valid patches
         terrain_origins_torch = torch.tensor(self.terrain_origins, dtype=torch.float, device=self.device).unsqueeze(2)
         for name, value in self.flat_patches.items():
             self.flat_patches[name] = value + terrain_origins_torch
 
+        # rasterize the terrain mesh into a height map
+        self.height_map = None
+        if self.cfg.height_map_resolution is not None:
+            with Timer("[INFO] Creating the height map of the terrain took"):
+                self.height_map = create_height_map_from_mesh(wp_mesh, self.cfg.height_map_resolution)
+
     def __str__(self):
         """Return a string representation of the terrain generator."""
         msg = "Terrain Generator:"
@@ -285,7 +318,8 @@ class TerrainGenerator:
         """Add input sub-terrain to the list of sub-terrains.
 
         This function adds the input sub-terrain mesh to the list of sub-terrains and updates the origin
-        of the sub-terrain in the list of origins. It also samples flat patches if specified.
+        of the sub-terrain in the list of origins. If flat patches are specified, the sub-terrain is recorded
+        for sampling them on the combined terrain mesh (see :meth:`_find_flat_patches`).
 
         Args:
             mesh: The mesh of the sub-terrain.
@@ -293,31 +327,6 @@ class TerrainGenerator:
             row: The row index of the sub-terrain.
             col: The column index of the sub-terrain.
         """
-        # sample flat patches if specified
-        if sub_terrain_cfg.flat_patch_sampling is not None:
-            omni.log.info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-            # sample flat patches based on each patch configuration for that sub-terrain
-            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
-                patch_cfg: FlatPatchSamplingCfg
-                # create the flat patches tensor (if not already created)
-                if name not in self.flat_patches:
-                    self.flat_patches[name] = torch.zeros(
-                        (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
-                    )
-                # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = find_flat_patches(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    num_patches=patch_cfg.num_patches,
-                    patch_radius=patch_cfg.patch_radius,
-                    x_range=patch_cfg.x_range,
-                    y_range=patch_cfg.y_range,
-                    z_range=patch_cfg.z_range,
-                    max_height_diff=patch_cfg.max_height_diff,
-                )
-
         # transform the mesh to the correct position
         transform = np.eye(4)
         transform[0:2, -1] = (row + 0.5) * self.cfg.size[0], (col + 0.5) * self.cfg.size[1]
@@ -326,6 +335,53 @@ class TerrainGenerator:
         self.terrain_meshes.append(mesh)
         # add origin to the list
         self.terrain_origins[row, col] = origin + transform[:3, -1]
+        # record the sub-terrain and its bounds (x_min, x_max, y_min, y_max) for sampling flat patches
+        if sub_terrain_cfg.flat_patch_sampling is not None:
+            bounds = mesh.bounds[:, :2].T.flatten()
+            self._flat_patch_sub_terrains.append((row, col, sub_terrain_cfg, bounds))
+
+    def _find_flat_patches(self, wp_mesh: wp.Mesh, offset: np.ndarray):
+        """Sample flat patches on the recorded sub-terrains of the combined terrain mesh.
+
+        The sub-terrains that share the name, the number of patches and the radii of a flat patch configuration
+        are sampled together with :meth:`~isaaclab.terrains.utils.find_flat_patches_batched`. The patches of each
+        sub-terrain are sampled within the bounds of its mesh and are stored relative to its origin.
+
+        Args:
+            wp_mesh: The warp mesh of the combined terrain.
+            offset: The 2D offset applied to the terrain mesh after the sub-terrains were added.
+        """
+        # group the sub-terrains by the flat patch configurations that can be sampled together
+        groups: dict[tuple[str, int, tuple[float, ...]], list] = dict()
+        for row, col, sub_terrain_cfg, bounds in self._flat_patch_sub_terrains:
+            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
+                patch_cfg: FlatPatchSamplingCfg
+                radii = patch_cfg.patch_radius if isinstance(patch_cfg.patch_radius, list) else [patch_cfg.patch_radius]
+                key = (name, patch_cfg.num_patches, tuple(float(radius) for radius in radii))
+                groups.setdefault(key, list()).append((row, col, patch_cfg, bounds))
+
+        # sample the flat patches of each group
+        for (name, num_patches, radii), sub_terrains in groups.items():
+            rows, cols, patch_cfgs, bounds = zip(*sub_terrains)
+            omni.log.info(f"Sampling flat patches '{name}' for {len(rows)} sub-terrains.")
+            # create the flat patches tensor (if not already created)
+            if name not in self.flat_patches:
+                self.flat_patches[name] = torch.zeros(
+                    (self.cfg.num_rows, self.cfg.num_cols, num_patches, 3), device=self.device
+                )
+            # add the flat patches to the tensor
+            rows, cols = list(rows), list(cols)
+            self.flat_patches[name][rows, cols] = find_flat_patches_batched(
+                wp_mesh=wp_mesh,
+                num_patches=num_patches,
+                patch_radius=list(radii),
+                origins=torch.tensor(self.terrain_origins[rows, cols], dtype=torch.float, device=self.device),
+                x_range=torch.tensor([cfg.x_range for cfg in patch_cfgs], device=self.device),
+                y_range=torch.tensor([cfg.y_range for cfg in patch_cfgs], device=self.device),
+                z_range=torch.tensor([cfg.z_range for cfg in patch_cfgs], device=self.device),
+                max_height_diff=torch.tensor([cfg.max_height_diff for cfg in patch_cfgs], device=self.device),
+                bounds=torch.tensor(np.array(bounds) + np.repeat(offset, 2), dtype=torch.float, device=self.device),
+            )
 
     def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
         """Generate a sub-terrain mesh based on the input difficulty parameter.
@@ -350,7 +406,7 @@ class TerrainGenerator:
         cfg.difficulty = float(difficulty)
         cfg.seed = self.cfg.seed
         # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
+        sub_terrain_hash = hash_dict(cfg.to_dict())
         # generate the file name
         sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
         sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
@@ -358,7 +414,15 @@ class TerrainGenerator:
         sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
 
         # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
+        if self.cfg.use_cache:
+            if not os.path.exists(sub_terrain_obj_filename):
+                cache_report = CacheReport(sub_terrain_cache_dir, sub_terrain_hash, False, "the mesh is not cached")
+            elif not os.path.exists(sub_terrain_csv_filename):
+                cache_report = CacheReport(sub_terrain_cache_dir, sub_terrain_hash, False, "the origin is not cached")
+            else:
+                cache_report = CacheReport(sub_terrain_cache_dir, sub_terrain_hash, True, "the mesh is cached")
+            self.cache_reports.append(cache_report)
+        if self.cfg.use_cache and cache_report.is_valid:
             # load existing mesh
             mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
             origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
@@ -174,6 +174,16 @@ class TerrainGeneratorCfg:
     This value is passed on to all the height field sub-terrain configurations.
     """
 
+    height_map_resolution: float | None = None
+    """The resolution of the height map of the terrain (in m). Defaults to None, in which case no height map
+    is created.
+
+    If not None, the generated terrain mesh (including the border) is rasterized once into a 2D grid of heights
+    on the device of the terrain generator. The height map is used by the
+    :class:`~isaaclab.sensors.ray_caster.HeightMapScanner` to look up the terrain heights without ray-casting.
+    A resolution of :attr:`horizontal_scale` matches the discretization of the height field sub-terrains.
+    """
+
     sub_terrains: dict[str, SubTerrainBaseCfg] = MISSING
     """Dictionary of sub-terrain configurations.
 
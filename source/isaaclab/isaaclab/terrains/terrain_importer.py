@@ -16,6 +16,8 @@ import isaaclab.sim as sim_utils
 from isaaclab.markers import VisualizationMarkers
 from isaaclab.markers.config import FRAME_MARKER_CFG
 
+from .height_map import HeightMap, create_flat_height_map, register_height_map, unregister_height_maps
+from .terrain_curriculum import TerrainCurriculum
 from .terrain_generator import TerrainGenerator
 from .utils import create_prim_from_mesh
 
@@ -36,8 +38,9 @@ class TerrainImporter:
     sampling the sub-terrain origins.
 
     If a curriculum is used, it is possible to update the environment origins to terrain origins that correspond
-    to a harder difficulty. This is done by calling :func:`update_terrain_levels`. The idea comes from game-based
+    to a harder difficulty. This is done by calling :meth:`update_env_origins`. The idea comes from game-based
     curriculum. For example, in a game, the player starts with easy levels and progresses to harder levels.
+    The terrain levels are updated on the device by the :attr:`curriculum` (see :class:`TerrainCurriculum`).
     """
 
     terrain_prim_paths: list[str]
@@ -53,6 +56,12 @@ class TerrainImporter:
     env_origins: torch.Tensor
     """The origins of the environments. Shape is (num_envs, 3)."""
 
+    curriculum: TerrainCurriculum | None
+    """The curriculum of the terrain levels of the environments.
+
+    It is None if the environment origins are computed based on the grid spacing.
+    """
+
     def __init__(self, cfg: TerrainImporterCfg):
         """Initialize the terrain importer.
 
@@ -75,8 +84,11 @@ class TerrainImporter:
         self.terrain_prim_paths = list()
         self.terrain_origins = None
         self.env_origins = None  # assigned later when `configure_env_origins` is called
+        self.curriculum = None
         # private variables
         self._terrain_flat_patches = dict()
+        # remove the height maps of the previously imported terrains at the same prim path
+        unregister_height_maps(self.cfg.prim_path)
 
         # auto-import the terrain based on the config
         if self.cfg.terrain_type == "generator":
@@ -85,7 +97,7 @@ class TerrainImporter:
                 raise ValueError("Input terrain type is 'generator' but no value provided for 'terrain_generator'.")
             # generate the terrain
             terrain_generator = TerrainGenerator(cfg=self.cfg.terrain_generator, device=self.device)
-            self.import_mesh("terrain", terrain_generator.terrain_mesh)
+            self.import_mesh("terrain", terrain_generator.terrain_mesh, height_map=terrain_generator.height_map)
             # configure the terrain origins based on the terrain generator
             self.configure_env_origins(terrain_generator.terrain_origins)
             # refer to the flat patches
@@ -181,6 +193,9 @@ class TerrainImporter:
     def import_ground_plane(self, name: str, size: tuple[float, float] = (2.0e6, 2.0e6)):
         """Add a plane to the terrain importer.
 
+        The height map of the plane is registered for the prim path of the terrain (see
+        :func:`~isaaclab.terrains.height_map.register_height_map`).
+
         Args:
             name: The name of the imported terrain. This name is used to create the USD prim
                 corresponding to the terrain.
@@ -215,17 +230,23 @@ class TerrainImporter:
         # get the mesh
         ground_plane_cfg = sim_utils.GroundPlaneCfg(physics_material=self.cfg.physics_material, size=size, color=color)
         ground_plane_cfg.func(prim_path, ground_plane_cfg)
+        # register the height map of the plane
+        register_height_map(prim_path, create_flat_height_map(size=max(size), device=self.device))
 
-    def import_mesh(self, name: str, mesh: trimesh.Trimesh):
+    def import_mesh(self, name: str, mesh: trimesh.Trimesh, height_map: HeightMap | None = None):
         """Import a mesh into the simulator.
 
         The mesh is imported into the simulator under the prim path ``cfg.prim_path/{key}``. The created path
         contains the mesh as a :class:`pxr.UsdGeom` instance along with visual or physics material prims.
 
+        If the height map of the mesh is provided, it is registered for the prim path of the terrain (see
+        :func:`~isaaclab.terrains.height_map.register_height_map`).
+
         Args:
             name: The name of the imported terrain. This name is used to create the USD prim
                 corresponding to the terrain.
             mesh: The mesh to import.
+            height_map: The height map of the mesh. Defaults to None.
 
         Raises:
             ValueError: If a terrain with the same name already exists.
@@ -244,6 +265,9 @@ class TerrainImporter:
         create_prim_from_mesh(
             prim_path, mesh, visual_material=self.cfg.visual_material, physics_material=self.cfg.physics_material
         )
+        # register the height map
+        if height_map is not None:
+            register_height_map(prim_path, height_map)
 
     def import_usd(self, name: str, usd_path: str):
         """Import a mesh from a USD file.
@@ -298,6 +322,7 @@ class TerrainImporter:
             self.env_origins = self._compute_env_origins_curriculum(self.cfg.num_envs, self.terrain_origins)
         else:
             self.terrain_origins = None
+            self.curriculum = None
             # check if env spacing is valid
             if self.cfg.env_spacing is None:
                 raise ValueError("Environment spacing must be specified for configuring grid-like origins.")
@@ -305,19 +330,20 @@ class TerrainImporter:
             self.env_origins = self._compute_env_origins_grid(self.cfg.num_envs, self.cfg.env_spacing)
 
     def update_env_origins(self, env_ids: torch.Tensor, move_up: torch.Tensor, move_down: torch.Tensor):
-        """Update the environment origins based on the terrain levels."""
+        """Update the environment origins based on the terrain levels.
+
+        The moves are recorded by the :attr:`curriculum`, which updates the terrain levels of the environments.
+
+        Args:
+            env_ids: The environment indices of the finished episodes.
+            move_up: Whether the episodes ask to move up. Shape is (len(env_ids),).
+            move_down: Whether the episodes ask to move down. Shape is (len(env_ids),).
+        """
         # check if grid-like spawning
         if self.terrain_origins is None:
             return
         # update terrain level for the envs
-        self.terrain_levels[env_ids] += 1 * move_up - 1 * move_down
-        # robots that solve the last level are sent to a random one
-        # the minimum level is zero
-        self.terrain_levels[env_ids] = torch.where(
-            self.terrain_levels[env_ids] >= self.max_terrain_level,
-            torch.randint_like(self.terrain_levels[env_ids], self.max_terrain_level),
-            torch.clip(self.terrain_levels[env_ids], 0),
-        )
+        self.curriculum.update(env_ids, move_up, move_down)
         # update the env origins
         self.env_origins[env_ids] = self.terrain_origins[self.terrain_levels[env_ids], self.terrain_types[env_ids]]
 
@@ -341,6 +367,10 @@ class TerrainImporter:
         self.terrain_types = torch.div(
             torch.arange(num_envs, device=self.device), (num_envs / num_cols), rounding_mode="floor"
         ).to(torch.long)
+        # create the curriculum of the terrain levels
+        self.curriculum = TerrainCurriculum(
+            self.cfg.curriculum, self.terrain_levels, self.terrain_types, self.max_terrain_level
+        )
         # create tensor based on number of environments
         env_origins = torch.zeros(num_envs, 3, device=self.device)
         env_origins[:] = origins[self.terrain_levels, self.terrain_types]
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Literal
 import isaaclab.sim as sim_utils
 from isaaclab.utils import configclass
 
+from .terrain_curriculum_cfg import TerrainCurriculumCfg
 from .terrain_importer import TerrainImporter
 
 if TYPE_CHECKING:
@@ -99,5 +100,12 @@ class TerrainImporterCfg:
       This parameter is used only when sub-terrain origins are defined.
     """
 
+    curriculum: TerrainCurriculumCfg = TerrainCurriculumCfg()
+    """The curriculum of the terrain levels. Defaults to moving the environments after every episode that asks to move.
+
+    Note:
+      This parameter is used only when sub-terrain origins are defined.
+    """
+
     debug_vis: bool = False
     """Whether to enable visualization of terrain origins for the terrain. Defaults to False."""
@@ -179,11 +179,7 @@ def find_flat_patches(
     # set device to warp mesh device
     device = wp.device_to_torch(wp_mesh.device)
 
-    # resolve inputs to consistent type
-    # -- patch radii
-    if isinstance(patch_radius, float):
-        patch_radius = [patch_radius]
-    # -- origin
+    # resolve the origin to consistent type
     if isinstance(origin, np.ndarray):
         origin = torch.from_numpy(origin).to(torch.float).to(device)
     elif isinstance(origin, torch.Tensor):
@@ -191,20 +187,92 @@ def find_flat_patches(
     else:
         origin = torch.tensor(origin, dtype=torch.float, device=device)
 
-    # create ranges for the x and y coordinates around the origin.
-    # The provided ranges are bounded by the mesh's bounding box.
-    x_range = (
-        max(x_range[0] + origin[0].item(), wp_mesh.points.numpy()[:, 0].min()),
-        min(x_range[1] + origin[0].item(), wp_mesh.points.numpy()[:, 0].max()),
-    )
-    y_range = (
-        max(y_range[0] + origin[1].item(), wp_mesh.points.numpy()[:, 1].min()),
-        min(y_range[1] + origin[1].item(), wp_mesh.points.numpy()[:, 1].max()),
-    )
-    z_range = (
-        z_range[0] + origin[2].item(),
-        z_range[1] + origin[2].item(),
+    # sample the patches in the single search space
+    return find_flat_patches_batched(
+        wp_mesh=wp_mesh,
+        num_patches=num_patches,
+        patch_radius=patch_radius,
+        origins=origin.unsqueeze(0),
+        x_range=x_range,
+        y_range=y_range,
+        z_range=z_range,
+        max_height_diff=max_height_diff,
+    )[0]
+
+
+def find_flat_patches_batched(
+    wp_mesh: wp.Mesh,
+    num_patches: int,
+    patch_radius: float | list[float],
+    origins: torch.Tensor,
+    x_range: tuple[float, float] | torch.Tensor,
+    y_range: tuple[float, float] | torch.Tensor,
+    z_range: tuple[float, float] | torch.Tensor,
+    max_height_diff: float | torch.Tensor,
+    bounds: torch.Tensor | None = None,
+) -> torch.Tensor:
+    """Finds flat patches of given radius in multiple search spaces of the input mesh at once.
+
+    This function performs the same rejection sampling as :meth:`find_flat_patches` for a batch of search
+    spaces, for example for all the sub-terrains of a terrain mesh. The invalid patches of all the search spaces
+    are re-sampled together, so that the mesh is ray-cast once per iteration for the whole batch.
+
+    The search spaces can additionally be bounded by the regions in :attr:`bounds`. The sampled positions are
+    clamped to the region of their search space and the patches that extend outside of it are rejected, as if the
+    region was the only part of the mesh.
+
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        num_patches: The desired number of patches to find in each search space.
+        patch_radius: The radii used to form patches. If a list is provided, multiple patch sizes are checked.
+            This is useful to deal with holes or other artifacts in the mesh.
+        origins: The origins defining the centers of the search spaces. Shape is (N, 3). These are specified in
+            the mesh frame.
+        x_range: The range of X coordinates to sample from. Shape is (2,) or (N, 2).
+        y_range: The range of Y coordinates to sample from. Shape is (2,) or (N, 2).
+        z_range: The range of valid Z coordinates used for filtering patches. Shape is (2,) or (N, 2).
+        max_height_diff: The maximum allowable distance between the lowest and highest points
+            on a patch to consider it as valid. Shape is () or (N,).
+        bounds: The regions (x_min, x_max, y_min, y_max) of the mesh that bound the search spaces. Shape is
+            (N, 4). Defaults to None, in which case the bounds of the mesh are used.
+
+    Returns:
+        A tensor of shape (N, num_patches, 3) containing the flat patches. The patches are defined in the mesh
+        frame relative to the origins of their search spaces.
+
+    Raises:
+        RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
+            are not suitable for finding valid patches and maximum number of iterations is reached.
+    """
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_mesh.device)
+    mesh_points = wp.to_torch(wp_mesh.points)
+    num_spaces = origins.shape[0]
+
+    # resolve inputs to consistent type
+    # -- patch radii
+    if isinstance(patch_radius, float):
+        patch_radius = [patch_radius]
+    # -- search spaces
+    origins = origins.to(device=device, dtype=torch.float)
+    x_range, y_range, z_range = (
+        torch.as_tensor(r, dtype=torch.float, device=device).expand(num_spaces, 2) for r in (x_range, y_range, z_range)
     )
+    max_height_diff = torch.as_tensor(max_height_diff, dtype=torch.float, device=device).expand(num_spaces)
+    # -- bounds of the search spaces
+    if bounds is None:
+        mesh_min, mesh_max = mesh_points.min(dim=0)[0], mesh_points.max(dim=0)[0]
+        bounds = torch.stack([mesh_min[0], mesh_max[0], mesh_min[1], mesh_max[1]]).expand(num_spaces, 4)
+    else:
+        bounds = bounds.to(device=device, dtype=torch.float)
+
+    # create ranges for the x and y coordinates around the origins.
+    # The provided ranges are bounded by the bounds of the search spaces.
+    x_lower = torch.maximum(x_range[:, 0] + origins[:, 0], bounds[:, 0])
+    x_upper = torch.minimum(x_range[:, 1] + origins[:, 0], bounds[:, 1])
+    y_lower = torch.maximum(y_range[:, 0] + origins[:, 1], bounds[:, 2])
+    y_upper = torch.minimum(y_range[:, 1] + origins[:, 1], bounds[:, 3])
+    z_range = z_range + origins[:, 2:3]
 
     # create a circle of points around (0, 0) to query validity of the patches
     # the ring of points is uniformly distributed around the circle
@@ -218,27 +286,31 @@ def find_flat_patches(
     query_y = torch.cat(query_y).unsqueeze(1)  # dim: (num_radii * 10, 1)
     # dim: (num_radii * 10, 3)
     query_points = torch.cat([query_x, query_y, torch.zeros_like(query_x)], dim=-1)
+    # the rays start above the mesh
+    ray_start_height = mesh_points[:, 2].max() + 1.0
 
     # create buffers
-    # -- a buffer to store indices of points that are not valid
-    points_ids = torch.arange(num_patches, device=device)
+    # -- a buffer to store indices of points that are not valid (over all the search spaces)
+    points_ids = torch.arange(num_spaces * num_patches, device=device)
     # -- a buffer to store the flat patches locations
-    flat_patches = torch.zeros(num_patches, 3, device=device)
+    flat_patches = torch.zeros(num_spaces * num_patches, 3, device=device)
 
     # sample points and raycast to find the height.
     # 1. Reject points that are outside the z_range or have a height difference that is too large.
     # 2. Keep sampling until all points are valid.
     iter_count = 0
     while len(points_ids) > 0 and iter_count < 10000:
-        # sample points in the 2D region around the origin
-        pos_x = torch.empty(len(points_ids), device=device).uniform_(*x_range)
-        pos_y = torch.empty(len(points_ids), device=device).uniform_(*y_range)
-        flat_patches[points_ids, :2] = torch.stack([pos_x, pos_y], dim=-1)
+        space_ids = points_ids // num_patches
+        # sample points in the 2D region around the origins
+        pos = torch.rand(len(points_ids), 2, device=device)
+        pos[:, 0] = x_lower[space_ids] + pos[:, 0] * (x_upper - x_lower)[space_ids]
+        pos[:, 1] = y_lower[space_ids] + pos[:, 1] * (y_upper - y_lower)[space_ids]
+        flat_patches[points_ids, :2] = pos
 
         # define the query points to check validity of the patch
-        # dim: (num_patches, num_radii * 10, 3)
+        # dim: (num_points, num_radii * 10, 3)
         points = flat_patches[points_ids].unsqueeze(1) + query_points
-        points[..., 2] = 100.0
+        points[..., 2] = ray_start_height
         # ray-cast direction is downwards
         dirs = torch.zeros_like(points)
         dirs[..., 2] = -1.0
@@ -253,9 +325,15 @@ def find_flat_patches(
 
         # check validity
         # -- height is within the z range
-        not_valid = torch.any(torch.logical_or(heights < z_range[0], heights > z_range[1]), dim=1)
+        z_lower, z_upper = z_range[space_ids, 0:1], z_range[space_ids, 1:2]
+        not_valid = torch.any((heights < z_lower) | (heights > z_upper), dim=1)
         # -- height difference is within the max height difference
-        not_valid = torch.logical_or(not_valid, (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff)
+        not_valid |= (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff[space_ids]
+        # -- patch is inside the bounds of the search space
+        space_bounds = bounds[space_ids].unsqueeze(1)
+        outside = (points[..., 0] < space_bounds[..., 0]) | (points[..., 0] > space_bounds[..., 1])
+        outside |= (points[..., 1] < space_bounds[..., 2]) | (points[..., 1] > space_bounds[..., 3])
+        not_valid |= torch.any(outside, dim=1)
 
         # remove invalid patches indices
         points_ids = points_ids[not_valid]
@@ -268,8 +346,9 @@ def find_flat_patches(
             "Failed to find valid patches! Please check the input parameters."
             f"\n\tMaximum number of iterations reached: {iter_count}"
             f"\n\tNumber of invalid patches: {len(points_ids)}"
-            f"\n\tMaximum height difference: {max_height_diff}"
+            f"\n\tSearch spaces with invalid patches: {torch.unique(points_ids // num_patches).tolist()}"
+            f"\n\tMaximum height difference: {max_height_diff.unique().tolist()}"
         )
 
     # return the flat patches (in the mesh frame)
-    return flat_patches - origin
+    return flat_patches.view(num_spaces, num_patches, 3) - origins.unsqueeze(1)
@@ -10,7 +10,15 @@ from .buffers import *
 from .configclass import configclass
 from .dict import *
 from .interpolation import *
+from .lazy import lazy_attach
 from .modifiers import *
 from .string import *
 from .timer import Timer
 from .types import *
+
+# sub-modules and attributes that depend on heavy third-party packages (warp, h5py, ...) are loaded on first access
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodules=["assets", "datasets", "hashing", "io", "math", "noise", "pretrained_checkpoint", "warp"],
+    attributes={"TENSOR_TYPES": ".array", "TENSOR_TYPE_CONVERSIONS": ".array"},
+)
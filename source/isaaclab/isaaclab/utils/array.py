@@ -9,40 +9,59 @@
 from __future__ import annotations
 
 import numpy as np
+import sys
 import torch
-from typing import Union
+from typing import TYPE_CHECKING, Any, Union
 
-import warp as wp
+if TYPE_CHECKING:
+    import warp as wp
 
-TensorData = Union[np.ndarray, torch.Tensor, wp.array]
+TensorData = Union[np.ndarray, torch.Tensor, "wp.array"]
 """Type definition for a tensor data.
 
 Union of numpy, torch, and warp arrays.
 """
 
-TENSOR_TYPES = {
-    "numpy": np.ndarray,
-    "torch": torch.Tensor,
-    "warp": wp.array,
-}
+TENSOR_TYPES: dict[str, type]
 """A dictionary containing the types for each backend.
 
 The keys are the name of the backend ("numpy", "torch", "warp") and the values are the corresponding type
 (``np.ndarray``, ``torch.Tensor``, ``wp.array``).
+
+Note:
+    The dictionary is created on its first access, so that importing this module does not import warp.
 """
 
-TENSOR_TYPE_CONVERSIONS = {
-    "numpy": {wp.array: lambda x: x.numpy(), torch.Tensor: lambda x: x.detach().cpu().numpy()},
-    "torch": {wp.array: lambda x: wp.torch.to_torch(x), np.ndarray: lambda x: torch.from_numpy(x)},
-    "warp": {np.array: lambda x: wp.array(x), torch.Tensor: lambda x: wp.torch.from_torch(x)},
-}
+TENSOR_TYPE_CONVERSIONS: dict[str, dict[type, Any]]
 """A nested dictionary containing the conversion functions for each backend.
 
 The keys of the outer dictionary are the name of target backend ("numpy", "torch", "warp"). The keys of the
 inner dictionary are the source backend (``np.ndarray``, ``torch.Tensor``, ``wp.array``).
+
+Note:
+    The dictionary is created on its first access, so that importing this module does not import warp.
 """
 
 
+def __getattr__(name: str) -> Any:
+    # create the dictionaries that depend on warp on their first access (PEP 562)
+    if name in ("TENSOR_TYPES", "TENSOR_TYPE_CONVERSIONS"):
+        import warp as wp
+
+        globals()["TENSOR_TYPES"] = {
+            "numpy": np.ndarray,
+            "torch": torch.Tensor,
+            "warp": wp.array,
+        }
+        globals()["TENSOR_TYPE_CONVERSIONS"] = {
+            "numpy": {wp.array: lambda x: x.numpy(), torch.Tensor: lambda x: x.detach().cpu().numpy()},
+            "torch": {wp.array: lambda x: wp.torch.to_torch(x), np.ndarray: lambda x: torch.from_numpy(x)},
+            "warp": {np.array: lambda x: wp.array(x), torch.Tensor: lambda x: wp.torch.from_torch(x)},
+        }
+        return globals()[name]
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 def convert_to_torch(
     array: TensorData,
     dtype: torch.dtype = None,
@@ -79,7 +98,9 @@ def convert_to_torch(
             array = array.astype(np.int32)
         # need to deal with object arrays (np.void) separately
         tensor = torch.from_numpy(array)
-    elif isinstance(array, wp.array):
+    elif "warp" in sys.modules and isinstance(array, sys.modules["warp"].array):
+        # note: a warp array can only exist if warp is already imported
+        wp = sys.modules["warp"]
         if array.dtype == wp.uint32:
             array = array.view(wp.int32)
         tensor = wp.to_torch(array)
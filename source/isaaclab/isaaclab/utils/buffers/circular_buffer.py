@@ -38,9 +38,13 @@ class CircularBuffer:
         self._ALL_INDICES = torch.arange(batch_size, device=device)
 
         # max length tensor for comparisons
+        self._max_length = max_len
         self._max_len = torch.full((batch_size,), max_len, dtype=torch.int, device=device)
         # number of data pushes passed since the last call to :meth:`reset`
         self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
+        # flag indicating whether some batches have no data pushed since the last call to :meth:`reset`
+        # note: this is tracked on the host to avoid synchronizing with the device on every call to :meth:`append`
+        self._has_empty_batches = True
         # the pointer to the current head of the circular buffer (-1 means not initialized)
         self._pointer: int = -1
         # the actual buffer for data storage
@@ -64,7 +68,7 @@ class CircularBuffer:
     @property
     def max_length(self) -> int:
         """The maximum length of the ring buffer."""
-        return int(self._max_len[0].item())
+        return self._max_length
 
     @property
     def current_length(self) -> torch.Tensor:
@@ -100,6 +104,7 @@ class CircularBuffer:
             batch_ids = slice(None)
         # reset the number of pushes for the specified batch indices
         self._num_pushes[batch_ids] = 0
+        self._has_empty_batches = True
         if self._buffer is not None:
             # set buffer at batch_id reset indices to 0.0 so that the buffer() getter returns the cleared circular buffer after reset.
             self._buffer[:, batch_ids, :] = 0.0
@@ -127,10 +132,11 @@ class CircularBuffer:
         # add the new data to the last layer
         self._buffer[self._pointer] = data.to(self._device)
         # Check for batches with zero pushes and initialize all values in batch to first append
-        if 0 in self._num_pushes.tolist():
-            fill_ids = [i for i, x in enumerate(self._num_pushes.tolist()) if x == 0]
-            self._num_pushes.tolist().index(0) if 0 in self._num_pushes.tolist() else None
-            self._buffer[:, fill_ids, :] = data.to(self._device)[fill_ids]
+        # note: the batches are selected with a mask to avoid synchronizing with the device
+        if self._has_empty_batches:
+            is_first_push = (self._num_pushes == 0).view(1, -1, *([1] * (data.dim() - 1)))
+            torch.where(is_first_push, data.to(self._device).unsqueeze(0), self._buffer, out=self._buffer)
+            self._has_empty_batches = False
         # increment number of number of pushes for all batches
         self._num_pushes += 1
 
@@ -155,7 +161,7 @@ class CircularBuffer:
         if len(key) != self.batch_size:
             raise ValueError(f"The argument 'key' has length {key.shape[0]}, while expecting {self.batch_size}")
         # check if the buffer is empty
-        if torch.any(self._num_pushes == 0) or self._buffer is None:
+        if self._has_empty_batches or self._buffer is None:
             raise RuntimeError("Attempting to retrieve data on an empty circular buffer. Please append data first.")
 
         # admissible lag
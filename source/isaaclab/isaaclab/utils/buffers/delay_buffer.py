@@ -26,6 +26,11 @@ class DelayBuffer:
     the delay can be set separately for each batch index. If the requested delay is larger than the current
     length of the underlying buffer, the most recent entry is returned.
 
+    Multiple quantities that share the same delay (for instance, the joint position, velocity and effort
+    commands of an actuator) can be stacked along the second dimension, i.e. (batch_size, num_channels, ...).
+    This stores all of them in a single ring buffer and retrieves all the delayed channels with a single
+    gather operation.
+
     .. note::
         By default, the delay buffer has no delay, meaning that the data is returned as is.
     """
@@ -47,8 +52,9 @@ class DelayBuffer:
         self._circular_buffer = CircularBuffer(self._history_length + 1, batch_size, device)
 
         # the minimum and maximum lags across all environments.
-        self._min_time_lag = 0
-        self._max_time_lag = 0
+        # note: these are computed lazily from the time lags (see :meth:`_update_time_lag_bounds`)
+        self._min_time_lag: int | None = 0
+        self._max_time_lag: int | None = 0
         # the lags for each environment.
         self._time_lags = torch.zeros(batch_size, dtype=torch.int, device=device)
 
@@ -79,7 +85,13 @@ class DelayBuffer:
         """Minimum amount of time steps that can be delayed.
 
         This value cannot be negative or larger than :attr:`max_time_lag`.
+
+        Note:
+            The value is cached. It is computed from :attr:`time_lags` on the first access after the time lags
+            are set with a tensor, which synchronizes with the device once.
         """
+        if self._min_time_lag is None:
+            self._update_time_lag_bounds()
         return self._min_time_lag
 
     @property
@@ -87,7 +99,13 @@ class DelayBuffer:
         """Maximum amount of time steps that can be delayed.
 
         This value cannot be greater than :attr:`history_length`.
+
+        Note:
+            The value is cached. It is computed from :attr:`time_lags` on the first access after the time lags
+            are set with a tensor, which synchronizes with the device once.
         """
+        if self._max_time_lag is None:
+            self._update_time_lag_bounds()
         return self._max_time_lag
 
     @property
@@ -103,9 +121,19 @@ class DelayBuffer:
     Operations.
     """
 
-    def set_time_lag(self, time_lag: int | torch.Tensor, batch_ids: Sequence[int] | None = None):
+    def set_time_lag(
+        self,
+        time_lag: int | torch.Tensor,
+        batch_ids: Sequence[int] | None = None,
+        time_lag_range: tuple[int, int] | None = None,
+    ):
         """Sets the time lag for the delay buffer across the provided batch indices.
 
+        For tensor inputs, the time lags must be checked against the feasible bounds. If the range of the values
+        is provided through :attr:`time_lag_range` (for instance, the bounds that the lags were sampled from),
+        only the range is checked and the values are used as is. Otherwise, the minimum and maximum values are
+        copied to the host, which synchronizes with the device once.
+
         Args:
             time_lag: The desired delay for the buffer.
 
@@ -115,38 +143,45 @@ class DelayBuffer:
 
             batch_ids: The batch indices for which the time lag is set. Default is None, which sets the time lag
                 for all batch indices.
+            time_lag_range: The minimum and maximum values of the :attr:`time_lag` tensor. Default is None,
+                in which case the values are read from the tensor.
 
         Raises:
             TypeError: If the type of the :attr:`time_lag` is not int or integer tensor.
             ValueError: If the minimum time lag is negative or the maximum time lag is larger than the history length.
         """
         # resolve batch indices
-        if batch_ids is None:
+        all_batch_ids = batch_ids is None
+        if all_batch_ids:
             batch_ids = slice(None)
 
         # parse requested time_lag
         if isinstance(time_lag, int):
+            # check that time_lag is feasible
+            self._check_time_lag_bounds(time_lag, time_lag)
             # set the time lags across provided batch indices
             self._time_lags[batch_ids] = time_lag
         elif isinstance(time_lag, torch.Tensor):
             # check valid dtype for time_lag: must be int or long
             if time_lag.dtype not in [torch.int, torch.long]:
                 raise TypeError(f"Invalid dtype for time_lag: {time_lag.dtype}. Expected torch.int or torch.long.")
+            # check that time_lag is feasible
+            if time_lag_range is not None:
+                self._check_time_lag_bounds(*time_lag_range)
+            elif time_lag.numel() > 0:
+                # note: the bounds are copied to the host together, which synchronizes with the device only once
+                self._check_time_lag_bounds(*torch.stack(torch.aminmax(time_lag)).tolist())
             # set the time lags
             self._time_lags[batch_ids] = time_lag.to(device=self.device)
         else:
             raise TypeError(f"Invalid type for time_lag: {type(time_lag)}. Expected int or integer tensor.")
 
-        # compute the min and max time lag
-        self._min_time_lag = int(torch.min(self._time_lags).item())
-        self._max_time_lag = int(torch.max(self._time_lags).item())
-        # check that time_lag is feasible
-        if self._min_time_lag < 0:
-            raise ValueError(f"The minimum time lag cannot be negative. Received: {self._min_time_lag}")
-        if self._max_time_lag > self._history_length:
-            raise ValueError(
-                f"The maximum time lag cannot be larger than the history length. Received: {self._max_time_lag}"
-            )
+        # update the minimum and maximum time lags
+        if isinstance(time_lag, int) and all_batch_ids:
+            self._min_time_lag = self._max_time_lag = time_lag
+        else:
+            # note: these are computed on their next access to avoid synchronizing with the device here
+            self._min_time_lag = self._max_time_lag = None
 
     def reset(self, batch_ids: Sequence[int] | None = None):
         """Reset the data in the delay buffer at the specified batch indices.
@@ -173,5 +208,28 @@ class DelayBuffer:
         # add the new data to the last layer
         self._circular_buffer.append(data)
         # return output
-        delayed_data = self._circular_buffer[self._time_lags]
-        return delayed_data.clone()
+        # note: indexing the circular buffer already returns a copy of the data
+        return self._circular_buffer[self._time_lags]
+
+    """
+    Helper functions.
+    """
+
+    def _update_time_lag_bounds(self):
+        """Compute the minimum and maximum time lags across all batch indices."""
+        self._min_time_lag, self._max_time_lag = torch.stack(torch.aminmax(self._time_lags)).tolist()
+
+    def _check_time_lag_bounds(self, min_time_lag: int, max_time_lag: int):
+        """Check that the time lags are within the feasible bounds.
+
+        Args:
+            min_time_lag: The minimum requested time lag.
+            max_time_lag: The maximum requested time lag.
+
+        Raises:
+            ValueError: If the minimum time lag is negative or the maximum time lag is larger than the history length.
+        """
+        if min_time_lag < 0:
+            raise ValueError(f"The minimum time lag cannot be negative. Received: {min_time_lag}")
+        if max_time_lag > self._history_length:
+            raise ValueError(f"The maximum time lag cannot be larger than the history length. Received: {max_time_lag}")
@@ -5,9 +5,11 @@
 
 """Sub-module that provides a wrapper around the Python 3.7 onwards ``dataclasses`` module."""
 
+import contextlib
+import enum
 import inspect
 import types
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from copy import deepcopy
 from dataclasses import MISSING, Field, dataclass, field, replace
 from typing import Any, ClassVar
@@ -17,6 +19,15 @@ from .dict import class_to_dict, update_class_from_dict
 _CONFIGCLASS_METHODS = ["to_dict", "from_dict", "replace", "copy", "validate"]
 """List of class methods added at runtime to dataclass."""
 
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None), type(Ellipsis))
+"""Types whose instances are returned unchanged by :func:`copy.deepcopy`."""
+
+_deferred_copy_depth = 0
+"""Number of active :func:`deferred_copy` contexts."""
+
+_post_init_objects: list[object] = []
+"""Configclass objects whose user-defined ``__post_init__`` functions are being executed."""
+
 """
 Wrapper around dataclass.
 """
@@ -101,10 +112,47 @@ def configclass(cls, **kwargs):
     setattr(cls, "validate", _validate)
     # wrap around dataclass
     cls = dataclass(cls, **kwargs)
+    # precompute the class members that are copied on initialization
+    _get_copied_class_members(cls)
     # return wrapped class
     return cls
 
 
+@contextlib.contextmanager
+def deferred_copy() -> Iterator[None]:
+    """Context manager to copy the members of configclass objects only once when they are initialized.
+
+    On initialization, a configclass object deep-copies all its members after its ``__post_init__`` function
+    is called, so that it does not share mutable members with other objects. When a configuration inherits from
+    other configurations, the ``__post_init__`` function of each parent configuration copies all the members again,
+    and so do the configclass objects that are created inside a ``__post_init__`` function (for example, through
+    :meth:`replace`). For large nested configurations, such as the ones of the environments, most of the
+    initialization time is spent in these copies.
+
+    Inside this context, the members of an object are only copied once all its ``__post_init__`` functions have
+    been called, and not after the ``__post_init__`` function of each parent configuration. The members of the
+    object are still not shared with other objects. However, the members that are assigned in the ``__post_init__`` function of a parent configuration
+    are not copied before the ``__post_init__`` function of the child configuration is called. Thus, they should
+    not be modified in-place by the child configuration if they are shared with other objects, such as module-level
+    configurations. Use :meth:`replace` to assign a modified copy of such configurations instead.
+
+    Usage:
+
+    .. code-block:: python
+
+        from isaaclab.utils.configclass import deferred_copy
+
+        with deferred_copy():
+            env_cfg = AnymalCRoughEnvCfg()
+    """
+    global _deferred_copy_depth
+    _deferred_copy_depth += 1
+    try:
+        yield
+    finally:
+        _deferred_copy_depth -= 1
+
+
 """
 Dictionary <-> Class operations.
 
@@ -168,8 +216,13 @@ def _replace_class_with_kwargs(obj: object, **kwargs) -> object:
 
 
 def _copy_class(obj: object) -> object:
-    """Return a new object with the same fields as the original."""
-    return replace(obj)
+    """Return a new object with the same fields as the original.
+
+    The fields of the original object are copied only once, even if the object inherits from other
+    configurations (see :func:`deferred_copy`).
+    """
+    with deferred_copy():
+        return replace(obj)
 
 
 """
@@ -378,23 +431,73 @@ def _custom_post_init(obj):
     This function is called explicitly instead of as a part of :func:`_process_mutable_types()` to prevent mapping
     proxy type i.e. a read only proxy for mapping objects. The error is thrown when using hierarchical data-classes
     for configuration.
+
+    The copied members are the members of the instance and the class members that are found by
+    :func:`_get_copied_class_members`. Inside a :func:`deferred_copy` context, the members are only copied by the
+    outermost ``__post_init__`` function of the object.
     """
-    for key in dir(obj):
-        # skip dunder members
-        if key.startswith("__"):
+    # skip the copy if the ``__post_init__`` function of a child configuration copies the members
+    if _deferred_copy_depth > 0 and any(other is obj for other in _post_init_objects):
+        return
+    class_members, class_properties = _get_copied_class_members(type(obj))
+    # note: the instance members are listed first since they may shadow class members
+    keys = [key for key in obj.__dict__ if not key.startswith("__")]
+    keys += [key for key in class_members if key not in obj.__dict__]
+    for key in keys:
+        # skip properties of the class
+        if key in class_properties:
             continue
         # get data member
         value = getattr(obj, key)
-        # check annotation
-        ann = obj.__class__.__dict__.get(key)
         # duplicate data members that are mutable
-        if not callable(value) and not isinstance(ann, property):
+        # note: immutable members are returned unchanged by deepcopy, so they are skipped
+        if not callable(value) and not _is_immutable(value):
             setattr(obj, key, deepcopy(value))
 
 
+def _get_copied_class_members(cls: type) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Get the class members that are copied when an instance of the class is initialized.
+
+    The class members are resolved once per class and stored in the class. They are the non-dunder
+    members of the class (including the inherited ones) that are not callable and are not properties
+    of the class. In practice, these are the class variables, since the fields of the dataclass are
+    instance members.
+
+    Args:
+        cls: The class.
+
+    Returns:
+        A tuple containing the names of the class members to copy and the names of the properties of the class.
+    """
+    members = cls.__dict__.get("__configclass_copied_members__")
+    if members is None:
+        class_properties = frozenset(key for key, value in cls.__dict__.items() if isinstance(value, property))
+        class_members = tuple(
+            key
+            for key in dir(cls)
+            if not key.startswith("__") and key not in class_properties and not callable(getattr(cls, key, None))
+        )
+        members = (class_members, class_properties)
+        setattr(cls, "__configclass_copied_members__", members)
+    return members
+
+
+def _is_immutable(value: Any) -> bool:
+    """Check if a value is immutable, i.e. if :func:`copy.deepcopy` returns it unchanged."""
+    if type(value) in _IMMUTABLE_TYPES or isinstance(value, enum.Enum):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
 def _combined_function(f1: Callable, f2: Callable) -> Callable:
     """Combine two functions into one.
 
+    This is used to combine the user-defined ``__post_init__`` function (the first function) with the copy of
+    the members (the second function). While the first function is executed, the object is recorded as being
+    initialized (see :func:`deferred_copy`).
+
     Args:
         f1: The first function.
         f2: The second function.
@@ -403,10 +506,14 @@ def _combined_function(f1: Callable, f2: Callable) -> Callable:
         The combined function.
     """
 
-    def _combined(*args, **kwargs):
+    def _combined(obj, *args, **kwargs):
         # call both functions
-        f1(*args, **kwargs)
-        f2(*args, **kwargs)
+        _post_init_objects.append(obj)
+        try:
+            f1(obj, *args, **kwargs)
+        finally:
+            _post_init_objects.pop()
+        f2(obj, *args, **kwargs)
 
     return _combined
 
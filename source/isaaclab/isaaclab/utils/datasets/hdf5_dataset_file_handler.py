@@ -3,16 +3,19 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-import h5py
 import json
-import numpy as np
 import os
 import torch
 from collections.abc import Iterable
 
+from isaaclab.utils.lazy import lazy_import
+
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
 
+# note: h5py is only loaded when a file is opened
+h5py = lazy_import("h5py")
+
 
 class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     """HDF5 dataset file handler for storing and loading episode data."""
@@ -110,13 +113,14 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         def load_dataset_helper(group):
             """Helper method to load dataset that contains recursive dict objects."""
             data = {}
-            for key in group:
-                if isinstance(group[key], h5py.Group):
-                    data[key] = load_dataset_helper(group[key])
+            # iterate over the items to look up each member of the group only once
+            for key, value in group.items():
+                if isinstance(value, h5py.Group):
+                    data[key] = load_dataset_helper(value)
                 else:
-                    # Converting group[key] to numpy array greatly improves the performance
+                    # Reading the dataset into a numpy array greatly improves the performance
                     # when converting to torch tensor
-                    data[key] = torch.tensor(np.array(group[key]), device=device)
+                    data[key] = torch.as_tensor(value[()], device=device)
             return data
 
         episode.data = load_dataset_helper(h5_episode_group)
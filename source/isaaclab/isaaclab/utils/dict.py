@@ -12,7 +12,7 @@ import torch
 from collections.abc import Iterable, Mapping
 from typing import Any
 
-from .array import TENSOR_TYPE_CONVERSIONS, TENSOR_TYPES
+from . import array as array_utils
 from .string import callable_to_string, string_to_callable, string_to_slice
 
 """
@@ -196,22 +196,22 @@ def convert_dict_to_backend(
     """
     # THINK: Should we also support converting to a specific device, e.g. "cuda:0"?
     # Check the backend is valid.
-    if backend not in TENSOR_TYPE_CONVERSIONS:
+    if backend not in array_utils.TENSOR_TYPE_CONVERSIONS:
         raise ValueError(f"Unknown backend '{backend}'. Supported backends are 'numpy', 'torch', and 'warp'.")
     # Define the conversion functions for each backend.
-    tensor_type_conversions = TENSOR_TYPE_CONVERSIONS[backend]
+    tensor_type_conversions = array_utils.TENSOR_TYPE_CONVERSIONS[backend]
 
     # Parse the array types and convert them to the corresponding types: "numpy" -> np.ndarray, etc.
     parsed_types = list()
     for t in array_types:
         # Check type is valid.
-        if t not in TENSOR_TYPES:
+        if t not in array_utils.TENSOR_TYPES:
             raise ValueError(f"Unknown array type: '{t}'. Supported array types are 'numpy', 'torch', and 'warp'.")
         # Exclude types that match the backend, since we do not need to convert these.
         if t == backend:
             continue
         # Convert the string types to the corresponding types.
-        parsed_types.append(TENSOR_TYPES[t])
+        parsed_types.append(array_utils.TENSOR_TYPES[t])
 
     # Convert the data to the desired backend.
     output_dict = dict()
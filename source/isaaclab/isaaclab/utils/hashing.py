@@ -0,0 +1,194 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module for stable content hashing of configurations and files.
+
+The hashes are used as keys of the caches of generated data, such as the cached sub-terrain meshes and the USD
+files generated by the asset converters. They are computed with SHA-256, which is hardware-accelerated on most
+recent CPUs and faster than MD5 in practice.
+
+Files are hashed by streaming their contents in chunks. The hash of a file is memoized by its path, size and
+modification time, so that files that did not change are only read once per process. The memoized hashes can be
+persisted in the cache itself (see :func:`get_file_hash_record` and :func:`set_file_hash_record`) to avoid reading
+large asset files again when the application is launched again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+
+from .dict import class_to_dict
+
+HASH_ALGORITHM = "sha256"
+"""Name of the hash algorithm in :mod:`hashlib`."""
+
+FILE_CHUNK_SIZE = 1 << 20
+"""Size of the chunks in which the files are read (in bytes)."""
+
+_file_hashes: dict[str, tuple[int, int, str]] = {}
+"""Memoized hashes of the files, keyed by their absolute path. The values are the size, modification time and hash."""
+
+
+@dataclass
+class CacheReport:
+    """Report about the validity of a cache entry."""
+
+    path: str
+    """Path to the cache entry."""
+
+    hash: str
+    """Hash of the configuration and files from which the cache entry is generated."""
+
+    is_valid: bool
+    """Whether the cache entry exists and was generated from the same configuration and files."""
+
+    reason: str
+    """Reason why the cache entry is valid or invalid."""
+
+    def __str__(self) -> str:
+        status = "valid" if self.is_valid else "invalid"
+        return f"Cache entry '{self.path}' is {status}: {self.reason} (hash: {self.hash})."
+
+
+class ContentHasher:
+    """Incremental hasher of configurations and files.
+
+    The configurations and files are added to the hash in their order. Adding a file adds its hash to the hash,
+    so that the contents of a file that did not change are not read again (see :func:`hash_file`).
+
+    Usage:
+
+    .. code-block:: python
+
+        from isaaclab.utils.hashing import ContentHasher
+
+        hasher = ContentHasher()
+        hasher.update_dict(cfg.to_dict())
+        hasher.update_file(cfg.asset_path)
+        cache_key = hasher.hexdigest()
+    """
+
+    def __init__(self):
+        self._hash = hashlib.new(HASH_ALGORITHM)
+
+    def update_bytes(self, data: bytes) -> ContentHasher:
+        """Add bytes to the hash.
+
+        Args:
+            data: The bytes to add.
+
+        Returns:
+            The hasher itself to chain the updates.
+        """
+        self._hash.update(data)
+        return self
+
+    def update_dict(self, data: object) -> ContentHasher:
+        """Add a dictionary or configuration object to the hash.
+
+        The dictionary is serialized to JSON with sorted keys, so that the hash does not depend on the order of
+        the keys.
+
+        Args:
+            data: Input dictionary or configuration object.
+
+        Returns:
+            The hasher itself to chain the updates.
+        """
+        if not isinstance(data, dict):
+            data = class_to_dict(data)
+        return self.update_bytes(json.dumps(data, sort_keys=True).encode())
+
+    def update_file(self, file_path: str) -> ContentHasher:
+        """Add the contents of a file to the hash.
+
+        Args:
+            file_path: The path to the file.
+
+        Returns:
+            The hasher itself to chain the updates.
+        """
+        return self.update_bytes(hash_file(file_path).encode())
+
+    def hexdigest(self) -> str:
+        """The hash of the added contents as a string of hexadecimal digits."""
+        return self._hash.hexdigest()
+
+
+def hash_dict(data: object) -> str:
+    """Compute a stable hash of a dictionary or configuration object.
+
+    Args:
+        data: Input dictionary or configuration object.
+
+    Returns:
+        The hash as a string of hexadecimal digits.
+    """
+    return ContentHasher().update_dict(data).hexdigest()
+
+
+def hash_file(file_path: str) -> str:
+    """Compute the hash of the contents of a file.
+
+    The file is read in chunks of :data:`FILE_CHUNK_SIZE` bytes. The hash is memoized by the path, size and
+    modification time of the file, so that the file is only read again if it changed.
+
+    Args:
+        file_path: The path to the file.
+
+    Returns:
+        The hash as a string of hexadecimal digits.
+    """
+    file_path = os.path.abspath(file_path)
+    file_stat = os.stat(file_path)
+    # check the memoized hash
+    record = _file_hashes.get(file_path)
+    if record is not None and record[:2] == (file_stat.st_size, file_stat.st_mtime_ns):
+        return record[2]
+    # hash the contents of the file
+    file_hash = hashlib.new(HASH_ALGORITHM)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(FILE_CHUNK_SIZE):
+            file_hash.update(chunk)
+    digest = file_hash.hexdigest()
+    _file_hashes[file_path] = (file_stat.st_size, file_stat.st_mtime_ns, digest)
+    return digest
+
+
+def get_file_hash_record(file_path: str) -> dict | None:
+    """Get the memoized hash of a file, so that it can be persisted.
+
+    Args:
+        file_path: The path to the file.
+
+    Returns:
+        The path, size, modification time and hash of the file. None if the hash of the file is not memoized.
+    """
+    file_path = os.path.abspath(file_path)
+    record = _file_hashes.get(file_path)
+    if record is None:
+        return None
+    return {"path": file_path, "size": record[0], "mtime_ns": record[1], "hash": record[2]}
+
+
+def set_file_hash_record(record: dict):
+    """Memoize the hash of a file that was persisted with :func:`get_file_hash_record`.
+
+    The hash is only used by :func:`hash_file` if the size and modification time of the file did not change.
+
+    Args:
+        record: The path, size, modification time and hash of the file.
+    """
+    file_path = os.path.abspath(record["path"])
+    if file_path not in _file_hashes:
+        _file_hashes[file_path] = (int(record["size"]), int(record["mtime_ns"]), str(record["hash"]))
+
+
+def clear_file_hashes():
+    """Clear the memoized hashes of the files."""
+    _file_hashes.clear()
@@ -0,0 +1,109 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module with utilities for deferring the import of modules until their attributes are accessed.
+
+Importing heavy third-party packages (such as warp, trimesh or h5py) and the modules that depend on them at
+the top of a package makes every import of the package pay for them, even when they are never used. The
+functions in this module defer these imports to the first access of the corresponding attributes.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from collections.abc import Callable, Iterable
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module that is only loaded when one of its attributes is accessed.
+
+    This is useful for heavy third-party modules that are only needed by some functions of a module. The
+    returned module object can be used in the same way as the module returned by a regular import.
+
+    .. code-block:: python
+
+        from isaaclab.utils.lazy import lazy_import
+
+        # the module is loaded at the first call of `h5py.File`
+        h5py = lazy_import("h5py")
+
+    Args:
+        name: The absolute name of the module.
+
+    Returns:
+        The module. If the module is already imported, it is returned directly.
+
+    Raises:
+        ModuleNotFoundError: If the module cannot be found.
+    """
+    # check if the module is already imported
+    if name in sys.modules:
+        return sys.modules[name]
+    # find the module without executing it
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'.", name=name)
+    # create the module with a loader that executes it on the first attribute access
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def lazy_attach(
+    package_name: str, submodules: Iterable[str] = (), attributes: dict[str, str] | None = None
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Create the module-level ``__getattr__`` and ``__dir__`` functions to lazily load attributes of a package.
+
+    The returned functions implement `PEP 562`_: the sub-modules and attributes of the package are only imported
+    on their first access and are then stored in the namespace of the package. This keeps the public interface of
+    the package unchanged, while its import does not execute the listed sub-modules.
+
+    .. code-block:: python
+
+        from isaaclab.utils.lazy import lazy_attach
+
+        __getattr__, __dir__ = lazy_attach(
+            __name__, submodules=["warp"], attributes={"MeshConverter": ".converters.mesh_converter"}
+        )
+
+    .. note::
+        Attributes that are loaded lazily are not part of the names imported with ``from package import *``,
+        since these are the names in the namespace of the package at the time of the import.
+
+    .. _PEP 562: https://peps.python.org/pep-0562/
+
+    Args:
+        package_name: The name of the package, i.e. the ``__name__`` of the package.
+        submodules: The names of the sub-modules that are loaded on their first access.
+        attributes: A dictionary mapping the names of the attributes that are loaded on their first access to the
+            names of the modules that define them. Relative module names are resolved with respect to the package.
+            Defaults to None.
+
+    Returns:
+        A tuple containing the ``__getattr__`` and ``__dir__`` functions of the package.
+    """
+    submodules = set(submodules)
+    attributes = attributes or {}
+
+    def __getattr__(name: str) -> object:
+        if name in submodules:
+            value = importlib.import_module(f"{package_name}.{name}")
+        elif name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package_name), name)
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        # store the attribute so that this function is not called again
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package_name])) | submodules | set(attributes))
+
+    return __getattr__, __dir__
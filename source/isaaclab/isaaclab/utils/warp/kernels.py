@@ -75,6 +75,130 @@ def raycast_mesh_kernel(
             ray_face_id[tid] = f
 
 
+@wp.func
+def _clip_distance(distance: float, max_distance: float, clipping_mode: int) -> float:
+    """Clips a distance that exceeds the maximum distance (or is not finite) based on the clipping mode.
+
+    The clipping mode is 1 to clip the distance to the maximum distance, 2 to set it to zero and 0 to not clip it.
+    """
+    if clipping_mode == 1 and not (distance <= max_distance):
+        return max_distance
+    if clipping_mode == 2 and not (distance <= max_distance):
+        return 0.0
+    return distance
+
+
+@wp.kernel(enable_backward=False)
+def raycast_camera_kernel(
+    mesh: wp.uint64,
+    env_ids: wp.array(dtype=wp.int32),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    pos_w: wp.array(dtype=wp.vec3),
+    quat_w: wp.array(dtype=wp.quat),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    distance_to_image_plane: Any,
+    distance_to_camera: Any,
+    normals: Any,
+    max_dist: float,
+    max_distance: float,
+    clipping_mode: int,
+    return_distance_to_image_plane: int,
+    return_distance_to_camera: int,
+    return_normal: int,
+):
+    """Performs ray-casting of a batch of cameras against a mesh and writes the camera images.
+
+    The rays are transformed from the frames of the cameras to the world frame, cast against the mesh, and the
+    hit positions, depths and normals are written directly into the output images of the cameras. The depths are
+    clipped based on the clipping mode (see :func:`_clip_distance`). For the missed rays, the hit positions and
+    normals are :obj:`float('inf')`, the distances to the camera are :obj:`float('inf')` and the distances to the
+    image plane are :obj:`float('nan')` before clipping.
+
+    The camera frame follows the world convention, i.e. the image plane depth is the first component of the hit
+    position in the camera frame.
+
+    Args:
+        mesh: The input mesh.
+        env_ids: The indices of the cameras to update. Shape is (M,).
+        ray_starts: The ray start positions in the frames of all the cameras. Shape is (N, R).
+        ray_directions: The ray directions in the frames of all the cameras. Shape is (N, R).
+        pos_w: The positions of the cameras to update in the world frame. Shape is (M,).
+        quat_w: The orientations (x, y, z, w) of the cameras to update in the world frame. Shape is (M,).
+        ray_hits: The output ray hit positions in the world frame. Shape is (N, R).
+        distance_to_image_plane: The output distances to the image plane. Shape is (N, R), if
+            `return_distance_to_image_plane` is 1. Otherwise, this array is not used.
+        distance_to_camera: The output distances to the camera. Shape is (N, R), if `return_distance_to_camera`
+            is 1. Otherwise, this array is not used.
+        normals: The output ray hit normals. Shape is (N, R, 3), if `return_normal` is 1. Otherwise, this array
+            is not used.
+        max_dist: The maximum ray-cast distance.
+        max_distance: The maximum distance of the depths.
+        clipping_mode: The clipping mode of the depths.
+        return_distance_to_image_plane: Whether to write the distances to the image plane.
+        return_distance_to_camera: Whether to write the distances to the camera.
+        return_normal: Whether to write the ray hit normals.
+    """
+    # get the thread id
+    tid, ray_id = wp.tid()
+    env_id = env_ids[tid]
+
+    # transform the ray to the world frame
+    ray_direction = ray_directions[env_id, ray_id]
+    start = pos_w[tid] + wp.quat_rotate(quat_w[tid], ray_starts[env_id, ray_id])
+    direction = wp.quat_rotate(quat_w[tid], ray_direction)
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # ray cast against the mesh
+    hit = wp.vec3(wp.inf, wp.inf, wp.inf)
+    distance = wp.inf
+    depth = wp.nan
+    if wp.mesh_query_ray(mesh, start, direction, max_dist, t, u, v, sign, n, f):
+        hit = start + t * direction
+        distance = t
+        # note: the rotation preserves the distance along the ray
+        depth = t * ray_direction[0]
+    else:
+        n = wp.vec3(wp.inf, wp.inf, wp.inf)
+
+    # store the hit data
+    ray_hits[env_id, ray_id] = hit
+    if return_distance_to_image_plane == 1:
+        depth = _clip_distance(depth, max_distance, clipping_mode)
+        distance_to_image_plane[env_id, ray_id] = distance_to_image_plane.dtype(depth)
+    if return_distance_to_camera == 1:
+        distance = _clip_distance(distance, max_distance, clipping_mode)
+        distance_to_camera[env_id, ray_id] = distance_to_camera.dtype(distance)
+    if return_normal == 1:
+        for i in range(3):
+            normals[env_id, ray_id, i] = normals.dtype(n[i])
+
+
+# float32 and float16 are used for the camera images
+wp.overload(
+    raycast_camera_kernel,
+    {
+        "distance_to_image_plane": wp.array2d(dtype=wp.float32),
+        "distance_to_camera": wp.array2d(dtype=wp.float32),
+        "normals": wp.array3d(dtype=wp.float32),
+    },
+)
+wp.overload(
+    raycast_camera_kernel,
+    {
+        "distance_to_image_plane": wp.array2d(dtype=wp.float16),
+        "distance_to_camera": wp.array2d(dtype=wp.float16),
+        "normals": wp.array3d(dtype=wp.float16),
+    },
+)
+
+
 @wp.kernel(enable_backward=False)
 def reshape_tiled_image(
     tiled_image_buffer: Any,
@@ -131,3 +255,92 @@ wp.overload(
     reshape_tiled_image,
     {"tiled_image_buffer": wp.array(dtype=wp.float32), "batched_image": wp.array(dtype=wp.float32, ndim=4)},
 )
+
+
+@wp.kernel(enable_backward=False)
+def post_process_image(
+    batched_image: Any,
+    processed_image: Any,
+    channels: wp.array(dtype=wp.int32),
+    channel_scale: wp.array(dtype=wp.float32),
+    channel_offset: wp.array(dtype=wp.float32),
+    downsample_factor: int,
+    is_depth: int,
+    invalid_depth_value: float,
+    depth_min: float,
+    depth_max: float,
+    normalize_depth: int,
+):
+    """Post-processes a batch of images into a batch of smaller images with normalized values.
+
+    The operations are applied in the following order for each pixel of the processed image:
+
+    1. The selected channels of the input pixels in a square block of size :attr:`downsample_factor` are averaged.
+       For depth images, the non-finite values are replaced with :attr:`invalid_depth_value` before averaging.
+    2. For depth images, the values are clipped to the range :math:`[d_{min}, d_{max}]`. If :attr:`normalize_depth`
+       is 1, the range is mapped to :math:`[0, 1]`.
+    3. The values are scaled and offset per channel: :math:`v \\cdot s_k + o_k`.
+
+    Args:
+        batched_image: The input images. Shape is (num_cameras, height, width, num_channels).
+        processed_image: The output images. Shape is
+            (num_cameras, height // downsample_factor, width // downsample_factor, num_processed_channels).
+        channels: The channels of the input image for each channel of the output image.
+            Shape is (num_processed_channels,).
+        channel_scale: The scale of each channel of the output image. Shape is (num_processed_channels,).
+        channel_offset: The offset of each channel of the output image. Shape is (num_processed_channels,).
+        downsample_factor: The size of the square blocks of input pixels that are averaged.
+        is_depth: Whether the images are depth images (1) or not (0).
+        invalid_depth_value: The value of the non-finite depth values.
+        depth_min: The minimum depth value.
+        depth_max: The maximum depth value.
+        normalize_depth: Whether to map the depth range to [0, 1] (1) or not (0).
+    """
+    # get the thread id
+    camera_id, height_id, width_id = wp.tid()
+
+    num_pixels = float(downsample_factor * downsample_factor)
+    for k in range(processed_image.shape[3]):
+        channel = channels[k]
+        # average the pixels of the block
+        value = float(0.0)
+        for i in range(downsample_factor):
+            for j in range(downsample_factor):
+                pixel_value = wp.float32(
+                    batched_image[
+                        camera_id, height_id * downsample_factor + i, width_id * downsample_factor + j, channel
+                    ]
+                )
+                if is_depth == 1 and not wp.isfinite(pixel_value):
+                    pixel_value = invalid_depth_value
+                value += pixel_value
+        value = value / num_pixels
+        # clip and normalize the depth values
+        if is_depth == 1:
+            value = wp.clamp(value, depth_min, depth_max)
+            if normalize_depth == 1:
+                value = (value - depth_min) / (depth_max - depth_min)
+        # scale and offset the values
+        processed_image[camera_id, height_id, width_id, k] = processed_image.dtype(
+            value * channel_scale[k] + channel_offset[k]
+        )
+
+
+# uint8 is used for color images
+wp.overload(
+    post_process_image,
+    {"batched_image": wp.array(dtype=wp.uint8, ndim=4), "processed_image": wp.array(dtype=wp.float32, ndim=4)},
+)
+wp.overload(
+    post_process_image,
+    {"batched_image": wp.array(dtype=wp.uint8, ndim=4), "processed_image": wp.array(dtype=wp.float16, ndim=4)},
+)
+# float32 is used for depth, normals and motion vectors
+wp.overload(
+    post_process_image,
+    {"batched_image": wp.array(dtype=wp.float32, ndim=4), "processed_image": wp.array(dtype=wp.float32, ndim=4)},
+)
+wp.overload(
+    post_process_image,
+    {"batched_image": wp.array(dtype=wp.float32, ndim=4), "processed_image": wp.array(dtype=wp.float16, ndim=4)},
+)
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import numpy as np
 import torch
+from typing import Literal
 
 import warp as wp
 
@@ -18,6 +19,8 @@ wp.config.quiet = True
 # initialize the warp module
 wp.init()
 
+import isaaclab.utils.math as math_utils
+
 from . import kernels
 
 
@@ -127,6 +130,95 @@ def raycast_mesh(
     return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
 
 
+def raycast_camera(
+    mesh: wp.Mesh,
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    pos_w: torch.Tensor,
+    quat_w: torch.Tensor,
+    ray_hits: torch.Tensor,
+    env_ids: torch.Tensor | None = None,
+    distance_to_image_plane: torch.Tensor | None = None,
+    distance_to_camera: torch.Tensor | None = None,
+    normals: torch.Tensor | None = None,
+    max_distance: float = 1e6,
+    depth_clipping_behavior: Literal["max", "zero", "none"] = "none",
+    max_dist: float = 1e6,
+):
+    """Performs ray-casting of a batch of cameras against a mesh and writes the results into the given buffers.
+
+    Unlike :func:`raycast_mesh`, the rays are given in the frames of the cameras and the outputs are written into
+    pre-allocated buffers, for example the images of :attr:`isaaclab.sensors.camera.CameraData.output`. The rays
+    are transformed, cast and converted to depths and normals in a single kernel launch.
+
+    The output buffers must be contiguous tensors on the device of the mesh whose first dimension is the number of
+    cameras, for example with shape (N, H, W, 1) for the depths and (N, H, W, 3) for the normals. The depth and
+    normal buffers can be of type float32 or float16, but they must be of the same type.
+
+    Args:
+        mesh: The warp mesh to ray-cast against.
+        ray_starts: The starting positions of the rays in the frames of all the cameras. Shape is (N, R, 3).
+        ray_directions: The directions of the rays in the frames of all the cameras. Shape is (N, R, 3).
+            The camera frames follow the world convention (forward axis: +X).
+        pos_w: The positions of the cameras to update in the world frame. Shape is (M, 3).
+        quat_w: The orientations (w, x, y, z) of the cameras to update in the world frame. Shape is (M, 4).
+        ray_hits: The output ray hit positions in the world frame. Shape is (N, R, 3).
+            It contains :obj:`float('inf')` for missed hits.
+        env_ids: The indices of the cameras to update. Shape is (M,). Defaults to None, which means all cameras.
+        distance_to_image_plane: The output distances to the image plane. Defaults to None, in which case they are
+            not computed. It contains :obj:`float('nan')` for missed hits if the depths are not clipped.
+        distance_to_camera: The output distances to the camera. Defaults to None, in which case they are not
+            computed. It contains :obj:`float('inf')` for missed hits if the depths are not clipped.
+        normals: The output ray hit normals. Defaults to None, in which case they are not computed.
+            It contains :obj:`float('inf')` for missed hits.
+        max_distance: The maximum distance of the depths. Defaults to 1e6.
+        depth_clipping_behavior: The clipping behavior of the depths that exceed the maximum distance.
+            Defaults to "none". The values are set to the maximum distance for "max" and to zero for "zero".
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+    """
+    num_cameras, num_rays = ray_directions.shape[:2]
+    device = ray_directions.device
+    # resolve the cameras to update
+    if env_ids is None:
+        env_ids = torch.arange(num_cameras, dtype=torch.int32, device=device)
+    # resolve the type of the images
+    outputs = [distance_to_image_plane, distance_to_camera, normals]
+    dtype = next((output.dtype for output in outputs if output is not None), torch.float32)
+    wp_dtype = wp.float16 if dtype == torch.float16 else wp.float32
+    empty_2d = wp.empty((1, 1), dtype=wp_dtype, device=mesh.device)
+    empty_3d = wp.empty((1, 1, 1), dtype=wp_dtype, device=mesh.device)
+
+    # launch the warp kernel
+    # note: the output buffers are mapped to warp arrays without copies
+    wp.launch(
+        kernel=kernels.raycast_camera_kernel,
+        dim=(len(env_ids), num_rays),
+        inputs=[
+            wp.uint64(mesh.id),  # note: the type of the generic kernel arguments is inferred
+            wp.from_torch(env_ids.to(torch.int32)),
+            wp.from_torch(ray_starts.contiguous(), dtype=wp.vec3),
+            wp.from_torch(ray_directions.contiguous(), dtype=wp.vec3),
+            wp.from_torch(pos_w.contiguous(), dtype=wp.vec3),
+            wp.from_torch(math_utils.convert_quat(quat_w, to="xyzw").contiguous(), dtype=wp.quat),
+            wp.from_torch(ray_hits, dtype=wp.vec3),
+            (
+                empty_2d
+                if distance_to_image_plane is None
+                else wp.from_torch(distance_to_image_plane.view(num_cameras, -1))
+            ),
+            empty_2d if distance_to_camera is None else wp.from_torch(distance_to_camera.view(num_cameras, -1)),
+            empty_3d if normals is None else wp.from_torch(normals.view(num_cameras, -1, 3)),
+            float(max_dist),
+            float(max_distance),
+            {"none": 0, "max": 1, "zero": 2}[depth_clipping_behavior],
+            int(distance_to_image_plane is not None),
+            int(distance_to_camera is not None),
+            int(normals is not None),
+        ],
+        device=mesh.device,
+    )
+
+
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
     """Create a warp mesh object with a mesh defined from vertices and triangles.
 
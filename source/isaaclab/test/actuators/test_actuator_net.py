@@ -0,0 +1,197 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import os
+import tempfile
+import torch
+import unittest
+
+from isaaclab.actuators import ActuatorNetInferenceCfg, ActuatorNetMLP, ActuatorNetMLPCfg
+from isaaclab.utils.types import ArticulationActions
+
+
+class TestActuatorNetMLP(unittest.TestCase):
+    """Test fixture for checking the MLP-based actuator model."""
+
+    def setUp(self):
+        self.device = "cpu"
+        self.num_envs = 16
+        self.num_joints = 3
+        # create a small network and save it as a TorchScript file
+        torch.manual_seed(0)
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.network_file = os.path.join(self._temp_dir.name, "actuator_net.pt")
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    """
+    Tests.
+    """
+
+    def test_history_parity(self):
+        """Test that the ring-buffer history produces the same efforts as shifting the history every step."""
+        for input_order in ["pos_vel", "vel_pos"]:
+            for input_idx in [[0], [0, 1, 2], [0, 2, 4], [3, 0, 1]]:
+                with self.subTest(input_order=input_order, input_idx=input_idx):
+                    actuator = self._create_actuator(input_order, input_idx)
+                    # reference history buffers
+                    history_length = max(input_idx) + 1
+                    pos_error_history = torch.zeros(self.num_envs, history_length, self.num_joints)
+                    vel_history = torch.zeros(self.num_envs, history_length, self.num_joints)
+
+                    for step in range(3 * history_length + 5):
+                        # reset a subset of environments midway
+                        if step == 2 * history_length:
+                            env_ids = [1, 5, 7]
+                            actuator.reset(env_ids)
+                            pos_error_history[env_ids] = 0.0
+                            vel_history[env_ids] = 0.0
+                        # generate random data
+                        joint_pos = torch.randn(self.num_envs, self.num_joints)
+                        joint_vel = torch.randn(self.num_envs, self.num_joints)
+                        joint_pos_des = torch.randn(self.num_envs, self.num_joints)
+                        # compute reference efforts
+                        pos_error_history = pos_error_history.roll(1, 1)
+                        pos_error_history[:, 0] = joint_pos_des - joint_pos
+                        vel_history = vel_history.roll(1, 1)
+                        vel_history[:, 0] = joint_vel
+                        expected_effort = self._compute_reference_effort(
+                            actuator, pos_error_history, vel_history, joint_vel
+                        )
+                        # compute efforts from the actuator model
+                        control_action = ArticulationActions(
+                            joint_positions=joint_pos_des,
+                            joint_velocities=torch.zeros_like(joint_pos),
+                            joint_efforts=torch.zeros_like(joint_pos),
+                        )
+                        control_action = actuator.compute(control_action, joint_pos, joint_vel)
+
+                        torch.testing.assert_close(actuator.computed_effort, expected_effort)
+                        torch.testing.assert_close(control_action.joint_efforts, actuator._clip_effort(expected_effort))
+
+    def test_inference_settings(self):
+        """Test that the inference settings produce the same efforts as the default settings."""
+        inference_cfgs = {
+            "bfloat16": (ActuatorNetInferenceCfg(dtype="bfloat16"), 5e-2),
+            "compile": (ActuatorNetInferenceCfg(compile=True), 1e-5),
+            "exported": (ActuatorNetInferenceCfg(), 1e-5),
+        }
+        for name, (inference_cfg, tol) in inference_cfgs.items():
+            with self.subTest(inference=name):
+                actuator = self._create_actuator("pos_vel", [0, 1, 2])
+                other_actuator = self._create_actuator(
+                    "pos_vel", [0, 1, 2], inference_cfg=inference_cfg, export=name == "exported", new_network=False
+                )
+                for _ in range(5):
+                    joint_pos = torch.randn(self.num_envs, self.num_joints)
+                    joint_vel = torch.randn(self.num_envs, self.num_joints)
+                    joint_pos_des = torch.randn(self.num_envs, self.num_joints)
+                    for act in [actuator, other_actuator]:
+                        control_action = ArticulationActions(
+                            joint_positions=joint_pos_des.clone(),
+                            joint_velocities=torch.zeros_like(joint_pos),
+                            joint_efforts=torch.zeros_like(joint_pos),
+                        )
+                        act.compute(control_action, joint_pos, joint_vel)
+                    torch.testing.assert_close(
+                        other_actuator.computed_effort, actuator.computed_effort, atol=tol, rtol=tol
+                    )
+                    self.assertEqual(other_actuator.computed_effort.dtype, torch.float32)
+
+    def test_shared_inference(self):
+        """Test that groups sharing the forward pass produce the same efforts as separate groups."""
+        separate_actuators = [self._create_actuator("pos_vel", [0, 1, 2], new_network=False) for _ in range(3)]
+        shared_actuators = [self._create_actuator("pos_vel", [0, 1, 2], new_network=False) for _ in range(3)]
+        # share the forward pass
+        self.assertEqual(len(ActuatorNetMLP.share_inference(shared_actuators)), 3)
+
+        for step in range(5):
+            joint_pos = torch.randn(len(shared_actuators), self.num_envs, self.num_joints)
+            joint_vel = torch.randn(len(shared_actuators), self.num_envs, self.num_joints)
+            joint_pos_des = torch.randn(len(shared_actuators), self.num_envs, self.num_joints)
+            # stage all inputs before computing (as done by the articulation) on even steps
+            if step % 2 == 0:
+                for i, actuator in enumerate(shared_actuators):
+                    actuator.stage_inputs(joint_pos_des[i], joint_pos[i], joint_vel[i])
+            for i, (separate, shared) in enumerate(zip(separate_actuators, shared_actuators)):
+                for actuator in [separate, shared]:
+                    control_action = ArticulationActions(
+                        joint_positions=joint_pos_des[i].clone(),
+                        joint_velocities=torch.zeros_like(joint_pos[i]),
+                        joint_efforts=torch.zeros_like(joint_pos[i]),
+                    )
+                    actuator.compute(control_action, joint_pos[i], joint_vel[i])
+                torch.testing.assert_close(shared.computed_effort, separate.computed_effort)
+                torch.testing.assert_close(shared.applied_effort, separate.applied_effort)
+
+    """
+    Helper functions.
+    """
+
+    def _create_actuator(
+        self,
+        input_order: str,
+        input_idx: list[int],
+        inference_cfg: ActuatorNetInferenceCfg | None = None,
+        export: bool = False,
+        new_network: bool = True,
+    ):
+        """Create the MLP actuator model with a randomly initialized network."""
+        if new_network or not os.path.exists(self.network_file):
+            network = torch.nn.Sequential(
+                torch.nn.Linear(2 * len(input_idx), 32), torch.nn.Softsign(), torch.nn.Linear(32, 1)
+            )
+            torch.jit.script(network).save(self.network_file)
+            # save the same network as an exported program
+            network_input = torch.zeros(self.num_envs * self.num_joints, 2 * len(input_idx))
+            torch.export.save(torch.export.export(network, (network_input,)), self.network_file + "2")
+        # create the actuator
+        cfg = ActuatorNetMLPCfg(
+            joint_names_expr=[".*"],
+            network_file=self.network_file + "2" if export else self.network_file,
+            pos_scale=-1.0,
+            vel_scale=0.5,
+            torque_scale=2.0,
+            input_order=input_order,
+            input_idx=input_idx,
+            effort_limit=1.5,
+            velocity_limit=30.0,
+            saturation_effort=2.0,
+        )
+        if inference_cfg is not None:
+            cfg.inference = inference_cfg
+        joint_names = [f"joint_{i}" for i in range(self.num_joints)]
+        return cfg.class_type(cfg, joint_names, slice(None), self.num_envs, self.device)
+
+    def _compute_reference_effort(
+        self, actuator, pos_error_history: torch.Tensor, vel_history: torch.Tensor, joint_vel: torch.Tensor
+    ) -> torch.Tensor:
+        """Compute the effort by concatenating the history entries as network inputs."""
+        cfg = actuator.cfg
+        pos_input = torch.cat([pos_error_history[:, i].unsqueeze(2) for i in cfg.input_idx], dim=2)
+        pos_input = pos_input.view(self.num_envs * self.num_joints, -1)
+        vel_input = torch.cat([vel_history[:, i].unsqueeze(2) for i in cfg.input_idx], dim=2)
+        vel_input = vel_input.view(self.num_envs * self.num_joints, -1)
+        if cfg.input_order == "pos_vel":
+            network_input = torch.cat([pos_input * cfg.pos_scale, vel_input * cfg.vel_scale], dim=1)
+        else:
+            network_input = torch.cat([vel_input * cfg.vel_scale, pos_input * cfg.pos_scale], dim=1)
+        with torch.inference_mode():
+            torques = actuator.network(network_input)
+        return torques.view(self.num_envs, self.num_joints) * cfg.torque_scale
+
+
+if __name__ == "__main__":
+    run_tests()
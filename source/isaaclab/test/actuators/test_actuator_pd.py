@@ -0,0 +1,151 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import unittest
+
+from isaaclab.actuators import DCMotorCfg, DelayedPDActuatorCfg, IdealPDActuatorCfg, MergedExplicitActuator
+from isaaclab.utils.types import ArticulationActions
+
+
+class TestMergedExplicitActuator(unittest.TestCase):
+    """Test fixture for checking the merged explicit actuator model."""
+
+    def setUp(self):
+        self.device = "cpu"
+        self.num_envs = 8
+        self.num_joints = 7
+        torch.manual_seed(0)
+
+    def test_merged_parity(self):
+        """Test that the merged actuator computes the same efforts as the separate groups."""
+        cfgs = [
+            (IdealPDActuatorCfg(joint_names_expr=[".*"], stiffness=20.0, damping=1.0, effort_limit=5.0), [4, 0]),
+            (
+                DCMotorCfg(
+                    joint_names_expr=[".*"],
+                    stiffness={"joint_1": 30.0, "joint_5": 10.0},
+                    damping=0.5,
+                    effort_limit=8.0,
+                    velocity_limit=4.0,
+                    saturation_effort=12.0,
+                ),
+                [1, 5],
+            ),
+            (
+                DCMotorCfg(
+                    joint_names_expr=[".*"],
+                    stiffness=15.0,
+                    damping=2.0,
+                    effort_limit=6.0,
+                    velocity_limit=2.0,
+                    saturation_effort=None,
+                ),
+                [2, 6, 3],
+            ),
+        ]
+        groups = [self._create_actuator(cfg, joint_ids) for cfg, joint_ids in cfgs]
+        reference_groups = [self._create_actuator(cfg, joint_ids) for cfg, joint_ids in cfgs]
+        merged = MergedExplicitActuator(groups)
+        # check the joints of the merged actuator
+        self.assertEqual(merged.num_joints, self.num_joints)
+        self.assertEqual(merged.joint_indices.tolist(), [4, 0, 1, 5, 2, 6, 3])
+
+        # check that in-place modifications of the group parameters are reflected in the merged actuator
+        for group, reference_group in zip(groups, reference_groups):
+            group.stiffness[0] = 5.0
+            reference_group.stiffness[0] = 5.0
+
+        for _ in range(10):
+            joint_pos = torch.randn(self.num_envs, self.num_joints)
+            joint_vel = 5.0 * torch.randn(self.num_envs, self.num_joints)
+            control_action = self._create_control_action()
+            # compute efforts for the merged actuator
+            merged_action = ArticulationActions(
+                joint_positions=control_action.joint_positions[:, merged.joint_indices],
+                joint_velocities=control_action.joint_velocities[:, merged.joint_indices],
+                joint_efforts=control_action.joint_efforts[:, merged.joint_indices],
+            )
+            merged_action = merged.compute(
+                merged_action, joint_pos[:, merged.joint_indices], joint_vel[:, merged.joint_indices]
+            )
+            merged_efforts = torch.zeros(self.num_envs, self.num_joints)
+            merged_efforts[:, merged.joint_indices] = merged_action.joint_efforts
+            # compute efforts for the separate groups
+            expected_efforts = torch.zeros(self.num_envs, self.num_joints)
+            for group, reference_group in zip(groups, reference_groups):
+                joint_ids = reference_group.joint_indices
+                group_action = ArticulationActions(
+                    joint_positions=control_action.joint_positions[:, joint_ids],
+                    joint_velocities=control_action.joint_velocities[:, joint_ids],
+                    joint_efforts=control_action.joint_efforts[:, joint_ids],
+                )
+                group_action = reference_group.compute(group_action, joint_pos[:, joint_ids], joint_vel[:, joint_ids])
+                expected_efforts[:, joint_ids] = group_action.joint_efforts
+                # check the efforts stored in the merged groups
+                torch.testing.assert_close(group.computed_effort, reference_group.computed_effort)
+                torch.testing.assert_close(group.applied_effort, reference_group.applied_effort)
+
+            torch.testing.assert_close(merged_efforts, expected_efforts)
+
+    def test_invalid_actuator_type(self):
+        """Test that only ideal PD and DC motor actuator models can be merged."""
+        cfg = DelayedPDActuatorCfg(joint_names_expr=[".*"], stiffness=20.0, damping=1.0, max_delay=2)
+        with self.assertRaises(TypeError):
+            MergedExplicitActuator([self._create_actuator(cfg, [0, 1])])
+
+    """
+    Helper functions.
+    """
+
+    def _create_actuator(self, cfg, joint_ids: list[int]):
+        """Create the actuator model for the given joint indices."""
+        joint_names = [f"joint_{i}" for i in joint_ids]
+        return cfg.class_type(cfg, joint_names, torch.tensor(joint_ids), self.num_envs, self.device)
+
+    def _create_control_action(self) -> ArticulationActions:
+        """Create random joint commands for all the joints."""
+        return ArticulationActions(
+            joint_positions=torch.randn(self.num_envs, self.num_joints),
+            joint_velocities=torch.randn(self.num_envs, self.num_joints),
+            joint_efforts=torch.randn(self.num_envs, self.num_joints),
+        )
+
+
+class TestDelayedPDActuator(unittest.TestCase):
+    """Test fixture for checking the delayed PD actuator model."""
+
+    def test_deprecated_delay_buffers(self):
+        """Test that the deprecated delay buffers of the setpoints are views of the shared delay buffer."""
+        cfg = DelayedPDActuatorCfg(joint_names_expr=[".*"], stiffness=20.0, damping=1.0, min_delay=1, max_delay=3)
+        actuator = cfg.class_type(cfg, ["joint_0", "joint_1"], torch.tensor([0, 1]), 4, "cpu")
+        actuator.reset(None)
+        for delay_buffer in [
+            actuator.positions_delay_buffer,
+            actuator.velocities_delay_buffer,
+            actuator.efforts_delay_buffer,
+        ]:
+            self.assertIs(delay_buffer.time_lags, actuator.delay_buffer.time_lags)
+            self.assertEqual(delay_buffer.history_length, 3)
+            # the channels cannot be appended on their own
+            with self.assertRaises(RuntimeError):
+                delay_buffer.compute(torch.zeros(4, 2))
+        # the time lags set through the deprecated buffers apply to all the setpoints
+        actuator.positions_delay_buffer.set_time_lag(2)
+        self.assertTrue(torch.all(actuator.delay_buffer.time_lags == 2))
+        self.assertEqual(actuator.velocities_delay_buffer.max_time_lag, 2)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -116,6 +116,71 @@ class TestDifferentialIKController(unittest.TestCase):
         # Run the controller and check that it converges to the goal
         self._run_ik_controller(robot, diff_ik_controller, "ee_link", [".*"])
 
+    def test_franka_ik_pose_abs_dls_cholesky(self):
+        """Test IK controller with the Cholesky-based damped least-squares solver for Franka arm."""
+        # Create robot instance
+        robot_cfg = FRANKA_PANDA_HIGH_PD_CFG.replace(prim_path="/World/envs/env_.*/Robot")
+        robot = Articulation(cfg=robot_cfg)
+
+        # Create IK controller
+        diff_ik_cfg = DifferentialIKControllerCfg(
+            command_type="pose", use_relative_mode=False, ik_method="dls_cholesky"
+        )
+        diff_ik_controller = DifferentialIKController(diff_ik_cfg, num_envs=self.num_envs, device=self.sim.device)
+
+        # Run the controller and check that it converges to the goal
+        self._run_ik_controller(robot, diff_ik_controller, "panda_hand", ["panda_joint.*"])
+
+    def test_dls_cholesky_matches_dls(self):
+        """Test that the Cholesky-based solver matches the damped least-squares solution."""
+        for num_dofs in [4, 6, 7, 12]:
+            with self.subTest(num_dofs=num_dofs):
+                jacobian = torch.randn(self.num_envs, 6, num_dofs, device=self.sim.device)
+                delta_pose = 0.01 * torch.randn(self.num_envs, 6, device=self.sim.device)
+                # compute the reference solution in double precision
+                jacobian_64 = jacobian.double()
+                lambda_matrix = 0.01**2 * torch.eye(6, dtype=torch.float64, device=self.sim.device)
+                expected_delta_joint_pos = jacobian_64.mT @ torch.linalg.solve(
+                    jacobian_64 @ jacobian_64.mT + lambda_matrix, delta_pose.double().unsqueeze(-1)
+                )
+                # compute the joint-space update with the controller
+                cfg = DifferentialIKControllerCfg(
+                    command_type="pose", ik_method="dls_cholesky", ik_params={"lambda_val": 0.01}
+                )
+                controller = DifferentialIKController(cfg, num_envs=self.num_envs, device=self.sim.device)
+                delta_joint_pos = controller._compute_delta_joint_pos(delta_pose, jacobian)
+
+                torch.testing.assert_close(
+                    delta_joint_pos, expected_delta_joint_pos.squeeze(-1).float(), rtol=1e-3, atol=1e-3
+                )
+
+    def test_dls_cholesky_near_singularity(self):
+        """Test that the refinement of the Cholesky-based solver keeps the damping near a singular configuration."""
+        num_dofs = 7
+        jacobian = torch.randn(self.num_envs, 6, num_dofs, device=self.sim.device)
+        # make two rows of the jacobian almost linearly dependent
+        jacobian[:, 1] = jacobian[:, 0] + 1e-5 * torch.randn(self.num_envs, num_dofs, device=self.sim.device)
+        delta_pose = 0.01 * torch.randn(self.num_envs, 6, device=self.sim.device)
+        # compute the closed-form damped least-squares solution in double precision
+        jacobian_64 = jacobian.double()
+        lambda_matrix = 0.01**2 * torch.eye(6, dtype=torch.float64, device=self.sim.device)
+        expected_delta_joint_pos = jacobian_64.mT @ torch.linalg.solve(
+            jacobian_64 @ jacobian_64.mT + lambda_matrix, delta_pose.double().unsqueeze(-1)
+        )
+        expected_delta_joint_pos = expected_delta_joint_pos.squeeze(-1).float()
+        # the refinement iterations must not remove the damping
+        for num_iterations in [1, 5]:
+            with self.subTest(num_iterations=num_iterations):
+                cfg = DifferentialIKControllerCfg(
+                    command_type="pose",
+                    ik_method="dls_cholesky",
+                    ik_params={"lambda_val": 0.01, "num_iterations": num_iterations},
+                )
+                controller = DifferentialIKController(cfg, num_envs=self.num_envs, device=self.sim.device)
+                delta_joint_pos = controller._compute_delta_joint_pos(delta_pose, jacobian)
+
+                torch.testing.assert_close(delta_joint_pos, expected_delta_joint_pos, rtol=1e-3, atol=1e-3)
+
     """
     Helper functions.
     """
@@ -668,6 +668,156 @@ class TestOperationalSpaceController(unittest.TestCase):
 
         self._run_op_space_controller(robot, osc, "panda_leftfinger", ["panda_joint.*"], self.target_hybrid_set_tilted)
 
+    def test_franka_taskframe_hybrid_with_nullspace_centering_high_throughput(self):
+        """Test hybrid control in task frame with inertial decoupling and nullspace centering in high-throughput mode."""
+        robot = Articulation(cfg=self.robot_cfg)
+        self.frame = "task"
+
+        obstacle_spawn_cfg = sim_utils.CuboidCfg(
+            size=(2.0, 1.5, 0.01),
+            collision_props=sim_utils.CollisionPropertiesCfg(),
+            visual_material=sim_utils.PreviewSurfaceCfg(diffuse_color=(1.0, 0.0, 0.0), opacity=0.1),
+            rigid_props=sim_utils.RigidBodyPropertiesCfg(kinematic_enabled=True),
+            activate_contact_sensors=True,
+        )
+        obstacle_spawn_cfg.func(
+            "/World/envs/env_.*/obstacle1",
+            obstacle_spawn_cfg,
+            translation=(self.target_hybrid_set_tilted[0, 0] + 0.085, 0.0, 0.3),
+            orientation=(0.9238795325, 0.0, -0.3826834324, 0.0),
+        )
+        contact_forces_cfg = ContactSensorCfg(
+            prim_path="/World/envs/env_.*/obstacle.*",
+            update_period=0.0,
+            history_length=2,
+            debug_vis=False,
+            force_threshold=0.1,
+        )
+        self.contact_forces = ContactSensor(contact_forces_cfg)
+
+        osc_cfg = OperationalSpaceControllerCfg(
+            target_types=["pose_abs", "wrench_abs"],
+            impedance_mode="fixed",
+            inertial_dynamics_decoupling=True,
+            partial_inertial_dynamics_decoupling=False,
+            gravity_compensation=False,
+            motion_stiffness_task=400.0,
+            motion_damping_ratio_task=1.0,
+            contact_wrench_stiffness_task=[0.0, 0.0, 0.1, 0.0, 0.0, 0.0],
+            motion_control_axes_task=[1, 1, 0, 1, 1, 1],
+            contact_wrench_control_axes_task=[0, 0, 1, 0, 0, 0],
+            nullspace_control="position",
+            high_throughput_mode=True,
+        )
+        osc = OperationalSpaceController(osc_cfg, num_envs=self.num_envs, device=self.sim.device)
+
+        self._run_op_space_controller(robot, osc, "panda_leftfinger", ["panda_joint.*"], self.target_hybrid_set_tilted)
+
+    def test_high_throughput_mode_parity(self):
+        """Test that the high-throughput mode computes the same joint efforts as the default mode."""
+        num_dofs = 7
+        for inertial_dynamics_decoupling, partial_inertial_dynamics_decoupling in [
+            (False, False),
+            (True, True),
+            (True, False),
+        ]:
+            with self.subTest(
+                inertial_dynamics_decoupling=inertial_dynamics_decoupling,
+                partial_inertial_dynamics_decoupling=partial_inertial_dynamics_decoupling,
+            ):
+                # random robot state with a well-conditioned Jacobian and a symmetric positive-definite mass matrix
+                jacobian_b = torch.eye(6, num_dofs, device=self.sim.device).repeat(self.num_envs, 1, 1)
+                jacobian_b += 0.1 * torch.randn(self.num_envs, 6, num_dofs, device=self.sim.device)
+                mass_matrix = torch.randn(self.num_envs, num_dofs, num_dofs, device=self.sim.device)
+                mass_matrix = mass_matrix @ mass_matrix.mT + num_dofs * torch.eye(num_dofs, device=self.sim.device)
+                inputs = {
+                    "jacobian_b": jacobian_b,
+                    "current_ee_pose_b": self.target_hybrid_set_b[0:1, :7].repeat(self.num_envs, 1),
+                    "current_ee_vel_b": torch.randn(self.num_envs, 6, device=self.sim.device),
+                    "current_ee_force_b": torch.randn(self.num_envs, 3, device=self.sim.device),
+                    "mass_matrix": mass_matrix,
+                    "gravity": torch.randn(self.num_envs, num_dofs, device=self.sim.device),
+                    "current_joint_pos": torch.randn(self.num_envs, num_dofs, device=self.sim.device),
+                    "current_joint_vel": torch.randn(self.num_envs, num_dofs, device=self.sim.device),
+                }
+                command = self.target_hybrid_set_b[1:2].repeat(self.num_envs, 1)
+                # compute the joint efforts in both modes
+                joint_efforts = []
+                for high_throughput_mode in [False, True]:
+                    osc_cfg = OperationalSpaceControllerCfg(
+                        target_types=["pose_abs", "wrench_abs"],
+                        impedance_mode="fixed",
+                        inertial_dynamics_decoupling=inertial_dynamics_decoupling,
+                        partial_inertial_dynamics_decoupling=partial_inertial_dynamics_decoupling,
+                        gravity_compensation=True,
+                        contact_wrench_stiffness_task=[0.0, 0.0, 0.1, 0.0, 0.0, 0.0],
+                        motion_control_axes_task=[1, 1, 0, 1, 1, 1],
+                        contact_wrench_control_axes_task=[0, 0, 1, 0, 0, 0],
+                        nullspace_control="position",
+                        high_throughput_mode=high_throughput_mode,
+                    )
+                    osc = OperationalSpaceController(osc_cfg, num_envs=self.num_envs, device=self.sim.device)
+                    osc.set_command(command)
+                    joint_efforts.append(osc.compute(**inputs).clone())
+
+                torch.testing.assert_close(joint_efforts[1], joint_efforts[0], rtol=1e-4, atol=1e-3)
+
+    def test_high_throughput_mode_singular_jacobian(self):
+        """Test that the high-throughput mode computes finite joint efforts for rank-deficient Jacobians."""
+        num_dofs = 7
+        jacobian_b = torch.eye(6, num_dofs, device=self.sim.device).repeat(self.num_envs, 1, 1)
+        jacobian_b += 0.1 * torch.randn(self.num_envs, 6, num_dofs, device=self.sim.device)
+        # remove a rotational direction of the end-effector for half of the environments
+        jacobian_b[::2, 5] = 0.0
+        mass_matrix = torch.randn(self.num_envs, num_dofs, num_dofs, device=self.sim.device)
+        mass_matrix = mass_matrix @ mass_matrix.mT + num_dofs * torch.eye(num_dofs, device=self.sim.device)
+        inputs = {
+            "jacobian_b": jacobian_b,
+            "current_ee_pose_b": self.target_hybrid_set_b[0:1, :7].repeat(self.num_envs, 1),
+            "current_ee_vel_b": torch.randn(self.num_envs, 6, device=self.sim.device),
+            "mass_matrix": mass_matrix,
+            "current_joint_pos": torch.randn(self.num_envs, num_dofs, device=self.sim.device),
+            "current_joint_vel": torch.randn(self.num_envs, num_dofs, device=self.sim.device),
+        }
+        command = self.target_hybrid_set_b[1:2, :7].repeat(self.num_envs, 1)
+        for inertial_dynamics_decoupling, partial_inertial_dynamics_decoupling in [
+            (False, False),
+            (True, True),
+            (True, False),
+        ]:
+            with self.subTest(
+                inertial_dynamics_decoupling=inertial_dynamics_decoupling,
+                partial_inertial_dynamics_decoupling=partial_inertial_dynamics_decoupling,
+            ):
+                osc_cfg = OperationalSpaceControllerCfg(
+                    target_types=["pose_abs"],
+                    impedance_mode="fixed",
+                    inertial_dynamics_decoupling=inertial_dynamics_decoupling,
+                    partial_inertial_dynamics_decoupling=partial_inertial_dynamics_decoupling,
+                    gravity_compensation=False,
+                    nullspace_control="position",
+                    high_throughput_mode=True,
+                )
+                osc = OperationalSpaceController(osc_cfg, num_envs=self.num_envs, device=self.sim.device)
+                osc.set_command(command)
+                joint_efforts = osc.compute(**inputs).clone()
+                self.assertTrue(torch.all(torch.isfinite(joint_efforts)))
+
+                # the environments with a full-rank Jacobian are not affected by the singular ones
+                # note: the default mode fails to invert the singular matrices used for the inertial decoupling
+                osc_cfg.high_throughput_mode = False
+                osc = OperationalSpaceController(osc_cfg, num_envs=self.num_envs // 2, device=self.sim.device)
+                osc.set_command(command[1::2])
+                expected_joint_efforts = osc.compute(**{name: value[1::2] for name, value in inputs.items()})
+                torch.testing.assert_close(joint_efforts[1::2], expected_joint_efforts, rtol=1e-4, atol=1e-3)
+
+                # the Moore-Penrose pseudo-inverse of the singular Jacobians is approximated by a damped solution
+                if not inertial_dynamics_decoupling:
+                    osc = OperationalSpaceController(osc_cfg, num_envs=self.num_envs, device=self.sim.device)
+                    osc.set_command(command)
+                    expected_joint_efforts = osc.compute(**inputs)
+                    torch.testing.assert_close(joint_efforts, expected_joint_efforts, rtol=1e-4, atol=1e-2)
+
     """
     Helper functions
     """
@@ -13,13 +13,14 @@ simulation_app = AppLauncher(headless=True).app
 """Rest everything follows."""
 
 import unittest
+from unittest import mock
 
 import isaaclab.sim as sim_utils
 from isaaclab.actuators import ImplicitActuatorCfg
 from isaaclab.assets import ArticulationCfg, AssetBaseCfg, RigidObjectCfg
 from isaaclab.scene import InteractiveScene, InteractiveSceneCfg
 from isaaclab.sensors import ContactSensorCfg
-from isaaclab.sim import build_simulation_context
+from isaaclab.sim import build_simulation_context, get_stage_path_index
 from isaaclab.terrains import TerrainImporterCfg
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
@@ -107,6 +108,34 @@ class TestInteractiveScene(unittest.TestCase):
             self.assertEqual(scene_0.extras, dict())
             self.assertNotEqual(scene_0.extras, scene_1.extras)
 
+    def test_stage_path_index(self):
+        """Tests that the prim paths of the stage are indexed while the entities are spawned and cloned."""
+        active_indices = []
+
+        def _add_entities_from_cfg(scene: InteractiveScene):
+            # record the index that is active while the entities are spawned
+            active_indices.append(get_stage_path_index(scene.stage))
+            return add_entities_from_cfg(scene)
+
+        add_entities_from_cfg = InteractiveScene._add_entities_from_cfg
+        for device in self.devices:
+            with self.subTest(device=device):
+                active_indices.clear()
+                with build_simulation_context(device=device, dt=self.sim_dt) as _:
+                    with mock.patch.object(InteractiveScene, "_add_entities_from_cfg", _add_entities_from_cfg):
+                        scene = InteractiveScene(MySceneCfg(num_envs=4, env_spacing=1))
+                    # check that the index was active during the construction and released afterwards
+                    self.assertEqual(len(active_indices), 1)
+                    self.assertIsNotNone(active_indices[0])
+                    self.assertIsNone(get_stage_path_index(scene.stage))
+                    # check that the entities are resolved as without the index
+                    self.assertEqual(
+                        [prim.GetPath().pathString for prim in sim_utils.find_matching_prims("/World/envs/env_.*")],
+                        scene.env_prim_paths,
+                    )
+                    self.assertIn("robot", scene.articulations)
+                    self.assertIn("rigid_obj", scene.rigid_objects)
+
 
 if __name__ == "__main__":
     run_tests()
@@ -0,0 +1,129 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import warp as wp
+
+from isaaclab.sensors.camera import ImagePostProcessingCfg, ImagePostProcessor
+from isaaclab.utils.warp.kernels import reshape_tiled_image
+
+
+class TestImagePostProcessing(unittest.TestCase):
+    """Test the post-processing of synthetic tiled images on the CPU."""
+
+    def setUp(self):
+        self.device = "cpu"
+        self.num_cameras = 5
+        self.num_tiles_x = 3
+        self.height = 8
+        self.width = 12
+
+    def test_color_images(self):
+        """Test the channel selection, downsampling and normalization of color images."""
+        images = self._reshape_tiled_images(
+            torch.randint(0, 256, (self.num_cameras, self.height, self.width, 4), dtype=torch.uint8)
+        )
+        cfg = ImagePostProcessingCfg(
+            data_type="rgb", channels=[0, 1, 2], downsample_factor=2, scale=1.0 / 255.0, mean=[0.5] * 3, std=[0.25] * 3
+        )
+        post_processor = ImagePostProcessor(cfg, images.shape, self.device)
+        processed_images = post_processor.process(images)
+
+        expected_images = torch.nn.functional.avg_pool2d(images[..., :3].permute(0, 3, 1, 2).float(), 2)
+        expected_images = (expected_images.permute(0, 2, 3, 1) / 255.0 - 0.5) / 0.25
+        torch.testing.assert_close(processed_images, expected_images)
+        # the output buffer is reused
+        self.assertIs(post_processor.process(images), processed_images)
+
+    def test_subtract_image_mean(self):
+        """Test the subtraction of the mean of each image on a non-contiguous color image."""
+        images = self._reshape_tiled_images(
+            torch.randint(0, 256, (self.num_cameras, self.height, self.width, 4), dtype=torch.uint8)
+        )
+        # note: the RGB images are a view of the RGBA images
+        rgb_images = images[..., :3]
+        cfg = ImagePostProcessingCfg(data_type="rgb", scale=1.0 / 255.0, subtract_image_mean=True, dtype="float16")
+        processed_images = ImagePostProcessor(cfg, rgb_images.shape, self.device).process(rgb_images)
+
+        expected_images = rgb_images.float() / 255.0
+        expected_images -= torch.mean(expected_images, dim=(1, 2), keepdim=True)
+        self.assertEqual(processed_images.dtype, torch.float16)
+        torch.testing.assert_close(processed_images.float(), expected_images, atol=1e-3, rtol=1e-3)
+
+    def test_depth_images(self):
+        """Test the replacement of the invalid values, the clipping and the normalization of depth images."""
+        depth = torch.rand(self.num_cameras, self.height, self.width, 1) * 6.0
+        depth[depth > 5.0] = torch.inf
+        images = self._reshape_tiled_images(depth)
+        cfg = ImagePostProcessingCfg(
+            data_type="depth", invalid_depth_value=4.0, depth_range=(1.0, 4.0), normalize_depth=True
+        )
+        processed_images = ImagePostProcessor(cfg, images.shape, self.device).process(images)
+
+        expected_images = torch.where(torch.isinf(images), 4.0, images).clamp(1.0, 4.0)
+        torch.testing.assert_close(processed_images, (expected_images - 1.0) / 3.0)
+
+    def test_invalid_cfg(self):
+        """Test that the configurations that do not match the images raise errors."""
+        image_shape = (self.num_cameras, self.height, self.width, 3)
+        with self.assertRaises(ValueError):
+            ImagePostProcessor(ImagePostProcessingCfg(data_type="rgb", channels=[3]), image_shape, self.device)
+        with self.assertRaises(ValueError):
+            ImagePostProcessor(ImagePostProcessingCfg(data_type="rgb", downsample_factor=5), image_shape, self.device)
+        with self.assertRaises(ValueError):
+            ImagePostProcessor(ImagePostProcessingCfg(data_type="rgb", mean=[0.5]), image_shape, self.device)
+        with self.assertRaises(ValueError):
+            ImagePostProcessor(
+                ImagePostProcessingCfg(data_type="depth", normalize_depth=True), image_shape, self.device
+            )
+
+    """
+    Helper functions.
+    """
+
+    def _reshape_tiled_images(self, images: torch.Tensor) -> torch.Tensor:
+        """Tile the images as the tiled rendering and reshape them back with the kernel of the tiled camera."""
+        num_channels = images.shape[-1]
+        num_tiles_y = -(-self.num_cameras // self.num_tiles_x)
+        # create the tiled buffer with empty tiles at the end
+        tiled_images = torch.zeros(
+            (num_tiles_y * self.num_tiles_x, self.height, self.width, num_channels), dtype=images.dtype
+        )
+        tiled_images[: self.num_cameras] = images
+        tiled_images = tiled_images.reshape(num_tiles_y, self.num_tiles_x, self.height, self.width, num_channels)
+        tiled_images = tiled_images.permute(0, 2, 1, 3, 4).contiguous()
+        # reshape the tiled buffer into a batch of images
+        batched_images = torch.zeros_like(images)
+        wp.launch(
+            kernel=reshape_tiled_image,
+            dim=(self.num_cameras, self.height, self.width),
+            inputs=[
+                wp.from_torch(tiled_images.flatten()),
+                wp.from_torch(batched_images),
+                self.height,
+                self.width,
+                num_channels,
+                self.num_tiles_x,
+            ],
+            device=self.device,
+        )
+        torch.testing.assert_close(batched_images, images)
+        return batched_images
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,146 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import isaaclab.utils.math as math_utils
+from isaaclab.sensors.camera.utils import (
+    create_batched_pointcloud_from_depth,
+    create_pointcloud_from_depth,
+    downsample_points_farthest,
+    downsample_points_voxel,
+)
+
+
+class TestBatchedPointcloud(unittest.TestCase):
+    """Test the creation of fixed-size pointclouds from batches of depth images on the CPU."""
+
+    def setUp(self):
+        self.device = "cpu"
+        self.num_envs = 4
+        self.height = 12
+        self.width = 16
+        self.intrinsic_matrices = torch.tensor(
+            [[10.0, 0.0, self.width / 2], [0.0, 10.0, self.height / 2], [0.0, 0.0, 1.0]], device=self.device
+        ).repeat(self.num_envs, 1, 1)
+        self.depth = torch.rand(self.num_envs, self.height, self.width, device=self.device) * 4.0 + 0.5
+        # the first environment has invalid values and the last environment has no valid values
+        self.depth[0, :4] = torch.inf
+        self.depth[0, 4, :8] = 0.0
+        self.depth[-1] = torch.nan
+        self.position = torch.randn(self.num_envs, 3, device=self.device)
+        self.orientation = math_utils.random_orientation(self.num_envs, device=self.device)
+
+    def test_batched_pointcloud(self):
+        """Test that the points match the points of the depth images of each camera."""
+        num_points = self.height * self.width
+        for downsample_mode in ("voxel", "farthest_point"):
+            with self.subTest(downsample_mode=downsample_mode):
+                points, valid, _ = create_batched_pointcloud_from_depth(
+                    self.intrinsic_matrices,
+                    self.depth,
+                    num_points,
+                    self.position,
+                    self.orientation,
+                    downsample_mode=downsample_mode,
+                    voxel_size=1e-4,
+                )
+                self.assertEqual(points.shape, (self.num_envs, num_points, 3))
+                self.assertEqual(valid.shape, (self.num_envs, num_points))
+                # the padded points are zeros
+                self.assertTrue(torch.all(points[~valid] == 0.0))
+                for i in range(self.num_envs):
+                    # note: the zero depth values are also invalid for the batched pointclouds
+                    expected_points = create_pointcloud_from_depth(
+                        self.intrinsic_matrices[i],
+                        torch.where(self.depth[i] > 0.0, self.depth[i], torch.inf),
+                        position=self.position[i],
+                        orientation=self.orientation[i],
+                        device=self.device,
+                    )
+                    self.assertEqual(valid[i].sum().item(), expected_points.shape[0])
+                    # each valid point is one of the expected points
+                    if expected_points.shape[0] > 0:
+                        distances = torch.linalg.norm(points[i, valid[i]].unsqueeze(1) - expected_points, dim=-1)
+                        torch.testing.assert_close(distances.min(dim=1).values, torch.zeros(expected_points.shape[0]))
+
+    def test_max_depth(self):
+        """Test that the depth values larger than the maximum depth are invalid."""
+        _, valid, _ = create_batched_pointcloud_from_depth(
+            self.intrinsic_matrices,
+            self.depth.unsqueeze(-1),
+            self.height * self.width,
+            downsample_mode="farthest_point",
+            max_depth=2.0,
+        )
+        expected_num_points = torch.sum((self.depth > 0.0) & (self.depth <= 2.0), dim=(1, 2))
+        torch.testing.assert_close(valid.sum(dim=1), expected_num_points)
+
+    def test_voxel_downsampling(self):
+        """Test that the points and features are averaged per voxel and the voxels are sampled per environment."""
+        # two environments with points in four voxels of size 1
+        points = torch.tensor(
+            [[[0.1, 0.1, 0.1], [0.3, 0.5, 0.7], [1.5, 0.5, 0.5], [5.0, 5.0, 5.0]], [[0.5, 0.5, 0.5]] * 4]
+        )
+        valid = torch.tensor([[True, True, True, False], [True, True, True, True]])
+        features = torch.arange(8, dtype=torch.float32).reshape(2, 4, 1)
+        out_points, out_valid, out_features = downsample_points_voxel(points, valid, 1.0, 3, features)
+
+        torch.testing.assert_close(out_valid, torch.tensor([[True, True, False], [True, False, False]]))
+        # the order of the voxels is random
+        order = torch.argsort(out_points[0, :2, 0])
+        torch.testing.assert_close(out_points[0, order], torch.tensor([[0.2, 0.3, 0.4], [1.5, 0.5, 0.5]]))
+        torch.testing.assert_close(out_features[0, order], torch.tensor([[0.5], [2.0]]))
+        torch.testing.assert_close(out_points[1, 0], torch.tensor([0.5, 0.5, 0.5]))
+        torch.testing.assert_close(out_features[1, 0], torch.tensor([5.5]))
+
+        # the voxels are sampled if there are more voxels than points
+        out_points, out_valid, _ = downsample_points_voxel(points, valid, 1.0, 1)
+        self.assertTrue(torch.all(out_valid))
+        self.assertEqual(out_points.shape, (2, 1, 3))
+
+    def test_voxel_downsampling_large_coordinates(self):
+        """Test that the voxels are distinguished when the voxel grid of all the environments is very large."""
+        # the voxel grid spans 2^22 voxels along each axis, so the environment and voxel coordinates cannot be
+        # packed into a single 64-bit key
+        points = torch.tensor([[[0.5, 0.5, 0.5], [4194303.5] * 3], [[0.5, 0.5, 0.5]] * 2])
+        valid = torch.ones(2, 2, dtype=torch.bool)
+        out_points, out_valid, _ = downsample_points_voxel(points, valid, 1.0, 2)
+
+        torch.testing.assert_close(out_valid, torch.tensor([[True, True], [True, False]]))
+        order = torch.argsort(out_points[0, :, 0])
+        torch.testing.assert_close(out_points[0, order], points[0])
+        torch.testing.assert_close(out_points[1, 0], points[1, 0])
+
+    def test_farthest_point_downsampling(self):
+        """Test that the farthest points are sampled first."""
+        points = torch.tensor([[[0.0, 0.0, 0.0], [0.1, 0.0, 0.0], [10.0, 0.0, 0.0], [4.0, 0.0, 0.0], [20.0, 0.0, 0.0]]])
+        valid = torch.tensor([[True, True, True, True, False]])
+        features = torch.arange(5, dtype=torch.float32).reshape(1, 5, 1)
+        out_points, out_valid, out_features = downsample_points_farthest(points, valid, 3, features)
+
+        torch.testing.assert_close(out_valid, torch.tensor([[True, True, True]]))
+        torch.testing.assert_close(out_points[0, :, 0], torch.tensor([0.0, 10.0, 4.0]))
+        torch.testing.assert_close(out_features[0, :, 0], torch.tensor([0.0, 2.0, 3.0]))
+
+    def test_invalid_downsample_mode(self):
+        """Test that an unsupported downsample mode raises an error."""
+        with self.assertRaises(ValueError):
+            create_batched_pointcloud_from_depth(self.intrinsic_matrices, self.depth, 16, downsample_mode="random")
+
+
+if __name__ == "__main__":
+    run_tests()
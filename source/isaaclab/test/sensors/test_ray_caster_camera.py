@@ -253,6 +253,31 @@ class TestWarpCamera(unittest.TestCase):
         self.assertTrue(camera_max.data.output["distance_to_camera"].max() <= camera_cfg_zero.max_distance)
         self.assertTrue(camera_max.data.output["distance_to_image_plane"].max() <= camera_cfg_zero.max_distance)
 
+    def test_half_precision_output(self):
+        """Test that the half precision images match the single precision images."""
+        prim_utils.create_prim("/World/CameraHalf", "Xform")
+        # get camera cfgs
+        camera_cfg = copy.deepcopy(self.camera_cfg)
+        camera_cfg.data_types = ["distance_to_image_plane", "distance_to_camera", "normals"]
+        camera_cfg.offset = RayCasterCameraCfg.OffsetCfg(pos=POSITION, rot=QUAT_WORLD, convention="world")
+        camera = RayCasterCamera(camera_cfg)
+        camera_cfg_half = camera_cfg.replace(prim_path="/World/CameraHalf", output_dtype="float16")
+        camera_half = RayCasterCamera(camera_cfg_half)
+
+        # Play sim
+        self.sim.reset()
+        camera.update(self.dt)
+        camera_half.update(self.dt)
+
+        # check the data types and values
+        for name in camera_cfg.data_types:
+            self.assertEqual(camera.data.output[name].dtype, torch.float32)
+            self.assertEqual(camera_half.data.output[name].dtype, torch.float16)
+            torch.testing.assert_close(
+                camera_half.data.output[name].float(), camera.data.output[name], atol=1e-2, rtol=1e-3, equal_nan=True
+            )
+        torch.testing.assert_close(camera_half.ray_hits_w, camera.ray_hits_w)
+
     def test_camera_init_offset(self):
         """Test camera initialization with offset using different conventions."""
         # define the same offset in all conventions
@@ -29,7 +29,7 @@ from isaacsim.core.prims import SingleGeometryPrim, SingleRigidPrim
 from pxr import Gf, Semantics, UsdGeom
 
 import isaaclab.sim as sim_utils
-from isaaclab.sensors.camera import Camera, CameraCfg, TiledCamera, TiledCameraCfg
+from isaaclab.sensors.camera import Camera, CameraCfg, ImagePostProcessingCfg, TiledCamera, TiledCameraCfg
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
 from isaaclab.utils.timer import Timer
 
@@ -157,6 +157,41 @@ class TestTiledCamera(unittest.TestCase):
 
         del camera
 
+    def test_post_processing(self):
+        """Test the post-processing of the color and depth images."""
+        camera_cfg = copy.deepcopy(self.camera_cfg)
+        camera_cfg.data_types = ["rgb", "depth"]
+        camera_cfg.post_processing = {
+            "rgb_normalized": ImagePostProcessingCfg(data_type="rgb", downsample_factor=2, scale=1.0 / 255.0),
+            "depth_normalized": ImagePostProcessingCfg(
+                data_type="depth", depth_range=(0.1, 10.0), normalize_depth=True, dtype="float16"
+            ),
+        }
+        camera = TiledCamera(camera_cfg)
+
+        # Play sim
+        self.sim.reset()
+        for _ in range(5):
+            self.sim.step()
+        camera.update(self.dt)
+
+        # check the processed images
+        rgb = camera.data.output["rgb_normalized"]
+        self.assertEqual(rgb.shape, (1, camera_cfg.height // 2, camera_cfg.width // 2, 3))
+        self.assertEqual(rgb.dtype, torch.float32)
+        expected_rgb = torch.nn.functional.avg_pool2d(camera.data.output["rgb"].permute(0, 3, 1, 2).float(), 2)
+        torch.testing.assert_close(rgb, expected_rgb.permute(0, 2, 3, 1) / 255.0)
+        depth = camera.data.output["depth_normalized"]
+        self.assertEqual(depth.shape, (1, camera_cfg.height, camera_cfg.width, 1))
+        self.assertEqual(depth.dtype, torch.float16)
+        self.assertTrue(torch.all((depth >= 0.0) & (depth <= 1.0)))
+        # check that the buffers are reused
+        data_ptr = rgb.data_ptr()
+        camera.update(self.dt)
+        self.assertEqual(camera.data.output["rgb_normalized"].data_ptr(), data_ptr)
+
+        del camera
+
     def test_depth_clipping_none(self):
         """Test depth none clipping."""
         # get camera cfgs
@@ -0,0 +1,150 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+config = {"headless": True}
+simulation_app = AppLauncher(config).app
+
+"""Rest everything follows."""
+
+import re
+import unittest
+
+from pxr import Usd
+
+from isaaclab.sim.stage_path_index import StagePathIndex, get_stage_path_index
+
+
+def find_matching_prim_paths_by_tokens(stage: Usd.Stage, prim_path_regex: str) -> list[str]:
+    """Matches the prim paths token by token by iterating over the children of the prims."""
+    prims = [stage.GetPseudoRoot()]
+    for token in prim_path_regex.split("/")[1:]:
+        pattern = re.compile(f"^{token}$")
+        prims = [child for prim in prims for child in prim.GetAllChildren() if pattern.match(child.GetName())]
+    return [prim.GetPath().pathString for prim in prims]
+
+
+def find_first_matching_prim_path_by_traversal(stage: Usd.Stage, prim_path_regex: str) -> str | None:
+    """Matches the full prim paths by traversing the stage."""
+    pattern = re.compile(f"^{prim_path_regex}$")
+    for prim in stage.Traverse():
+        if pattern.match(prim.GetPath().pathString):
+            return prim.GetPath().pathString
+    return None
+
+
+class TestStagePathIndex(unittest.TestCase):
+    """Test the path index of a stage against the matching of the prims on the stage."""
+
+    def setUp(self):
+        """Create an in-memory stage with environments."""
+        self.stage = Usd.Stage.CreateInMemory()
+        self.num_envs = 16
+        self.stage.DefinePrim("/World/ground/terrain", "Mesh")
+        for i in range(self.num_envs):
+            self.stage.DefinePrim(f"/World/envs/env_{i}/Robot/base", "Xform")
+            self.stage.DefinePrim(f"/World/envs/env_{i}/Robot/base/camera", "Camera")
+            self.stage.DefinePrim(f"/World/envs/env_{i}/Object", "Cube")
+        self.stage.DefinePrim("/World/envs/other/Robot/base", "Xform")
+        self.index = StagePathIndex(self.stage)
+
+    def tearDown(self):
+        self.index.release()
+
+    def _check_expressions(self, expressions: list[str]):
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                paths = [prim.GetPath().pathString for prim in self.index.find_matching_prims(expression)]
+                self.assertListEqual(paths, find_matching_prim_paths_by_tokens(self.stage, expression))
+                prim = self.index.find_first_matching_prim(expression)
+                path = prim.GetPath().pathString if prim is not None else None
+                self.assertEqual(path, find_first_matching_prim_path_by_traversal(self.stage, expression))
+
+    def test_find_matching_prims(self):
+        """Test the matching of literal, environment and regex expressions."""
+        self._check_expressions([
+            "/World/envs/env_0/Robot",
+            "/World/envs/env_.*/Robot",
+            "/World/envs/env_.*/Robot/base/camera",
+            "/World/envs/.*/Robot/base",
+            "/World/envs/env_[0-9]/Object",
+            "/World/envs/env_1.*",
+            "/World/envs/env_1?",
+            "/World/envs/env_.*/Missing",
+            "/World/.*/terrain",
+            "/World/envs/env_.*",
+            "/World",
+            "/",
+        ])
+        # the full path expressions can match several tokens
+        self._check_expressions(["/World/envs/env_0/.*", "/World/envs/env_1/Robot.*camera", "/World|/Missing"])
+        self.assertEqual(len(self.index.find_matching_prims("/World/envs/env_.*/Robot")), self.num_envs)
+
+    def test_stage_edits(self):
+        """Test that the index follows the prims that are added, removed and deactivated on the stage."""
+        expressions = ["/World/envs/env_.*/Robot/base", "/World/envs/env_.*/Robot/.*", "/World/envs/env_.*/Robot/arm"]
+        self._check_expressions(expressions)
+        # add and remove prims in the indexed sub-trees
+        self.stage.DefinePrim(f"/World/envs/env_{self.num_envs}/Robot/base", "Xform")
+        self.stage.DefinePrim("/World/envs/env_3/Robot/arm", "Xform")
+        self.stage.RemovePrim("/World/envs/env_5/Robot/base")
+        self.stage.RemovePrim("/World/envs/env_7")
+        self._check_expressions(expressions)
+        # deactivated prims are not traversed by the stage
+        self.stage.GetPrimAtPath("/World/envs/env_0").SetActive(False)
+        self._check_expressions(expressions)
+        # the index is released from the stage
+        # note: the literal names are looked up on the stage, but the children matched by regex are indexed
+        self.index.release()
+        self.stage.DefinePrim("/World/envs/env_2/Robot/arm", "Xform")
+        self.assertEqual(len(self.index.find_matching_prims("/World/envs/env_.*/Robot/arm")), 2)
+        self.assertEqual(len(self.index.find_matching_prims("/World/envs/env_.*/Robot/a.*")), 1)
+        self.index.clear()
+        self.assertEqual(len(self.index.find_matching_prims("/World/envs/env_.*/Robot/a.*")), 2)
+
+    def test_instance_proxies(self):
+        """Test that the prims inside instances are not matched, as for the children of the prims on the stage."""
+        self.stage.DefinePrim("/Prototypes/Robot/link/visuals", "Xform")
+        for i in range(self.num_envs):
+            robot = self.stage.GetPrimAtPath(f"/World/envs/env_{i}/Robot")
+            robot.GetReferences().AddInternalReference("/Prototypes/Robot")
+            robot.SetInstanceable(True)
+        # the prims inside the instances are instance proxies on the stage
+        self.assertTrue(self.stage.GetPrimAtPath("/World/envs/env_0/Robot/link").IsInstanceProxy())
+        self._check_expressions([
+            "/World/envs/env_.*/Robot",
+            "/World/envs/env_0/Robot/link",
+            "/World/envs/env_.*/Robot/link",
+            "/World/envs/env_.*/Robot/li.*",
+            "/World/envs/env_0/Robot/link/visuals",
+            "/World/envs/env_0/Robot/.*/visuals",
+        ])
+        self.assertListEqual(self.index.find_matching_prims("/World/envs/env_.*/Robot/link"), [])
+        self.assertIsNone(self.index.find_first_matching_prim("/World/envs/env_0/Robot/link/visuals"))
+
+    def test_get_stage_path_index(self):
+        """Test that the index is only active for its stage within its context."""
+        self.assertIsNone(get_stage_path_index(self.stage))
+        with StagePathIndex(self.stage) as index:
+            self.assertIs(get_stage_path_index(self.stage), index)
+            self.assertIs(get_stage_path_index(self.stage.GetPseudoRoot().GetStage()), index)
+            # the index of another stage is not used
+            other_stage = Usd.Stage.CreateInMemory()
+            self.assertIsNone(get_stage_path_index(other_stage))
+            with StagePathIndex(other_stage) as other_index:
+                self.assertIs(get_stage_path_index(other_stage), other_index)
+                self.assertIs(get_stage_path_index(self.stage), index)
+            self.assertIsNone(get_stage_path_index(other_stage))
+        self.assertIsNone(get_stage_path_index(self.stage))
+        # the index is released when the context exits
+        self.assertIsNone(index._listener)
+
+
+if __name__ == "__main__":
+    run_tests()
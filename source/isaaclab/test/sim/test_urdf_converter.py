@@ -74,6 +74,7 @@ class TestUrdfConverter(unittest.TestCase):
         new_time_usd_file_created = os.stat(new_urdf_converter.usd_path).st_mtime_ns
 
         self.assertEqual(time_usd_file_created, new_time_usd_file_created)
+        self.assertTrue(new_urdf_converter.cache_report.is_valid)
 
     def test_config_change(self):
         """Call conversion twice but change the config in the second call. This should generate a new USD file."""
@@ -91,6 +92,8 @@ class TestUrdfConverter(unittest.TestCase):
         new_time_usd_file_created = os.stat(new_urdf_converter.usd_path).st_mtime_ns
 
         self.assertNotEqual(time_usd_file_created, new_time_usd_file_created)
+        self.assertFalse(new_urdf_converter.cache_report.is_valid)
+        self.assertNotEqual(new_urdf_converter.cache_report.hash, urdf_converter.cache_report.hash)
 
     def test_create_prim_from_usd(self):
         """Call conversion and create a prim from it."""
@@ -0,0 +1,87 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+from isaaclab.terrains import TerrainCurriculum, TerrainCurriculumCfg
+
+
+class TestTerrainCurriculum(unittest.TestCase):
+    """Test the curriculum of the terrain levels."""
+
+    def setUp(self):
+        self.device = "cpu"
+        self.num_envs = 64
+        self.num_levels = 5
+
+    def _create_curriculum(self, cfg: TerrainCurriculumCfg) -> TerrainCurriculum:
+        levels = torch.randint(0, self.num_levels, (self.num_envs,), device=self.device)
+        types = torch.arange(self.num_envs, device=self.device) % 4
+        return TerrainCurriculum(cfg, levels, types, self.num_levels)
+
+    def test_default_update(self):
+        """Test that the default curriculum moves the environments after every episode that asks to move."""
+        curriculum = self._create_curriculum(TerrainCurriculumCfg())
+        terrain_levels = curriculum.terrain_levels
+        for _ in range(20):
+            env_ids = torch.randperm(self.num_envs, device=self.device)[:20]
+            move_up = torch.rand(20, device=self.device) < 0.3
+            move_down = (torch.rand(20, device=self.device) < 0.3) & ~move_up
+            # compute the expected levels
+            # note: the environments that solve the last level are sent to a random level
+            expected_levels = terrain_levels.clone()
+            expected_levels[env_ids] += 1 * move_up - 1 * move_down
+            expected_levels = torch.clip(expected_levels, 0)
+            curriculum.update(env_ids, move_up, move_down)
+            # check the levels are updated in-place
+            self.assertIs(curriculum.terrain_levels, terrain_levels)
+            solved = expected_levels >= self.num_levels
+            torch.testing.assert_close(terrain_levels[~solved], expected_levels[~solved])
+            self.assertTrue(torch.all(terrain_levels[solved] < self.num_levels))
+
+    def test_statistics_window(self):
+        """Test that the environments change levels based on the moves in their windows."""
+        cfg = TerrainCurriculumCfg(window_size=4, move_up_ratio=0.5, move_down_ratio=0.75)
+        curriculum = self._create_curriculum(cfg)
+        curriculum.terrain_levels[:] = 2
+        env_ids = torch.tensor([0, 1])
+        no = torch.tensor([False, False])
+        # the first environment is promoted after two episodes that ask to move up
+        curriculum.update(env_ids, torch.tensor([True, False]), no)
+        self.assertListEqual(curriculum.terrain_levels[:2].tolist(), [2, 2])
+        curriculum.update(env_ids, torch.tensor([True, False]), torch.tensor([False, True]))
+        self.assertListEqual(curriculum.terrain_levels[:2].tolist(), [3, 2])
+        # the window is cleared after the level changes
+        curriculum.update(env_ids, torch.tensor([True, False]), torch.tensor([False, True]))
+        self.assertListEqual(curriculum.terrain_levels[:2].tolist(), [3, 2])
+        # the second environment is demoted after three episodes that ask to move down
+        curriculum.update(env_ids, no, torch.tensor([False, True]))
+        self.assertListEqual(curriculum.terrain_levels[:2].tolist(), [3, 1])
+        # the other environments are not updated
+        self.assertTrue(torch.all(curriculum.terrain_levels[2:] == 2))
+
+        # check the statistics
+        stats = curriculum.get_stats()
+        self.assertEqual(stats["num_promotions"].item(), 1)
+        self.assertEqual(stats["num_demotions"].item(), 1)
+        torch.testing.assert_close(stats["mean_level"], curriculum.terrain_levels.float().mean())
+        # the counts are cleared after they are returned
+        stats = curriculum.get_stats()
+        self.assertEqual(stats["num_promotions"].item(), 0)
+        self.assertEqual(stats["num_demotions"].item(), 0)
+
+
+if __name__ == "__main__":
+    run_tests()
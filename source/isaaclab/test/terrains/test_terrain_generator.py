@@ -22,6 +22,7 @@ import isaacsim.core.utils.torch as torch_utils
 
 from isaaclab.terrains import FlatPatchSamplingCfg, TerrainGenerator, TerrainGeneratorCfg
 from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from isaaclab.utils.warp import convert_to_warp_mesh, raycast_mesh
 
 
 class TestTerrainGenerator(unittest.TestCase):
@@ -116,6 +117,9 @@ class TestTerrainGenerator(unittest.TestCase):
                 # with curriculum, all sub-terrains are uniquely generated
                 hash_ids_1 = set(os.listdir(cfg.cache_dir))
                 self.assertTrue(os.listdir(cfg.cache_dir))
+                # check that the sub-terrains were not cached
+                self.assertEqual(len(terrain_generator.cache_reports), cfg.num_rows * cfg.num_cols)
+                self.assertFalse(any(report.is_valid for report in terrain_generator.cache_reports))
 
                 # set a random seed to disturb the process
                 # this is to ensure that the seed inside the terrain generator makes deterministic results
@@ -130,6 +134,8 @@ class TestTerrainGenerator(unittest.TestCase):
                 hash_ids_2 = set(os.listdir(cfg.cache_dir))
                 self.assertEqual(len(hash_ids_1), len(hash_ids_2))
                 self.assertSetEqual(hash_ids_1, hash_ids_2)
+                # check that all the sub-terrains are loaded from the cache
+                self.assertTrue(all(report.is_valid for report in terrain_generator.cache_reports))
 
                 # check if the mesh is the same
                 # check they don't point to the same object
@@ -164,6 +170,40 @@ class TestTerrainGenerator(unittest.TestCase):
         # check that no flat patches are zero
         for _, flat_patches in terrain_generator.flat_patches.items():
             self.assertFalse(torch.allclose(flat_patches, torch.zeros_like(flat_patches)))
+            # check that the flat patches are sampled on their sub-terrains
+            terrain_origins = torch.tensor(terrain_generator.terrain_origins, dtype=torch.float).unsqueeze(2)
+            distance_to_origins = torch.abs(flat_patches[..., :2] - terrain_origins[..., :2])
+            self.assertTrue(torch.all(distance_to_origins <= torch.tensor(cfg.size) / 2))
+
+    def test_terrain_height_map(self):
+        """Test that the height map of the terrain matches the ray-casted heights of the terrain mesh."""
+        # create terrain generator with a height map
+        cfg = ROUGH_TERRAINS_CFG.replace(num_rows=4, num_cols=4, use_cache=False, seed=0, height_map_resolution=0.05)
+        terrain_generator = TerrainGenerator(cfg=cfg)
+        height_map = terrain_generator.height_map
+        self.assertIsNotNone(height_map)
+
+        # check that the height map covers the terrain mesh
+        bounds = terrain_generator.terrain_mesh.bounds
+        expected_shape = np.floor((bounds[1, :2] - bounds[0, :2]) / cfg.height_map_resolution + 1e-6).astype(int) + 1
+        self.assertTupleEqual(tuple(height_map.heights.shape), tuple(expected_shape))
+        self.assertFalse(torch.isnan(height_map.heights).any())
+
+        # ray-cast the grid points of the height map
+        mesh = convert_to_warp_mesh(
+            terrain_generator.terrain_mesh.vertices, terrain_generator.terrain_mesh.faces, "cpu"
+        )
+        grid_ids = torch.stack([torch.randint(0, n, (1000,)) for n in height_map.heights.shape], dim=-1)
+        points = torch.zeros(1, 1000, 3)
+        points[0, :, :2] = torch.tensor(height_map.origin) + grid_ids * height_map.resolution
+        points[0, :, 2] = float(bounds[1, 2]) + 1.0
+        directions = torch.zeros_like(points)
+        directions[..., 2] = -1.0
+        ray_hits = raycast_mesh(points, directions, mesh)[0]
+        # the heights at the grid points are not interpolated
+        torch.testing.assert_close(height_map.sample(points[0]), ray_hits[0, :, 2], atol=1e-4, rtol=0.0)
+        # the heights outside the terrain are not defined
+        self.assertTrue(torch.isnan(height_map.sample(torch.tensor([[bounds[1, 0] + 1.0, 0.0]]))).all())
 
 
 if __name__ == "__main__":
@@ -26,7 +26,7 @@ from dataclasses import MISSING, asdict, field
 from functools import wraps
 from typing import Any, ClassVar
 
-from isaaclab.utils.configclass import configclass
+from isaaclab.utils.configclass import configclass, deferred_copy
 from isaaclab.utils.dict import class_to_dict, dict_to_md5_hash, update_class_from_dict
 from isaaclab.utils.io import dump_yaml, load_yaml
 
@@ -393,6 +393,58 @@ class MissingChildDemoCfg(MissingParentDemoCfg):
     e: dict = {}
 
 
+"""
+Dummy configuration: Counting copies
+"""
+
+
+class CopyCounter:
+    """Mutable object that counts how many times it is deep-copied."""
+
+    num_copies = 0
+
+    def __init__(self, value: int = 0):
+        self.value = value
+
+    def __deepcopy__(self, memo):
+        CopyCounter.num_copies += 1
+        return CopyCounter(self.value)
+
+
+SHARED_COUNTER = CopyCounter(value=-1)
+"""Module-level object that is assigned to the configurations."""
+
+
+@configclass
+class CopyParentCfg:
+    """Dummy parent configuration with mutable members."""
+
+    counter: CopyCounter = CopyCounter()
+    values: list[int] = [1, 2, 3]
+    shared: CopyCounter | None = None
+
+    def __post_init__(self):
+        self.values.append(4)
+        self.shared = SHARED_COUNTER
+
+
+NESTED_CFG = CopyParentCfg()
+"""Module-level configuration that is assigned to the configurations."""
+
+
+@configclass
+class CopyChildCfg(CopyParentCfg):
+    """Dummy child configuration with a nested configuration."""
+
+    nested: CopyParentCfg = CopyParentCfg()
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.counter.value = 1
+        self.nested = NESTED_CFG.replace(values=[0])
+        self.nested.counter.value = 2
+
+
 """
 Test solutions: Basic
 """
@@ -1024,6 +1076,46 @@ class TestConfigClass(unittest.TestCase):
         # check that no more than the expected missing fields are in the error message
         self.assertEqual(len(error_message.split("\n")) - 2, len(validity_expected_fields))
 
+    def test_deferred_copy(self):
+        """Check that the members are copied once inside a deferred copy context."""
+        # count the copies of the default initialization
+        CopyCounter.num_copies = 0
+        cfg = CopyChildCfg()
+        num_copies = CopyCounter.num_copies
+        # count the copies inside the context
+        CopyCounter.num_copies = 0
+        with deferred_copy():
+            cfg_deferred = CopyChildCfg()
+        self.assertLess(CopyCounter.num_copies, num_copies)
+
+        # check that the configurations are the same
+        self.assertDictEqual(class_to_dict(cfg_deferred), class_to_dict(cfg))
+        self.assertEqual(cfg_deferred.values, [1, 2, 3, 4])
+        self.assertEqual(cfg_deferred.nested.values, [0, 4])
+        # check that no member is shared with the class, the other instances or module-level objects
+        for other in (cfg, CopyChildCfg()):
+            self.assertIsNot(cfg_deferred.counter, other.counter)
+            self.assertIsNot(cfg_deferred.values, other.values)
+            self.assertIsNot(cfg_deferred.nested, other.nested)
+        self.assertIsNot(cfg_deferred.shared, SHARED_COUNTER)
+        self.assertIsNot(cfg_deferred.nested.shared, SHARED_COUNTER)
+        self.assertEqual(CopyChildCfg().counter.value, 1)
+        self.assertEqual(CopyParentCfg().counter.value, 0)
+        self.assertEqual(cfg_deferred.nested.counter.value, 2)
+        self.assertEqual(NESTED_CFG.counter.value, 0)
+
+    def test_copy_members_once(self):
+        """Check that copying a configuration copies its members once."""
+        cfg = CopyChildCfg()
+        CopyCounter.num_copies = 0
+        cfg_copy = cfg.copy()
+        # the counter and the shared object are copied once by the nested configuration that is replaced in the
+        # ``__post_init__`` function and once for the configuration and its nested configuration
+        self.assertEqual(CopyCounter.num_copies, 6)
+        self.assertDictEqual(class_to_dict(cfg_copy), class_to_dict(cfg))
+        self.assertIsNot(cfg_copy.counter, cfg.counter)
+        self.assertIsNot(cfg_copy.nested.counter, cfg.nested.counter)
+
 
 if __name__ == "__main__":
     run_tests()
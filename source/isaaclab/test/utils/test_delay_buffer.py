@@ -87,6 +87,53 @@ class TestDelayBuffer(unittest.TestCase):
                 error = delayed_data[i] - all_data[true_delayed_index[i]][i]
                 self.assertTrue(torch.all(error == 0))
 
+    def test_stacked_channels(self):
+        """Test that stacked channels are delayed the same as separate buffers with the same time lags."""
+        num_channels = 3
+        time_lags = torch.randint(low=0, high=self.history_length + 1, size=(self.batch_size,), device=self.device)
+        # create separate buffers for each channel
+        buffers = [DelayBuffer(self.history_length, self.batch_size, self.device) for _ in range(num_channels)]
+        for buffer in buffers:
+            buffer.set_time_lag(time_lags)
+        self.buffer.set_time_lag(time_lags)
+
+        for i in range(20):
+            if i == 10:
+                self.buffer.reset([0, 3])
+                for buffer in buffers:
+                    buffer.reset([0, 3])
+            data = torch.randn(self.batch_size, num_channels, 2, device=self.device)
+            # apply delay
+            delayed_data = self.buffer.compute(data)
+            for channel, buffer in enumerate(buffers):
+                torch.testing.assert_close(delayed_data[:, channel], buffer.compute(data[:, channel]))
+
+    def test_time_lag_range(self):
+        """Test the minimum and maximum time lags when the range of the lags is provided."""
+        time_lags = torch.tensor([1, 2], dtype=torch.int, device=self.device)
+        self.buffer.set_time_lag(time_lags, batch_ids=[0, 1], time_lag_range=(1, 2))
+        self.assertListEqual(self.buffer.time_lags[:2].tolist(), [1, 2])
+        self.assertEqual(self.buffer.min_time_lag, 0)
+        self.assertEqual(self.buffer.max_time_lag, 2)
+        # the range is checked instead of the values
+        with self.assertRaises(ValueError):
+            self.buffer.set_time_lag(time_lags, batch_ids=[0, 1], time_lag_range=(0, self.history_length + 1))
+        # setting the same lag for all the batch indices
+        self.buffer.set_time_lag(1)
+        self.assertEqual(self.buffer.min_time_lag, 1)
+        self.assertEqual(self.buffer.max_time_lag, 1)
+
+    def test_invalid_time_lags(self):
+        """Test that infeasible time lags raise an error."""
+        with self.assertRaises(ValueError):
+            self.buffer.set_time_lag(-1)
+        with self.assertRaises(ValueError):
+            self.buffer.set_time_lag(self.history_length + 1)
+        with self.assertRaises(ValueError):
+            self.buffer.set_time_lag(torch.tensor([self.history_length + 1], device=self.device), batch_ids=[0])
+        with self.assertRaises(TypeError):
+            self.buffer.set_time_lag(torch.tensor([1.0], device=self.device), batch_ids=[0])
+
     """Helper functions."""
 
     def _generate_data(self, length: int) -> Generator[torch.Tensor]:
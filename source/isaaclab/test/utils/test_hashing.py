@@ -0,0 +1,103 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import isaaclab.utils.hashing as hashing_utils
+from isaaclab.utils.configclass import configclass
+
+
+@configclass
+class HashedCfg:
+    """Dummy configuration to hash."""
+
+    name: str = "terrain"
+    size: tuple[float, float] = (8.0, 8.0)
+    params: dict = {"a": 1, "b": [1.0, 2.0]}
+
+
+class TestHashingUtilities(unittest.TestCase):
+    """Test fixture for checking the hashing utilities in Isaac Lab."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "asset.urdf")
+        with open(self.file_path, "wb") as f:
+            f.write(os.urandom(3 * hashing_utils.FILE_CHUNK_SIZE + 17))
+        hashing_utils.clear_file_hashes()
+
+    def tearDown(self):
+        hashing_utils.clear_file_hashes()
+        self.temp_dir.cleanup()
+
+    def test_hash_dict(self):
+        """Test that the hash of a configuration is stable and does not depend on the order of the keys."""
+        cfg = HashedCfg()
+        self.assertEqual(hashing_utils.hash_dict(cfg), hashing_utils.hash_dict(HashedCfg()))
+        self.assertEqual(hashing_utils.hash_dict(cfg), hashing_utils.hash_dict(cfg.to_dict()))
+        self.assertEqual(hashing_utils.hash_dict({"a": 1, "b": 2}), hashing_utils.hash_dict({"b": 2, "a": 1}))
+        # changing a value changes the hash
+        self.assertNotEqual(hashing_utils.hash_dict(cfg), hashing_utils.hash_dict(cfg.replace(size=(4.0, 8.0))))
+
+    def test_hash_file(self):
+        """Test that the hash of a file is the hash of its contents and is memoized until the file changes."""
+        with open(self.file_path, "rb") as f:
+            expected_hash = hashlib.new(hashing_utils.HASH_ALGORITHM, f.read()).hexdigest()
+        self.assertEqual(hashing_utils.hash_file(self.file_path), expected_hash)
+
+        # the memoized hash is reused without reading the file
+        with mock.patch("builtins.open", side_effect=AssertionError("The file is read again.")):
+            self.assertEqual(hashing_utils.hash_file(self.file_path), expected_hash)
+
+        # modifying the file changes its hash
+        with open(self.file_path, "ab") as f:
+            f.write(b"modified")
+        self.assertNotEqual(hashing_utils.hash_file(self.file_path), expected_hash)
+
+    def test_file_hash_record(self):
+        """Test that a persisted hash of a file is only used if the file did not change."""
+        self.assertIsNone(hashing_utils.get_file_hash_record(self.file_path))
+        file_hash = hashing_utils.hash_file(self.file_path)
+        record = hashing_utils.get_file_hash_record(self.file_path)
+        self.assertEqual(record["hash"], file_hash)
+
+        # the persisted hash is used by another process
+        hashing_utils.clear_file_hashes()
+        hashing_utils.set_file_hash_record({**record, "hash": "persisted"})
+        self.assertEqual(hashing_utils.hash_file(self.file_path), "persisted")
+
+        # the persisted hash is ignored if the file changed
+        hashing_utils.clear_file_hashes()
+        hashing_utils.set_file_hash_record({**record, "hash": "persisted", "mtime_ns": record["mtime_ns"] - 1})
+        self.assertEqual(hashing_utils.hash_file(self.file_path), file_hash)
+
+    def test_content_hasher(self):
+        """Test that the incremental hash depends on the configuration and the file."""
+        cfg = HashedCfg()
+        key = hashing_utils.ContentHasher().update_dict(cfg).update_file(self.file_path).hexdigest()
+        self.assertEqual(key, hashing_utils.ContentHasher().update_dict(cfg).update_file(self.file_path).hexdigest())
+        self.assertNotEqual(key, hashing_utils.hash_dict(cfg))
+
+        with open(self.file_path, "ab") as f:
+            f.write(b"modified")
+        self.assertNotEqual(key, hashing_utils.ContentHasher().update_dict(cfg).update_file(self.file_path).hexdigest())
+
+
+if __name__ == "__main__":
+    run_tests()
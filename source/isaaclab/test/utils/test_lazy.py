@@ -0,0 +1,122 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+import torch
+import unittest
+
+import isaaclab.utils as utils
+from isaaclab.utils.lazy import lazy_import
+
+# code of the modules that record their execution in an environment variable
+MODULE_CODE = """
+import os
+
+os.environ["ISAACLAB_TEST_LAZY"] = os.environ.get("ISAACLAB_TEST_LAZY", "") + "{name};"
+VALUE = "{name}"
+"""
+
+# code of a package with lazily loaded sub-modules and attributes
+PACKAGE_CODE = """
+from isaaclab.utils.lazy import lazy_attach
+
+__getattr__, __dir__ = lazy_attach(__name__, submodules=["submodule"], attributes={"VALUE": ".attribute"})
+"""
+
+
+class TestLazy(unittest.TestCase):
+    """Test fixture for the lazy loading of modules."""
+
+    def setUp(self):
+        # create a package in a temporary directory
+        self.temp_dir = tempfile.TemporaryDirectory()
+        package_dir = os.path.join(self.temp_dir.name, "lazy_test_package")
+        os.makedirs(package_dir)
+        for name, code in [
+            ("__init__", PACKAGE_CODE),
+            ("submodule", MODULE_CODE.format(name="submodule")),
+            ("attribute", MODULE_CODE.format(name="attribute")),
+        ]:
+            with open(os.path.join(package_dir, f"{name}.py"), "w") as f:
+                f.write(code)
+        with open(os.path.join(self.temp_dir.name, "lazy_test_module.py"), "w") as f:
+            f.write(MODULE_CODE.format(name="module"))
+        sys.path.insert(0, self.temp_dir.name)
+        os.environ["ISAACLAB_TEST_LAZY"] = ""
+
+    def tearDown(self):
+        sys.path.remove(self.temp_dir.name)
+        for name in list(sys.modules):
+            if name.startswith("lazy_test"):
+                del sys.modules[name]
+        del os.environ["ISAACLAB_TEST_LAZY"]
+        self.temp_dir.cleanup()
+
+    def test_lazy_import(self):
+        """Test that a lazily imported module is executed on the first access of an attribute."""
+        module = lazy_import("lazy_test_module")
+        self.assertEqual(os.environ["ISAACLAB_TEST_LAZY"], "")
+        # the module is shared with regular imports
+        import lazy_test_module
+
+        self.assertIs(lazy_test_module, module)
+        self.assertEqual(module.VALUE, "module")
+        self.assertEqual(os.environ["ISAACLAB_TEST_LAZY"], "module;")
+        # missing modules are reported at the call
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_import("lazy_test_missing_module")
+
+    def test_lazy_attach(self):
+        """Test that the sub-modules and attributes of a package are loaded on their first access."""
+        import lazy_test_package
+
+        self.assertEqual(os.environ["ISAACLAB_TEST_LAZY"], "")
+        self.assertIn("submodule", dir(lazy_test_package))
+        self.assertIn("VALUE", dir(lazy_test_package))
+        # access the attribute
+        self.assertEqual(lazy_test_package.VALUE, "attribute")
+        self.assertEqual(os.environ["ISAACLAB_TEST_LAZY"], "attribute;")
+        self.assertNotIn("lazy_test_package.submodule", sys.modules)
+        # access the sub-module
+        self.assertEqual(lazy_test_package.submodule.VALUE, "submodule")
+        self.assertEqual(os.environ["ISAACLAB_TEST_LAZY"], "attribute;submodule;")
+        # unknown attributes
+        with self.assertRaises(AttributeError):
+            lazy_test_package.missing
+
+    def test_utils_attributes(self):
+        """Test the lazily loaded attributes of the utilities."""
+        import warp as wp
+
+        self.assertIs(utils.math, sys.modules["isaaclab.utils.math"])
+        self.assertIs(utils.TENSOR_TYPES["warp"], wp.array)
+        self.assertIs(utils.TENSOR_TYPES["numpy"], np.ndarray)
+        # conversion of a warp array
+        array = wp.array(np.arange(4, dtype=np.uint32), dtype=wp.uint32, device="cpu")
+        torch.testing.assert_close(utils.convert_to_torch(array), torch.arange(4, dtype=torch.int32))
+
+    def test_cold_import(self):
+        """Test that the import of the utilities does not load the heavy packages."""
+        code = "import sys, isaaclab.utils; print(sorted({'h5py', 'trimesh', 'warp'} & set(sys.modules)))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+
+
+if __name__ == "__main__":
+    run_tests()
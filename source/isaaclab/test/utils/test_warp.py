@@ -0,0 +1,135 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+import trimesh
+import unittest
+
+import isaaclab.utils.math as math_utils
+from isaaclab.terrains.trimesh.utils import make_plane
+from isaaclab.utils.warp import convert_to_warp_mesh, raycast_camera, raycast_mesh
+
+
+class TestRaycastCamera(unittest.TestCase):
+    """Test the fused ray-casting of a batch of cameras against the ray-casting of the rays in the world frame."""
+
+    def setUp(self):
+        self.device = "cpu"
+        self.num_cameras = 6
+        self.num_rays = 50
+        # a ground plane with a box
+        box = trimesh.creation.box((1.0, 1.0, 1.0))
+        box.apply_translation((1.0, 0.0, 0.5))
+        mesh = trimesh.util.concatenate([make_plane((6.0, 6.0), 0.0, center_zero=True), box])
+        self.mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+        # rays of the cameras in the world convention (forward axis: +X)
+        # note: some rays look above the horizon and miss the mesh
+        self.ray_directions = torch.nn.functional.normalize(
+            torch.randn(self.num_cameras, self.num_rays, 3) * torch.tensor([0.3, 1.0, 1.0]) + torch.tensor([1, 0, 0]),
+            dim=-1,
+        )
+        self.ray_starts = torch.zeros_like(self.ray_directions)
+        self.pos_w = torch.rand(self.num_cameras, 3) * 2.0 + torch.tensor([-1.0, -1.0, 2.0])
+        self.quat_w = math_utils.quat_from_euler_xyz(
+            torch.zeros(self.num_cameras), torch.full((self.num_cameras,), 0.5), torch.rand(self.num_cameras) * 6.0
+        )
+
+    def test_raycast_camera(self):
+        """Test the hits, depths and normals for all the clipping behaviors and data types."""
+        # compute the expected values in the world frame
+        ray_starts_w = math_utils.quat_apply(self.quat_w.repeat(1, self.num_rays), self.ray_starts)
+        ray_starts_w += self.pos_w.unsqueeze(1)
+        ray_directions_w = math_utils.quat_apply(self.quat_w.repeat(1, self.num_rays), self.ray_directions)
+        expected_hits, expected_distance, expected_normals, _ = raycast_mesh(
+            ray_starts_w, ray_directions_w, self.mesh, return_distance=True, return_normal=True
+        )
+        expected_depth = expected_distance * self.ray_directions[..., 0]
+        missed = torch.isinf(expected_distance)
+        expected_depth[missed] = torch.nan
+        self.assertTrue(missed.any() and not missed.all())
+
+        max_distance = 3.0
+        for dtype in (torch.float32, torch.float16):
+            for depth_clipping_behavior in ("none", "max", "zero"):
+                with self.subTest(dtype=dtype, depth_clipping_behavior=depth_clipping_behavior):
+                    ray_hits = torch.zeros(self.num_cameras, self.num_rays, 3)
+                    distance_to_image_plane = torch.zeros(self.num_cameras, self.num_rays, 1, dtype=dtype)
+                    distance_to_camera = torch.zeros(self.num_cameras, self.num_rays, 1, dtype=dtype)
+                    normals = torch.zeros(self.num_cameras, self.num_rays, 3, dtype=dtype)
+                    raycast_camera(
+                        self.mesh,
+                        self.ray_starts,
+                        self.ray_directions,
+                        self.pos_w,
+                        self.quat_w,
+                        ray_hits,
+                        distance_to_image_plane=distance_to_image_plane,
+                        distance_to_camera=distance_to_camera,
+                        normals=normals,
+                        max_distance=max_distance,
+                        depth_clipping_behavior=depth_clipping_behavior,
+                    )
+                    # clip the expected depths
+                    depth, distance = expected_depth.clone(), expected_distance.clone()
+                    if depth_clipping_behavior != "none":
+                        clip_value = max_distance if depth_clipping_behavior == "max" else 0.0
+                        depth[~(depth <= max_distance)] = clip_value
+                        distance[~(distance <= max_distance)] = clip_value
+
+                    tolerance = {"atol": 1e-5, "rtol": 1e-5} if dtype == torch.float32 else {"atol": 5e-3, "rtol": 1e-3}
+                    torch.testing.assert_close(ray_hits, expected_hits)
+                    torch.testing.assert_close(
+                        distance_to_image_plane.squeeze(-1).float(), depth, equal_nan=True, **tolerance
+                    )
+                    torch.testing.assert_close(distance_to_camera.squeeze(-1).float(), distance, **tolerance)
+                    torch.testing.assert_close(normals.float(), expected_normals, **tolerance)
+
+    def test_raycast_camera_env_ids(self):
+        """Test that only the outputs of the given cameras are written."""
+        env_ids = torch.tensor([1, 4])
+        ray_hits = torch.zeros(self.num_cameras, self.num_rays, 3)
+        distance_to_camera = torch.zeros(self.num_cameras, self.num_rays)
+        raycast_camera(
+            self.mesh,
+            self.ray_starts,
+            self.ray_directions,
+            self.pos_w[env_ids],
+            self.quat_w[env_ids],
+            ray_hits,
+            env_ids=env_ids,
+            distance_to_camera=distance_to_camera,
+        )
+        expected_hits = torch.zeros_like(ray_hits)
+        expected_distance = torch.zeros_like(distance_to_camera)
+        raycast_camera(
+            self.mesh,
+            self.ray_starts,
+            self.ray_directions,
+            self.pos_w,
+            self.quat_w,
+            expected_hits,
+            distance_to_camera=expected_distance,
+        )
+        # the other cameras are not updated
+        mask = torch.zeros(self.num_cameras, dtype=torch.bool)
+        mask[env_ids] = True
+        torch.testing.assert_close(ray_hits[mask], expected_hits[mask])
+        torch.testing.assert_close(distance_to_camera[mask], expected_distance[mask])
+        self.assertTrue(torch.all(ray_hits[~mask] == 0.0))
+        self.assertTrue(torch.all(distance_to_camera[~mask] == 0.0))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -5,6 +5,7 @@
 
 """Sub-package with core implementation logic for Isaac Lab Mimic."""
 
+from .batched_data_generator import *
 from .data_generator import *
 from .datagen_info import *
 from .datagen_info_pool import *
@@ -0,0 +1,374 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Data generator that runs all environments in lockstep.
+"""
+import torch
+
+import isaaclab.utils.math as PoseUtils
+
+from isaaclab_mimic.datagen.data_generator import DataGenerator
+from isaaclab_mimic.datagen.selection_strategy import make_selection_strategy
+from isaaclab_mimic.datagen.waypoint import TensorWaypointTrajectory
+
+
+class BatchedDataGenerator(DataGenerator):
+    """
+    Data generator that generates demonstrations in all environments in lockstep.
+
+    Unlike @DataGenerator.generate, which runs one asyncio task per environment and exchanges actions
+    through a queue, this generator keeps the subtask state machine of every environment in tensors.
+    Each call to @step plans new subtask segments for all environments that need one in a batched
+    fashion (source demo selection, frame transformation and interpolation), looks up the current
+    waypoint of all environments at once, and steps the environment with the full action tensor.
+    """
+
+    def __init__(
+        self,
+        env,
+        success_term,
+        src_demo_datagen_info_pool=None,
+        dataset_path=None,
+        demo_keys=None,
+        select_src_per_subtask=False,
+        transform_first_robot_pose=False,
+        interpolate_from_last_target_pose=True,
+        export_demo=True,
+    ):
+        """
+        Args:
+            env (Isaac Lab ManagerBasedRLMimicEnv instance): environment to use for data generation
+            success_term (TerminationTermCfg): success function to check if the task is successful
+            src_demo_datagen_info_pool (DataGenInfoPool): source demo datagen info pool
+            dataset_path (str): path to hdf5 dataset to use for generation
+            demo_keys (list of str): list of demonstration keys to use in file. If not provided,
+                all demonstration keys will be used.
+            select_src_per_subtask (bool): if True, select a different source demonstration for each subtask
+                during data generation, else keep the same one for the entire episode
+            transform_first_robot_pose (bool): if True, each subtask segment will consist of the first
+                robot pose and the target poses instead of just the target poses
+            interpolate_from_last_target_pose (bool): if True, each interpolation segment will start from
+                the last target pose in the previous subtask segment, instead of the current robot pose
+            export_demo (bool): if True, export the generated episodes with the recorder manager
+        """
+        super().__init__(
+            env=env,
+            src_demo_datagen_info_pool=src_demo_datagen_info_pool,
+            dataset_path=dataset_path,
+            demo_keys=demo_keys,
+        )
+        self.success_term = success_term
+        self.select_src_per_subtask = select_src_per_subtask
+        self.transform_first_robot_pose = transform_first_robot_pose
+        self.interpolate_from_last_target_pose = interpolate_from_last_target_pose
+        self.export_demo = export_demo
+
+        self.num_envs = self.env.num_envs
+        self.device = self.env.device
+        self.eef_names = [self.eef_name]
+        env_ids = torch.arange(self.num_envs, device=self.device)
+
+        # generation statistics
+        self.num_success = 0
+        self.num_failures = 0
+        self.num_attempts = 0
+
+        # per-environment state machines
+        self._subtask_ind = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self._timestep = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self._src_demo_ind = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self._success = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        self._reset_env_ids = env_ids
+        self._plan_env_ids = env_ids.new_empty(0)
+
+        # per-environment subtask boundaries of shape (num_envs, N, S, 2) for N source demos and S subtasks
+        self._src_subtask_indices = None
+        self._src_episode_starts = None
+        self._all_subtask_inds = None
+        # trajectories currently executed in each environment
+        self._trajectory = None
+
+    def __repr__(self):
+        """
+        Pretty print this object.
+        """
+        msg = str(self.__class__.__name__)
+        msg += " (\n\tdataset_path={}\n\tdemo_keys={}\n\tnum_envs={}\n)".format(
+            self.dataset_path,
+            self.demo_keys,
+            self.num_envs,
+        )
+        return msg
+
+    def step(self):
+        """
+        Run one step of data generation in all environments.
+
+        Environments whose episode has ended are reset, new subtask segments are planned for all environments
+        that finished their previous one, and the environment is stepped once with the actions of all
+        environments. Finished episodes are labeled with their success and exported.
+
+        Returns:
+            actions (torch.Tensor): actions applied to the environment of shape (num_envs, action_dim)
+        """
+        # reset the environments that finished their episode
+        if len(self._reset_env_ids) > 0:
+            self._reset_episodes(self._reset_env_ids)
+        # plan the next subtask segment of the environments that finished their previous one
+        if len(self._plan_env_ids) > 0:
+            self._plan_subtasks(self._plan_env_ids)
+
+        # compute the actions of all environments from their current waypoints
+        poses, gripper_actions, noise = self._trajectory.get_waypoints(self._timestep)
+        actions = self.env.target_eef_pose_to_action_batch(
+            target_eef_pose_dict={self.eef_name: poses},
+            gripper_action_dict={self.eef_name: gripper_actions},
+            noise=noise,
+        )
+        self.env.step(actions)
+
+        # an episode is successful if the task was solved at any timestep
+        self._success |= self.success_term.func(self.env, **self.success_term.params).bool()
+
+        # advance the state machines
+        self._timestep += 1
+        finished_env_ids = (self._timestep >= self._trajectory.lengths).nonzero(as_tuple=False).squeeze(-1)
+        if len(finished_env_ids) > 0:
+            self._subtask_ind[finished_env_ids] += 1
+            is_done = self._subtask_ind[finished_env_ids] >= len(self.subtask_configs)
+            self._plan_env_ids = finished_env_ids[~is_done]
+            if torch.any(is_done):
+                self._finish_episodes(finished_env_ids[is_done])
+        else:
+            self._plan_env_ids = finished_env_ids
+
+        return actions
+
+    def select_source_demos(self, env_ids, subtask_ind, eef_poses, object_poses):
+        """
+        Select the source demonstrations for a batch of environments.
+
+        Args:
+            env_ids (torch.Tensor): environment indices of shape (B,)
+            subtask_ind (int): index of subtask
+            eef_poses (torch.Tensor): current end effector poses of shape (B, 4, 4)
+            object_poses (torch.Tensor or None): current poses of the reference object of the subtask
+                of shape (B, 4, 4)
+
+        Returns:
+            src_demo_inds (torch.Tensor): selected source demo indices of shape (B,)
+        """
+        subtask_config = self.subtask_configs[subtask_ind]
+        selection_strategy_obj = make_selection_strategy(subtask_config.selection_strategy)
+        if selection_strategy_obj.BATCHED:
+            # the start of the subtask segments only differs from the nominal one if the end of the
+            # previous subtask is randomized
+            src_subtask_start_inds = None
+            if subtask_ind > 0 and tuple(self.subtask_configs[subtask_ind - 1].subtask_term_offset_range) != (0, 0):
+                src_subtask_start_inds = self._all_subtask_inds[env_ids, :, subtask_ind, 0]
+            return selection_strategy_obj.select_source_demos(
+                eef_poses=eef_poses,
+                object_poses=object_poses,
+                pose_index=self.src_demo_datagen_info_pool.pose_index,
+                subtask_ind=subtask_ind,
+                src_subtask_start_inds=src_subtask_start_inds,
+                **subtask_config.selection_strategy_kwargs,
+            )
+
+        # run the selection strategy for each environment
+        src_demo_inds = []
+        for i, env_id in enumerate(env_ids.tolist()):
+            src_demo_inds.append(
+                self.select_source_demo(
+                    eef_pose=eef_poses[i],
+                    object_pose=object_poses[i] if object_poses is not None else None,
+                    subtask_ind=subtask_ind,
+                    src_subtask_inds=self._all_subtask_inds[env_id, :, subtask_ind].tolist(),
+                    subtask_object_name=subtask_config.object_ref,
+                    selection_strategy_name=subtask_config.selection_strategy,
+                    selection_strategy_kwargs=subtask_config.selection_strategy_kwargs,
+                )
+            )
+        return torch.tensor(src_demo_inds, dtype=torch.long, device=self.device)
+
+    """
+    Internal helpers.
+    """
+
+    def _reset_episodes(self, env_ids):
+        """Reset the environments and the state machines to start new episodes."""
+        self.env.recorder_manager.reset(env_ids=env_ids)
+        self.env.reset(env_ids=env_ids)
+        self._subtask_ind[env_ids] = 0
+        self._success[env_ids] = False
+        # re-sample the subtask boundaries for the new episodes
+        self._randomize_subtask_boundaries(env_ids)
+        self._plan_env_ids = torch.cat([self._plan_env_ids, env_ids])
+        self._reset_env_ids = env_ids.new_empty(0)
+
+    def _finish_episodes(self, env_ids):
+        """Label the episodes of the environments with their success and export them."""
+        success = self._success[env_ids]
+        self.env.recorder_manager.set_success_to_episodes(env_ids, success.unsqueeze(1))
+        if self.export_demo:
+            self.env.recorder_manager.export_episodes(env_ids)
+        num_success = int(success.sum())
+        self.num_success += num_success
+        self.num_failures += len(env_ids) - num_success
+        self.num_attempts += len(env_ids)
+        self._reset_env_ids = env_ids
+
+    def _randomize_subtask_boundaries(self, env_ids):
+        """
+        Sample random offsets of the subtask boundaries for the given environments. This is the batched
+        counterpart of @DataGenerator.randomize_subtask_boundaries, with one sample per environment.
+        """
+        num_src_demos = self.src_demo_datagen_info_pool.num_datagen_infos
+        if self._src_subtask_indices is None or self._src_subtask_indices.shape[0] != num_src_demos:
+            # the pool was updated with new demos, so all the environments need new subtask boundaries
+            self._src_subtask_indices = torch.tensor(
+                self.src_demo_datagen_info_pool.subtask_indices, dtype=torch.long, device=self.device
+            )
+            self._src_episode_starts = self.src_demo_datagen_info_pool.episode_starts.to(self.device)
+            self._all_subtask_inds = self._src_subtask_indices.repeat(self.num_envs, 1, 1, 1)
+            env_ids = torch.arange(self.num_envs, device=self.device)
+
+        # initial subtask start and end indices - shape (B, N, S, 2)
+        src_subtask_indices = self._src_subtask_indices.repeat(len(env_ids), 1, 1, 1)
+        num_subtasks = src_subtask_indices.shape[2]
+        for i in range(num_subtasks - 1):
+            low, high = self.subtask_configs[i].subtask_term_offset_range
+            end_offsets = torch.randint(low, high + 1, src_subtask_indices.shape[:2], device=self.device)
+            src_subtask_indices[:, :, i, 1] += end_offsets
+            # don't forget to set these as start indices for next subtask too
+            src_subtask_indices[:, :, i + 1, 0] = src_subtask_indices[:, :, i, 1]
+
+        # ensure non-empty subtasks
+        assert torch.all((src_subtask_indices[..., 1] - src_subtask_indices[..., 0]) > 0), "got empty subtasks!"
+        # ensure subtask indices increase (both starts and ends)
+        assert torch.all(
+            (src_subtask_indices[:, :, 1:] - src_subtask_indices[:, :, :-1]) > 0
+        ), "subtask indices do not strictly increase"
+
+        self._all_subtask_inds[env_ids] = src_subtask_indices
+
+    def _plan_subtasks(self, env_ids):
+        """Plan the trajectories of the next subtask segment, grouping the environments by subtask."""
+        subtask_inds = self._subtask_ind[env_ids]
+        for subtask_ind in torch.unique(subtask_inds).tolist():
+            group_env_ids = env_ids[subtask_inds == subtask_ind]
+            trajectory = self._plan_subtask(group_env_ids, subtask_ind)
+            if self._trajectory is None:
+                self._trajectory = TensorWaypointTrajectory.from_poses(
+                    eef_names=self.eef_names,
+                    poses=trajectory.poses[:1].repeat(self.num_envs, 1, 1, 1),
+                    gripper_actions=trajectory.gripper_actions[:1].repeat(self.num_envs, 1, 1),
+                    action_noise=0.0,
+                )
+            self._trajectory.set_trajectories(group_env_ids, trajectory)
+        self._timestep[env_ids] = 0
+        self._plan_env_ids = env_ids.new_empty(0)
+
+    def _plan_subtask(self, env_ids, subtask_ind):
+        """
+        Plan the trajectories of a subtask segment for a batch of environments that are at the same subtask.
+        This follows the same steps as @DataGenerator.generate for all environments at once.
+
+        Returns:
+            trajectory (TensorWaypointTrajectory instance): trajectories to execute, one per environment
+        """
+        subtask_config = self.subtask_configs[subtask_ind]
+        is_first_subtask = subtask_ind == 0
+
+        # current poses of the robot and the reference object for this subtask
+        subtask_object_name = subtask_config.object_ref
+        cur_eef_poses = self.env.get_robot_eef_pose(self.eef_name, env_ids=env_ids)
+        cur_object_poses = (
+            self.env.get_object_poses(env_ids=env_ids)[subtask_object_name]
+            if (subtask_object_name is not None)
+            else None
+        )
+
+        # select the source demos for the first subtask (always), and possibly for other subtasks
+        if is_first_subtask or self.select_src_per_subtask:
+            if subtask_object_name is None:
+                # no reference object - only random selection is supported
+                assert subtask_config.selection_strategy == "random"
+            self._src_demo_ind[env_ids] = self.select_source_demos(
+                env_ids, subtask_ind, cur_eef_poses, cur_object_poses
+            )
+        src_demo_inds = self._src_demo_ind[env_ids]
+        src_subtask_inds = self._all_subtask_inds[env_ids, src_demo_inds, subtask_ind]
+
+        # gather the selected subtask segments from the columns of the pool into padded tensors
+        src_columns = self.src_demo_datagen_info_pool.columns
+        src_flat_start_inds = self._src_episode_starts[src_demo_inds] + src_subtask_inds[:, 0]
+        lengths = src_subtask_inds[:, 1] - src_subtask_inds[:, 0]
+        steps = torch.arange(int(lengths.max()), device=self.device)
+        src_flat_inds = src_flat_start_inds.unsqueeze(1) + torch.minimum(steps, lengths.unsqueeze(1) - 1)
+        src_target_poses = src_columns["target_eef_pose"][src_flat_inds]
+        src_gripper_actions = src_columns["gripper_action"][src_flat_inds]
+
+        if is_first_subtask or self.transform_first_robot_pose:
+            # Source segment consists of first robot eef pose and the target poses.
+            src_eef_poses = src_columns["eef_pose"][src_flat_start_inds]
+            src_poses = torch.cat([src_eef_poses.unsqueeze(1), src_target_poses], dim=1)
+            lengths = lengths + 1
+        else:
+            # Source segment consists of just the target poses.
+            src_poses = src_target_poses
+
+        # account for extra timestep added to @src_poses
+        src_gripper_actions = torch.cat([src_gripper_actions[:, 0:1], src_gripper_actions], dim=1)
+        src_gripper_actions = src_gripper_actions[:, : src_poses.shape[1]]
+
+        # Transform source demonstration segments using relevant object poses.
+        if subtask_object_name is not None:
+            src_object_poses = src_columns["object_poses"][subtask_object_name][src_flat_start_inds]
+            src_poses_rel_object = PoseUtils.pose_in_A_to_pose_in_B(
+                pose_in_A=src_poses, pose_A_in_B=PoseUtils.pose_inv(src_object_poses).unsqueeze(1)
+            )
+            transformed_eef_poses = PoseUtils.pose_in_A_to_pose_in_B(
+                pose_in_A=src_poses_rel_object, pose_A_in_B=cur_object_poses.unsqueeze(1)
+            )
+        else:
+            # skip transformation if no reference object is provided
+            transformed_eef_poses = src_poses
+
+        transformed_traj = TensorWaypointTrajectory.from_poses(
+            eef_names=self.eef_names,
+            poses=transformed_eef_poses,
+            gripper_actions=src_gripper_actions,
+            action_noise=subtask_config.action_noise,
+            lengths=lengths,
+        )
+
+        if self.interpolate_from_last_target_pose and (not is_first_subtask):
+            # Interpolation segment will start from last target pose (which may not have been achieved).
+            last_poses, last_gripper_actions, last_noise = self._trajectory[env_ids].last_waypoints
+            init_traj = TensorWaypointTrajectory.from_poses(
+                eef_names=self.eef_names,
+                poses=last_poses.unsqueeze(1),
+                gripper_actions=last_gripper_actions.unsqueeze(1),
+                action_noise=last_noise.unsqueeze(1),
+            )
+        else:
+            # Interpolation segment will start from current robot eef pose.
+            init_traj = TensorWaypointTrajectory.from_poses(
+                eef_names=self.eef_names,
+                poses=cur_eef_poses.unsqueeze(1),
+                gripper_actions=src_gripper_actions[:, 0:1],
+                action_noise=subtask_config.action_noise,
+            )
+
+        # Merge the transformed segments using linear interpolation and discard the initial waypoints.
+        traj_to_execute = init_traj.merge(
+            transformed_traj,
+            num_steps_interp=subtask_config.num_interpolation_steps,
+            num_steps_fixed=subtask_config.num_fixed_steps,
+            action_noise=float(subtask_config.apply_noise_during_interpolation) * subtask_config.action_noise,
+        )
+        return traj_to_execute.pop_first()
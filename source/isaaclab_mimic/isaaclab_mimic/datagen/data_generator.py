@@ -144,6 +144,26 @@ class DataGenerator:
             # no reference object - only random selection is supported
             assert selection_strategy_name == "random"
 
+        # make selection strategy object
+        selection_strategy_obj = make_selection_strategy(selection_strategy_name)
+        if selection_strategy_kwargs is None:
+            selection_strategy_kwargs = dict()
+
+        if selection_strategy_obj.BATCHED:
+            # use the pose index of the pool instead of collecting the datagen infos of the source demos
+            src_subtask_start_inds = torch.as_tensor(
+                np.asarray(src_subtask_inds)[:, 0], dtype=torch.long, device=self.src_demo_datagen_info_pool.device
+            )
+            selected_src_demo_inds = selection_strategy_obj.select_source_demos(
+                eef_poses=eef_pose[None],
+                object_poses=object_pose[None] if object_pose is not None else None,
+                pose_index=self.src_demo_datagen_info_pool.pose_index,
+                subtask_ind=subtask_ind,
+                src_subtask_start_inds=src_subtask_start_inds[None],
+                **selection_strategy_kwargs,
+            )
+            return int(selected_src_demo_inds[0])
+
         # We need to collect the datagen info objects over the timesteps for the subtask segment in each source
         # demo, so that it can be used by the selection strategy.
         src_subtask_datagen_infos = []
@@ -176,12 +196,7 @@ class DataGenerator:
                 )
             )
 
-        # make selection strategy object
-        selection_strategy_obj = make_selection_strategy(selection_strategy_name)
-
         # run selection
-        if selection_strategy_kwargs is None:
-            selection_strategy_kwargs = dict()
         selected_src_demo_ind = selection_strategy_obj.select_source_demo(
             eef_pose=eef_pose,
             object_pose=object_pose,
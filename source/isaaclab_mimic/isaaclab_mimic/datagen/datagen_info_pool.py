@@ -4,11 +4,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import torch
+from concurrent.futures import ThreadPoolExecutor
 
 import isaaclab.utils.math as PoseUtils
 from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
 
 from isaaclab_mimic.datagen.datagen_info import DatagenInfo
+from isaaclab_mimic.datagen.selection_strategy import SourceDemoPoseIndex
 
 
 class DataGenInfoPool:
@@ -18,21 +21,40 @@ class DataGenInfoPool:
     This class is a container for storing `DatagenInfo` objects that are extracted from episodes.
     The pool supports the use of an asyncio lock to safely add new episodes to the pool while
     consuming the data, so it can be shared across multiple mimic data generators.
+
+    The data of all episodes is stored in columns, i.e. the eef poses, object poses, target eef poses,
+    gripper actions and subtask termination signals of all episodes are concatenated along the time
+    dimension, and each episode is referenced by the index of its first timestep (:attr:`episode_starts`)
+    and its length (:attr:`episode_lengths`). The `DatagenInfo` object of each episode holds views into
+    these columns. New episodes, e.g. newly generated successes when the pool is used for bootstrapping,
+    are appended to the columns without copying the existing data in most cases.
     """
 
-    def __init__(self, env, env_cfg, device, asyncio_lock: asyncio.Lock | None = None):
+    def __init__(self, env, env_cfg, device, asyncio_lock: asyncio.Lock | None = None, num_load_workers: int = 4):
         """
         Args:
             env_cfg (dict): environment configuration
             device (torch.device): device to store the data
             asyncio_lock (asyncio.Lock or None): asyncio lock to use for thread safety
+            num_load_workers (int): number of threads used to read the episodes from dataset files. The HDF5
+                reads themselves are serialized by h5py, so the threads mostly overlap the conversion of the
+                data to tensors. If 1, the episodes are read sequentially.
         """
         self._datagen_infos = []
         self._subtask_indices = []
+        self._pose_index = None
+        self._pose_index_kwargs = dict()
+
+        # columnar storage of the episodes
+        self._columns = None
+        self._num_steps = 0
+        self._episode_starts = []
+        self._episode_lengths = []
 
         self.env = env
         self.env_cfg = env_cfg
         self.device = device
+        self.num_load_workers = num_load_workers
 
         self._asyncio_lock = asyncio_lock
 
@@ -44,6 +66,7 @@ class DataGenInfoPool:
         self.subtask_term_offset_ranges = [
             subtask_config.subtask_term_offset_range for subtask_config in subtask_configs
         ]
+        self.subtask_object_names = [subtask_config.object_ref for subtask_config in subtask_configs]
 
     @property
     def datagen_infos(self):
@@ -65,6 +88,59 @@ class DataGenInfoPool:
         """Returns the number of datagen infos."""
         return len(self._datagen_infos)
 
+    @property
+    def columns(self):
+        """Returns the columns of the pool.
+
+        This is a dictionary with the concatenated ``"eef_pose"``, ``"target_eef_pose"`` and ``"gripper_action"``
+        of all episodes, and dictionaries of the concatenated ``"object_poses"`` and ``"subtask_term_signals"``.
+        The first dimension of each tensor is the total number of timesteps in the pool.
+        """
+        if self._columns is None:
+            return None
+        return _map_columns(self._columns, lambda column: column[: self._num_steps])
+
+    @property
+    def episode_starts(self):
+        """Returns the index of the first timestep of each episode in the columns."""
+        return torch.tensor(self._episode_starts, dtype=torch.long, device=self.device)
+
+    @property
+    def episode_lengths(self):
+        """Returns the number of timesteps of each episode."""
+        return torch.tensor(self._episode_lengths, dtype=torch.long, device=self.device)
+
+    @property
+    def pose_index(self):
+        """Returns the index of the poses at the start of the subtask segments.
+
+        The index is rebuilt when new episodes were added to the pool since it was last built.
+        """
+        if self._pose_index is None or self._pose_index.num_src_demos != len(self._datagen_infos):
+            self.build_pose_index(**self._pose_index_kwargs)
+        return self._pose_index
+
+    def build_pose_index(self, **kwargs):
+        """
+        Build the index of the poses at the start of the subtask segments used by the batched selection strategies.
+
+        Args:
+            kwargs (dict): additional arguments of the @SourceDemoPoseIndex, e.g. to use a KD-tree
+        """
+        self._pose_index_kwargs = kwargs
+        if self.num_datagen_infos == 0:
+            self._pose_index = None
+            return
+        columns = self.columns
+        self._pose_index = SourceDemoPoseIndex(
+            eef_poses=columns["eef_pose"],
+            object_poses=columns["object_poses"],
+            episode_starts=self.episode_starts,
+            subtask_start_inds=torch.tensor(self._subtask_indices, dtype=torch.long, device=self.device)[..., 0],
+            subtask_object_names=self.subtask_object_names,
+            **kwargs,
+        )
+
     async def add_episode(self, episode: EpisodeData):
         """
         Add a datagen info from the given episode.
@@ -85,104 +161,196 @@ class DataGenInfoPool:
         Args:
             episode (EpisodeData): episode to add
         """
-        ep_grp = episode.data
+        self._add_episodes([episode])
+
+    def _add_episodes(self, episodes: list[EpisodeData]):
+        """
+        Add the datagen infos of the given episodes.
+
+        The data of all episodes is concatenated first, so that the conversion of the poses and the parsing of the
+        subtask boundaries are done once for all episodes, and the columns are copied to the device at once.
+
+        Args:
+            episodes (list): episodes to add
+        """
+        if len(episodes) == 0:
+            return
         eef_name = list(self.env.cfg.subtask_configs.keys())[0]
 
         # extract datagen info
-        if "datagen_info" in ep_grp["obs"]:
-            eef_pose = ep_grp["obs"]["datagen_info"]["eef_pose"][eef_name]
-            object_poses_dict = ep_grp["obs"]["datagen_info"]["object_pose"]
-            target_eef_pose = ep_grp["obs"]["datagen_info"]["target_eef_pose"][eef_name]
-            subtask_term_signals_dict = ep_grp["obs"]["datagen_info"]["subtask_term_signals"]
-        else:
-            # Extract eef poses
-            eef_pos = ep_grp["obs"]["eef_pos"]
-            eef_quat = ep_grp["obs"]["eef_quat"]  # format (w, x, y, z)
-            eef_rot_matrices = PoseUtils.matrix_from_quat(eef_quat)  # shape (N, 3, 3)
-            # Create pose matrices for all environments
-            eef_pose = PoseUtils.make_pose(eef_pos, eef_rot_matrices)  # shape (N, 4, 4)
-
-            # Object poses
-            object_poses_dict = dict()
-            for object_name, value in ep_grp["obs"]["object_pose"].items():
-                # object_pose
-                value = value["root_pose"]
-                # Root state ``[pos, quat, lin_vel, ang_vel]`` in simulation world frame. Shape is (num_steps, 13).
-                # Quaternion ordering is wxyz
-
-                # Convert to rotation matrices
-                object_rot_matrices = PoseUtils.matrix_from_quat(value[:, 3:7])  # shape (N, 3, 3)
-                object_rot_positions = value[:, 0:3]  # shape (N, 3)
-                object_poses_dict[object_name] = PoseUtils.make_pose(object_rot_positions, object_rot_matrices)
-
-            # Target eef pose
-            target_eef_pose = ep_grp["obs"]["target_eef_pose"]
-
-            # Subtask termination signalsS
-            subtask_term_signals_dict = (ep_grp["obs"]["subtask_term_signals"],)
+        episode_columns = []
+        for episode in episodes:
+            ep_grp = episode.data
+            if "datagen_info" in ep_grp["obs"]:
+                episode_columns.append(
+                    dict(
+                        eef_pose=ep_grp["obs"]["datagen_info"]["eef_pose"][eef_name],
+                        object_poses=ep_grp["obs"]["datagen_info"]["object_pose"],
+                        target_eef_pose=ep_grp["obs"]["datagen_info"]["target_eef_pose"][eef_name],
+                        subtask_term_signals=ep_grp["obs"]["datagen_info"]["subtask_term_signals"],
+                        actions=ep_grp["actions"],
+                    )
+                )
+            else:
+                episode_columns.append(
+                    dict(
+                        # eef pose as position and quaternion in format (w, x, y, z)
+                        eef_pose=torch.cat([ep_grp["obs"]["eef_pos"], ep_grp["obs"]["eef_quat"]], dim=-1),
+                        # root state ``[pos, quat, lin_vel, ang_vel]`` in simulation world frame
+                        object_poses={
+                            object_name: value["root_pose"][:, :7]
+                            for object_name, value in ep_grp["obs"]["object_pose"].items()
+                        },
+                        target_eef_pose=ep_grp["obs"]["target_eef_pose"],
+                        subtask_term_signals=ep_grp["obs"]["subtask_term_signals"],
+                        actions=ep_grp["actions"],
+                    )
+                )
+        lengths = [len(columns["actions"]) for columns in episode_columns]
+
+        # concatenate the episodes and move them to the device at once
+        columns = {
+            key: _concatenate([columns[key] for columns in episode_columns], self.device) for key in episode_columns[0]
+        }
+        # convert positions and quaternions (w, x, y, z) to pose matrices
+        if columns["eef_pose"].shape[-1] == 7:
+            columns["eef_pose"] = _make_pose_from_pos_quat(columns["eef_pose"])
+            columns["object_poses"] = {
+                name: _make_pose_from_pos_quat(value) for name, value in columns["object_poses"].items()
+            }
 
         # Extract gripper actions
-        gripper_actions = self.env.actions_to_gripper_actions(ep_grp["actions"])[eef_name]
-
-        ep_datagen_info_obj = DatagenInfo(
-            eef_pose=eef_pose,
-            object_poses=object_poses_dict,
-            subtask_term_signals=subtask_term_signals_dict,
-            target_eef_pose=target_eef_pose,
-            gripper_action=gripper_actions,
-        )
-        self._datagen_infos.append(ep_datagen_info_obj)
+        columns["gripper_action"] = self.env.actions_to_gripper_actions(columns.pop("actions"))[eef_name]
 
         # parse subtask indices using subtask termination signals
-        ep_subtask_indices = []
-        prev_subtask_term_ind = 0
-        for subtask_ind in range(len(self.subtask_term_signals)):
-            subtask_term_signal = self.subtask_term_signals[subtask_ind]
+        subtask_indices = self._parse_subtask_indices(columns["subtask_term_signals"], lengths)
+
+        # append the episodes to the columns
+        self._append_columns(columns)
+        all_columns = self._columns
+        for ep_length, ep_subtask_indices in zip(lengths, subtask_indices):
+            start = self._num_steps
+            end = start + ep_length
+            ep_columns = _map_columns(all_columns, lambda column: column[start:end])
+            self._datagen_infos.append(
+                DatagenInfo(
+                    eef_pose=ep_columns["eef_pose"],
+                    object_poses=ep_columns["object_poses"],
+                    subtask_term_signals=ep_columns["subtask_term_signals"],
+                    target_eef_pose=ep_columns["target_eef_pose"],
+                    gripper_action=ep_columns["gripper_action"],
+                )
+            )
+            self._subtask_indices.append(ep_subtask_indices)
+            self._episode_starts.append(start)
+            self._episode_lengths.append(ep_length)
+            self._num_steps = end
+
+    def _parse_subtask_indices(self, subtask_term_signals: dict, lengths: list[int]) -> list:
+        """
+        Parse the subtask indices of concatenated episodes using the subtask termination signals.
+
+        Args:
+            subtask_term_signals (dict): concatenated subtask termination signals of the episodes
+            lengths (list): number of timesteps of each episode
+
+        Returns:
+            subtask_indices (list): start and end indices of each subtask in each episode of shape [N, S, 2]
+        """
+        num_episodes = len(lengths)
+        lengths = torch.tensor(lengths, dtype=torch.long, device=self.device)
+        episode_starts = torch.cumsum(lengths, dim=0) - lengths
+        # episode index of each pair of consecutive timesteps, ignoring the pairs across episodes
+        episode_ids = torch.repeat_interleave(torch.arange(num_episodes, device=self.device), lengths)
+        is_same_episode = episode_ids[:-1] == episode_ids[1:]
+        episode_ids = episode_ids[:-1]
+
+        subtask_term_inds = []
+        for subtask_term_signal in self.subtask_term_signals:
             if subtask_term_signal is None:
                 # final subtask, finishes at end of demo
-                subtask_term_ind = ep_grp["actions"].shape[0]
-            else:
-                # trick to detect index where first 0 -> 1 transition occurs - this will be the end of the subtask
-                subtask_indicators = ep_datagen_info_obj.subtask_term_signals[subtask_term_signal].flatten().int()
-                diffs = subtask_indicators[1:] - subtask_indicators[:-1]
-                end_ind = int(diffs.nonzero()[0][0]) + 1
-                subtask_term_ind = end_ind + 1  # increment to support indexing like demo[start:end]
-            ep_subtask_indices.append([prev_subtask_term_ind, subtask_term_ind])
-            prev_subtask_term_ind = subtask_term_ind
+                subtask_term_inds.append(lengths)
+                continue
+            # trick to detect index where first 0 -> 1 transition occurs - this will be the end of the subtask
+            subtask_indicators = subtask_term_signals[subtask_term_signal].reshape(len(episode_ids) + 1, -1)
+            subtask_indicators = subtask_indicators[:, 0].int()
+            diffs = subtask_indicators[1:] - subtask_indicators[:-1]
+            steps = torch.arange(len(diffs), device=self.device)
+            steps = torch.where((diffs != 0) & is_same_episode, steps, len(diffs))
+            first_steps = torch.full((num_episodes,), len(diffs), dtype=torch.long, device=self.device)
+            first_steps.scatter_reduce_(0, episode_ids, steps, reduce="amin")
+            assert torch.all(first_steps < len(diffs)), f"no transition of subtask signal {subtask_term_signal}"
+            end_inds = first_steps - episode_starts + 1
+            subtask_term_inds.append(end_inds + 1)  # increment to support indexing like demo[start:end]
+        subtask_term_inds = torch.stack(subtask_term_inds, dim=1)
+        subtask_start_inds = torch.cat([torch.zeros_like(subtask_term_inds[:, :1]), subtask_term_inds[:, :-1]], dim=1)
+        subtask_indices = torch.stack([subtask_start_inds, subtask_term_inds], dim=-1).tolist()
 
         # run sanity check on subtask_term_offset_range in task spec to make sure we can never
         # get an empty subtask in the worst case when sampling subtask bounds:
         #
         #   end index of subtask i + max offset of subtask i < end index of subtask i + 1 + min offset of subtask i + 1
         #
-        assert len(ep_subtask_indices) == len(
-            self.subtask_term_signals
-        ), "mismatch in length of extracted subtask info and number of subtasks"
-        for i in range(1, len(ep_subtask_indices)):
-            prev_max_offset_range = self.subtask_term_offset_ranges[i - 1][1]
-            assert (
-                ep_subtask_indices[i - 1][1] + prev_max_offset_range
-                < ep_subtask_indices[i][1] + self.subtask_term_offset_ranges[i][0]
-            ), (
-                "subtask sanity check violation in demo with subtask {} end ind {}, subtask {} max offset {},"
-                " subtask {} end ind {}, and subtask {} min offset {}".format(
-                    i - 1,
-                    ep_subtask_indices[i - 1][1],
-                    i - 1,
-                    prev_max_offset_range,
-                    i,
-                    ep_subtask_indices[i][1],
-                    i,
-                    self.subtask_term_offset_ranges[i][0],
+        for ep_subtask_indices in subtask_indices:
+            assert len(ep_subtask_indices) == len(
+                self.subtask_term_signals
+            ), "mismatch in length of extracted subtask info and number of subtasks"
+            for i in range(1, len(ep_subtask_indices)):
+                prev_max_offset_range = self.subtask_term_offset_ranges[i - 1][1]
+                assert (
+                    ep_subtask_indices[i - 1][1] + prev_max_offset_range
+                    < ep_subtask_indices[i][1] + self.subtask_term_offset_ranges[i][0]
+                ), (
+                    "subtask sanity check violation in demo with subtask {} end ind {}, subtask {} max offset {},"
+                    " subtask {} end ind {}, and subtask {} min offset {}".format(
+                        i - 1,
+                        ep_subtask_indices[i - 1][1],
+                        i - 1,
+                        prev_max_offset_range,
+                        i,
+                        ep_subtask_indices[i][1],
+                        i,
+                        self.subtask_term_offset_ranges[i][0],
+                    )
                 )
-            )
+        return subtask_indices
 
-        self._subtask_indices.append(ep_subtask_indices)
+    def _append_columns(self, columns: dict):
+        """
+        Append concatenated episode data to the columns.
+
+        The capacity of the columns grows geometrically, so that appending episodes one at a time
+        does not copy the existing data every time.
+        """
+        num_new_steps = len(columns["eef_pose"])
+        if self._columns is None:
+            self._columns = columns
+            return
+        capacity = len(self._columns["eef_pose"])
+        if self._num_steps + num_new_steps > capacity:
+            # grow the columns (existing views of the episodes keep referencing the previous storage)
+            new_capacity = max(2 * capacity, self._num_steps + num_new_steps)
+
+            def _grow(column):
+                new_column = column.new_empty((new_capacity,) + column.shape[1:])
+                new_column[: self._num_steps] = column[: self._num_steps]
+                return new_column
+
+            self._columns = _map_columns(self._columns, _grow)
+        end = self._num_steps + num_new_steps
+        for key, value in columns.items():
+            if isinstance(value, dict):
+                for name, column in value.items():
+                    self._columns[key][name][self._num_steps : end] = column
+            else:
+                self._columns[key][self._num_steps : end] = value
 
     def load_from_dataset_file(self, file_path, select_demo_keys: str | None = None):
         """
         Load from a dataset file.
 
+        The episodes are read from the file by a pool of threads and added to the columns at once.
+
         Args:
             file_path (str): path to the dataset file
             select_demo_keys (str or None): keys of the demos to load
@@ -194,8 +362,42 @@ class DataGenInfoPool:
         if len(episode_names) == 0:
             return
 
-        for episode_name in episode_names:
-            if select_demo_keys is not None and episode_name not in select_demo_keys:
-                continue
-            episode = dataset_file_handler.load_episode(episode_name, self.device)
-            self._add_episode(episode)
+        episode_names = [
+            episode_name
+            for episode_name in episode_names
+            if select_demo_keys is None or episode_name in select_demo_keys
+        ]
+
+        # read the episodes on the CPU, the concatenated data is moved to the device at once
+        def load_episode(episode_name):
+            return dataset_file_handler.load_episode(episode_name, "cpu")
+
+        if self.num_load_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.num_load_workers) as executor:
+                episodes = list(executor.map(load_episode, episode_names))
+        else:
+            episodes = [load_episode(episode_name) for episode_name in episode_names]
+        self._add_episodes(episodes)
+
+        # build the pose index once for the loaded episodes
+        self.build_pose_index(**self._pose_index_kwargs)
+
+
+def _map_columns(columns: dict, func) -> dict:
+    """Apply a function to all tensors of a dictionary of columns, which may contain dictionaries of tensors."""
+    return {
+        key: {name: func(column) for name, column in value.items()} if isinstance(value, dict) else func(value)
+        for key, value in columns.items()
+    }
+
+
+def _concatenate(values: list, device) -> torch.Tensor | dict:
+    """Concatenate tensors (or dictionaries of tensors) of episodes along the time dimension on the device."""
+    if isinstance(values[0], dict):
+        return {name: _concatenate([value[name] for value in values], device) for name in values[0]}
+    return torch.cat([torch.as_tensor(value) for value in values]).to(device)
+
+
+def _make_pose_from_pos_quat(pos_quat: torch.Tensor) -> torch.Tensor:
+    """Convert positions and quaternions (w, x, y, z) of shape (N, 7) to pose matrices of shape (N, 4, 4)."""
+    return PoseUtils.make_pose(pos_quat[:, 0:3], PoseUtils.matrix_from_quat(pos_quat[:, 3:7]))
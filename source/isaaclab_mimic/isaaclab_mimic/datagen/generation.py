@@ -12,6 +12,7 @@ from isaaclab.envs import ManagerBasedEnv
 from isaaclab.envs.mdp.recorders.recorders_cfg import ActionStateRecorderManagerCfg
 from isaaclab.managers import DatasetExportMode
 
+from isaaclab_mimic.datagen.batched_data_generator import BatchedDataGenerator
 from isaaclab_mimic.datagen.data_generator import DataGenerator
 from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
 
@@ -101,6 +102,42 @@ def env_loop(
     env.close()
 
 
+def batched_env_loop(env: ManagerBasedEnv, data_generator: BatchedDataGenerator) -> None:
+    """Main loop for the environment with the batched data generator.
+
+    All the environments are stepped in lockstep by the data generator, without any asyncio tasks.
+    """
+    prev_num_attempts = 0
+    # simulate environment -- run everything in inference mode
+    with contextlib.suppress(KeyboardInterrupt), torch.inference_mode():
+        while True:
+
+            # plan and execute one step of data generation in all the environments
+            data_generator.step()
+
+            if prev_num_attempts != data_generator.num_attempts:
+                prev_num_attempts = data_generator.num_attempts
+                print("")
+                print("*" * 50)
+                print(f"have {data_generator.num_success} successes out of {data_generator.num_attempts} trials so far")
+                print(f"have {data_generator.num_failures} failures out of {data_generator.num_attempts} trials so far")
+                print("*" * 50)
+
+                # termination condition is on enough successes if @guarantee_success or enough attempts otherwise
+                generation_guarantee = env.unwrapped.cfg.datagen_config.generation_guarantee
+                generation_num_trials = env.unwrapped.cfg.datagen_config.generation_num_trials
+                check_val = data_generator.num_success if generation_guarantee else data_generator.num_attempts
+                if check_val >= generation_num_trials:
+                    print(f"Reached {generation_num_trials} successes/attempts. Exiting.")
+                    break
+
+            # check that simulation is stopped or not
+            if env.unwrapped.sim.is_stopped():
+                break
+
+    env.close()
+
+
 def setup_env_config(
     env_name: str,
     output_dir: str,
@@ -198,3 +235,34 @@ def setup_async_generation(
         "action_queue": env_action_queue,
         "info_pool": shared_datagen_info_pool,
     }
+
+
+def setup_batched_generation(env: Any, input_file: str, success_term: Any) -> dict[str, Any]:
+    """Setup batched data generation, where all environments are generated in lockstep.
+
+    Args:
+        env: The environment instance
+        input_file: Path to input dataset file
+        success_term: Success termination condition
+
+    Returns:
+        Dictionary containing the batched data generator and the datagen info pool
+    """
+    datagen_info_pool = DataGenInfoPool(env.unwrapped, env.unwrapped.cfg, env.unwrapped.device)
+    datagen_info_pool.load_from_dataset_file(input_file)
+    print(f"Loaded {datagen_info_pool.num_datagen_infos} to datagen info pool")
+
+    datagen_config = env.unwrapped.cfg.datagen_config
+    data_generator = BatchedDataGenerator(
+        env=env.unwrapped,
+        success_term=success_term,
+        src_demo_datagen_info_pool=datagen_info_pool,
+        select_src_per_subtask=datagen_config.generation_select_src_per_subtask,
+        transform_first_robot_pose=datagen_config.generation_transform_first_robot_pose,
+        interpolate_from_last_target_pose=datagen_config.generation_interpolate_from_last_target_pose,
+    )
+
+    return {
+        "data_generator": data_generator,
+        "info_pool": datagen_info_pool,
+    }
@@ -61,6 +61,9 @@ class SelectionStrategy(metaclass=SelectionStrategyMeta):
     Defines methods and functions for selection strategies to implement.
     """
 
+    # whether the strategy implements @select_source_demos with a @SourceDemoPoseIndex
+    BATCHED = False
+
     def __init__(self):
         pass
 
@@ -96,6 +99,32 @@ class SelectionStrategy(metaclass=SelectionStrategyMeta):
         """
         raise NotImplementedError
 
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        pose_index,
+        subtask_ind,
+        src_subtask_start_inds=None,
+    ):
+        """
+        Batched version of @select_source_demo that selects the source demonstrations of many environments
+        at once using the poses in @pose_index.
+
+        Args:
+            eef_poses (torch.Tensor): current 4x4 eef poses of shape [B, 4, 4]
+            object_poses (torch.Tensor or None): current 4x4 object poses of shape [B, 4, 4], for the object
+                in this subtask
+            pose_index (SourceDemoPoseIndex): index of the poses of the source demonstrations
+            subtask_ind (int): index of subtask
+            src_subtask_start_inds (torch.Tensor or None): start index of the subtask segment in each source demo,
+                for each environment, of shape [B, N]. If None, the nominal subtask boundaries are used.
+
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [B]
+        """
+        raise NotImplementedError
+
 
 class RandomStrategy(SelectionStrategy):
     """
@@ -104,6 +133,7 @@ class RandomStrategy(SelectionStrategy):
 
     # name for registering this class into registry
     NAME = "random"
+    BATCHED = True
 
     def select_source_demo(
         self,
@@ -130,6 +160,32 @@ class RandomStrategy(SelectionStrategy):
         n_src_demo = len(src_subtask_datagen_infos)
         return torch.randint(0, n_src_demo, (1,)).item()
 
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        pose_index,
+        subtask_ind,
+        src_subtask_start_inds=None,
+    ):
+        """
+        Batched version of @select_source_demo that selects the source demonstrations of many environments
+        at once using the poses in @pose_index.
+
+        Args:
+            eef_poses (torch.Tensor): current 4x4 eef poses of shape [B, 4, 4]
+            object_poses (torch.Tensor or None): current 4x4 object poses of shape [B, 4, 4], for the object
+                in this subtask
+            pose_index (SourceDemoPoseIndex): index of the poses of the source demonstrations
+            subtask_ind (int): index of subtask
+            src_subtask_start_inds (torch.Tensor or None): start index of the subtask segment in each source demo,
+                for each environment, of shape [B, N]. If None, the nominal subtask boundaries are used.
+
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [B]
+        """
+        return torch.randint(0, pose_index.num_src_demos, (len(eef_poses),), device=eef_poses.device)
+
 
 class NearestNeighborObjectStrategy(SelectionStrategy):
     """
@@ -139,6 +195,7 @@ class NearestNeighborObjectStrategy(SelectionStrategy):
 
     # name for registering this class into registry
     NAME = "nearest_neighbor_object"
+    BATCHED = True
 
     def select_source_demo(
         self,
@@ -207,6 +264,47 @@ class NearestNeighborObjectStrategy(SelectionStrategy):
         top_k_neighbors_in_order = torch.argsort(dists_to_minimize)[:nn_k]
         return top_k_neighbors_in_order[rand_k]
 
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        pose_index,
+        subtask_ind,
+        src_subtask_start_inds=None,
+        pos_weight=1.0,
+        rot_weight=1.0,
+        nn_k=3,
+    ):
+        """
+        Batched version of @select_source_demo that selects the source demonstrations of many environments
+        at once using the poses in @pose_index.
+
+        Args:
+            eef_poses (torch.Tensor): current 4x4 eef poses of shape [B, 4, 4]
+            object_poses (torch.Tensor or None): current 4x4 object poses of shape [B, 4, 4], for the object
+                in this subtask
+            pose_index (SourceDemoPoseIndex): index of the poses of the source demonstrations
+            subtask_ind (int): index of subtask
+            src_subtask_start_inds (torch.Tensor or None): start index of the subtask segment in each source demo,
+                for each environment, of shape [B, N]. If None, the nominal subtask boundaries are used.
+            pos_weight (float): weight on position for minimizing pose distance
+            rot_weight (float): weight on rotation for minimizing pose distance
+            nn_k (int): pick source demo index uniformly at randomly from the top @nn_k nearest neighbors
+
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [B]
+        """
+        neighbor_inds = pose_index.nearest_neighbors(
+            subtask_ind,
+            object_poses,
+            "object",
+            src_subtask_start_inds=src_subtask_start_inds,
+            pos_weight=pos_weight,
+            rot_weight=rot_weight,
+            nn_k=nn_k,
+        )
+        return sample_top_k(neighbor_inds)
+
 
 class NearestNeighborRobotDistanceStrategy(SelectionStrategy):
     """
@@ -217,6 +315,7 @@ class NearestNeighborRobotDistanceStrategy(SelectionStrategy):
 
     # name for registering this class into registry
     NAME = "nearest_neighbor_robot_distance"
+    BATCHED = True
 
     def select_source_demo(
         self,
@@ -306,3 +405,237 @@ class NearestNeighborRobotDistanceStrategy(SelectionStrategy):
         rand_k = torch.randint(0, nn_k, (1,)).item()
         top_k_neighbors_in_order = torch.argsort(dists_to_minimize)[:nn_k]
         return top_k_neighbors_in_order[rand_k]
+
+    def select_source_demos(
+        self,
+        eef_poses,
+        object_poses,
+        pose_index,
+        subtask_ind,
+        src_subtask_start_inds=None,
+        pos_weight=1.0,
+        rot_weight=1.0,
+        nn_k=3,
+    ):
+        """
+        Batched version of @select_source_demo that selects the source demonstrations of many environments
+        at once using the poses in @pose_index.
+
+        Args:
+            eef_poses (torch.Tensor): current 4x4 eef poses of shape [B, 4, 4]
+            object_poses (torch.Tensor or None): current 4x4 object poses of shape [B, 4, 4], for the object
+                in this subtask
+            pose_index (SourceDemoPoseIndex): index of the poses of the source demonstrations
+            subtask_ind (int): index of subtask
+            src_subtask_start_inds (torch.Tensor or None): start index of the subtask segment in each source demo,
+                for each environment, of shape [B, N]. If None, the nominal subtask boundaries are used.
+            pos_weight (float): weight on position for minimizing pose distance
+            rot_weight (float): weight on rotation for minimizing pose distance
+            nn_k (int): pick source demo index uniformly at randomly from the top @nn_k nearest neighbors
+
+        Returns:
+            source_demo_inds (torch.Tensor): indices of source demonstrations of shape [B]
+        """
+        # The distance between the current eef pose and the first pose of each transformed segment is the same
+        # as the distance between their poses relative to the current and the source object frames.
+        eef_poses_in_obj = PoseUtils.pose_in_A_to_pose_in_B(
+            pose_in_A=eef_poses,
+            pose_A_in_B=PoseUtils.pose_inv(object_poses),
+        )
+        neighbor_inds = pose_index.nearest_neighbors(
+            subtask_ind,
+            eef_poses_in_obj,
+            "eef_in_object",
+            src_subtask_start_inds=src_subtask_start_inds,
+            pos_weight=pos_weight,
+            rot_weight=rot_weight,
+            nn_k=nn_k,
+        )
+        return sample_top_k(neighbor_inds)
+
+
+class SourceDemoPoseIndex:
+    """
+    Index of the robot and object poses at the start of the subtask segments of the source demonstrations.
+
+    The poses of all source demonstrations are concatenated into tensors on the device once, so that the
+    selection strategies can compute the distances of many environments to all source segments at once
+    and pick their nearest neighbors with @torch.topk, instead of stacking the poses of the @DatagenInfo
+    objects on every query. Queries take the start index of the subtask segment in each source demo,
+    which can differ for each environment when the subtask boundaries are randomized. When they are not
+    given, the nominal subtask boundaries of the source demos are used.
+
+    For large pools, a KD-tree on the positions of the nominal start poses can be used to pre-select
+    candidates, which are then ranked with the full pose distance. This is approximate, since candidates
+    are selected without considering the rotation distance.
+    """
+
+    def __init__(
+        self,
+        eef_poses,
+        object_poses,
+        episode_starts,
+        subtask_start_inds,
+        subtask_object_names,
+        use_kdtree=False,
+        kdtree_num_candidates=32,
+        max_query_size=2**20,
+    ):
+        """
+        Args:
+            eef_poses (torch.Tensor): concatenated eef poses of all source demos of shape [M, 4, 4]
+            object_poses (dict): dictionary mapping object name to concatenated object poses of shape [M, 4, 4]
+            episode_starts (torch.Tensor): index of the first timestep of each source demo in the
+                concatenated poses of shape [N]
+            subtask_start_inds (torch.Tensor): nominal start index of each subtask in each source demo
+                of shape [N, S]
+            subtask_object_names (list): name of the reference object of each subtask (or None)
+            use_kdtree (bool): if True, pre-select candidates with a KD-tree on positions for queries
+                on the nominal subtask boundaries
+            kdtree_num_candidates (int): number of candidates to pre-select with the KD-tree
+            max_query_size (int): maximum number of (environment, source demo) pairs that are evaluated
+                at once, to bound the memory of the queries
+        """
+        self.eef_poses = eef_poses
+        self.object_poses = object_poses
+        self.episode_starts = episode_starts
+        self.subtask_start_inds = subtask_start_inds
+        self.subtask_object_names = subtask_object_names
+        self.use_kdtree = use_kdtree
+        self.kdtree_num_candidates = kdtree_num_candidates
+        self.max_query_size = max_query_size
+        # nominal first poses of each subtask
+        self._nominal_poses = [
+            self._gather_poses(i, subtask_start_inds[:, i]) for i in range(len(subtask_object_names))
+        ]
+        self._kdtrees = dict()
+
+    @classmethod
+    def from_datagen_infos(cls, datagen_infos, subtask_indices, subtask_object_names, device, **kwargs):
+        """
+        Build the index from a list of @DatagenInfo objects.
+
+        Args:
+            datagen_infos (list): DatagenInfo instance of each source demo
+            subtask_indices (list): start and end indices of each subtask in each source demo of shape [N, S, 2]
+            subtask_object_names (list): name of the reference object of each subtask (or None)
+            device (torch.device): device to store the index on
+            kwargs (dict): additional arguments of the index
+
+        Returns:
+            pose_index (SourceDemoPoseIndex instance)
+        """
+        lengths = torch.tensor([len(di.eef_pose) for di in datagen_infos], dtype=torch.long, device=device)
+        episode_starts = torch.cumsum(lengths, dim=0) - lengths
+        eef_poses = torch.cat([di.eef_pose for di in datagen_infos]).to(device)
+        object_poses = {
+            name: torch.cat([di.object_poses[name] for di in datagen_infos]).to(device)
+            for name in set(subtask_object_names)
+            if name is not None
+        }
+        subtask_start_inds = torch.tensor(subtask_indices, dtype=torch.long, device=device)[..., 0]
+        return cls(eef_poses, object_poses, episode_starts, subtask_start_inds, subtask_object_names, **kwargs)
+
+    @property
+    def num_src_demos(self):
+        """Number of source demos in the index."""
+        return len(self.episode_starts)
+
+    def nearest_neighbors(
+        self,
+        subtask_ind,
+        poses,
+        pose_type,
+        src_subtask_start_inds=None,
+        pos_weight=1.0,
+        rot_weight=1.0,
+        nn_k=3,
+    ):
+        """
+        Find the source demos with the closest poses at the start of the subtask segment for a batch of query poses.
+
+        Args:
+            subtask_ind (int): index of subtask
+            poses (torch.Tensor): query poses of shape [B, 4, 4]
+            pose_type (str): which source poses to compare the query poses to. "object" compares to the pose
+                of the reference object of the subtask, and "eef_in_object" compares to the eef pose expressed
+                in the frame of the reference object.
+            src_subtask_start_inds (torch.Tensor or None): start index of the subtask segment in each source demo,
+                for each query, of shape [B, N]. If None, the nominal subtask boundaries are used.
+            pos_weight (float): weight on position for minimizing pose distance
+            rot_weight (float): weight on rotation for minimizing pose distance
+            nn_k (int): number of nearest neighbors to return
+
+        Returns:
+            neighbor_inds (torch.Tensor): indices of the source demos of the nearest neighbors of each query,
+                in order of increasing distance, of shape [B, min(nn_k, N)]
+        """
+        nn_k = min(nn_k, self.num_src_demos)
+        if src_subtask_start_inds is None and self.use_kdtree and self.kdtree_num_candidates < self.num_src_demos:
+            # pre-select candidates with the KD-tree and rank them with the full pose distance
+            candidate_inds = self._query_kdtree(subtask_ind, poses, pose_type, max(nn_k, self.kdtree_num_candidates))
+            src_poses = self._nominal_poses[subtask_ind][pose_type][candidate_inds]
+            dists = self._pose_distances(src_poses, poses, pos_weight, rot_weight)
+            return torch.gather(candidate_inds, 1, torch.topk(dists, nn_k, dim=1, largest=False).indices)
+
+        # evaluate the queries in chunks to bound the memory
+        chunk_size = max(1, self.max_query_size // self.num_src_demos)
+        neighbor_inds = []
+        for start in range(0, len(poses), chunk_size):
+            chunk_poses = poses[start : start + chunk_size]
+            if src_subtask_start_inds is None:
+                src_poses = self._nominal_poses[subtask_ind][pose_type].unsqueeze(0)
+            else:
+                chunk_start_inds = src_subtask_start_inds[start : start + chunk_size]
+                src_poses = self._gather_poses(subtask_ind, chunk_start_inds, pose_type)[pose_type]
+            dists = self._pose_distances(src_poses, chunk_poses, pos_weight, rot_weight)
+            neighbor_inds.append(torch.topk(dists, nn_k, dim=1, largest=False).indices)
+        return torch.cat(neighbor_inds)
+
+    def _gather_poses(self, subtask_ind, start_inds, pose_type=None):
+        """Gather the object pose and the eef pose in the object frame (or only @pose_type) at the given start indices."""
+        flat_inds = self.episode_starts + start_inds
+        object_name = self.subtask_object_names[subtask_ind]
+        if object_name is None:
+            return dict()
+        src_poses = dict(object=self.object_poses[object_name][flat_inds])
+        if pose_type in (None, "eef_in_object"):
+            src_poses["eef_in_object"] = PoseUtils.pose_in_A_to_pose_in_B(
+                pose_in_A=self.eef_poses[flat_inds], pose_A_in_B=PoseUtils.pose_inv(src_poses["object"])
+            )
+        return src_poses
+
+    def _pose_distances(self, src_poses, poses, pos_weight, rot_weight):
+        """Weighted pose distances between source poses of shape [B or 1, N, 4, 4] and query poses of shape [B, 4, 4]."""
+        # pos dist is just L2 between positions
+        pos_dists = torch.linalg.norm(src_poses[..., :3, 3] - poses[:, None, :3, 3], dim=-1)
+        # angle of the delta rotation, using trace(R_1 R_2^T) = sum(R_1 * R_2)
+        # (see http://www.boris-belousov.net/2016/12/01/quat-dist/)
+        trace = torch.einsum("bnij,bij->bn", src_poses[..., :3, :3].expand(len(poses), -1, -1, -1), poses[:, :3, :3])
+        rot_dists = torch.acos(torch.clamp((trace - 1.0) / 2.0, -1.0, 1.0))
+        return pos_weight * pos_dists + rot_weight * rot_dists
+
+    def _query_kdtree(self, subtask_ind, poses, pose_type, num_candidates):
+        """Pre-select the source demos with the closest positions using a KD-tree."""
+        from scipy.spatial import cKDTree
+
+        key = (subtask_ind, pose_type)
+        if key not in self._kdtrees:
+            positions = self._nominal_poses[subtask_ind][pose_type][:, :3, 3]
+            self._kdtrees[key] = cKDTree(positions.cpu().numpy())
+        _, candidate_inds = self._kdtrees[key].query(poses[:, :3, 3].cpu().numpy(), k=num_candidates)
+        return torch.as_tensor(candidate_inds, dtype=torch.long, device=poses.device).reshape(len(poses), -1)
+
+
+def sample_top_k(neighbor_inds):
+    """
+    Pick one of the nearest neighbors of each query uniformly at random.
+
+    Args:
+        neighbor_inds (torch.Tensor): indices of the nearest neighbors of shape [B, K]
+
+    Returns:
+        source_demo_inds (torch.Tensor): selected indices of shape [B]
+    """
+    rand_k = torch.randint(0, neighbor_inds.shape[1], (neighbor_inds.shape[0], 1), device=neighbor_inds.device)
+    return torch.gather(neighbor_inds, 1, rand_k).squeeze(1)
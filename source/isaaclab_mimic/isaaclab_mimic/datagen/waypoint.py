@@ -428,3 +428,453 @@ class WaypointTrajectory:
             success=success,
         )
         return results
+
+
+class TensorWaypointTrajectory:
+    """
+    A batch of 6-DoF waypoint trajectories backed by tensors, with one trajectory per environment.
+
+    Unlike @WaypointTrajectory, which stores one Waypoint object per timestep, the waypoints of all
+    trajectories are stored in padded tensors. Trajectories can have different lengths, given by @lengths.
+    Entries after the end of a trajectory are padding and are never read, since all lookups are clamped to the
+    last valid waypoint. All operations (construction, interpolation, merging and lookup of the waypoints to
+    execute) are vectorized over the environments and timesteps.
+
+    The tensors have the following shapes, where N is the number of trajectories, T the maximum number
+    of timesteps and G the dimension of the gripper actions:
+
+        poses (torch.Tensor): pose targets of shape (N, T, 4, 4)
+        gripper_actions (torch.Tensor): gripper actions of shape (N, T, G)
+        noise (torch.Tensor): action noise amplitudes of shape (N, T)
+        lengths (torch.Tensor): number of valid timesteps of each trajectory of shape (N,)
+    """
+
+    def __init__(self, eef_names, poses, gripper_actions, noise, lengths=None):
+        """
+        Args:
+            eef_names (list): names of the end effectors
+            poses (torch.Tensor): pose targets of shape (N, T, 4, 4)
+            gripper_actions (torch.Tensor): gripper actions of shape (N, T, G)
+            noise (torch.Tensor): action noise amplitudes of shape (N, T)
+            lengths (torch.Tensor or None): number of valid timesteps of each trajectory of shape (N,).
+                If None, all trajectories are assumed to have T timesteps.
+        """
+        assert poses.dim() == 4 and poses.shape[-2:] == (4, 4)
+        assert gripper_actions.shape[:2] == poses.shape[:2]
+        assert noise.shape == poses.shape[:2]
+        self.eef_names = eef_names
+        self.poses = poses
+        self.gripper_actions = gripper_actions
+        self.noise = noise
+        if lengths is None:
+            lengths = torch.full((poses.shape[0],), poses.shape[1], dtype=torch.long, device=poses.device)
+        self.lengths = lengths.to(dtype=torch.long, device=poses.device)
+
+    @classmethod
+    def from_poses(cls, eef_names, poses, gripper_actions, action_noise, lengths=None):
+        """
+        Instantiate a TensorWaypointTrajectory object given sequences of poses, gripper actions,
+        and action noise for one or many trajectories.
+
+        Args:
+            poses (torch.Tensor): sequence of pose matrices of shape (T, 4, 4) or (N, T, 4, 4)
+            gripper_actions (torch.Tensor): sequence of gripper actions that should be applied
+                at each timestep of shape (T, G) or (N, T, G).
+            action_noise (float or torch.Tensor): action noise magnitudes that should be applied at each
+                timestep. If a single float is provided, the noise magnitude will be constant over the
+                trajectories. For a single trajectory, a tensor should be of shape (T,) or (T, 1). For a batch
+                of trajectories, a tensor should be of shape (N, 1) for a constant noise over each trajectory,
+                or of shape (N, T) or (N, T, 1).
+            lengths (torch.Tensor or None): number of valid timesteps of each trajectory of shape (N,).
+                If None, all trajectories are assumed to have T timesteps.
+        """
+        assert isinstance(action_noise, (float, torch.Tensor))
+        # add the batch dimension for a single trajectory
+        if poses.dim() == 3:
+            poses = poses.unsqueeze(0)
+            gripper_actions = gripper_actions.unsqueeze(0)
+            if isinstance(action_noise, torch.Tensor):
+                if action_noise.shape not in [(poses.shape[1],), (poses.shape[1], 1)]:
+                    raise ValueError(
+                        f"Invalid shape of the action noise for a single trajectory: {tuple(action_noise.shape)}."
+                    )
+                action_noise = action_noise.reshape(1, -1)
+        num_trajectories, num_timesteps = poses.shape[:2]
+
+        # handle scalar to tensor conversion
+        if isinstance(action_noise, float):
+            noise = torch.full((num_trajectories, num_timesteps), action_noise, device=poses.device)
+        else:
+            if action_noise.shape == (num_trajectories, num_timesteps, 1):
+                action_noise = action_noise.squeeze(-1)
+            if action_noise.shape == (num_trajectories, 1):
+                noise = action_noise.expand(num_trajectories, num_timesteps)
+            elif action_noise.shape == (num_trajectories, num_timesteps):
+                noise = action_noise
+            else:
+                raise ValueError(
+                    f"Invalid shape of the action noise: {tuple(action_noise.shape)}. Expected"
+                    f" ({num_trajectories}, 1), ({num_trajectories}, {num_timesteps}) or"
+                    f" ({num_trajectories}, {num_timesteps}, 1)."
+                )
+        noise = noise.to(device=poses.device, dtype=torch.float32)
+
+        return cls(eef_names=eef_names, poses=poses, gripper_actions=gripper_actions, noise=noise, lengths=lengths)
+
+    @classmethod
+    def from_waypoint_trajectories(cls, trajectories):
+        """
+        Convert a list of @WaypointTrajectory objects into a batched tensor representation.
+
+        Args:
+            trajectories (list): list of WaypointTrajectory (or WaypointSequence) objects, one per trajectory
+
+        Returns:
+            trajectory (TensorWaypointTrajectory instance)
+        """
+        assert len(trajectories) > 0
+        waypoints = [[trajectory[i] for i in range(len(trajectory))] for trajectory in trajectories]
+        eef_names = waypoints[0][0].eef_names
+        lengths = torch.tensor([len(w) for w in waypoints], dtype=torch.long)
+        max_length = int(lengths.max())
+        # pad trajectories by repeating their last waypoint
+        waypoints = [w + [w[-1]] * (max_length - len(w)) for w in waypoints]
+        poses = torch.stack([torch.stack([wp.pose for wp in w]) for w in waypoints])
+        gripper_actions = torch.stack([torch.stack([wp.gripper_action for wp in w]) for w in waypoints])
+        noise = torch.tensor(
+            [[0.0 if wp.noise is None else float(wp.noise) for wp in w] for w in waypoints], device=poses.device
+        )
+        return cls(eef_names=eef_names, poses=poses, gripper_actions=gripper_actions, noise=noise, lengths=lengths)
+
+    @property
+    def num_trajectories(self):
+        """Number of trajectories in the batch."""
+        return self.poses.shape[0]
+
+    @property
+    def max_length(self):
+        """Maximum number of timesteps over all trajectories (including padding)."""
+        return self.poses.shape[1]
+
+    @property
+    def device(self):
+        """Device on which the trajectories are stored."""
+        return self.poses.device
+
+    def __len__(self):
+        # number of trajectories
+        return self.num_trajectories
+
+    def __getitem__(self, ind):
+        """
+        Returns the trajectories at the given indices.
+
+        Args:
+            ind (int, slice or torch.Tensor): indices of the trajectories
+
+        Returns:
+            trajectory (TensorWaypointTrajectory instance)
+        """
+        if isinstance(ind, int):
+            ind = slice(ind, ind + 1)
+        return TensorWaypointTrajectory(
+            eef_names=self.eef_names,
+            poses=self.poses[ind],
+            gripper_actions=self.gripper_actions[ind],
+            noise=self.noise[ind],
+            lengths=self.lengths[ind],
+        )
+
+    def __str__(self):
+        """String representation of the trajectories."""
+        return (
+            f"TensorWaypointTrajectory(num_trajectories={self.num_trajectories}, "
+            f"lengths={self.lengths.tolist()}, eef_names={self.eef_names})"
+        )
+
+    def get_waypoints(self, timesteps):
+        """
+        Look up the waypoints of all trajectories at the given timesteps. Timesteps after the end
+        of a trajectory return its last waypoint.
+
+        Args:
+            timesteps (int or torch.Tensor): timestep for all trajectories, or tensor of shape (N,)
+                with the timestep for each trajectory
+
+        Returns:
+            poses (torch.Tensor): pose targets of shape (N, 4, 4)
+            gripper_actions (torch.Tensor): gripper actions of shape (N, G)
+            noise (torch.Tensor): action noise amplitudes of shape (N,)
+        """
+        if isinstance(timesteps, int):
+            timesteps = torch.full((self.num_trajectories,), timesteps, dtype=torch.long, device=self.device)
+        timesteps = torch.minimum(timesteps.to(self.device), self.lengths - 1).clamp_(min=0)
+        env_ids = torch.arange(self.num_trajectories, device=self.device)
+        return (
+            self.poses[env_ids, timesteps],
+            self.gripper_actions[env_ids, timesteps],
+            self.noise[env_ids, timesteps],
+        )
+
+    @property
+    def last_waypoints(self):
+        """
+        Return the last waypoint of each trajectory.
+
+        Returns:
+            poses (torch.Tensor): pose targets of shape (N, 4, 4)
+            gripper_actions (torch.Tensor): gripper actions of shape (N, G)
+            noise (torch.Tensor): action noise amplitudes of shape (N,)
+        """
+        return self.get_waypoints(self.lengths - 1)
+
+    def set_trajectories(self, ind, other):
+        """
+        Replace the trajectories at the given indices with the trajectories in @other, in-place.
+        The padded tensors are extended if @other contains longer trajectories.
+
+        Args:
+            ind (torch.Tensor): indices of the trajectories to replace of shape (M,)
+            other (TensorWaypointTrajectory instance): the M new trajectories
+        """
+        assert len(ind) == other.num_trajectories
+        num_pad = other.max_length - self.max_length
+        if num_pad > 0:
+            # extend the padding by repeating the last entry
+            self.poses = torch.cat([self.poses, self.poses[:, -1:].expand(-1, num_pad, -1, -1)], dim=1)
+            self.gripper_actions = torch.cat(
+                [self.gripper_actions, self.gripper_actions[:, -1:].expand(-1, num_pad, -1)], dim=1
+            )
+            self.noise = torch.cat([self.noise, self.noise[:, -1:].expand(-1, num_pad)], dim=1)
+        self.poses[ind, : other.max_length] = other.poses
+        self.gripper_actions[ind, : other.max_length] = other.gripper_actions
+        self.noise[ind, : other.max_length] = other.noise
+        self.lengths[ind] = other.lengths
+
+    def concatenate(self, other):
+        """
+        Concatenate the trajectories in @other to the end of the trajectories in this batch.
+        Both batches must contain the same number of trajectories.
+
+        Args:
+            other (TensorWaypointTrajectory instance): trajectories to append
+
+        Returns:
+            trajectory (TensorWaypointTrajectory instance): the concatenated trajectories
+        """
+        assert self.num_trajectories == other.num_trajectories
+        lengths = self.lengths + other.lengths
+        timesteps = torch.arange(int(lengths.max()), device=self.device).unsqueeze(0)
+        # indices into the trajectories of both batches
+        in_self = timesteps < self.lengths.unsqueeze(1)
+        self_ids = torch.minimum(timesteps, self.lengths.unsqueeze(1) - 1)
+        other_ids = (timesteps - self.lengths.unsqueeze(1)).clamp_(min=0)
+        other_ids = torch.minimum(other_ids, other.lengths.unsqueeze(1) - 1)
+
+        def _gather(self_data, other_data):
+            env_ids = torch.arange(self.num_trajectories, device=self.device).unsqueeze(1)
+            mask = in_self.view(in_self.shape + (1,) * (self_data.dim() - 2))
+            return torch.where(mask, self_data[env_ids, self_ids], other_data[env_ids, other_ids])
+
+        return TensorWaypointTrajectory(
+            eef_names=self.eef_names,
+            poses=_gather(self.poses, other.poses),
+            gripper_actions=_gather(self.gripper_actions, other.gripper_actions),
+            noise=_gather(self.noise, other.noise),
+            lengths=lengths,
+        )
+
+    def add_target_poses(
+        self,
+        poses,
+        gripper_actions,
+        num_steps,
+        skip_interpolation=False,
+        action_noise=0.0,
+    ):
+        """
+        Appends a new segment corresponding to a desired target pose to each trajectory. This is the batched
+        counterpart of @WaypointTrajectory.add_waypoint_sequence_for_target_pose. The segment has @num_steps
+        waypoints that are either linearly interpolated from the last waypoint of each trajectory (default) or
+        constant (set @skip_interpolation to True).
+
+        Args:
+            poses (torch.Tensor): target poses of shape (N, 4, 4)
+            gripper_actions (torch.Tensor): gripper actions for the segment of shape (N, G)
+            num_steps (int): number of action steps when trying to reach the target poses. For interpolation,
+                @num_steps intermediate waypoints and the target pose are added.
+            skip_interpolation (bool): if True, keep the target pose fixed and repeat it @num_steps times
+            action_noise (float or torch.Tensor): noise amplitude for the segment, shared or of shape (N,)
+
+        Returns:
+            trajectory (TensorWaypointTrajectory instance): the trajectories with the appended segment
+        """
+        if skip_interpolation:
+            segment_poses = poses.unsqueeze(1).expand(-1, num_steps, -1, -1)
+        else:
+            last_poses, _, _ = self.last_waypoints
+            # skip the first element of the new path, which already exists on the current trajectory path
+            segment_poses = interpolate_poses(last_poses, poses, num_steps)[:, 1:]
+        segment_gripper_actions = gripper_actions.unsqueeze(1).expand(-1, segment_poses.shape[1], -1)
+        # the noise of each trajectory is constant over the segment
+        if isinstance(action_noise, torch.Tensor):
+            action_noise = action_noise.reshape(-1, 1)
+        segment = TensorWaypointTrajectory.from_poses(
+            eef_names=self.eef_names,
+            poses=segment_poses,
+            gripper_actions=segment_gripper_actions,
+            action_noise=action_noise,
+        )
+        return self.concatenate(segment)
+
+    def pop_first(self):
+        """
+        Removes the first waypoint of each trajectory.
+
+        Returns:
+            trajectory (TensorWaypointTrajectory instance): the trajectories without their first waypoint
+        """
+        assert torch.all(self.lengths > 0)
+        return TensorWaypointTrajectory(
+            eef_names=self.eef_names,
+            poses=self.poses[:, 1:],
+            gripper_actions=self.gripper_actions[:, 1:],
+            noise=self.noise[:, 1:],
+            lengths=self.lengths - 1,
+        )
+
+    def merge(
+        self,
+        other,
+        num_steps_interp=None,
+        num_steps_fixed=None,
+        action_noise=0.0,
+    ):
+        """
+        Merge these trajectories with other trajectories (@other). This is the batched counterpart of
+        @WaypointTrajectory.merge.
+
+        Args:
+            other (TensorWaypointTrajectory object): the other trajectories to merge into these ones
+
+            num_steps_interp (int or None): if not None, add a segment that interpolates
+                between the end of the current trajectories and the start of @other
+
+            num_steps_fixed (int or None): if not None, add a segment that has constant
+                target poses corresponding to the first target pose in @other
+
+            action_noise (float or torch.Tensor): noise to use during the interpolation segment, shared or of
+                shape (N,)
+
+        Returns:
+            trajectory (TensorWaypointTrajectory instance): the merged trajectories
+        """
+        need_interp = (num_steps_interp is not None) and (num_steps_interp > 0)
+        need_fixed = (num_steps_fixed is not None) and (num_steps_fixed > 0)
+
+        merged = self
+        if need_interp or need_fixed:
+            # The interpolated segment will include the first element of @other as its last point.
+            target_poses, target_gripper_actions, target_noise = other.get_waypoints(0)
+            other = other.pop_first()
+
+            if need_interp:
+                # interpolation segment
+                merged = merged.add_target_poses(
+                    poses=target_poses,
+                    gripper_actions=target_gripper_actions,
+                    num_steps=num_steps_interp,
+                    skip_interpolation=False,
+                    action_noise=action_noise,
+                )
+
+            if need_fixed:
+                # account for the fact that we pop'd the first element of @other
+                num_steps_fixed_to_use = num_steps_fixed if need_interp else (num_steps_fixed + 1)
+                merged = merged.add_target_poses(
+                    poses=target_poses,
+                    gripper_actions=target_gripper_actions,
+                    num_steps=num_steps_fixed_to_use,
+                    skip_interpolation=True,
+                    action_noise=action_noise,
+                )
+
+            # make sure to preserve noise from first element of other trajectory
+            env_ids = torch.arange(merged.num_trajectories, device=merged.device)
+            merged.noise[env_ids, merged.lengths - 1] = target_noise
+
+        # concatenate the trajectories
+        return merged.concatenate(other)
+
+
+def interpolate_poses(pose_1, pose_2, num_steps):
+    """
+    Batched linear interpolation between two sets of poses. This is the vectorized counterpart of
+    @PoseUtils.interpolate_poses: positions are interpolated linearly and rotations in axis-angle form
+    (with no interpolation for rotations smaller than 0.05 rad).
+
+    Args:
+        pose_1 (torch.Tensor): start poses of shape (..., 4, 4)
+        pose_2 (torch.Tensor): end poses of shape (..., 4, 4)
+        num_steps (int): number of interpolated points (excluding the start and end points)
+
+    Returns:
+        pose_steps (torch.Tensor): interpolated poses of shape (..., num_steps + 2, 4, 4), including
+            the start and end poses
+    """
+    assert isinstance(pose_1, torch.Tensor), "Input must be a torch tensor"
+    assert isinstance(pose_2, torch.Tensor), "Input must be a torch tensor"
+    assert num_steps >= 0
+
+    pos1, rot1 = PoseUtils.unmake_pose(pose_1)
+    pos2, rot2 = PoseUtils.unmake_pose(pose_2)
+    if num_steps == 0:
+        # skip interpolation
+        return torch.stack([pose_1, pose_2], dim=-3)
+
+    num_steps += 1  # include starting pose
+    # interpolation coefficients of shape (num_steps,)
+    grid = torch.arange(num_steps, dtype=pose_1.dtype, device=pose_1.device) / num_steps
+
+    # linear interpolation of positions
+    pos_steps = pos1.unsqueeze(-2) + grid.unsqueeze(-1) * (pos2 - pos1).unsqueeze(-2)
+
+    # delta rotation expressed as axis-angle
+    delta_quat = PoseUtils.quat_from_matrix(torch.matmul(rot2, rot1.transpose(-1, -2)))
+    delta_axis_angle = PoseUtils.axis_angle_from_quat(delta_quat)
+    delta_angle = torch.linalg.norm(delta_axis_angle, dim=-1, keepdim=True)
+    delta_axis = delta_axis_angle / delta_angle.clamp(min=1e-9)
+    # fix the axis, and chunk the angle up into steps
+    step_angles = delta_angle * grid
+    step_axes = delta_axis.unsqueeze(-2).expand(step_angles.shape + (3,))
+    delta_rot_steps = PoseUtils.matrix_from_quat(
+        PoseUtils.quat_from_angle_axis(step_angles.reshape(-1), step_axes.reshape(-1, 3))
+    ).reshape(step_angles.shape + (3, 3))
+    rot_steps = torch.matmul(delta_rot_steps, rot1.unsqueeze(-3))
+    # small angle - don't bother with interpolation
+    is_small_angle = (delta_angle < 0.05).unsqueeze(-1).unsqueeze(-1)
+    rot_steps = torch.where(is_small_angle, rot2.unsqueeze(-3), rot_steps)
+
+    # add in endpoint
+    pose_steps = PoseUtils.make_pose(pos_steps, rot_steps)
+    return torch.cat([pose_steps, pose_2.unsqueeze(-3)], dim=-3)
+
+
+def apply_action_noise(pose_actions, noise, clip=1.0):
+    """
+    Batched injection of gaussian action noise, scaled per trajectory.
+
+    Args:
+        pose_actions (torch.Tensor): arm actions of shape (N, A) (without the gripper actions)
+        noise (torch.Tensor or float): noise amplitudes, shared or of shape (N,)
+        clip (float or None): if not None, the noisy actions are clipped to [-clip, clip]
+
+    Returns:
+        pose_actions (torch.Tensor): the noisy arm actions of shape (N, A)
+    """
+    if isinstance(noise, torch.Tensor):
+        noise = noise.reshape(-1, 1)
+    pose_actions = pose_actions + noise * torch.randn_like(pose_actions)
+    if clip is not None:
+        pose_actions = pose_actions.clamp(-clip, clip)
+    return pose_actions
@@ -9,6 +9,8 @@ from collections.abc import Sequence
 import isaaclab.utils.math as PoseUtils
 from isaaclab.envs import ManagerBasedRLMimicEnv
 
+from isaaclab_mimic.datagen.waypoint import apply_action_noise
+
 
 class FrankaCubeStackIKRelMimicEnv(ManagerBasedRLMimicEnv):
     """
@@ -52,6 +54,35 @@ class FrankaCubeStackIKRelMimicEnv(ManagerBasedRLMimicEnv):
         Returns:
             An action torch.Tensor that's compatible with env.step().
         """
+        # compute the action of a single environment with the batched implementation
+        action = self.target_eef_pose_to_action_batch(
+            target_eef_pose_dict={name: pose.unsqueeze(0) for name, pose in target_eef_pose_dict.items()},
+            gripper_action_dict={name: action.unsqueeze(0) for name, action in gripper_action_dict.items()},
+            noise=noise,
+            env_ids=[env_id],
+        )
+        return action[0]
+
+    def target_eef_pose_to_action_batch(
+        self,
+        target_eef_pose_dict: dict,
+        gripper_action_dict: dict,
+        noise: torch.Tensor | float | None = None,
+        env_ids: Sequence[int] | None = None,
+    ) -> torch.Tensor:
+        """
+        Vectorized version of @target_eef_pose_to_action for multiple environments.
+
+        Args:
+            target_eef_pose_dict: Dictionary of 4x4 target eef poses for each end-effector. Shape is (len(env_ids), 4, 4).
+            gripper_action_dict: Dictionary of gripper actions for each end-effector. Shape is (len(env_ids), G).
+            noise: Noise magnitudes to add to the actions. Shared or of shape (len(env_ids),). If None, no noise
+                is added.
+            env_ids: Environment indices to compute the actions for. If None, all envs are considered.
+
+        Returns:
+            An action torch.Tensor of shape (len(env_ids), action_dim) that's compatible with env.step().
+        """
         eef_name = list(self.cfg.subtask_configs.keys())[0]
 
         # target position and rotation
@@ -59,7 +90,7 @@ class FrankaCubeStackIKRelMimicEnv(ManagerBasedRLMimicEnv):
         target_pos, target_rot = PoseUtils.unmake_pose(target_eef_pose)
 
         # current position and rotation
-        curr_pose = self.get_robot_eef_pose(eef_name, env_ids=[env_id])[0]
+        curr_pose = self.get_robot_eef_pose(eef_name, env_ids=env_ids)
         curr_pos, curr_rot = PoseUtils.unmake_pose(curr_pose)
 
         # normalized delta position action
@@ -74,13 +105,11 @@ class FrankaCubeStackIKRelMimicEnv(ManagerBasedRLMimicEnv):
         (gripper_action,) = gripper_action_dict.values()
 
         # add noise to action
-        pose_action = torch.cat([delta_position, delta_rotation], dim=0)
+        pose_action = torch.cat([delta_position, delta_rotation], dim=-1)
         if noise is not None:
-            noise = noise * torch.randn_like(pose_action)
-            pose_action += noise
-            pose_action = torch.clamp(pose_action, -1.0, 1.0)
+            pose_action = apply_action_noise(pose_action, noise, clip=1.0)
 
-        return torch.cat([pose_action, gripper_action], dim=0)
+        return torch.cat([pose_action, gripper_action], dim=-1)
 
     def action_to_target_eef_pose(self, action: torch.Tensor) -> dict[str, torch.Tensor]:
         """
@@ -0,0 +1,170 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+import torch
+import unittest
+from types import SimpleNamespace
+
+import isaaclab.utils.math as PoseUtils
+from isaaclab.envs.mimic_env_cfg import MimicEnvCfg, SubTaskConfig
+from isaaclab.utils.datasets import EpisodeData
+
+from isaaclab_mimic.datagen.batched_data_generator import BatchedDataGenerator
+from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
+from isaaclab_mimic.datagen.waypoint import TensorWaypointTrajectory, WaypointSequence, WaypointTrajectory
+
+
+def random_poses(num_poses):
+    """Generate random 4x4 pose matrices."""
+    rot = PoseUtils.matrix_from_quat(PoseUtils.random_orientation(num_poses, "cpu"))
+    return PoseUtils.make_pose(torch.randn(num_poses, 3), rot)
+
+
+class KinematicMimicEnv:
+    """Minimal mimic environment in which the end effector reaches its target pose in one step."""
+
+    def __init__(self, cfg, num_envs):
+        self.cfg = cfg
+        self.num_envs = num_envs
+        self.device = "cpu"
+        self.eef_pose = random_poses(num_envs)
+        self.object_pose = random_poses(num_envs)
+        self.is_success = torch.arange(num_envs) % 2 == 0
+        self.recorder_manager = SimpleNamespace(
+            reset=lambda env_ids: None,
+            set_success_to_episodes=self._set_success_to_episodes,
+            export_episodes=lambda env_ids: None,
+        )
+        self.exported_success = []
+
+    def reset(self, env_ids):
+        self.eef_pose[env_ids] = random_poses(len(env_ids))
+        self.reset_eef_pose = self.eef_pose.clone()
+        self.object_pose[env_ids] = random_poses(len(env_ids))
+
+    def step(self, actions):
+        self.eef_pose = self._target_poses
+
+    def get_robot_eef_pose(self, eef_name, env_ids=None):
+        return self.eef_pose[env_ids]
+
+    def get_object_poses(self, env_ids=None):
+        return {"cube": self.object_pose[env_ids]}
+
+    def target_eef_pose_to_action_batch(self, target_eef_pose_dict, gripper_action_dict, noise=None, env_ids=None):
+        (self._target_poses,) = target_eef_pose_dict.values()
+        (gripper_actions,) = gripper_action_dict.values()
+        return torch.cat([self._target_poses[:, :3, 3], gripper_actions], dim=-1)
+
+    def actions_to_gripper_actions(self, actions):
+        return {"franka": actions[:, -1:]}
+
+    def _set_success_to_episodes(self, env_ids, success):
+        self.exported_success += list(zip(env_ids.tolist(), success.squeeze(1).tolist()))
+
+
+class TestBatchedDataGenerator(unittest.TestCase):
+    """Test the BatchedDataGenerator class against the trajectories of the DataGenerator class."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.num_envs = 6
+        self.subtask_configs = [
+            SubTaskConfig(
+                object_ref="cube",
+                subtask_term_signal="grasp",
+                subtask_term_offset_range=(0, 3),
+                num_interpolation_steps=4,
+            ),
+            SubTaskConfig(object_ref="cube", num_interpolation_steps=3, num_fixed_steps=2),
+        ]
+        self.env = KinematicMimicEnv(MimicEnvCfg(subtask_configs={"franka": self.subtask_configs}), self.num_envs)
+        # create source demos of different lengths with two subtasks each
+        self.pool = DataGenInfoPool(self.env, self.env.cfg, "cpu")
+        episodes = []
+        for length in [20, 14, 25]:
+            episode = EpisodeData()
+            episode.data = {
+                "actions": torch.randn(length, 7),
+                "obs": {
+                    "datagen_info": {
+                        "eef_pose": {"franka": random_poses(length)},
+                        "object_pose": {"cube": random_poses(length)},
+                        "target_eef_pose": {"franka": random_poses(length)},
+                        "subtask_term_signals": {"grasp": (torch.arange(length) >= length // 2 - 1).float()},
+                    }
+                },
+            }
+            episodes.append(episode)
+        self.pool._add_episodes(episodes)
+        self.success_term = SimpleNamespace(func=lambda env: env.is_success, params={})
+
+    def test_first_subtask_trajectories(self):
+        """Test that the planned trajectories match the trajectories of the per-environment generator."""
+        generator = BatchedDataGenerator(
+            self.env, self.success_term, src_demo_datagen_info_pool=self.pool, interpolate_from_last_target_pose=False
+        )
+        generator.step()
+        trajectory = generator._trajectory
+
+        expected_trajectories = []
+        for env_id in range(self.num_envs):
+            src_demo_ind = int(generator._src_demo_ind[env_id])
+            start, end = generator._all_subtask_inds[env_id, src_demo_ind, 0].tolist()
+            src_info = self.pool.datagen_infos[src_demo_ind]
+            src_poses = torch.cat([src_info.eef_pose[start : start + 1], src_info.target_eef_pose[start:end]])
+            gripper_actions = torch.cat(
+                [src_info.gripper_action[start : start + 1], src_info.gripper_action[start:end]]
+            )
+            transformed_poses = PoseUtils.transform_poses_from_frame_A_to_frame_B(
+                src_poses, self.env.object_pose[env_id], src_info.object_poses["cube"][start]
+            )
+            expected = WaypointTrajectory()
+            expected.add_waypoint_sequence(
+                WaypointSequence.from_poses(
+                    ["franka"], self.env.reset_eef_pose[env_id, None], gripper_actions[:1], 0.03
+                )
+            )
+            other = WaypointTrajectory()
+            other.add_waypoint_sequence(
+                WaypointSequence.from_poses(["franka"], transformed_poses, gripper_actions, 0.03)
+            )
+            expected.merge(other, eef_names=["franka"], num_steps_interp=4, num_steps_fixed=0, action_noise=0.0)
+            expected_trajectories.append(expected)
+        expected = TensorWaypointTrajectory.from_waypoint_trajectories(expected_trajectories)
+
+        torch.testing.assert_close(trajectory.lengths, expected.lengths - 1)
+        for env_id in range(self.num_envs):
+            length = int(trajectory.lengths[env_id])
+            # the first waypoint of the expected trajectory is the initial pose that is popped
+            torch.testing.assert_close(trajectory.poses[env_id, :length], expected.poses[env_id, 1 : length + 1])
+            torch.testing.assert_close(
+                trajectory.gripper_actions[env_id, :length], expected.gripper_actions[env_id, 1 : length + 1]
+            )
+            torch.testing.assert_close(trajectory.noise[env_id, :length], expected.noise[env_id, 1 : length + 1])
+
+    def test_generation_loop(self):
+        """Test that all environments run through their subtasks and export labeled episodes."""
+        generator = BatchedDataGenerator(self.env, self.success_term, src_demo_datagen_info_pool=self.pool)
+        num_steps = 0
+        while generator.num_attempts < 2 * self.num_envs:
+            generator.step()
+            num_steps += 1
+            self.assertLess(num_steps, 1000)
+            self.assertTrue(torch.all(generator._subtask_ind <= len(self.subtask_configs)))
+
+        self.assertEqual(generator.num_success + generator.num_failures, generator.num_attempts)
+        self.assertEqual(len(self.env.exported_success), generator.num_attempts)
+        for env_id, success in self.env.exported_success:
+            self.assertEqual(success, env_id % 2 == 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
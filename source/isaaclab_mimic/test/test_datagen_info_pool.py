@@ -0,0 +1,146 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+import asyncio
+import os
+import tempfile
+import torch
+import unittest
+from types import SimpleNamespace
+
+import isaaclab.utils.math as PoseUtils
+from isaaclab.envs.mimic_env_cfg import MimicEnvCfg, SubTaskConfig
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+
+from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
+
+
+def random_poses(num_poses):
+    """Generate random 4x4 pose matrices."""
+    rot = PoseUtils.matrix_from_quat(PoseUtils.random_orientation(num_poses, "cpu"))
+    return PoseUtils.make_pose(torch.randn(num_poses, 3), rot)
+
+
+def create_episode(length, grasp_step):
+    """Create an episode with datagen info in which the grasp subtask is completed at the given step."""
+    episode = EpisodeData()
+    episode.data = {
+        "actions": torch.randn(length, 7),
+        "obs": {
+            "datagen_info": {
+                "eef_pose": {"franka": random_poses(length)},
+                "object_pose": {"cube": random_poses(length)},
+                "target_eef_pose": {"franka": random_poses(length)},
+                "subtask_term_signals": {"grasp": (torch.arange(length) >= grasp_step).float()},
+            }
+        },
+    }
+    return episode
+
+
+class TestDataGenInfoPool(unittest.TestCase):
+    """Test the columnar storage of the datagen info pool."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        subtask_configs = [
+            SubTaskConfig(object_ref="cube", subtask_term_signal="grasp", subtask_term_offset_range=(0, 2)),
+            SubTaskConfig(object_ref="cube"),
+        ]
+        self.env = SimpleNamespace(
+            cfg=MimicEnvCfg(subtask_configs={"franka": subtask_configs}),
+            actions_to_gripper_actions=lambda actions: {"franka": actions[:, -1:]},
+        )
+        self.episodes = [create_episode(length, length // 2) for length in torch.randint(10, 30, (20,)).tolist()]
+
+    def test_load_from_dataset_file(self):
+        """Test that the episodes loaded from a dataset file match the episodes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "dataset.hdf5")
+            dataset_file_handler = HDF5DatasetFileHandler()
+            dataset_file_handler.create(file_path)
+            for episode in self.episodes:
+                dataset_file_handler.write_episode(episode)
+            dataset_file_handler.close()
+            # the episodes are loaded in the order of their names in the file
+            dataset_file_handler.open(file_path)
+            episode_names = list(dataset_file_handler.get_episode_names())
+            dataset_file_handler.close()
+
+            pool = DataGenInfoPool(self.env, self.env.cfg, "cpu", num_load_workers=4)
+            pool.load_from_dataset_file(file_path)
+
+        self.assertEqual(pool.num_datagen_infos, len(self.episodes))
+        self.assertEqual(pool.pose_index.num_src_demos, len(self.episodes))
+        self._check_pool(pool, [self.episodes[int(name.split("_")[-1])] for name in episode_names])
+
+    def test_add_episode(self):
+        """Test that episodes appended one at a time match the episodes."""
+        pool = DataGenInfoPool(self.env, self.env.cfg, "cpu", asyncio_lock=asyncio.Lock())
+        for i, episode in enumerate(self.episodes):
+            asyncio.run(pool.add_episode(episode))
+            # the pose index follows the episodes added to the pool
+            self.assertEqual(pool.pose_index.num_src_demos, i + 1)
+        self._check_pool(pool, self.episodes)
+
+    def test_add_episode_without_datagen_info(self):
+        """Test that episodes with positions and quaternions are converted to pose matrices."""
+        length = 12
+        eef_pos, object_pos = torch.randn(length, 3), torch.randn(length, 3)
+        eef_quat = PoseUtils.random_orientation(length, "cpu")
+        object_quat = PoseUtils.random_orientation(length, "cpu")
+        episode = EpisodeData()
+        episode.data = {
+            "actions": torch.randn(length, 7),
+            "obs": {
+                "eef_pos": eef_pos,
+                "eef_quat": eef_quat,
+                "object_pose": {"cube": {"root_pose": torch.cat([object_pos, object_quat, torch.randn(length, 6)], 1)}},
+                "target_eef_pose": random_poses(length),
+                "subtask_term_signals": {"grasp": (torch.arange(length) >= 5).float()},
+            },
+        }
+        pool = DataGenInfoPool(self.env, self.env.cfg, "cpu")
+        pool._add_episode(episode)
+
+        datagen_info = pool.datagen_infos[0]
+        torch.testing.assert_close(
+            datagen_info.eef_pose, PoseUtils.make_pose(eef_pos, PoseUtils.matrix_from_quat(eef_quat))
+        )
+        torch.testing.assert_close(
+            datagen_info.object_poses["cube"], PoseUtils.make_pose(object_pos, PoseUtils.matrix_from_quat(object_quat))
+        )
+        self.assertEqual(pool.subtask_indices, [[[0, 6], [6, length]]])
+
+    """
+    Helper functions.
+    """
+
+    def _check_pool(self, pool, episodes):
+        """Check the datagen infos, the subtask indices and the columns of the pool against the episodes."""
+        columns = pool.columns
+        for i, episode in enumerate(episodes):
+            datagen_info = episode.data["obs"]["datagen_info"]
+            length = len(episode.data["actions"])
+            pool_datagen_info = pool.datagen_infos[i]
+            torch.testing.assert_close(pool_datagen_info.eef_pose, datagen_info["eef_pose"]["franka"])
+            torch.testing.assert_close(pool_datagen_info.object_poses["cube"], datagen_info["object_pose"]["cube"])
+            torch.testing.assert_close(pool_datagen_info.target_eef_pose, datagen_info["target_eef_pose"]["franka"])
+            torch.testing.assert_close(pool_datagen_info.gripper_action, episode.data["actions"][:, -1:])
+            # the grasp signal switches at the middle of the episode
+            self.assertEqual(pool.subtask_indices[i], [[0, length // 2 + 1], [length // 2 + 1, length]])
+            # the episode is stored at its offset in the columns
+            start = int(pool.episode_starts[i])
+            self.assertEqual(int(pool.episode_lengths[i]), length)
+            torch.testing.assert_close(columns["eef_pose"][start : start + length], datagen_info["eef_pose"]["franka"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,8 @@ from isaaclab_mimic.datagen.datagen_info import DatagenInfo
 from isaaclab_mimic.datagen.selection_strategy import (
     NearestNeighborObjectStrategy,
     NearestNeighborRobotDistanceStrategy,
+    SourceDemoPoseIndex,
+    make_selection_strategy,
 )
 
 # Number of iterations to run the batched tests
@@ -293,5 +295,84 @@ class TestNearestNeighborRobotDistanceStrategy(unittest.TestCase):
         )
 
 
+def random_poses(num_poses):
+    """Generate random 4x4 pose matrices."""
+    rot = PoseUtils.matrix_from_quat(PoseUtils.random_orientation(num_poses, "cpu"))
+    return PoseUtils.make_pose(torch.randn(num_poses, 3), rot)
+
+
+class TestSelectionStrategy(unittest.TestCase):
+    """Test the batched selection strategies against the selection of each environment."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.num_envs = 16
+        self.num_src_demos = 40
+        self.datagen_infos, self.subtask_indices = [], []
+        for _ in range(self.num_src_demos):
+            length = int(torch.randint(20, 30, (1,)))
+            self.datagen_infos.append(
+                DatagenInfo(eef_pose=random_poses(length), object_poses={"cube": random_poses(length)})
+            )
+            self.subtask_indices.append([[0, 10], [10, length]])
+        self.eef_poses = random_poses(self.num_envs)
+        self.object_poses = random_poses(self.num_envs)
+
+    def test_nearest_neighbor_strategies(self):
+        """Test that the batched nearest neighbors match the nearest neighbor of each environment."""
+        pose_index = SourceDemoPoseIndex.from_datagen_infos(
+            self.datagen_infos, self.subtask_indices, ["cube", "cube"], "cpu"
+        )
+        # randomized start of the second subtask for each environment
+        src_subtask_start_inds = torch.randint(8, 13, (self.num_envs, self.num_src_demos))
+
+        for name in ["nearest_neighbor_object", "nearest_neighbor_robot_distance"]:
+            strategy = make_selection_strategy(name)
+            for subtask_ind, start_inds in [(0, None), (1, None), (1, src_subtask_start_inds)]:
+                with self.subTest(strategy=name, subtask_ind=subtask_ind, randomized=start_inds is not None):
+                    selected = strategy.select_source_demos(
+                        self.eef_poses,
+                        self.object_poses,
+                        pose_index,
+                        subtask_ind,
+                        src_subtask_start_inds=start_inds,
+                        rot_weight=0.5,
+                        nn_k=1,
+                    )
+                    for env_id in range(self.num_envs):
+                        src_subtask_datagen_infos = []
+                        for i, di in enumerate(self.datagen_infos):
+                            start = self.subtask_indices[i][subtask_ind][0]
+                            if start_inds is not None:
+                                start = int(start_inds[env_id, i])
+                            src_subtask_datagen_infos.append(
+                                DatagenInfo(
+                                    eef_pose=di.eef_pose[start:], object_poses={"cube": di.object_poses["cube"][start:]}
+                                )
+                            )
+                        expected = strategy.select_source_demo(
+                            self.eef_poses[env_id],
+                            self.object_poses[env_id],
+                            src_subtask_datagen_infos,
+                            rot_weight=0.5,
+                            nn_k=1,
+                        )
+                        self.assertEqual(int(selected[env_id]), int(expected))
+
+    def test_kdtree(self):
+        """Test that the KD-tree pre-selection returns the exact nearest neighbors with enough candidates."""
+        pose_index = SourceDemoPoseIndex.from_datagen_infos(
+            self.datagen_infos, self.subtask_indices, ["cube", "cube"], "cpu"
+        )
+        kdtree_pose_index = SourceDemoPoseIndex.from_datagen_infos(
+            self.datagen_infos, self.subtask_indices, ["cube", "cube"], "cpu", use_kdtree=True, kdtree_num_candidates=30
+        )
+        # without rotation, the KD-tree on positions is exact
+        for pose_type in ["object", "eef_in_object"]:
+            expected = pose_index.nearest_neighbors(0, self.object_poses, pose_type, rot_weight=0.0, nn_k=5)
+            neighbors = kdtree_pose_index.nearest_neighbors(0, self.object_poses, pose_type, rot_weight=0.0, nn_k=5)
+            torch.testing.assert_close(neighbors, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,133 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+import torch
+import unittest
+
+import isaaclab.utils.math as PoseUtils
+
+from isaaclab_mimic.datagen.waypoint import (
+    TensorWaypointTrajectory,
+    WaypointSequence,
+    WaypointTrajectory,
+    interpolate_poses,
+)
+
+
+def random_poses(num_poses):
+    """Generate random 4x4 pose matrices."""
+    rot = PoseUtils.matrix_from_quat(PoseUtils.random_orientation(num_poses, "cpu"))
+    return PoseUtils.make_pose(torch.randn(num_poses, 3), rot)
+
+
+class TestTensorWaypointTrajectory(unittest.TestCase):
+    """Test the TensorWaypointTrajectory class against the WaypointTrajectory class."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.eef_names = ["franka"]
+
+    def test_interpolate_poses(self):
+        """Test that the batched interpolation matches the interpolation of each pair of poses."""
+        start_poses = random_poses(16)
+        end_poses = random_poses(16)
+        # use a small rotation for one pair, which is not interpolated
+        end_poses[0, :3, :3] = start_poses[0, :3, :3]
+
+        for num_steps in [1, 5]:
+            batched_poses = interpolate_poses(start_poses, end_poses, num_steps)
+            self.assertEqual(batched_poses.shape, (16, num_steps + 2, 4, 4))
+            for i in range(16):
+                expected_poses, _ = PoseUtils.interpolate_poses(start_poses[i], end_poses[i], num_steps=num_steps)
+                torch.testing.assert_close(batched_poses[i], expected_poses, atol=1e-5, rtol=1e-5)
+
+    def test_from_poses_noise(self):
+        """Test that the action noise is resolved from its shape, including for as many trajectories as timesteps."""
+        num_trajectories = num_timesteps = 4
+        poses = random_poses(num_trajectories * num_timesteps).view(num_trajectories, num_timesteps, 4, 4)
+        gripper_actions = torch.randn(num_trajectories, num_timesteps, 1)
+        noise = torch.rand(num_trajectories, num_timesteps)
+        # the noise of each trajectory is constant over the trajectory
+        trajectory = TensorWaypointTrajectory.from_poses(self.eef_names, poses, gripper_actions, noise[:, :1])
+        torch.testing.assert_close(trajectory.noise, noise[:, :1].expand(-1, num_timesteps))
+        # the noise is given for each timestep of each trajectory
+        for action_noise in [noise, noise.unsqueeze(-1)]:
+            trajectory = TensorWaypointTrajectory.from_poses(self.eef_names, poses, gripper_actions, action_noise)
+            torch.testing.assert_close(trajectory.noise, noise)
+        # the noise is given for each timestep of a single trajectory
+        for action_noise in [noise[0], noise[0].unsqueeze(-1)]:
+            trajectory = TensorWaypointTrajectory.from_poses(self.eef_names, poses[0], gripper_actions[0], action_noise)
+            torch.testing.assert_close(trajectory.noise, noise[:1])
+        # the ambiguous shapes are rejected
+        with self.assertRaises(ValueError):
+            TensorWaypointTrajectory.from_poses(self.eef_names, poses, gripper_actions, noise[:, 0])
+
+    def test_merge(self):
+        """Test that merging batched trajectories matches merging each trajectory separately."""
+        segment_lengths = [3, 5, 4, 7, 1, 6]
+        num_trajectories = len(segment_lengths)
+        start_poses = random_poses(num_trajectories)
+        start_gripper_actions = torch.ones(num_trajectories, 1)
+        segment_poses = random_poses(num_trajectories * max(segment_lengths)).view(num_trajectories, -1, 4, 4)
+        segment_gripper_actions = torch.randn(num_trajectories, max(segment_lengths), 1)
+
+        for num_steps_interp, num_steps_fixed in [(5, 2), (5, 0), (0, 3), (0, 0)]:
+            with self.subTest(num_steps_interp=num_steps_interp, num_steps_fixed=num_steps_fixed):
+                # merge the trajectories one by one
+                expected_trajectories = []
+                for i, length in enumerate(segment_lengths):
+                    trajectory = WaypointTrajectory()
+                    trajectory.add_waypoint_sequence(
+                        WaypointSequence.from_poses(
+                            self.eef_names, start_poses[i : i + 1], start_gripper_actions[i : i + 1], 0.05
+                        )
+                    )
+                    other = WaypointTrajectory()
+                    other.add_waypoint_sequence(
+                        WaypointSequence.from_poses(
+                            self.eef_names, segment_poses[i, :length], segment_gripper_actions[i, :length], 0.03
+                        )
+                    )
+                    trajectory.merge(
+                        other,
+                        eef_names=self.eef_names,
+                        num_steps_interp=num_steps_interp,
+                        num_steps_fixed=num_steps_fixed,
+                        action_noise=0.01,
+                    )
+                    trajectory.pop_first()
+                    expected_trajectories.append(trajectory)
+                expected = TensorWaypointTrajectory.from_waypoint_trajectories(expected_trajectories)
+
+                # merge all trajectories at once
+                trajectory = TensorWaypointTrajectory.from_poses(
+                    self.eef_names, start_poses.unsqueeze(1), start_gripper_actions.unsqueeze(1), 0.05
+                )
+                other = TensorWaypointTrajectory.from_poses(
+                    self.eef_names,
+                    segment_poses,
+                    segment_gripper_actions,
+                    0.03,
+                    lengths=torch.tensor(segment_lengths),
+                )
+                trajectory = trajectory.merge(
+                    other, num_steps_interp=num_steps_interp, num_steps_fixed=num_steps_fixed, action_noise=0.01
+                ).pop_first()
+
+                torch.testing.assert_close(trajectory.lengths, expected.lengths)
+                for timestep in range(int(expected.lengths.max()) + 2):
+                    for data, expected_data in zip(
+                        trajectory.get_waypoints(timestep), expected.get_waypoints(timestep)
+                    ):
+                        torch.testing.assert_close(data, expected_data, atol=1e-5, rtol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -56,6 +56,12 @@ class RlGamesVecEnvWrapper(IVecEnv):
     to the same device as the learning agent. Additionally, it performs clipping of
     observations and actions.
 
+    When the simulation and the learning agent are on different devices, the step signals are copied
+    into preallocated buffers on the agent device on a dedicated CUDA stream. The copies are ordered
+    with the streams of both devices through a single CUDA event, so the host only blocks when the agent
+    runs on the CPU. Two sets of buffers are used in alternation, so the signals returned by a step
+    remain valid until the step after the next one.
+
     For algorithms like asymmetric actor-critic, RL-Games expects a dictionary for
     observations. This dictionary contains "obs" and "states" which typically correspond
     to the actor and critic observations respectively.
@@ -110,6 +116,15 @@ class RlGamesVecEnvWrapper(IVecEnv):
             self.rlg_num_states = 0
         else:
             self.rlg_num_states = self.state_space.shape[0]
+        # stream and buffers for transferring the signals between devices
+        sim_device, rl_device = torch.device(self._sim_device), torch.device(self._rl_device)
+        if sim_device != rl_device and "cuda" in (sim_device.type, rl_device.type):
+            self._transfer_stream = torch.cuda.Stream(device=sim_device if sim_device.type == "cuda" else rl_device)
+        else:
+            self._transfer_stream = None
+        self._transfer_buffers: dict[str, list[torch.Tensor]] = dict()
+        self._transfer_events: list[torch.cuda.Event | None] = [None, None]
+        self._transfer_slot = 0
 
     def __str__(self):
         """Returns the wrapper name and the :attr:`env` representation string."""
@@ -247,16 +262,32 @@ class RlGamesVecEnvWrapper(IVecEnv):
         # this is only needed for infinite horizon tasks
         # note: only useful when `value_bootstrap` is True in the agent configuration
         if not self.unwrapped.cfg.is_finite_horizon:
-            extras["time_outs"] = truncated.to(device=self._rl_device)
-        # process observations and states
-        obs_and_states = self._process_obs(obs_dict)
-        # move buffers to rl-device
-        # note: we perform clone to prevent issues when rl-device and sim-device are the same.
-        rew = rew.to(device=self._rl_device)
-        dones = (terminated | truncated).to(device=self._rl_device)
-        extras = {
-            k: v.to(device=self._rl_device, non_blocking=True) if hasattr(v, "to") else v for k, v in extras.items()
-        }
+            extras["time_outs"] = truncated
+        dones = terminated | truncated
+
+        if self._transfer_stream is not None:
+            # clip the observations and states on the sim-device
+            tensors = self._clip_obs_and_states(obs_dict)
+            tensors.update({"rew": rew, "dones": dones})
+            tensors.update({f"extras/{k}": v for k, v in extras.items() if isinstance(v, torch.Tensor)})
+            # move all buffers to the rl-device at once
+            tensors = self._transfer_to_rl_device(tensors)
+            if self.rlg_num_states > 0:
+                obs_and_states = {"obs": tensors["obs"], "states": tensors["states"]}
+            else:
+                obs_and_states = tensors["obs"]
+            rew, dones = tensors["rew"], tensors["dones"]
+            extras = {k: tensors.get(f"extras/{k}", v) for k, v in extras.items()}
+        else:
+            # process observations and states
+            obs_and_states = self._process_obs(obs_dict)
+            # move buffers to rl-device
+            # note: we perform clone to prevent issues when rl-device and sim-device are the same.
+            rew = rew.to(device=self._rl_device)
+            dones = dones.to(device=self._rl_device)
+            extras = {
+                k: v.to(device=self._rl_device, non_blocking=True) if hasattr(v, "to") else v for k, v in extras.items()
+            }
         # remap extras from "log" to "episode"
         if "log" in extras:
             extras["episode"] = extras.pop("log")
@@ -284,12 +315,28 @@ class RlGamesVecEnvWrapper(IVecEnv):
             If environment provides states, then a dictionary containing the observations and states is returned.
             Otherwise just the observations tensor is returned.
         """
+        obs_and_states = self._clip_obs_and_states(obs_dict)
+        # move the buffers to rl-device
+        obs_and_states = {k: v.to(device=self._rl_device).clone() for k, v in obs_and_states.items()}
+        # check if asymmetric actor-critic or not
+        if self.rlg_num_states > 0:
+            return obs_and_states
+        else:
+            return obs_and_states["obs"]
+
+    def _clip_obs_and_states(self, obs_dict: VecEnvObs) -> dict[str, torch.Tensor]:
+        """Clip the observations and states from the environment on the sim-device.
+
+        Args:
+            obs_dict: The current observations from environment.
+
+        Returns:
+            A dictionary containing the observations and, if the environment provides them, the states.
+        """
         # process policy obs
         obs = obs_dict["policy"]
         # clip the observations
-        obs = torch.clamp(obs, -self._clip_obs, self._clip_obs)
-        # move the buffer to rl-device
-        obs = obs.to(device=self._rl_device).clone()
+        obs_and_states = {"obs": torch.clamp(obs, -self._clip_obs, self._clip_obs)}
 
         # check if asymmetric actor-critic or not
         if self.rlg_num_states > 0:
@@ -299,13 +346,74 @@ class RlGamesVecEnvWrapper(IVecEnv):
             except AttributeError:
                 raise NotImplementedError("Environment does not define key 'critic' for privileged observations.")
             # clip the states
-            states = torch.clamp(states, -self._clip_obs, self._clip_obs)
-            # move buffers to rl-device
-            states = states.to(self._rl_device).clone()
-            # convert to dictionary
-            return {"obs": obs, "states": states}
+            obs_and_states["states"] = torch.clamp(states, -self._clip_obs, self._clip_obs)
+        return obs_and_states
+
+    def _transfer_to_rl_device(self, tensors: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        """Copy the tensors from the sim-device to preallocated buffers on the rl-device.
+
+        The copies are issued on the transfer stream. If the sim-device is the CPU, the tensors are first
+        staged in pinned memory. A single event orders the copies with the streams of both devices. The host
+        only waits for the event if the rl-device is the CPU.
+
+        Args:
+            tensors: The tensors on the sim-device.
+
+        Returns:
+            The tensors on the rl-device. They are overwritten by the step after the next one.
+        """
+        sim_device, rl_device = torch.device(self._sim_device), torch.device(self._rl_device)
+        # alternate between the two sets of buffers
+        slot = self._transfer_slot
+        self._transfer_slot = 1 - slot
+        # wait for the last transfer from the buffers of this slot to finish before they are overwritten
+        if self._transfer_events[slot] is not None:
+            self._transfer_events[slot].synchronize()
+        # stage the tensors in pinned memory if they are on the CPU
+        if sim_device.type != "cuda":
+            tensors = {
+                name: self._get_transfer_buffer(f"{name}/staging", tensor, sim_device, slot).copy_(tensor)
+                for name, tensor in tensors.items()
+            }
+        # wait for the data to be produced and for the buffers to be consumed
+        if sim_device.type == "cuda":
+            self._transfer_stream.wait_stream(torch.cuda.current_stream(sim_device))
+        if rl_device.type == "cuda":
+            self._transfer_stream.wait_stream(torch.cuda.current_stream(rl_device))
+        # copy the tensors on the transfer stream
+        outputs = dict()
+        with torch.cuda.stream(self._transfer_stream):
+            for name, tensor in tensors.items():
+                if tensor.is_cuda:
+                    tensor.record_stream(self._transfer_stream)
+                buffer = self._get_transfer_buffer(name, tensor, rl_device, slot)
+                outputs[name] = buffer.copy_(tensor, non_blocking=True)
+        event = torch.cuda.Event()
+        event.record(self._transfer_stream)
+        self._transfer_events[slot] = event
+        # order the copies with the streams of the devices
+        if sim_device.type == "cuda":
+            torch.cuda.current_stream(sim_device).wait_event(event)
+        if rl_device.type == "cuda":
+            torch.cuda.current_stream(rl_device).wait_event(event)
         else:
-            return obs
+            event.synchronize()
+        return outputs
+
+    def _get_transfer_buffer(self, name: str, tensor: torch.Tensor, device: torch.device, slot: int) -> torch.Tensor:
+        """Get the preallocated buffer of a tensor for the given slot.
+
+        The buffers are (re-)allocated when the shape or type of the tensor changes. Buffers on the CPU
+        are allocated in pinned memory.
+        """
+        buffers = self._transfer_buffers.get(name)
+        if buffers is None or buffers[0].shape != tensor.shape or buffers[0].dtype != tensor.dtype:
+            pin_memory = device.type != "cuda"
+            buffers = [
+                torch.empty(tensor.shape, dtype=tensor.dtype, device=device, pin_memory=pin_memory) for _ in range(2)
+            ]
+            self._transfer_buffers[name] = buffers
+        return buffers[slot]
 
 
 """
@@ -103,6 +103,17 @@ class Sb3VecEnvWrapper(VecEnv):
        to the one after reset. The "real" final observation is passed using the info dicts
        under the key ``terminal_observation``.
 
+    The wrapper can use a fast variant for converting the MDP signals (see :attr:`fast_variant`). All the signals
+    of a step are packed into a staging buffer on the simulation device and copied with a single non-blocking
+    transfer into one of two pinned host buffers, which are used in turns. The info dicts are created while the
+    transfer is running, and then completed from the host arrays without synchronizing with the device for each
+    sub-environment. The returned signals and info dicts have the same values as in the default variant.
+
+    .. note::
+        In the fast variant, the returned arrays are views of the pinned host buffers. They are overwritten two
+        steps later, which is after the stable-baselines3 algorithms have copied them into their buffers. Please
+        copy the arrays if they must be kept longer.
+
     .. warning::
 
         By the nature of physics stepping in Isaac Sim, it is not possible to forward the
@@ -123,11 +134,15 @@ class Sb3VecEnvWrapper(VecEnv):
 
     """
 
-    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv):
+    def __init__(self, env: ManagerBasedRLEnv | DirectRLEnv, fast_variant: bool = False):
         """Initialize the wrapper.
 
         Args:
             env: The environment to wrap around.
+            fast_variant: Whether to use the fast variant for converting the MDP signals. It returns the same
+                values as the default variant, but copies the signals to the host with a single transfer and fills
+                the info dicts without synchronizing with the device for each sub-environment. The returned arrays
+                are overwritten two steps later. Defaults to False.
 
         Raises:
             ValueError: When the environment is not an instance of :class:`ManagerBasedRLEnv` or :class:`DirectRLEnv`.
@@ -144,6 +159,7 @@ class Sb3VecEnvWrapper(VecEnv):
         self.num_envs = self.unwrapped.num_envs
         self.sim_device = self.unwrapped.device
         self.render_mode = self.unwrapped.render_mode
+        self.fast_variant = fast_variant
 
         # obtain gym spaces
         # note: stable-baselines3 does not like when we have unbounded action space so
@@ -158,6 +174,15 @@ class Sb3VecEnvWrapper(VecEnv):
         # add buffer for logging episodic information
         self._ep_rew_buf = torch.zeros(self.num_envs, device=self.sim_device)
         self._ep_len_buf = torch.zeros(self.num_envs, device=self.sim_device)
+        # staging buffers for the fast variant (created on the first transfer)
+        self._staging_layout = None
+        self._staging_buffer = None
+        self._staging_views = dict()
+        self._host_buffers = list()
+        self._host_views = list()
+        self._host_arrays = list()
+        self._host_index = 0
+        self._transfer_event = None
 
     def __str__(self):
         """Returns the wrapper name and the :attr:`env` representation string."""
@@ -229,6 +254,40 @@ class Sb3VecEnvWrapper(VecEnv):
         self._ep_len_buf += 1
         # compute reset ids
         dones = terminated | truncated
+
+        if self.fast_variant:
+            # copy all the signals to the host at once
+            # note: the episode buffers are copied before they are reset below
+            tensors = {
+                "rew": rew,
+                "terminated": terminated,
+                "truncated": truncated,
+                "dones": dones,
+                "ep_rew": self._ep_rew_buf,
+                "ep_len": self._ep_len_buf,
+            }
+            policy_obs = obs_dict["policy"]
+            if isinstance(policy_obs, dict):
+                tensors.update({f"obs/{key}": value for key, value in policy_obs.items()})
+            elif isinstance(policy_obs, torch.Tensor):
+                tensors["obs"] = policy_obs
+            else:
+                raise NotImplementedError(f"Unsupported data type: {type(policy_obs)}")
+            arrays = self._transfer_to_host(tensors)
+            if isinstance(policy_obs, dict):
+                obs = {key: arrays[f"obs/{key}"] for key in policy_obs}
+            else:
+                obs = arrays["obs"]
+            # convert extra information to list of dicts
+            # note: the info dicts are created while the signals are copied to the host
+            infos = self._process_extras_fast(obs, arrays, extras)
+
+            # reset info for terminated environments
+            self._ep_rew_buf.masked_fill_(dones, 0)
+            self._ep_len_buf.masked_fill_(dones, 0)
+
+            return obs, arrays["rew"], arrays["dones"], infos
+
         reset_ids = (dones > 0).nonzero(as_tuple=False)
 
         # convert data types to numpy depending on backend
@@ -346,3 +405,115 @@ class Sb3VecEnvWrapper(VecEnv):
                 infos[idx]["terminal_observation"] = None
         # return list of dictionaries
         return infos
+
+    def _process_extras_fast(
+        self, obs: np.ndarray | dict[str, np.ndarray], arrays: dict[str, np.ndarray], extras: dict
+    ) -> list[dict[str, Any]]:
+        """Convert miscellaneous information into dictionary for each sub-environment (fast variant).
+
+        The info dicts are the same as the ones of :meth:`_process_extras`. They are created from a template
+        while the signals are copied to the host (see :meth:`_transfer_to_host`). Once the copy is complete,
+        only the info dicts of the time-out and reset sub-environments are updated from the host arrays.
+        """
+        # create the info dicts with the default values
+        template = dict.fromkeys(extras.keys())
+        template["episode"] = None
+        template["TimeLimit.truncated"] = False
+        template["terminal_observation"] = None
+        infos: list[dict[str, Any]] = [template.copy() for _ in range(self.num_envs)]
+        # fill-in information from extras
+        for key, value in extras.items():
+            if key != "log":
+                for info, env_value in zip(infos, value.unbind(0) if isinstance(value, torch.Tensor) else value):
+                    info[key] = env_value
+        # wait for the signals to be copied to the host
+        self._wait_for_host_transfer()
+        # fill-in bootstrap information of the time-out sub-environments
+        for idx in np.flatnonzero(arrays["truncated"] & ~arrays["terminated"]).tolist():
+            infos[idx]["TimeLimit.truncated"] = True
+        # fill-in episode monitoring info and terminal observations of the reset sub-environments
+        reset_ids = np.flatnonzero(arrays["dones"]).tolist()
+        if len(reset_ids) == 0:
+            return infos
+        episode_rew = arrays["ep_rew"][reset_ids].tolist()
+        episode_len = arrays["ep_len"][reset_ids].tolist()
+        log = extras.get("log", {})
+        for i, idx in enumerate(reset_ids):
+            infos[idx]["episode"] = {"r": episode_rew[i], "l": episode_len[i], **log}
+            if isinstance(obs, dict):
+                infos[idx]["terminal_observation"] = {key: value[idx] for key, value in obs.items()}
+            else:
+                infos[idx]["terminal_observation"] = obs[idx]
+        return infos
+
+    def _transfer_to_host(self, tensors: dict[str, torch.Tensor]) -> dict[str, np.ndarray]:
+        """Start copying the tensors to NumPy arrays on the host with a single transfer.
+
+        The tensors are packed into a staging buffer on the simulation device, which is copied to one of two pinned
+        host buffers with a non-blocking transfer. The host buffers are used in turns, so that the arrays returned
+        at the previous step are not overwritten. If the simulation device is the CPU, the tensors are packed into
+        the host buffer directly.
+
+        The returned arrays must not be read before :meth:`_wait_for_host_transfer` is called.
+
+        Args:
+            tensors: The tensors to transfer.
+
+        Returns:
+            The NumPy arrays (views into the host buffer) for each tensor.
+        """
+        layout = tuple((name, tuple(tensor.shape), tensor.dtype) for name, tensor in tensors.items())
+        if layout != self._staging_layout:
+            self._create_staging_buffer(layout)
+        # use the other host buffer than at the previous step
+        self._host_index = 1 - self._host_index
+        if self._staging_buffer is None:
+            # pack the tensors into the host buffer
+            for name, tensor in tensors.items():
+                self._host_views[self._host_index][name].copy_(tensor)
+        else:
+            # pack the tensors into the device buffer
+            for name, tensor in tensors.items():
+                self._staging_views[name].copy_(tensor)
+            # copy the device buffer to the host
+            self._host_buffers[self._host_index].copy_(self._staging_buffer, non_blocking=True)
+            self._transfer_event.record()
+        return self._host_arrays[self._host_index]
+
+    def _wait_for_host_transfer(self):
+        """Wait until the transfer started by :meth:`_transfer_to_host` is complete."""
+        if self._transfer_event is not None:
+            self._transfer_event.synchronize()
+
+    def _create_staging_buffer(self, layout: tuple[tuple[str, tuple[int, ...], torch.dtype], ...]):
+        """Create the staging buffer on the simulation device and the host buffers for the given layout of tensors.
+
+        Each tensor occupies a contiguous and aligned slice of the byte buffers.
+        """
+        # compute the slices of the tensors in the buffer
+        slices = dict()
+        num_bytes = 0
+        for name, shape, dtype in layout:
+            size = int(np.prod(shape)) * torch.empty(0, dtype=dtype).element_size()
+            slices[name] = slice(num_bytes, num_bytes + size)
+            # align the next tensor to 16 bytes
+            num_bytes += (size + 15) // 16 * 16
+
+        def create_views(buffer: torch.Tensor) -> dict[str, torch.Tensor]:
+            return {name: buffer[slices[name]].view(dtype).view(shape) for name, shape, dtype in layout}
+
+        # create the device buffer, unless the simulation device is the CPU
+        if torch.device(self.sim_device).type == "cpu":
+            self._staging_buffer = None
+            self._staging_views = dict()
+            self._transfer_event = None
+        else:
+            self._staging_buffer = torch.empty(num_bytes, dtype=torch.uint8, device=self.sim_device)
+            self._staging_views = create_views(self._staging_buffer)
+            self._transfer_event = torch.cuda.Event()
+        # create the host buffers
+        pin_memory = self._staging_buffer is not None
+        self._host_buffers = [torch.empty(num_bytes, dtype=torch.uint8, pin_memory=pin_memory) for _ in range(2)]
+        self._host_views = [create_views(buffer) for buffer in self._host_buffers]
+        self._host_arrays = [{name: view.numpy() for name, view in views.items()} for views in self._host_views]
+        self._staging_layout = layout
@@ -108,6 +108,65 @@ class TestRlGamesVecEnvWrapper(unittest.TestCase):
                 print(f">>> Closing environment: {task_name}")
                 env.close()
 
+    @unittest.skipIf(not torch.cuda.is_available(), "The staged transfers require a CUDA device.")
+    def test_transfer_to_rl_device(self):
+        """Check that the staged transfers return the same values as a direct copy over consecutive steps."""
+        task_name = self.registered_tasks[0]
+        for sim_device, rl_device in [("cuda:0", "cpu"), ("cpu", "cuda:0")]:
+            with self.subTest(sim_device=sim_device, rl_device=rl_device):
+                print(f">>> Running test for environment: {task_name} ({sim_device} -> {rl_device})")
+                # create a new stage
+                omni.usd.get_context().new_stage()
+                # reset the rtx sensors carb setting to False
+                carb.settings.get_settings().set_bool("/isaaclab/render/rtx_sensors", False)
+                try:
+                    # parse configuration
+                    env_cfg = parse_env_cfg(task_name, device=sim_device, num_envs=self.num_envs)
+                    # create environment
+                    env = gym.make(task_name, cfg=env_cfg)
+                    # convert to single-agent instance if required by the RL algorithm
+                    if isinstance(env.unwrapped, DirectMARLEnv):
+                        env = multi_agent_to_single_agent(env)
+                    # wrap environment
+                    env = RlGamesVecEnvWrapper(env, rl_device, 100, 100)
+                except Exception as e:
+                    if "env" in locals() and hasattr(env, "_is_closed"):
+                        env.close()
+                    else:
+                        if hasattr(e, "obj") and hasattr(e.obj, "_is_closed"):
+                            e.obj.close()
+                    self.fail(f"Failed to set-up the environment for task {task_name}. Error: {e}")
+
+                # avoid shutdown of process on simulation stop
+                env.unwrapped.sim._app_control_on_stop_handle = None
+
+                # the signals are always staged when one of the devices is the CPU
+                self.assertIsNotNone(env._transfer_stream)
+                # buffers that are overwritten in-place at every step, as done by the environments
+                tensors = {
+                    "obs": torch.empty(self.num_envs, 32, device=sim_device),
+                    "rew": torch.empty(self.num_envs, device=sim_device),
+                    "dones": torch.empty(self.num_envs, dtype=torch.bool, device=sim_device),
+                }
+                # transfer the buffers over consecutive steps
+                outputs, expected_outputs = list(), list()
+                with torch.inference_mode():
+                    for _ in range(10):
+                        tensors["obs"].normal_()
+                        tensors["rew"].uniform_()
+                        tensors["dones"].copy_(torch.rand(self.num_envs, device=sim_device) < 0.5)
+                        outputs.append(env._transfer_to_rl_device(tensors))
+                        expected_outputs.append({name: tensor.to(rl_device) for name, tensor in tensors.items()})
+                        # check the outputs of this step and of the previous one, which are still in use
+                        for output, expected_output in zip(outputs[-2:], expected_outputs[-2:]):
+                            for name, expected_tensor in expected_output.items():
+                                self.assertEqual(output[name].device, expected_tensor.device)
+                                torch.testing.assert_close(output[name], expected_tensor, rtol=0.0, atol=0.0)
+
+                # close the environment
+                print(f">>> Closing environment: {task_name}")
+                env.close()
+
     """
     Helper functions.
     """
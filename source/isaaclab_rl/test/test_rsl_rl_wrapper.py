@@ -144,6 +144,45 @@ class TestRslRlVecEnvWrapper(unittest.TestCase):
                 print(f">>> Closing environment: {task_name}")
                 env.close()
 
+    def test_step_matches_actions(self):
+        """Check that each step returns the rewards and dones produced by the actions passed to it."""
+        for task_name in self.registered_tasks:
+            with self.subTest(task_name=task_name):
+                print(f">>> Running test for environment: {task_name}")
+                # create a new stage
+                omni.usd.get_context().new_stage()
+                # parse configuration
+                env_cfg = parse_env_cfg(task_name, device=self.device, num_envs=self.num_envs)
+
+                # create environment
+                env = gym.make(task_name, cfg=env_cfg)
+                # convert to single-agent instance if required by the RL algorithm
+                if isinstance(env.unwrapped, DirectMARLEnv):
+                    env = multi_agent_to_single_agent(env)
+                # wrap environment
+                env = RslRlVecEnvWrapper(env)
+
+                # simulate environment for 10 steps
+                with torch.inference_mode():
+                    for _ in range(10):
+                        # sample actions from -1 to 1
+                        actions = 2 * torch.rand(env.action_space.shape, device=env.unwrapped.device) - 1
+                        # apply actions
+                        obs, rew, dones, extras = env.step(actions)
+                        # check that the actions of this call were applied
+                        if hasattr(env.unwrapped, "action_manager"):
+                            torch.testing.assert_close(env.unwrapped.action_manager.action, actions)
+                        # check that the signals are the ones of the environment after this step
+                        # note: the multi-agent environments store the signals per agent
+                        if not isinstance(env.unwrapped, DirectMARLEnv):
+                            torch.testing.assert_close(rew, env.unwrapped.reward_buf)
+                            torch.testing.assert_close(dones, env.unwrapped.reset_buf.to(dtype=torch.long))
+                        torch.testing.assert_close(obs, extras["observations"]["policy"])
+
+                # close the environment
+                print(f">>> Closing environment: {task_name}")
+                env.close()
+
     """
     Helper functions.
     """
@@ -30,6 +30,31 @@ import isaaclab_tasks  # noqa: F401
 from isaaclab_tasks.utils.parse_cfg import parse_env_cfg
 
 
+class _ReplayStepWrapper(gym.Wrapper):
+    """Wrapper that returns a copy of a given transition instead of stepping the environment.
+
+    This allows processing the same transition with several SB3 wrappers.
+    """
+
+    def __init__(self, env: gym.Env):
+        super().__init__(env)
+        self.transition = None
+
+    def step(self, action):
+        return _clone(self.transition)
+
+
+def _clone(data):
+    """Clones the tensors of the nested data."""
+    if isinstance(data, torch.Tensor):
+        return data.clone()
+    elif isinstance(data, dict):
+        return {key: _clone(value) for key, value in data.items()}
+    elif isinstance(data, (list, tuple)):
+        return type(data)(_clone(value) for value in data)
+    return data
+
+
 class TestStableBaselines3VecEnvWrapper(unittest.TestCase):
     """Test that SB3 VecEnv wrapper works as expected."""
 
@@ -106,10 +131,87 @@ class TestStableBaselines3VecEnvWrapper(unittest.TestCase):
                 print(f">>> Closing environment: {task_name}")
                 env.close()
 
+    def test_fast_variant(self):
+        """Check that the fast variant returns the same signals and info dicts as the default variant."""
+        for task_name in self.registered_tasks:
+            with self.subTest(task_name=task_name):
+                print(f">>> Running test for environment: {task_name}")
+                # create a new stage
+                omni.usd.get_context().new_stage()
+                # reset the rtx sensors carb setting to False
+                carb.settings.get_settings().set_bool("/isaaclab/render/rtx_sensors", False)
+                try:
+                    # parse configuration
+                    env_cfg = parse_env_cfg(task_name, device=self.device, num_envs=self.num_envs)
+                    # create environment
+                    env = gym.make(task_name, cfg=env_cfg)
+                    # convert to single-agent instance if required by the RL algorithm
+                    if isinstance(env.unwrapped, DirectMARLEnv):
+                        env = multi_agent_to_single_agent(env)
+                    # wrap environment twice to process the same transitions
+                    replay_env = _ReplayStepWrapper(env)
+                    fast_env = Sb3VecEnvWrapper(replay_env, fast_variant=True)
+                    default_env = Sb3VecEnvWrapper(replay_env)
+                except Exception as e:
+                    if "env" in locals() and hasattr(env, "_is_closed"):
+                        env.close()
+                    else:
+                        if hasattr(e, "obj") and hasattr(e.obj, "_is_closed"):
+                            e.obj.close()
+                    self.fail(f"Failed to set-up the environment for task {task_name}. Error: {e}")
+
+                # reset environment
+                fast_env.reset()
+
+                # simulate environment for 100 steps
+                previous_transitions = None
+                with torch.inference_mode():
+                    for _ in range(100):
+                        # sample actions from -1 to 1
+                        actions = 2 * np.random.rand(fast_env.num_envs, *fast_env.action_space.shape) - 1
+                        # step the environment once and process the transition with both variants
+                        replay_env.transition = env.step(torch.tensor(actions, device=self.device, dtype=torch.float32))
+                        fast_transition = fast_env.step(actions)
+                        default_transition = default_env.step(actions)
+                        # check signals
+                        for fast_data, default_data in zip(fast_transition, default_transition):
+                            self._assert_equal(fast_data, default_data)
+                        # the signals of the previous step are not overwritten by this step
+                        if previous_transitions is not None:
+                            for fast_data, default_data in zip(*previous_transitions):
+                                self._assert_equal(fast_data, default_data)
+                        previous_transitions = (fast_transition, default_transition)
+
+                # close the environment
+                print(f">>> Closing environment: {task_name}")
+                env.close()
+
     """
     Helper functions.
     """
 
+    def _assert_equal(self, data: np.ndarray | torch.Tensor | dict | list | None, expected):
+        """Checks that the given nested data are equal."""
+        if isinstance(data, np.ndarray):
+            self.assertIsInstance(expected, np.ndarray)
+            self.assertEqual(data.dtype, expected.dtype)
+            np.testing.assert_array_equal(data, expected)
+        elif isinstance(data, torch.Tensor):
+            self.assertIsInstance(expected, torch.Tensor)
+            torch.testing.assert_close(data, expected, rtol=0.0, atol=0.0)
+        elif isinstance(data, dict):
+            self.assertIsInstance(expected, dict)
+            self.assertEqual(data.keys(), expected.keys())
+            for key, value in data.items():
+                self._assert_equal(value, expected[key])
+        elif isinstance(data, list):
+            self.assertIsInstance(expected, list)
+            self.assertEqual(len(data), len(expected))
+            for value, expected_value in zip(data, expected):
+                self._assert_equal(value, expected_value)
+        else:
+            self.assertEqual(data, expected)
+
     @staticmethod
     def _check_valid_array(data: np.ndarray | dict | list) -> bool:
         """Checks if given data does not have corrupted values.
@@ -22,9 +22,10 @@ __version__ = ISAACLAB_TASKS_METADATA["package"]["version"]
 # Register Gym environments.
 ##
 
-from .utils import import_packages
+from .utils import register_task_packages
 
 # The blacklist is used to prevent importing configs from sub-packages
 _BLACKLIST_PKGS = ["utils", ".mdp"]
-# Import all configs in this package
-import_packages(__name__, _BLACKLIST_PKGS)
+# Register all tasks in this package
+# note: the sub-packages are not imported. The tasks are registered from a manifest with string entry points.
+register_task_packages(__name__, _BLACKLIST_PKGS)
@@ -25,7 +25,7 @@ if TYPE_CHECKING:
 
 def terrain_levels_vel(
     env: ManagerBasedRLEnv, env_ids: Sequence[int], asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
-) -> torch.Tensor:
+) -> dict[str, torch.Tensor]:
     """Curriculum based on the distance the robot walked when commanded to move at a desired velocity.
 
     This term is used to increase the difficulty of the terrain when the robot walks far enough and decrease the
@@ -36,7 +36,8 @@ def terrain_levels_vel(
         on different terrain types, check the :class:`isaaclab.terrains.TerrainImporter` class.
 
     Returns:
-        The mean terrain level for the given environment ids.
+        The statistics of the terrain curriculum (see :meth:`isaaclab.terrains.TerrainCurriculum.get_stats`): the
+        mean terrain level over all the environments and the number of promotions and demotions at this update.
     """
     # extract the used quantities (to enable type-hinting)
     asset: Articulation = env.scene[asset_cfg.name]
@@ -51,5 +52,5 @@ def terrain_levels_vel(
     move_down *= ~move_up
     # update terrain levels
     terrain.update_env_origins(env_ids, move_up, move_down)
-    # return the mean terrain level
-    return torch.mean(terrain.terrain_levels.float())
+    # return the statistics of the curriculum
+    return terrain.curriculum.get_stats()
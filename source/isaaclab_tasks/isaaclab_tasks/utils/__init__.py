@@ -7,3 +7,4 @@
 
 from .importer import import_packages
 from .parse_cfg import get_checkpoint_path, load_cfg_from_registry, parse_env_cfg
+from .registry import load_task_manifest, register_task_packages
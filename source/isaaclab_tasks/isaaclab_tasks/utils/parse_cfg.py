@@ -14,6 +14,7 @@ import re
 import yaml
 
 from isaaclab.envs import DirectRLEnvCfg, ManagerBasedRLEnvCfg
+from isaaclab.utils.configclass import deferred_copy
 
 
 def load_cfg_from_registry(task_name: str, entry_point_key: str) -> dict | object:
@@ -90,7 +91,9 @@ def load_cfg_from_registry(task_name: str, entry_point_key: str) -> dict | objec
         # load the configuration
         print(f"[INFO]: Parsing configuration from: {cfg_entry_point}")
         if callable(cfg_cls):
-            cfg = cfg_cls()
+            # note: the members of the configuration are copied once instead of once per parent configuration
+            with deferred_copy():
+                cfg = cfg_cls()
         else:
             cfg = cfg_cls
     return cfg
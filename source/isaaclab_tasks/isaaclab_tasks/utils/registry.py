@@ -0,0 +1,419 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module with utilities for registering the tasks of a package without importing its sub-packages.
+
+Importing all the sub-packages of a task package only to execute their :func:`gymnasium.register` calls is slow,
+since the sub-packages usually import the environment and configuration modules. Instead, the functions in this
+module parse the ``__init__.py`` files of the sub-packages and statically resolve the arguments of their
+:func:`gymnasium.register` calls into a manifest. The entry points of the manifest are strings of the form
+``"module:attribute"``, so the environment and configuration modules are only imported for the task that is
+created (see :func:`~isaaclab_tasks.utils.parse_cfg.load_cfg_from_registry`).
+
+The manifest is cached in a JSON file. The cache is keyed on the paths, sizes and modification times of the
+``__init__.py`` files of the package, so it is rebuilt whenever a file changes.
+
+Sub-packages whose registrations cannot be resolved statically (for example, because they are computed in a
+loop or use names that are not imported from the package) are imported as before.
+
+When a sub-package whose tasks are registered from the manifest is imported later (for example, because it contains
+the configuration module of the created task), its :func:`gymnasium.register` calls register the same tasks again.
+To avoid the warnings of :mod:`gymnasium` about overridden tasks, the tasks of the sub-package are removed from the
+registry right before it is executed. If the execution of the sub-package fails, the removed tasks are registered
+back.
+"""
+
+from __future__ import annotations
+
+import ast
+import gymnasium as gym
+import hashlib
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import json
+import os
+import sys
+
+TASK_MANIFEST_VERSION = 2
+"""Version of the format of the task manifest. Cached manifests with another version are rebuilt."""
+
+
+def register_task_packages(
+    package_name: str, blacklist_pkgs: list[str] | None = None, cache_dir: str | None = "/tmp/isaaclab/tasks"
+):
+    """Register the tasks of all the sub-packages in a package from its task manifest.
+
+    This function is a faster replacement of :func:`~isaaclab_tasks.utils.importer.import_packages` for packages
+    whose sub-packages only register tasks in their ``__init__.py`` files.
+
+    Args:
+        package_name: The package name.
+        blacklist_pkgs: The list of blacklisted packages to skip. Defaults to None,
+            which means no packages are blacklisted.
+        cache_dir: The directory where the task manifest is cached. Defaults to "/tmp/isaaclab/tasks".
+            If None, the manifest is not cached.
+    """
+    manifest = load_task_manifest(package_name, blacklist_pkgs, cache_dir)
+    # register the tasks
+    task_specs = dict()
+    for task in manifest["tasks"]:
+        if task["id"] not in gym.registry:
+            gym.register(**task)
+            task_specs[task["id"]] = gym.registry[task["id"]]
+    # unregister the tasks of a sub-package right before it is imported, since it registers them again
+    task_modules = {
+        module_name: {task_id: task_specs[task_id] for task_id in task_ids if task_id in task_specs}
+        for module_name, task_ids in manifest["task_modules"].items()
+    }
+    sys.meta_path.insert(0, _TaskModuleFinder(task_modules))
+    # import the sub-packages whose registrations could not be resolved
+    for module_name in manifest["modules"]:
+        importlib.import_module(module_name)
+
+
+def load_task_manifest(
+    package_name: str, blacklist_pkgs: list[str] | None = None, cache_dir: str | None = "/tmp/isaaclab/tasks"
+) -> dict:
+    """Load the task manifest of a package from the cache or build it if the cache is outdated.
+
+    Args:
+        package_name: The package name.
+        blacklist_pkgs: The list of blacklisted packages to skip. Defaults to None,
+            which means no packages are blacklisted.
+        cache_dir: The directory where the task manifest is cached. Defaults to "/tmp/isaaclab/tasks".
+            If None, the manifest is not cached.
+
+    Returns:
+        The task manifest. It contains the keyword arguments of the :func:`gymnasium.register` calls under the key
+        ``"tasks"``, the identifiers of the tasks of each sub-package under the key ``"task_modules"`` and the
+        names of the sub-packages that must be imported under the key ``"modules"``.
+    """
+    if blacklist_pkgs is None:
+        blacklist_pkgs = []
+    package_dir = os.path.dirname(importlib.util.find_spec(package_name).origin)
+    init_files = _find_init_files(package_name, package_dir, blacklist_pkgs)
+    # compute the key of the manifest from the state of the files
+    key_data = [TASK_MANIFEST_VERSION, package_dir, sorted(blacklist_pkgs)]
+    for module_name, file_path in init_files:
+        stat = os.stat(file_path)
+        key_data.append([module_name, stat.st_size, stat.st_mtime_ns])
+    key = hashlib.md5(json.dumps(key_data).encode()).hexdigest()
+    # load the cached manifest
+    cache_file = None
+    if cache_dir is not None:
+        path_hash = hashlib.md5(package_dir.encode()).hexdigest()[:8]
+        cache_file = os.path.join(cache_dir, f"{package_name}_{path_hash}.json")
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("key") == key:
+                return manifest
+        except (OSError, ValueError):
+            pass
+    # build the manifest
+    manifest = build_task_manifest(package_name, package_dir, init_files)
+    manifest["key"] = key
+    # cache the manifest
+    # note: the manifest is written to a temporary file first so that concurrent processes never read partial files
+    if cache_file is not None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            pass
+    return manifest
+
+
+def build_task_manifest(package_name: str, package_dir: str, init_files: list[tuple[str, str]]) -> dict:
+    """Build the task manifest of a package by parsing the ``__init__.py`` files of its sub-packages.
+
+    Args:
+        package_name: The package name.
+        package_dir: The directory of the package.
+        init_files: The module names and paths of the ``__init__.py`` files to parse.
+
+    Returns:
+        The task manifest. See :func:`load_task_manifest` for its content.
+    """
+    manifest = {"tasks": [], "task_modules": {}, "modules": []}
+    for module_name, file_path in init_files:
+        with open(file_path, encoding="utf-8") as f:
+            source = f.read()
+        # skip the files without registrations
+        if "register" not in source:
+            continue
+        try:
+            tasks = _parse_registrations(ast.parse(source), module_name, package_name, package_dir)
+        except _UnresolvedError:
+            manifest["modules"].append(module_name)
+        else:
+            manifest["tasks"] += tasks
+            manifest["task_modules"][module_name] = [task["id"] for task in tasks]
+    return manifest
+
+
+"""
+Helper functions.
+"""
+
+
+class _UnresolvedError(Exception):
+    """Raised when a registration cannot be resolved statically."""
+
+
+class _TaskModuleFinder(importlib.abc.MetaPathFinder):
+    """Import finder that unregisters the tasks of a sub-package right before the sub-package is executed.
+
+    The finder finds the sub-packages whose tasks were registered from the manifest with the other finders, and wraps
+    their loaders in :class:`_TaskModuleLoader`.
+    """
+
+    def __init__(self, task_modules: dict[str, dict[str, gym.envs.registration.EnvSpec]]):
+        self._task_modules = task_modules
+
+    def find_spec(self, fullname: str, path, target=None) -> importlib.machinery.ModuleSpec | None:
+        task_specs = self._task_modules.pop(fullname, None)
+        # remove the finder once all the sub-packages are imported
+        if not self._task_modules and self in sys.meta_path:
+            sys.meta_path.remove(self)
+        if task_specs is None:
+            return None
+        # find the sub-package with the other finders
+        spec = None
+        for finder in sys.meta_path:
+            if finder is not self and hasattr(finder, "find_spec"):
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        if spec is None or spec.loader is None:
+            return spec
+        spec.loader = _TaskModuleLoader(spec.loader, task_specs, self)
+        return spec
+
+    def restore(self, fullname: str, task_specs: dict[str, gym.envs.registration.EnvSpec]):
+        """Restore the tasks of a sub-package whose execution failed.
+
+        The tasks are then removed again at the next import of the sub-package.
+        """
+        self._task_modules[fullname] = task_specs
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+
+class _TaskModuleLoader(importlib.abc.Loader):
+    """Loader that unregisters the tasks of a sub-package while the sub-package is executed.
+
+    The tasks are removed from the registry, unless they were overridden in the meantime, right before the
+    sub-package is executed. If the execution fails, the tasks that were not registered again are restored.
+    """
+
+    def __init__(
+        self,
+        loader: importlib.abc.Loader,
+        task_specs: dict[str, gym.envs.registration.EnvSpec],
+        finder: _TaskModuleFinder,
+    ):
+        self._loader = loader
+        self._task_specs = task_specs
+        self._finder = finder
+
+    def __getattr__(self, name: str):
+        # forward the other methods (for example, the resource readers) to the wrapped loader
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        removed_specs = dict()
+        for task_id, task_spec in self._task_specs.items():
+            if gym.registry.get(task_id) is task_spec:
+                removed_specs[task_id] = gym.registry.pop(task_id)
+        try:
+            self._loader.exec_module(module)
+        except BaseException:
+            for task_id, task_spec in removed_specs.items():
+                gym.registry.setdefault(task_id, task_spec)
+            self._finder.restore(module.__name__, self._task_specs)
+            raise
+
+
+def _find_init_files(package_name: str, package_dir: str, blacklist_pkgs: list[str]) -> list[tuple[str, str]]:
+    """Find the ``__init__.py`` files of all the sub-packages of a package.
+
+    The sub-packages are skipped in the same way as in :func:`~isaaclab_tasks.utils.importer.import_packages`.
+    """
+    init_files = []
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        rel_path = os.path.relpath(root, package_dir)
+        if rel_path == ".":
+            # the package itself is not a sub-package
+            continue
+        module_name = ".".join([package_name] + rel_path.split(os.sep))
+        if "__init__.py" not in files or any(black_pkg_name in module_name for black_pkg_name in blacklist_pkgs):
+            # do not descend into the blacklisted packages and namespace directories
+            dirs.clear()
+            continue
+        init_files.append((module_name, os.path.join(root, "__init__.py")))
+    return init_files
+
+
+def _parse_registrations(tree: ast.Module, module_name: str, package_name: str, package_dir: str) -> list[dict]:
+    """Resolve the arguments of the :func:`gymnasium.register` calls of an ``__init__.py`` file.
+
+    Raises:
+        _UnresolvedError: If a registration cannot be resolved.
+    """
+    # resolve the names bound by the imports of the module
+    names = dict()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname is not None:
+                    names[alias.asname] = ("module", alias.name)
+                else:
+                    names[alias.name.split(".")[0]] = ("module", alias.name.split(".")[0])
+        elif isinstance(node, ast.ImportFrom):
+            # note: the module is a package, so a relative import of level 1 refers to the module itself
+            base = module_name.rsplit(".", node.level - 1)[0] if node.level > 0 else ""
+            from_module = ".".join(part for part in [base, node.module] if part)
+            for alias in node.names:
+                if node.module is None:
+                    names[alias.asname or alias.name] = ("module", f"{from_module}.{alias.name}")
+                else:
+                    names[alias.asname or alias.name] = ("attribute", from_module, alias.name)
+    # collect the registrations at the top-level of the module
+    register_calls = [
+        node.value for node in tree.body if isinstance(node, ast.Expr) and _is_register_call(node.value, names)
+    ]
+    num_calls = sum(1 for node in ast.walk(tree) if isinstance(node, ast.Call) and _is_register_call(node, names))
+    if num_calls != len(register_calls):
+        raise _UnresolvedError
+    # evaluate the arguments
+    evaluator = _Evaluator(module_name, names, package_name, package_dir)
+    # resolve the constants assigned at the top-level of the module, for example, common entry points
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                evaluator.constants[node.targets[0].id] = evaluator.evaluate(node.value)
+            except _UnresolvedError:
+                evaluator.constants.pop(node.targets[0].id, None)
+    tasks = []
+    for call in register_calls:
+        if call.args or any(keyword.arg is None for keyword in call.keywords):
+            raise _UnresolvedError
+        tasks.append({keyword.arg: evaluator.evaluate(keyword.value) for keyword in call.keywords})
+    return tasks
+
+
+def _is_register_call(node: ast.AST, names: dict) -> bool:
+    """Check whether the node is a call of :func:`gymnasium.register`."""
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        return func.attr == "register" and names.get(func.value.id) == ("module", "gymnasium")
+    if isinstance(func, ast.Name):
+        return names.get(func.id) == ("attribute", "gymnasium", "register")
+    return False
+
+
+class _Evaluator:
+    """Static evaluator of the arguments of the registrations.
+
+    It supports literals, containers, f-strings, constants of the module, the ``__name__`` of the module and of
+    the imported modules, the ``__path__`` of the imported sub-packages, ``os.path.join`` and the imported classes,
+    which are converted to string entry points.
+    """
+
+    def __init__(self, module_name: str, names: dict, package_name: str, package_dir: str):
+        self.module_name = module_name
+        self.names = names
+        self.package_name = package_name
+        self.package_dir = package_dir
+        self.constants = dict()
+
+    def evaluate(self, node: ast.AST):
+        """Evaluate the node.
+
+        Raises:
+            _UnresolvedError: If the node cannot be resolved.
+        """
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Dict):
+            if any(key is None for key in node.keys):
+                raise _UnresolvedError
+            return {self.evaluate(key): self.evaluate(value) for key, value in zip(node.keys, node.values)}
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return [self.evaluate(element) for element in node.elts]
+        if isinstance(node, ast.JoinedStr):
+            parts = []
+            for value in node.values:
+                if isinstance(value, ast.FormattedValue):
+                    if value.conversion != -1 or value.format_spec is not None:
+                        raise _UnresolvedError
+                    value = self.evaluate(value.value)
+                    if not isinstance(value, str):
+                        raise _UnresolvedError
+                    parts.append(value)
+                else:
+                    parts.append(self.evaluate(value))
+            return "".join(parts)
+        if isinstance(node, ast.Name):
+            if node.id == "__name__":
+                return self.module_name
+            if node.id in self.constants:
+                return self.constants[node.id]
+            # imported classes and functions are converted to entry points
+            binding = self.names.get(node.id)
+            if binding is not None and binding[0] == "attribute":
+                return f"{binding[1]}:{binding[2]}"
+            raise _UnresolvedError
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            binding = self.names.get(node.value.id)
+            if binding is None or binding[0] != "module":
+                raise _UnresolvedError
+            if node.attr == "__name__":
+                return binding[1]
+            if node.attr.startswith("__") or not binding[1].startswith(self.package_name + "."):
+                raise _UnresolvedError
+            # attributes of the modules of the package are converted to entry points
+            return f"{binding[1]}:{node.attr}"
+        if isinstance(node, ast.Subscript):
+            # the path of an imported sub-package: "module.__path__[0]"
+            value, index = node.value, node.slice
+            if (
+                isinstance(value, ast.Attribute)
+                and value.attr == "__path__"
+                and isinstance(value.value, ast.Name)
+                and isinstance(index, ast.Constant)
+                and index.value == 0
+            ):
+                binding = self.names.get(value.value.id)
+                if binding is not None and binding[0] == "module" and binding[1].startswith(self.package_name + "."):
+                    return os.path.join(self.package_dir, *binding[1].split(".")[1:])
+            raise _UnresolvedError
+        if isinstance(node, ast.Call):
+            # path joins: "os.path.join(...)"
+            func = node.func
+            if (
+                isinstance(func, ast.Attribute)
+                and func.attr == "join"
+                and isinstance(func.value, ast.Attribute)
+                and func.value.attr == "path"
+                and isinstance(func.value.value, ast.Name)
+                and self.names.get(func.value.value.id) == ("module", "os")
+                and not node.keywords
+            ):
+                return os.path.join(*[self.evaluate(arg) for arg in node.args])
+            raise _UnresolvedError
+        raise _UnresolvedError
@@ -0,0 +1,187 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+import warnings
+
+import isaaclab_tasks  # noqa: F401
+from isaaclab_tasks.utils.registry import load_task_manifest, register_task_packages
+
+# registrations of a task package with string entry points, imported classes and constants
+TASK_INIT = """
+import gymnasium as gym
+import os
+
+from . import agents
+from .env_cfg import TaskEnvCfg
+
+ENTRY_POINT = "isaaclab.envs:ManagerBasedRLEnv"
+
+gym.register(
+    id="Test-Registry-{name}-v0",
+    entry_point=ENTRY_POINT,
+    disable_env_checker=True,
+    kwargs={{
+        "env_cfg_entry_point": TaskEnvCfg,
+        "rsl_rl_cfg_entry_point": f"{{agents.__name__}}.rsl_rl_ppo_cfg:PPORunnerCfg",
+        "robomimic_bc_cfg_entry_point": os.path.join(agents.__path__[0], "bc.json"),
+    }},
+)
+"""
+
+# registrations that cannot be resolved statically
+DYNAMIC_TASK_INIT = """
+import gymnasium as gym
+
+for i in range(2):
+    gym.register(id=f"Test-Registry-Dynamic-{i}-v0", entry_point="isaaclab.envs:ManagerBasedRLEnv")
+"""
+
+
+class TestTaskRegistry(unittest.TestCase):
+    """Test the registration of tasks from the task manifest."""
+
+    def setUp(self):
+        # create a task package with two static sub-packages and a dynamic one
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.package_dir = os.path.join(self.temp_dir.name, "registry_test_tasks")
+        for name in ["Alpha", "Beta"]:
+            self._write_file(os.path.join(name.lower(), "__init__.py"), TASK_INIT.format(name=name))
+            self._write_file(os.path.join(name.lower(), "env_cfg.py"), "raise ImportError")
+            self._write_file(os.path.join(name.lower(), "agents", "__init__.py"), "")
+        self._write_file(os.path.join("dynamic", "__init__.py"), DYNAMIC_TASK_INIT)
+        self._write_file(os.path.join("alpha", "mdp", "__init__.py"), "raise ImportError")
+        self._write_file("__init__.py", "")
+        sys.path.insert(0, self.temp_dir.name)
+
+    def tearDown(self):
+        sys.path.remove(self.temp_dir.name)
+        for name in list(sys.modules):
+            if name.startswith("registry_test_tasks"):
+                del sys.modules[name]
+        for task_id in list(gym.registry):
+            if task_id.startswith("Test-Registry-"):
+                del gym.registry[task_id]
+        self.temp_dir.cleanup()
+
+    def test_manifest(self):
+        """Test that the registrations are resolved without importing the sub-packages."""
+        manifest = load_task_manifest("registry_test_tasks", [".mdp"], self.cache_dir)
+
+        self.assertEqual(manifest["modules"], ["registry_test_tasks.dynamic"])
+        self.assertEqual(
+            [task["id"] for task in manifest["tasks"]], ["Test-Registry-Alpha-v0", "Test-Registry-Beta-v0"]
+        )
+        task = manifest["tasks"][0]
+        self.assertEqual(task["entry_point"], "isaaclab.envs:ManagerBasedRLEnv")
+        self.assertTrue(task["disable_env_checker"])
+        self.assertEqual(
+            task["kwargs"],
+            {
+                "env_cfg_entry_point": "registry_test_tasks.alpha.env_cfg:TaskEnvCfg",
+                "rsl_rl_cfg_entry_point": "registry_test_tasks.alpha.agents.rsl_rl_ppo_cfg:PPORunnerCfg",
+                "robomimic_bc_cfg_entry_point": os.path.join(self.package_dir, "alpha", "agents", "bc.json"),
+            },
+        )
+        # the environment configuration module is not imported
+        self.assertNotIn("registry_test_tasks.alpha", sys.modules)
+
+    def test_register_task_packages(self):
+        """Test that the static and dynamic registrations are added to the gym registry."""
+        register_task_packages("registry_test_tasks", [".mdp"], self.cache_dir)
+
+        for task_id in ["Test-Registry-Alpha-v0", "Test-Registry-Beta-v0", "Test-Registry-Dynamic-1-v0"]:
+            self.assertIn(task_id, gym.registry)
+        self.assertIn("registry_test_tasks.dynamic", sys.modules)
+        self.assertNotIn("registry_test_tasks.beta", sys.modules)
+
+    def test_import_registered_task_package(self):
+        """Test that importing a sub-package whose tasks are registered from the manifest does not override them."""
+        self._write_file(os.path.join("alpha", "env_cfg.py"), "class TaskEnvCfg:\n    pass\n")
+        register_task_packages("registry_test_tasks", [".mdp"], self.cache_dir)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            env_cfg_module = importlib.import_module("registry_test_tasks.alpha.env_cfg")
+        self.assertIs(gym.spec("Test-Registry-Alpha-v0").kwargs["env_cfg_entry_point"], env_cfg_module.TaskEnvCfg)
+
+    def test_failed_import_of_registered_task_package(self):
+        """Test that the tasks of a sub-package remain registered when the import of the sub-package fails."""
+        register_task_packages("registry_test_tasks", [".mdp"], self.cache_dir)
+        task_spec = gym.spec("Test-Registry-Beta-v0")
+
+        # the environment configuration module raises an import error
+        with self.assertRaises(ImportError):
+            importlib.import_module("registry_test_tasks.beta.env_cfg")
+        self.assertIs(gym.spec("Test-Registry-Beta-v0"), task_spec)
+
+        # the tasks are still not overridden once the import succeeds
+        self._write_file(os.path.join("beta", "env_cfg.py"), "class TaskEnvCfg:\n    pass\n")
+        importlib.invalidate_caches()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            env_cfg_module = importlib.import_module("registry_test_tasks.beta.env_cfg")
+        self.assertIs(gym.spec("Test-Registry-Beta-v0").kwargs["env_cfg_entry_point"], env_cfg_module.TaskEnvCfg)
+
+    def test_manifest_cache(self):
+        """Test that the cached manifest is reused until an ``__init__.py`` file changes."""
+        manifest = load_task_manifest("registry_test_tasks", [".mdp"], self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        # modify the cached manifest to check that it is loaded
+        cache_file = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(cache_file, encoding="utf-8") as f:
+            content = f.read()
+        with open(cache_file, "w", encoding="utf-8") as f:
+            f.write(content.replace("Test-Registry-Alpha-v0", "Test-Registry-Cached-v0"))
+        cached_manifest = load_task_manifest("registry_test_tasks", [".mdp"], self.cache_dir)
+        self.assertEqual(cached_manifest["tasks"][0]["id"], "Test-Registry-Cached-v0")
+
+        # changing a file rebuilds the manifest
+        self._write_file(os.path.join("beta", "__init__.py"), TASK_INIT.format(name="Gamma"))
+        os.utime(os.path.join(self.package_dir, "beta", "__init__.py"), ns=(0, 0))
+        rebuilt_manifest = load_task_manifest("registry_test_tasks", [".mdp"], self.cache_dir)
+        self.assertEqual(rebuilt_manifest["tasks"][0], manifest["tasks"][0])
+        self.assertEqual(rebuilt_manifest["tasks"][1]["id"], "Test-Registry-Gamma-v0")
+
+    def test_isaaclab_tasks_manifest(self):
+        """Test that all the tasks of the package are registered without importing their sub-packages."""
+        manifest = load_task_manifest("isaaclab_tasks", ["utils", ".mdp"], cache_dir=None)
+
+        self.assertGreater(len(manifest["tasks"]), 0)
+        for task in manifest["tasks"]:
+            self.assertIn(task["id"], gym.registry)
+            self.assertIsInstance(task["kwargs"]["env_cfg_entry_point"], str)
+
+    """
+    Helper functions.
+    """
+
+    def _write_file(self, file_path: str, content: str):
+        """Write a file of the task package."""
+        file_path = os.path.join(self.package_dir, file_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+if __name__ == "__main__":
+    run_tests()
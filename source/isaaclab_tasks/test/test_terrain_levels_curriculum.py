@@ -0,0 +1,78 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import functools
+import torch
+import unittest
+from types import SimpleNamespace
+
+from isaaclab.terrains import TerrainCurriculum, TerrainCurriculumCfg, TerrainImporter
+
+from isaaclab_tasks.manager_based.locomotion.velocity.mdp import terrain_levels_vel
+
+
+class _Scene(dict):
+    """Scene with the entities as items and the terrain and origins as attributes."""
+
+
+class TestTerrainLevelsCurriculum(unittest.TestCase):
+    """Test the curriculum term of the terrain levels of the velocity tasks."""
+
+    def setUp(self):
+        # four environments on two terrain types with three levels
+        num_envs, num_levels, num_types = 4, 3, 2
+        terrain = SimpleNamespace(
+            cfg=SimpleNamespace(terrain_generator=SimpleNamespace(size=(8.0, 8.0))),
+            terrain_origins=torch.arange(num_levels * num_types * 3, dtype=torch.float).reshape(num_levels, -1, 3),
+            terrain_levels=torch.ones(num_envs, dtype=torch.long),
+            terrain_types=torch.tensor([0, 0, 1, 1]),
+        )
+        terrain.curriculum = TerrainCurriculum(
+            TerrainCurriculumCfg(), terrain.terrain_levels, terrain.terrain_types, num_levels
+        )
+        terrain.env_origins = terrain.terrain_origins[terrain.terrain_levels, terrain.terrain_types]
+        terrain.update_env_origins = functools.partial(TerrainImporter.update_env_origins, terrain)
+        # the first robot walks far, the second one does not move and the third one is not commanded to move
+        scene = _Scene(robot=SimpleNamespace(data=SimpleNamespace(root_pos_w=terrain.env_origins.clone())))
+        scene["robot"].data.root_pos_w[0, 0] += 5.0
+        scene["robot"].data.root_pos_w[2, 0] += 1.0
+        scene.terrain = terrain
+        scene.env_origins = terrain.env_origins
+        command = torch.tensor([[1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+        self.env = SimpleNamespace(
+            scene=scene,
+            command_manager=SimpleNamespace(get_command=lambda name: command),
+            max_episode_length_s=20.0,
+        )
+
+    def test_curriculum_statistics(self):
+        """Test that the term updates the terrain levels and returns the statistics of the curriculum."""
+        terrain = self.env.scene.terrain
+        stats = terrain_levels_vel(self.env, torch.tensor([0, 1, 2]))
+
+        self.assertListEqual(terrain.terrain_levels.tolist(), [2, 0, 1, 1])
+        torch.testing.assert_close(terrain.env_origins[0], terrain.terrain_origins[2, 0])
+        torch.testing.assert_close(terrain.env_origins[1], terrain.terrain_origins[0, 0])
+        self.assertEqual(stats["num_promotions"].item(), 1)
+        self.assertEqual(stats["num_demotions"].item(), 1)
+        torch.testing.assert_close(stats["mean_level"], torch.tensor(1.0))
+
+        # the level changes are counted per update
+        stats = terrain_levels_vel(self.env, torch.tensor([2]))
+        self.assertEqual(stats["num_promotions"].item(), 0)
+        self.assertEqual(stats["num_demotions"].item(), 0)
+
+
+if __name__ == "__main__":
+    run_tests()